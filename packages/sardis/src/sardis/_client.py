@@ -52,6 +52,8 @@ from typing import (
 import httpx
 
 from ._version import __version__
+from .balances import BalanceCache
+from .metadata import GasEstimateCache
 from .models.errors import (
     APIError,
     AuthenticationError,
@@ -63,15 +65,19 @@ from .models.errors import (
     TimeoutError,
     ValidationError,
 )
+from .rates import QuoteCache
 from .telemetry import AsyncSardisTelemetry, SardisTelemetry, TelemetryConfig
+from .waiters import AsyncPollScheduler, PollScheduler
 
 if TYPE_CHECKING:
+    import concurrent.futures
     from collections.abc import Callable
 
     from .resources.agents import AgentsResource, AsyncAgentsResource
     from .resources.approvals import ApprovalsResource, AsyncApprovalsResource
     from .resources.cards import AsyncCardsResource, CardsResource
     from .resources.escrow import AsyncEscrowResource, EscrowResource
+    from .resources.events import AsyncEventsResource
     from .resources.evidence import AsyncEvidenceResource, EvidenceResource
     from .resources.exceptions import AsyncExceptionsResource, ExceptionsResource
     from .resources.facility_gate import AsyncFacilityGateResource, FacilityGateResource
@@ -87,11 +93,14 @@ if TYPE_CHECKING:
     from .resources.payments import AsyncPaymentsResource, PaymentsResource
     from .resources.policies import AsyncPoliciesResource, PoliciesResource
     from .resources.simulation import AsyncSimulationResource, SimulationResource
+    from .resources.streaming import AsyncStreamingResource, StreamingResource
     from .resources.subscriptions_v2 import AsyncSubscriptionsV2Resource, SubscriptionsV2Resource
     from .resources.transactions import AsyncTransactionsResource, TransactionsResource
     from .resources.treasury import AsyncTreasuryResource, TreasuryResource
+    from .resources.usage import AsyncUsageResource, UsageResource
     from .resources.wallets import AsyncWalletsResource, WalletsResource
     from .resources.webhooks import AsyncWebhooksResource, WebhooksResource
+    from .waiters import OperationKind
 
 # Configure module logger
 logger = logging.getLogger("sardis_sdk")
@@ -379,6 +388,9 @@ class BaseClient:
         token_refresh_callback: Callable[[], str] | None = None,
         default_headers: dict[str, str] | None = None,
         telemetry: TelemetryConfig | bool | None = None,
+        balance_cache: BalanceCache | bool | None = None,
+        gas_cache: GasEstimateCache | bool | None = None,
+        quote_cache: QuoteCache | bool | None = None,
     ):
         """Initialize the base client.
 
@@ -396,6 +408,12 @@ class BaseClient:
                        TelemetryConfig instance for custom settings. None (the
                        default) reads SARDIS_TELEMETRY_ENABLED and stays off
                        unless explicitly enabled.
+            balance_cache: Opt-in wallet balance cache. True for a cache
+                           with default TTL, or a BalanceCache instance.
+            gas_cache: Opt-in gas estimate cache. True for a cache with
+                       default TTL, or a GasEstimateCache instance.
+            quote_cache: Opt-in FX quote reuse. True for a cache with
+                         default settings, or a QuoteCache instance.
         """
         if not api_key:
             raise ValueError("API key is required")
@@ -441,6 +459,28 @@ class BaseClient:
         else:
             self._telemetry_config = telemetry
 
+        # Balance cache is opt-in; resources keep it current on their own writes.
+        if balance_cache is True:
+            self._balance_cache: BalanceCache | None = BalanceCache()
+        elif balance_cache is False:
+            self._balance_cache = None
+        else:
+            self._balance_cache = balance_cache
+
+        if gas_cache is True:
+            self._gas_cache: GasEstimateCache | None = GasEstimateCache()
+        elif gas_cache is False:
+            self._gas_cache = None
+        else:
+            self._gas_cache = gas_cache
+
+        if quote_cache is True:
+            self._quote_cache: QuoteCache | None = QuoteCache()
+        elif quote_cache is False:
+            self._quote_cache = None
+        else:
+            self._quote_cache = quote_cache
+
         # Default headers
         self._default_headers = {
             "X-API-Key": self._api_key,
@@ -450,6 +490,21 @@ class BaseClient:
             **(default_headers or {}),
         }
 
+    @property
+    def balance_cache(self) -> BalanceCache | None:
+        """The wallet balance cache, if enabled."""
+        return self._balance_cache
+
+    @property
+    def gas_cache(self) -> GasEstimateCache | None:
+        """The gas estimate cache, if enabled."""
+        return self._gas_cache
+
+    @property
+    def quote_cache(self) -> QuoteCache | None:
+        """The FX quote cache, if enabled."""
+        return self._quote_cache
+
     def _get_headers(
         self,
         context: RequestContext | None = None,
@@ -613,6 +668,9 @@ class AsyncSardis(BaseClient):
         token_refresh_callback: Callable[[], str] | None = None,
         default_headers: dict[str, str] | None = None,
         telemetry: TelemetryConfig | bool | None = None,
+        balance_cache: BalanceCache | bool | None = None,
+        gas_cache: GasEstimateCache | bool | None = None,
+        quote_cache: QuoteCache | bool | None = None,
     ):
         """Initialize the async client.
 
@@ -630,6 +688,12 @@ class AsyncSardis(BaseClient):
                        TelemetryConfig instance for custom settings. None (the
                        default) reads SARDIS_TELEMETRY_ENABLED and stays off
                        unless explicitly enabled.
+            balance_cache: Opt-in wallet balance cache. True for a cache
+                           with default TTL, or a BalanceCache instance.
+            gas_cache: Opt-in gas estimate cache. True for a cache with
+                       default TTL, or a GasEstimateCache instance.
+            quote_cache: Opt-in FX quote reuse. True for a cache with
+                         default settings, or a QuoteCache instance.
         """
         super().__init__(
             api_key=api_key,
@@ -641,6 +705,9 @@ class AsyncSardis(BaseClient):
             token_refresh_callback=token_refresh_callback,
             default_headers=default_headers,
             telemetry=telemetry,
+            balance_cache=balance_cache,
+            gas_cache=gas_cache,
+            quote_cache=quote_cache,
         )
 
         self._client: httpx.AsyncClient | None = None
@@ -679,9 +746,13 @@ class AsyncSardis(BaseClient):
         self._fx: AsyncFXResource | None = None
         self._subscriptions_v2: AsyncSubscriptionsV2Resource | None = None
         self._escrow: AsyncEscrowResource | None = None
+        self._streaming: AsyncStreamingResource | None = None
+        self._usage: AsyncUsageResource | None = None
+        self._events: AsyncEventsResource | None = None
         self._pay: AsyncPayResource | None = None
         self._mandate_delegation: Any = None
         self._batch: Any = None
+        self._poll_scheduler: Any = None
 
     @property
     def pay(self) -> AsyncPayResource:
@@ -891,6 +962,30 @@ class AsyncSardis(BaseClient):
             self._escrow = AsyncEscrowResource(self)
         return self._escrow
 
+    @property
+    def streaming(self) -> AsyncStreamingResource:
+        """Access the streaming payments resource."""
+        if self._streaming is None:
+            from .resources.streaming import AsyncStreamingResource
+            self._streaming = AsyncStreamingResource(self)
+        return self._streaming
+
+    @property
+    def usage(self) -> AsyncUsageResource:
+        """Access the usage metering resource."""
+        if self._usage is None:
+            from .resources.usage import AsyncUsageResource
+            self._usage = AsyncUsageResource(self)
+        return self._usage
+
+    @property
+    def events(self) -> AsyncEventsResource:
+        """Access real-time account events."""
+        if self._events is None:
+            from .resources.events import AsyncEventsResource
+            self._events = AsyncEventsResource(self)
+        return self._events
+
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client with connection pooling."""
         if self._client is None or self._client.is_closed:
@@ -1076,6 +1171,48 @@ class AsyncSardis(BaseClient):
             request_id=context.request_id,
         )
 
+    @property
+    def poll_scheduler(self) -> AsyncPollScheduler:
+        """The scheduler polling operations tracked by :meth:`wait_for`."""
+        if self._poll_scheduler is None:
+            self._poll_scheduler = AsyncPollScheduler(self)
+        return self._poll_scheduler
+
+    def wait_for(
+        self,
+        kind: str | OperationKind,
+        operation_id: str,
+        *,
+        max_wait: float | None = None,
+        callback: Callable[[asyncio.Future[Any]], None] | None = None,
+        **params: Any,
+    ) -> asyncio.Future[Any]:
+        """Wait until a long-running operation reaches a terminal state.
+
+        All operations of this client are polled by one shared scheduler,
+        batched per kind where the API allows.
+
+        Args:
+            kind: ``"transaction"``, ``"treasury_payment"``, ``"facility_request"``,
+                ``"escrow_dispute"`` or a custom :class:`~sardis.waiters.OperationKind`
+            operation_id: Transaction hash, payment token, request or dispute ID
+            max_wait: Seconds before the future fails with
+                :class:`~sardis.waiters.WaitTimeoutError`
+            callback: Called with the future once it is done
+            **params: Query parameters of the status call, e.g. ``chain="base"``
+
+        Returns:
+            Future resolving to the final status
+
+        Example:
+            ```python
+            status = await client.wait_for("transaction", tx_hash, chain="base", max_wait=300)
+            ```
+        """
+        return self.poll_scheduler.wait_for(
+            kind, operation_id, max_wait=max_wait, callback=callback, **params
+        )
+
     async def health(self) -> dict[str, Any]:
         """Check API health status.
 
@@ -1112,6 +1249,10 @@ class AsyncSardis(BaseClient):
 
     async def close(self) -> None:
         """Close the HTTP client and release resources."""
+        if self._poll_scheduler is not None:
+            await self._poll_scheduler.close()
+        if self._events is not None:
+            await self._events.close()
         if self._client and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
@@ -1167,6 +1308,9 @@ class Sardis(BaseClient):
         token_refresh_callback: Callable[[], str] | None = None,
         default_headers: dict[str, str] | None = None,
         telemetry: TelemetryConfig | bool | None = None,
+        balance_cache: BalanceCache | bool | None = None,
+        gas_cache: GasEstimateCache | bool | None = None,
+        quote_cache: QuoteCache | bool | None = None,
     ):
         """Initialize the sync client.
 
@@ -1184,6 +1328,12 @@ class Sardis(BaseClient):
                        TelemetryConfig instance for custom settings. None (the
                        default) reads SARDIS_TELEMETRY_ENABLED and stays off
                        unless explicitly enabled.
+            balance_cache: Opt-in wallet balance cache. True for a cache
+                           with default TTL, or a BalanceCache instance.
+            gas_cache: Opt-in gas estimate cache. True for a cache with
+                       default TTL, or a GasEstimateCache instance.
+            quote_cache: Opt-in FX quote reuse. True for a cache with
+                         default settings, or a QuoteCache instance.
         """
         super().__init__(
             api_key=api_key,
@@ -1195,6 +1345,9 @@ class Sardis(BaseClient):
             token_refresh_callback=token_refresh_callback,
             default_headers=default_headers,
             telemetry=telemetry,
+            balance_cache=balance_cache,
+            gas_cache=gas_cache,
+            quote_cache=quote_cache,
         )
 
         self._client: httpx.Client | None = None
@@ -1239,9 +1392,12 @@ class Sardis(BaseClient):
         self._fx: FXResource | None = None
         self._subscriptions_v2: SubscriptionsV2Resource | None = None
         self._escrow: EscrowResource | None = None
+        self._streaming: StreamingResource | None = None
+        self._usage: UsageResource | None = None
         self._pay: PayResource | None = None
         self._mandate_delegation: Any = None
         self._batch: Any = None
+        self._poll_scheduler: Any = None
 
     @property
     def pay(self) -> PayResource:
@@ -1451,6 +1607,22 @@ class Sardis(BaseClient):
             self._escrow = EscrowResource(self)
         return self._escrow
 
+    @property
+    def streaming(self) -> StreamingResource:
+        """Access the streaming payments resource."""
+        if self._streaming is None:
+            from .resources.streaming import StreamingResource
+            self._streaming = StreamingResource(self)
+        return self._streaming
+
+    @property
+    def usage(self) -> UsageResource:
+        """Access the usage metering resource."""
+        if self._usage is None:
+            from .resources.usage import UsageResource
+            self._usage = UsageResource(self)
+        return self._usage
+
     def _get_client(self) -> httpx.Client:
         """Get or create the HTTP client with connection pooling."""
         if self._client is None or self._client.is_closed:
@@ -1636,6 +1808,48 @@ class Sardis(BaseClient):
             request_id=context.request_id,
         )
 
+    @property
+    def poll_scheduler(self) -> PollScheduler:
+        """The scheduler polling operations tracked by :meth:`wait_for`."""
+        if self._poll_scheduler is None:
+            self._poll_scheduler = PollScheduler(self)
+        return self._poll_scheduler
+
+    def wait_for(
+        self,
+        kind: str | OperationKind,
+        operation_id: str,
+        *,
+        max_wait: float | None = None,
+        callback: Callable[[concurrent.futures.Future[Any]], None] | None = None,
+        **params: Any,
+    ) -> concurrent.futures.Future[Any]:
+        """Wait until a long-running operation reaches a terminal state.
+
+        All operations of this client are polled by one shared background
+        thread, batched per kind where the API allows.
+
+        Args:
+            kind: ``"transaction"``, ``"treasury_payment"``, ``"facility_request"``,
+                ``"escrow_dispute"`` or a custom :class:`~sardis.waiters.OperationKind`
+            operation_id: Transaction hash, payment token, request or dispute ID
+            max_wait: Seconds before the future fails with
+                :class:`~sardis.waiters.WaitTimeoutError`
+            callback: Called with the future once it is done
+            **params: Query parameters of the status call, e.g. ``chain="base"``
+
+        Returns:
+            Future resolving to the final status
+
+        Example:
+            ```python
+            status = client.wait_for("transaction", tx_hash, chain="base", max_wait=300).result()
+            ```
+        """
+        return self.poll_scheduler.wait_for(
+            kind, operation_id, max_wait=max_wait, callback=callback, **params
+        )
+
     def health(self) -> dict[str, Any]:
         """Check API health status.
 
@@ -1672,6 +1886,8 @@ class Sardis(BaseClient):
 
     def close(self) -> None:
         """Close the HTTP client and release resources."""
+        if self._poll_scheduler is not None:
+            self._poll_scheduler.close()
         if self._telemetry:
             try:
                 self._telemetry.shutdown()
@@ -0,0 +1,510 @@
+"""
+Vectorized spend analytics over ledger and card transaction streams.
+
+:class:`SpendAnalytics` ingests raw pages as they arrive (ledger entries from
+``client.ledger.paginate_entries(lazy=True)`` or card transactions from
+``client.cards.transactions(..., lazy=True)``), keeps them in columnar
+buffers, and answers rollups, percentile transaction sizes, budget burn and
+anomaly queries with NumPy group-bys instead of Python loops.
+
+Per-group counts and sums are updated incrementally with every page, and
+anomalies are flagged at ingestion time against the statistics of everything
+seen before, so a dashboard can keep one instance per process and refresh by
+feeding it only the new pages.
+
+Amounts are never summed across currencies: every rollup key is a
+``(value, currency)`` pair. Declined, reversed and otherwise failed card
+transactions are skipped rather than counted as spend.
+
+Requires NumPy (``pip install "sardis[analytics]"``).
+
+Example:
+    ```python
+    analytics = SpendAnalytics(dimensions=("wallet", "chain", "day"))
+    await analytics.consume(client.ledger.paginate_entries(lazy=True).pages())
+
+    for row in analytics.rollup("wallet")[:10]:
+        print(row.key, row.currency, row.total)
+    ```
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from .columnar import (
+    _EPOCH,
+    _MICROSECOND,
+    DEFAULT_SCALE,
+    CategoricalColumn,
+    _require_numpy,
+    to_epoch_micros,
+    to_minor_units,
+)
+from .pagination import LazyModelList, Page
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Iterable, Mapping
+
+    import numpy as np
+
+_MICROS_PER_DAY = 86_400_000_000
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Canonical dimension -> candidate field names, in order of preference. Ledger
+# entries and card transactions name the same concept differently.
+DIMENSION_FIELDS: dict[str, tuple[str, ...]] = {
+    "agent": ("agent_id", "agent_name"),
+    "wallet": ("from_wallet", "wallet_id"),
+    "merchant": ("merchant", "merchant_name", "merchant_id", "to_wallet"),
+    "chain": ("chain",),
+    "group": ("group_id",),
+    "card": ("card_id",),
+    "source": ("_source",),
+}
+
+DEFAULT_DIMENSIONS = ("agent", "wallet", "merchant", "chain", "group", "day")
+
+# Card transaction statuses that never moved money. Ledger entries carry no
+# status and always count.
+NON_SPEND_STATUSES = frozenset({"declined", "reversed", "returned", "failed", "canceled", "cancelled", "voided"})
+
+
+@dataclass(frozen=True)
+class Rollup:
+    """Aggregated spend for one group.
+
+    Attributes:
+        key: Dimension value (an ISO date for the ``day`` dimension)
+        currency: Currency of the aggregated amounts
+        count: Number of transactions
+        total: Sum of amounts
+        mean: Mean amount
+        min: Smallest amount
+        max: Largest amount
+    """
+
+    key: str
+    currency: str
+    count: int
+    total: Decimal
+    mean: Decimal
+    min: Decimal
+    max: Decimal
+
+
+@dataclass(frozen=True)
+class BudgetBurn:
+    """Spend against a budget for one group.
+
+    Attributes:
+        key: Dimension value
+        currency: Budget currency
+        spent: Amount spent
+        budget: Budget amount
+        ratio: ``spent / budget`` (above 1.0 means over budget)
+    """
+
+    key: str
+    currency: str
+    spent: Decimal
+    budget: Decimal
+    ratio: float
+
+    @property
+    def remaining(self) -> Decimal:
+        """Budget left (negative when over budget)."""
+        return self.budget - self.spent
+
+
+@dataclass(frozen=True)
+class Anomaly:
+    """A transaction that is unusually large for its group.
+
+    Attributes:
+        tx_id: Transaction ID
+        key: Group the transaction was compared against
+        currency: Transaction currency
+        amount: Transaction amount
+        zscore: Standard deviations above the group mean at ingestion time
+        created_at: When the transaction happened
+    """
+
+    tx_id: str
+    key: str
+    currency: str
+    amount: Decimal
+    zscore: float
+    created_at: datetime
+
+
+class _GroupStats:
+    """Incrementally maintained per-group count/sum/min/max/sum of squares."""
+
+    def __init__(self) -> None:
+        np = _require_numpy()
+        self.count = np.zeros(0, dtype=np.int64)
+        self.total = np.zeros(0, dtype=np.int64)
+        self.sumsq = np.zeros(0, dtype=np.float64)
+        self.min = np.zeros(0, dtype=np.int64)
+        self.max = np.zeros(0, dtype=np.int64)
+
+    def _grow(self, size: int) -> None:
+        np = _require_numpy()
+        old = len(self.count)
+        if size <= old:
+            return
+        extra = size - old
+        self.count = np.concatenate([self.count, np.zeros(extra, dtype=np.int64)])
+        self.total = np.concatenate([self.total, np.zeros(extra, dtype=np.int64)])
+        self.sumsq = np.concatenate([self.sumsq, np.zeros(extra, dtype=np.float64)])
+        self.min = np.concatenate([self.min, np.full(extra, np.iinfo(np.int64).max)])
+        self.max = np.concatenate([self.max, np.full(extra, np.iinfo(np.int64).min)])
+
+    def update(self, codes: np.ndarray, amounts: np.ndarray, size: int) -> None:
+        np = _require_numpy()
+        self._grow(size)
+        valid = codes >= 0
+        codes, amounts = codes[valid], amounts[valid]
+        np.add.at(self.count, codes, 1)
+        np.add.at(self.total, codes, amounts)
+        np.add.at(self.sumsq, codes, amounts.astype(np.float64) ** 2)
+        np.minimum.at(self.min, codes, amounts)
+        np.maximum.at(self.max, codes, amounts)
+
+    def zscores(self, codes: np.ndarray, amounts: np.ndarray, min_count: int) -> np.ndarray:
+        """Z-score of each amount against the current stats of its group."""
+        np = _require_numpy()
+        out = np.zeros(len(codes), dtype=np.float64)
+        known = (codes >= 0) & (codes < len(self.count))
+        idx = codes[known]
+        n = self.count[idx].astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = self.total[idx] / n
+            std = np.sqrt(np.maximum(self.sumsq[idx] / n - mean**2, 0.0))
+            z = (amounts[known] - mean) / std
+        z[(n < min_count) | ~np.isfinite(z)] = 0.0
+        out[known] = z
+        return out
+
+
+class SpendAnalytics:
+    """Incremental, vectorized spend analytics.
+
+    Args:
+        dimensions: Dimensions to maintain rollups for. Any key of
+            :data:`DIMENSION_FIELDS` or ``"day"``.
+        scale: Fractional digits kept for amounts (int64 minor units)
+        anomaly_dimension: Dimension whose groups anomalies are judged against
+        anomaly_zscore: Z-score above which a transaction is flagged
+        anomaly_min_count: Minimum prior transactions in a group before it
+            can flag anomalies
+        exclude_statuses: Row statuses that are not spend; rows with one of
+            them, or with a ``decline_reason``, are skipped
+
+    Attributes:
+        skipped: Rows skipped as not being spend
+    """
+
+    def __init__(
+        self,
+        dimensions: Iterable[str] = DEFAULT_DIMENSIONS,
+        scale: int = DEFAULT_SCALE,
+        anomaly_dimension: str = "wallet",
+        anomaly_zscore: float = 4.0,
+        anomaly_min_count: int = 20,
+        exclude_statuses: Iterable[str] = NON_SPEND_STATUSES,
+    ) -> None:
+        self.dimensions = tuple(dimensions)
+        for dim in (*self.dimensions, anomaly_dimension):
+            if dim != "day" and dim not in DIMENSION_FIELDS:
+                raise ValueError(f"Unknown dimension: {dim!r}")
+        if anomaly_dimension not in self.dimensions:
+            self.dimensions = (*self.dimensions, anomaly_dimension)
+
+        self.scale = scale
+        self.anomaly_dimension = anomaly_dimension
+        self.anomaly_zscore = anomaly_zscore
+        self.anomaly_min_count = anomaly_min_count
+        self.exclude_statuses = frozenset(s.lower() for s in exclude_statuses)
+        self.skipped = 0
+
+        self._tx_id: list[str] = []
+        self._amount = array("q")
+        self._created_at = array("q")
+        self._currency = CategoricalColumn()
+        # Per dimension: interned (value, currency) keys and their row codes.
+        self._keys: dict[str, CategoricalColumn] = {d: CategoricalColumn() for d in self.dimensions}
+        self._stats: dict[str, _GroupStats] = {d: _GroupStats() for d in self.dimensions}
+        self._anomalies: list[tuple[int, float]] = []
+
+    def __len__(self) -> int:
+        return len(self._tx_id)
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def add_ledger_entries(self, entries: Page[Any] | Iterable[Any]) -> int:
+        """Ingest ledger entries (raw dicts, models, a page or a lazy list).
+
+        Returns:
+            Number of entries ingested
+        """
+        return self._ingest(entries, "ledger")
+
+    def add_card_transactions(self, transactions: Page[Any] | Iterable[Any]) -> int:
+        """Ingest card transactions (raw dicts, models, a page or a lazy list).
+
+        Returns:
+            Number of transactions ingested
+        """
+        return self._ingest(transactions, "card")
+
+    async def consume(self, pages: AsyncIterable[Any], source: str = "ledger") -> int:
+        """Ingest every page of an async page stream.
+
+        Args:
+            pages: e.g. ``client.ledger.paginate_entries(lazy=True).pages()``
+            source: ``"ledger"`` or ``"card"``
+
+        Returns:
+            Number of rows ingested
+        """
+        total = 0
+        async for page in pages:
+            total += self._ingest(page, source)
+        return total
+
+    def _ingest(self, rows: Any, source: str) -> int:
+        if isinstance(rows, Page):
+            rows = rows.items
+        if isinstance(rows, LazyModelList):
+            rows = rows.raw
+
+        start = len(self._tx_id)
+        try:
+            for row in rows:
+                self._append(row, source)
+        finally:
+            # Rows appended before a bad one are kept, so keep their stats too.
+            count = len(self._tx_id) - start
+            if count:
+                self._update_stats(start)
+        return count
+
+    def _append(self, row: Any, source: str) -> None:
+        if isinstance(row, BaseModel):
+            row = row.model_dump()
+        status = row.get("status")
+        if row.get("decline_reason") or (status and str(status).lower() in self.exclude_statuses):
+            self.skipped += 1
+            return
+        # Convert the whole row first so a bad value cannot leave the columns
+        # misaligned; the int64 amount column is the only append that can fail.
+        row = {**row, "_source": source}
+        amount = to_minor_units(row["amount"], self.scale)
+        created_at = to_epoch_micros(row["created_at"])
+        currency = row.get("currency") or ""
+        keys = {}
+        for dim in self._keys:
+            value = self._dimension_value(dim, row, created_at)
+            keys[dim] = None if value is None else f"{value}\x1f{currency}"
+
+        self._amount.append(amount)
+        self._created_at.append(created_at)
+        self._tx_id.append(str(row.get("tx_id") or row.get("transaction_id") or ""))
+        self._currency.append(currency)
+        for dim, key in keys.items():
+            self._keys[dim].append(key)
+
+    def _dimension_value(self, dim: str, row: dict[str, Any], created_at: int) -> str | None:
+        if dim == "day":
+            return date.fromordinal(_EPOCH_ORDINAL + created_at // _MICROS_PER_DAY).isoformat()
+        for name in DIMENSION_FIELDS[dim]:
+            value = row.get(name)
+            if value:
+                return str(value)
+        return None
+
+    def _update_stats(self, start: int) -> None:
+        np = _require_numpy()
+        amounts = np.frombuffer(self._amount, dtype=np.int64)[start:]
+        for dim, keys in self._keys.items():
+            codes = np.frombuffer(keys.codes, dtype=np.int32)[start:]
+            stats = self._stats[dim]
+            if dim == self.anomaly_dimension:
+                z = stats.zscores(codes, amounts, self.anomaly_min_count)
+                for offset in np.flatnonzero(z > self.anomaly_zscore):
+                    self._anomalies.append((start + int(offset), float(z[offset])))
+            stats.update(codes, amounts, len(keys.categories))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _decimal(self, minor: int | float) -> Decimal:
+        return Decimal(int(minor)).scaleb(-self.scale)
+
+    def _split(self, dimension: str, code: int) -> tuple[str, str]:
+        key, _, currency = self._keys[dimension].categories[code].partition("\x1f")
+        return key, currency
+
+    def _require(self, dimension: str) -> None:
+        if dimension not in self._keys:
+            raise ValueError(f"Dimension {dimension!r} is not tracked; tracked: {self.dimensions}")
+
+    def rollup(self, dimension: str, currency: str | None = None) -> list[Rollup]:
+        """Spend per group of ``dimension``, largest total first.
+
+        Args:
+            dimension: A tracked dimension
+            currency: Only include groups in this currency
+        """
+        np = _require_numpy()
+        self._require(dimension)
+        stats = self._stats[dimension]
+        out = []
+        for code in np.argsort(-stats.total, kind="stable"):
+            count = int(stats.count[code])
+            if not count:
+                continue
+            key, cur = self._split(dimension, int(code))
+            if currency is not None and cur != currency:
+                continue
+            total = int(stats.total[code])
+            out.append(Rollup(
+                key=key,
+                currency=cur,
+                count=count,
+                total=self._decimal(total),
+                mean=(self._decimal(total) / count).quantize(Decimal(1).scaleb(-self.scale)),
+                min=self._decimal(stats.min[code]),
+                max=self._decimal(stats.max[code]),
+            ))
+        return out
+
+    def percentiles(
+        self,
+        dimension: str,
+        q: Iterable[float] = (50, 90, 99),
+    ) -> dict[tuple[str, str], dict[float, Decimal]]:
+        """Transaction size percentiles per group (linear interpolation).
+
+        Returns:
+            ``{(key, currency): {percentile: amount}}``
+        """
+        np = _require_numpy()
+        self._require(dimension)
+        qs = tuple(q)
+        codes = np.frombuffer(self._keys[dimension].codes, dtype=np.int32)
+        amounts = np.frombuffer(self._amount, dtype=np.int64)
+        valid = codes >= 0
+        codes, amounts = codes[valid], amounts[valid]
+        if not len(codes):
+            return {}
+
+        order = np.lexsort((amounts, codes))
+        sorted_amounts = amounts[order].astype(np.float64)
+        counts = np.bincount(codes, minlength=len(self._keys[dimension].categories))
+        present = np.flatnonzero(counts)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])[present]
+        counts = counts[present]
+
+        result: dict[tuple[str, str], dict[float, Decimal]] = {
+            self._split(dimension, int(c)): {} for c in present
+        }
+        for pct in qs:
+            pos = (counts - 1) * (pct / 100.0)
+            lo = np.floor(pos).astype(np.int64)
+            hi = np.ceil(pos).astype(np.int64)
+            values = sorted_amounts[starts + lo] + (
+                sorted_amounts[starts + hi] - sorted_amounts[starts + lo]
+            ) * (pos - lo)
+            for code, value in zip(present, values, strict=True):
+                result[self._split(dimension, int(code))][pct] = self._decimal(round(value))
+        return result
+
+    def budget_burn(
+        self,
+        dimension: str,
+        budgets: Mapping[str, Decimal | str | int],
+        currency: str = "USDC",
+    ) -> list[BudgetBurn]:
+        """Spend against per-group budgets, highest burn first.
+
+        Args:
+            dimension: A tracked dimension
+            budgets: Budget per dimension value
+            currency: Currency the budgets are denominated in
+        """
+        self._require(dimension)
+        keys, stats = self._keys[dimension], self._stats[dimension]
+        out = []
+        for key, raw_budget in budgets.items():
+            budget = Decimal(str(raw_budget))
+            code = keys.code_of(f"{key}\x1f{currency}")
+            spent = self._decimal(stats.total[code]) if 0 <= code < len(stats.total) else Decimal(0)
+            ratio = float(spent / budget) if budget else float("inf")
+            out.append(BudgetBurn(key=key, currency=currency, spent=spent, budget=budget, ratio=ratio))
+        out.sort(key=lambda b: b.ratio, reverse=True)
+        return out
+
+    def running_spend(
+        self,
+        dimension: str,
+        key: str,
+        currency: str = "USDC",
+    ) -> list[tuple[date, Decimal]]:
+        """Cumulative daily spend for one group, for budget burn-down charts.
+
+        Returns:
+            ``(day, cumulative spend up to and including that day)`` pairs
+        """
+        np = _require_numpy()
+        self._require(dimension)
+        code = self._keys[dimension].code_of(f"{key}\x1f{currency}")
+        if code < 0:
+            return []
+        mask = np.frombuffer(self._keys[dimension].codes, dtype=np.int32) == code
+        days = np.frombuffer(self._created_at, dtype=np.int64)[mask] // _MICROS_PER_DAY
+        amounts = np.frombuffer(self._amount, dtype=np.int64)[mask]
+        order = np.argsort(days, kind="stable")
+        days, amounts = days[order], amounts[order]
+        unique_days, starts = np.unique(days, return_index=True)
+        cumulative = np.cumsum(np.add.reduceat(amounts, starts))
+        return [
+            (date.fromordinal(_EPOCH_ORDINAL + int(d)), self._decimal(total))
+            for d, total in zip(unique_days, cumulative, strict=True)
+        ]
+
+    def anomalies(self) -> list[Anomaly]:
+        """Transactions flagged as unusually large for their group when ingested."""
+        out = []
+        for row, z in self._anomalies:
+            key, currency = self._split(self.anomaly_dimension, self._keys[self.anomaly_dimension].codes[row])
+            out.append(Anomaly(
+                tx_id=self._tx_id[row],
+                key=key,
+                currency=currency,
+                amount=self._decimal(self._amount[row]),
+                zscore=z,
+                created_at=_EPOCH + self._created_at[row] * _MICROSECOND,
+            ))
+        return out
+
+
+__all__ = [
+    "DEFAULT_DIMENSIONS",
+    "DIMENSION_FIELDS",
+    "NON_SPEND_STATUSES",
+    "Anomaly",
+    "BudgetBurn",
+    "Rollup",
+    "SpendAnalytics",
+]
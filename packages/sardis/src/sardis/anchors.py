@@ -0,0 +1,335 @@
+"""
+Bulk local verification of ledger audit anchors.
+
+``ledger.verify_entry`` costs one round trip per entry. Entries committed in
+the same batch share an ``audit_anchor``, so :class:`AsyncAnchorVerifier`
+and :class:`AnchorVerifier` fetch the Merkle material once per anchor
+(``ledger.get_anchor``), then recompute leaf hashes and fold proofs locally
+across a process pool. The API sees one request per anchor instead of one
+per entry.
+
+Hashing follows RFC 6962: ``leaf = SHA-256(0x00 || canonical entry)`` and
+``node = SHA-256(0x01 || left || right)``, where the canonical entry is the
+sorted-key compact JSON of :data:`LEAF_FIELDS` with ``amount`` normalized and
+``created_at`` as epoch microseconds.
+
+Example:
+    ```python
+    verifier = AsyncAnchorVerifier(client.ledger)
+    report = await verifier.verify(client.ledger.paginate_entries(lazy=True))
+    for mismatch in report.mismatches:
+        print(mismatch.tx_id, mismatch.reason)
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from .columnar import to_epoch_micros
+from .models.errors import NotFoundError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Iterable
+
+    from .resources.ledger import AsyncLedgerResource, LedgerResource
+
+# Entry fields committed to by the leaf hash.
+LEAF_FIELDS = (
+    "tx_id", "mandate_id", "from_wallet", "to_wallet", "amount",
+    "currency", "chain", "chain_tx_hash", "created_at",
+)
+
+
+def leaf_hash(entry: dict[str, Any]) -> bytes:
+    """Hash of one ledger entry as committed to by its anchor."""
+    canonical = {name: entry.get(name) for name in LEAF_FIELDS}
+    canonical["amount"] = format(Decimal(str(entry["amount"])).normalize(), "f")
+    canonical["created_at"] = to_epoch_micros(entry["created_at"])
+    data = json.dumps(canonical, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.sha256(b"\x00" + data).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    """Hash of an interior Merkle node."""
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def merkle_root(leaves: list[bytes]) -> bytes:
+    """Root of a Merkle tree over ``leaves`` (an odd last node is promoted)."""
+    if not leaves:
+        return hashlib.sha256(b"").digest()
+    level = leaves
+    while len(level) > 1:
+        paired = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+def _hex(value: str) -> bytes:
+    return bytes.fromhex(value.removeprefix("0x"))
+
+
+def _anchor_root(anchor: str) -> bytes | None:
+    """Root embedded in an anchor of the form ``merkle::<hex root>``, if any."""
+    prefix, _, tail = anchor.rpartition("::")
+    if not prefix.startswith("merkle"):
+        return None
+    try:
+        return _hex(tail)
+    except ValueError:
+        return None
+
+
+def _verify_batch(anchor: str, entries: list[dict[str, Any]], material: dict[str, Any]) -> list[tuple[str, str]]:
+    """Verify entries of one anchor against its material; returns (tx_id, reason) mismatches.
+
+    Top-level so it can run in a worker process.
+    """
+    try:
+        root = _hex(material["root"])
+    except (KeyError, TypeError, ValueError):
+        return [(e["tx_id"], "anchor material has no valid root") for e in entries]
+    embedded = _anchor_root(anchor)
+    if embedded is not None and embedded != root:
+        return [(e["tx_id"], "server root does not match the anchor") for e in entries]
+
+    mismatches = []
+    if "proofs" in material:
+        proofs = material["proofs"]
+        for entry in entries:
+            proof = proofs.get(entry["tx_id"])
+            if proof is None:
+                mismatches.append((entry["tx_id"], "no inclusion proof for entry"))
+                continue
+            digest = leaf_hash(entry)
+            for step in proof:
+                sibling = _hex(step["hash"])
+                digest = node_hash(sibling, digest) if step.get("position") == "left" else node_hash(digest, sibling)
+            if digest != root:
+                mismatches.append((entry["tx_id"], "inclusion proof does not reach the anchor root"))
+    elif "leaves" in material:
+        leaves = [_hex(h) for h in material["leaves"]]
+        if merkle_root(leaves) != root:
+            return [(e["tx_id"], "anchor leaves do not hash to the anchor root") for e in entries]
+        committed = set(leaves)
+        mismatches.extend(
+            (entry["tx_id"], "entry hash is not committed under the anchor")
+            for entry in entries
+            if leaf_hash(entry) not in committed
+        )
+    else:
+        mismatches.extend((e["tx_id"], "anchor material has no proofs or leaves") for e in entries)
+    return mismatches
+
+
+@dataclass(frozen=True)
+class AnchorMismatch:
+    """An entry that failed verification.
+
+    Attributes:
+        tx_id: Ledger transaction ID
+        anchor: The entry's audit anchor
+        reason: Why verification failed
+    """
+
+    tx_id: str
+    anchor: str | None
+    reason: str
+
+
+@dataclass
+class AnchorVerificationReport:
+    """Outcome of a bulk anchor verification.
+
+    Attributes:
+        checked: Entries checked
+        anchors: Distinct anchors fetched
+        mismatches: Entries that failed verification
+    """
+
+    checked: int = 0
+    anchors: int = 0
+    mismatches: list[AnchorMismatch] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every entry verified."""
+        return not self.mismatches
+
+
+class _VerifierBase:
+    def __init__(self, max_workers: int | None, batch_size: int) -> None:
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+
+    def _executor(self) -> Executor | None:
+        # max_workers=0 hashes in the calling process (small audits, tests).
+        return None if self.max_workers == 0 else ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _group(self, entries: list[dict[str, Any]], report: AnchorVerificationReport) -> dict[str, list[dict[str, Any]]]:
+        groups: dict[str, list[dict[str, Any]]] = {}
+        for entry in entries:
+            anchor = entry.get("audit_anchor")
+            if not anchor:
+                report.mismatches.append(AnchorMismatch(entry["tx_id"], None, "entry has no audit anchor"))
+                continue
+            groups.setdefault(anchor, []).append(entry)
+        report.checked = len(entries)
+        report.anchors = len(groups)
+        return groups
+
+    def _jobs(self, anchor: str, entries: list[dict[str, Any]], material: dict[str, Any]) -> Iterable[tuple[Any, ...]]:
+        for start in range(0, len(entries), self.batch_size):
+            chunk = entries[start:start + self.batch_size]
+            if "proofs" in material:
+                # Ship each worker only the proofs it needs.
+                chunk_material = {
+                    "root": material.get("root"),
+                    "proofs": {e["tx_id"]: material["proofs"].get(e["tx_id"]) for e in chunk
+                               if e["tx_id"] in material["proofs"]},
+                }
+            else:
+                chunk_material = material
+            yield anchor, chunk, chunk_material
+
+    @staticmethod
+    def _collect(report: AnchorVerificationReport, anchor: str, result: list[tuple[str, str]]) -> None:
+        report.mismatches.extend(AnchorMismatch(tx_id, anchor, reason) for tx_id, reason in result)
+
+
+def _as_dict(entry: Any) -> dict[str, Any]:
+    return entry.model_dump(mode="json") if isinstance(entry, BaseModel) else entry
+
+
+class AsyncAnchorVerifier(_VerifierBase):
+    """Verifies ledger entries against their audit anchors in bulk (async client).
+
+    Args:
+        ledger: ``client.ledger`` of an :class:`~sardis.AsyncSardis` client
+        max_workers: Worker processes for hashing (``None`` = CPU count,
+            ``0`` = hash in this process)
+        fetch_concurrency: Anchors fetched concurrently
+        batch_size: Entries per worker task
+    """
+
+    def __init__(
+        self,
+        ledger: AsyncLedgerResource,
+        max_workers: int | None = None,
+        fetch_concurrency: int = 8,
+        batch_size: int = 5000,
+    ) -> None:
+        super().__init__(max_workers, batch_size)
+        self._ledger = ledger
+        self.fetch_concurrency = fetch_concurrency
+
+    async def verify(self, entries: Iterable[Any] | AsyncIterable[Any]) -> AnchorVerificationReport:
+        """Verify entries (models, raw dicts, or an async paginator of either).
+
+        Returns:
+            Report of checked entries and mismatches
+        """
+        if hasattr(entries, "__aiter__"):
+            collected = [_as_dict(e) async for e in entries]
+        else:
+            collected = [_as_dict(e) for e in entries]
+        report = AnchorVerificationReport()
+        groups = self._group(collected, report)
+
+        semaphore = asyncio.Semaphore(self.fetch_concurrency)
+        loop = asyncio.get_running_loop()
+        executor = self._executor()
+
+        async def check(anchor: str, group: list[dict[str, Any]]) -> None:
+            async with semaphore:
+                try:
+                    material = await self._ledger.get_anchor(anchor)
+                except NotFoundError:
+                    self._collect(report, anchor, [(e["tx_id"], "anchor not found") for e in group])
+                    return
+            results = await asyncio.gather(*(
+                loop.run_in_executor(executor, _verify_batch, *job)
+                for job in self._jobs(anchor, group, material)
+            ))
+            for result in results:
+                self._collect(report, anchor, result)
+
+        try:
+            await asyncio.gather(*(check(anchor, group) for anchor, group in groups.items()))
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        return report
+
+
+class AnchorVerifier(_VerifierBase):
+    """Verifies ledger entries against their audit anchors in bulk (sync client).
+
+    Anchors are fetched one at a time while earlier batches hash in the pool.
+
+    Args:
+        ledger: ``client.ledger`` of a sync :class:`~sardis.Sardis` client
+        max_workers: Worker processes for hashing (``None`` = CPU count,
+            ``0`` = hash in this process)
+        batch_size: Entries per worker task
+    """
+
+    def __init__(
+        self,
+        ledger: LedgerResource,
+        max_workers: int | None = None,
+        batch_size: int = 5000,
+    ) -> None:
+        super().__init__(max_workers, batch_size)
+        self._ledger = ledger
+
+    def verify(self, entries: Iterable[Any]) -> AnchorVerificationReport:
+        """Verify entries (models, raw dicts, or a sync paginator of either).
+
+        Returns:
+            Report of checked entries and mismatches
+        """
+        report = AnchorVerificationReport()
+        groups = self._group([_as_dict(e) for e in entries], report)
+        executor = self._executor()
+        pending = []
+        try:
+            for anchor, group in groups.items():
+                try:
+                    material = self._ledger.get_anchor(anchor)
+                except NotFoundError:
+                    self._collect(report, anchor, [(e["tx_id"], "anchor not found") for e in group])
+                    continue
+                for job in self._jobs(anchor, group, material):
+                    if executor is None:
+                        self._collect(report, anchor, _verify_batch(*job))
+                    else:
+                        pending.append((anchor, executor.submit(_verify_batch, *job)))
+            for anchor, future in pending:
+                self._collect(report, anchor, future.result())
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        return report
+
+
+__all__ = [
+    "LEAF_FIELDS",
+    "AnchorMismatch",
+    "AnchorVerificationReport",
+    "AnchorVerifier",
+    "AsyncAnchorVerifier",
+    "leaf_hash",
+    "merkle_root",
+    "node_hash",
+]
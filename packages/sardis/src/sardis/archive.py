@@ -0,0 +1,470 @@
+"""
+Append-only binary archive for ledger entries and audit packets.
+
+An archive is four files sharing a base path:
+
+- ``<path>``: a 64-byte header followed by fixed-width 48-byte records
+  (``created_at`` µs, ``amount`` in minor units, interned currency, chain and
+  wallet codes, record kind, and the location of the record's payload)
+- ``<path>.heap``: compact JSON payloads (IDs, hashes, full audit packets)
+- ``<path>.strings``: the interned string table
+- ``<path>.idx``: sidecar index, records sorted by ``tx_id`` hash and by time
+
+Readers memory-map the record and heap files, so scans touch only the pages
+they read and ``to_numpy()`` is a zero-copy view. Lookups by ID and time
+ranges are binary searches over the sidecar index.
+
+Writes are crash-safe: payloads and strings are appended before the record
+that refers to them, and the header's counts only advance on :meth:`flush`.
+A writer reopening an archive truncates anything past the committed counts.
+
+Example:
+    ```python
+    with ArchiveWriter("ledger-2026.sda") as writer:
+        for entry in entries:
+            writer.append_ledger_entry(entry)
+
+    with ArchiveReader("ledger-2026.sda") as reader:
+        entry = reader.get("tx_123")
+        march = list(reader.between(datetime(2026, 3, 1), datetime(2026, 4, 1)))
+    ```
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .columnar import (
+    _EPOCH,
+    _MICROSECOND,
+    DEFAULT_SCALE,
+    _require_numpy,
+    to_epoch_micros,
+    to_minor_units,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from datetime import datetime
+
+    import numpy as np
+
+MAGIC = b"SARDISA1"
+FORMAT_VERSION = 1
+
+# magic, version, scale, records, heap bytes, strings, string bytes (padded to 64)
+_HEADER = struct.Struct("<8sIIQQQQ16x")
+# created_at, amount, currency, chain, from_wallet, to_wallet, kind, payload length, payload offset
+_RECORD = struct.Struct("<qqiiiiiIQ")
+_STRING_LEN = struct.Struct("<I")
+# magic, indexed record count
+_INDEX_HEADER = struct.Struct("<8sQ")
+_INDEX_MAGIC = b"SARDISX1"
+
+RECORD_KINDS = ("ledger", "audit")
+
+# Fields stored in fixed-width columns; everything else goes to the heap.
+_COLUMN_FIELDS = ("created_at", "amount", "currency", "chain", "from_wallet", "to_wallet")
+_ID_FIELDS = ("tx_id", "packet_id", "decision_id", "event_id", "request_id", "id")
+_TIME_FIELDS = ("created_at", "occurred_at", "exported_at", "timestamp")
+
+
+def _id_hash(record_id: str) -> int:
+    return int.from_bytes(hashlib.blake2b(record_id.encode(), digest_size=8).digest(), "little")
+
+
+def _record_id(record: dict[str, Any]) -> str:
+    for name in _ID_FIELDS:
+        if record.get(name):
+            return str(record[name])
+    raise ValueError(f"Record has none of the ID fields {_ID_FIELDS}")
+
+
+def _paths(path: str | os.PathLike[str]) -> tuple[Path, Path, Path, Path]:
+    base = Path(path)
+    return base, Path(f"{base}.heap"), Path(f"{base}.strings"), Path(f"{base}.idx")
+
+
+def _read_strings(data: bytes | mmap.mmap, count: int) -> list[str]:
+    strings, pos = [], 0
+    for _ in range(count):
+        (length,) = _STRING_LEN.unpack_from(data, pos)
+        pos += _STRING_LEN.size
+        strings.append(bytes(data[pos:pos + length]).decode())
+        pos += length
+    return strings
+
+
+class ArchiveWriter:
+    """Appends ledger entries and audit packets to an archive.
+
+    Opening an existing archive continues it; the amount scale must match.
+
+    Args:
+        path: Archive base path
+        scale: Fractional digits kept for amounts (fixed per archive)
+    """
+
+    def __init__(self, path: str | os.PathLike[str], scale: int = DEFAULT_SCALE) -> None:
+        self.path, heap_path, strings_path, self._index_path = _paths(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._strings: list[str] = []
+        self._codes: dict[str, int] = {}
+
+        if self.path.exists() and self.path.stat().st_size >= _HEADER.size:
+            with open(self.path, "rb") as f:
+                magic, version, self.scale, self._count, heap_size, n_strings, strings_size = _HEADER.unpack(
+                    f.read(_HEADER.size)
+                )
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} Sardis archive")
+            if scale != self.scale:
+                raise ValueError(f"Archive scale is {self.scale}, not {scale}")
+            # Drop anything written after the last flush.
+            for p, size in ((self.path, _HEADER.size + self._count * _RECORD.size),
+                            (heap_path, heap_size), (strings_path, strings_size)):
+                os.truncate(p, size)
+            self._strings = _read_strings(strings_path.read_bytes(), n_strings)
+            self._codes = {s: i for i, s in enumerate(self._strings)}
+        else:
+            self.scale, self._count = scale, 0
+            for p in (self.path, heap_path, strings_path):
+                p.write_bytes(b"")
+            with open(self.path, "r+b") as f:
+                f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, scale, 0, 0, 0, 0))
+
+        self._records = open(self.path, "ab")  # noqa: SIM115 - closed by close()
+        self._heap = open(heap_path, "ab")  # noqa: SIM115
+        self._string_file = open(strings_path, "ab")  # noqa: SIM115
+
+    def __enter__(self) -> ArchiveWriter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _intern(self, value: Any) -> int:
+        if value is None:
+            return -1
+        value = str(value)
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._strings)
+            self._strings.append(value)
+            encoded = value.encode()
+            self._string_file.write(_STRING_LEN.pack(len(encoded)) + encoded)
+        return code
+
+    def _append(self, record: dict[str, Any], kind: int, created_at: Any, amount: Any, payload: dict[str, Any]) -> int:
+        _record_id(record)  # every record must be addressable by ID
+        created = to_epoch_micros(created_at)
+        minor = to_minor_units(amount, self.scale) if amount is not None else 0
+        body = json.dumps(payload, separators=(",", ":"), default=str).encode()
+        offset = self._heap.tell()
+        self._heap.write(body)
+        self._records.write(_RECORD.pack(
+            created,
+            minor,
+            self._intern(record.get("currency")),
+            self._intern(record.get("chain")),
+            self._intern(record.get("from_wallet")),
+            self._intern(record.get("to_wallet")),
+            kind,
+            len(body),
+            offset,
+        ))
+        self._count += 1
+        return self._count - 1
+
+    def append_ledger_entry(self, entry: dict[str, Any] | Any) -> int:
+        """Append a ledger entry (raw dict or ``LedgerEntry``).
+
+        Returns:
+            Record number of the entry
+        """
+        if not isinstance(entry, dict):
+            entry = entry.model_dump()
+        payload = {k: v for k, v in entry.items() if k not in _COLUMN_FIELDS and v is not None}
+        return self._append(entry, 0, entry["created_at"], entry["amount"], payload)
+
+    def append_audit_packet(self, packet: dict[str, Any]) -> int:
+        """Append an audit packet (e.g. from ``evidence.export_decision`` or
+        ``facility_gate.export_audit``). The full packet is kept in the heap.
+
+        Returns:
+            Record number of the packet
+        """
+        created_at = next((packet[f] for f in _TIME_FIELDS if packet.get(f)), None)
+        if created_at is None:
+            raise ValueError(f"Audit packet has none of the time fields {_TIME_FIELDS}")
+        return self._append(packet, 1, created_at, packet.get("amount"), packet)
+
+    def flush(self) -> None:
+        """Commit appended records: sync data files, then advance the header."""
+        for f in (self._heap, self._string_file, self._records):
+            f.flush()
+            os.fsync(f.fileno())
+        with open(self.path, "r+b") as f:
+            f.write(_HEADER.pack(
+                MAGIC, FORMAT_VERSION, self.scale, self._count,
+                self._heap.tell(), len(self._strings), self._string_file.tell(),
+            ))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_index(self) -> None:
+        """Merge records appended since the last index into the sidecar index."""
+        with ArchiveReader(self.path) as reader:
+            indexed = reader._indexed
+            ids = list(zip(reader._id_hashes, reader._id_recnos, strict=True))
+            times = list(zip(reader._times, reader._time_recnos, strict=True))
+            for recno in range(indexed, len(reader)):
+                created, *_ = reader._record(recno)
+                ids.append((_id_hash(reader.record_id(recno)), recno))
+                times.append((created, recno))
+            count = len(reader)
+        ids.sort()
+        times.sort()
+
+        tmp = self._index_path.with_name(f".{self._index_path.name}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, count))
+            f.write(array("Q", [h for h, _ in ids]).tobytes())
+            f.write(array("Q", [r for _, r in ids]).tobytes())
+            f.write(array("q", [t for t, _ in times]).tobytes())
+            f.write(array("Q", [r for _, r in times]).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._index_path)
+
+    def close(self) -> None:
+        """Flush, update the sidecar index and close the archive."""
+        if self._records.closed:
+            return
+        self.flush()
+        for f in (self._heap, self._string_file, self._records):
+            f.close()
+        self._write_index()
+
+
+def _map(path: Path) -> mmap.mmap | None:
+    if not path.exists() or path.stat().st_size == 0:
+        return None
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class ArchiveReader:
+    """Memory-mapped, read-only view of an archive.
+
+    Only records committed by the writer's last :meth:`ArchiveWriter.flush`
+    are visible. Records appended after the sidecar index was last written
+    are still returned by lookups, through a linear scan of that tail.
+
+    Args:
+        path: Archive base path
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path, heap_path, strings_path, index_path = _paths(path)
+        self._data = _map(self.path)
+        if self._data is None or len(self._data) < _HEADER.size:
+            raise ValueError(f"{self.path} is not a Sardis archive")
+        magic, version, self.scale, self._count, _, n_strings, _ = _HEADER.unpack_from(self._data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{self.path} is not a version {FORMAT_VERSION} Sardis archive")
+        self._heap = _map(heap_path)
+        strings = _map(strings_path)
+        self.strings = _read_strings(strings, n_strings) if strings is not None else []
+        if strings is not None:
+            strings.close()
+
+        self._index = _map(index_path)
+        self._indexed = 0
+        self._index_view = memoryview(b"")
+        empty = memoryview(b"").cast("Q")
+        self._id_hashes = self._id_recnos = self._time_recnos = empty
+        self._times = memoryview(b"").cast("q")
+        if self._index is not None:
+            magic, indexed = _INDEX_HEADER.unpack_from(self._index)
+            if magic == _INDEX_MAGIC:
+                self._indexed = min(indexed, self._count)
+                view = self._index_view = memoryview(self._index)[_INDEX_HEADER.size:]
+                width = indexed * 8
+                self._id_hashes = view[:width].cast("Q")
+                self._id_recnos = view[width:2 * width].cast("Q")
+                self._times = view[2 * width:3 * width].cast("q")
+                self._time_recnos = view[3 * width:4 * width].cast("Q")
+
+    def __enter__(self) -> ArchiveReader:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for recno in range(self._count):
+            yield self[recno]
+
+    def __getitem__(self, recno: int) -> dict[str, Any]:
+        if not 0 <= recno < self._count:
+            raise IndexError(recno)
+        created, amount, currency, chain, from_wallet, to_wallet, kind, length, offset = self._record(recno)
+        record = json.loads(self._heap[offset:offset + length]) if length else {}
+        if kind == 0:
+            record.update({
+                "amount": self._decimal(amount),
+                "currency": self._string(currency),
+                "chain": self._string(chain),
+                "from_wallet": self._string(from_wallet),
+                "to_wallet": self._string(to_wallet),
+                "created_at": _EPOCH + created * _MICROSECOND,
+            })
+        record["_kind"] = RECORD_KINDS[kind]
+        return record
+
+    def _record(self, recno: int) -> tuple[int, ...]:
+        return _RECORD.unpack_from(self._data, _HEADER.size + recno * _RECORD.size)
+
+    def _string(self, code: int) -> str | None:
+        return self.strings[code] if code >= 0 else None
+
+    def _decimal(self, minor: int) -> Decimal:
+        return Decimal(minor).scaleb(-self.scale)
+
+    def record_id(self, recno: int) -> str:
+        """ID of a record (``tx_id`` for ledger entries) without decoding all of it."""
+        *_, length, offset = self._record(recno)
+        return _record_id(json.loads(self._heap[offset:offset + length]))
+
+    def get(self, record_id: str) -> dict[str, Any] | None:
+        """Look up a record by ID in O(log n)."""
+        target = _id_hash(record_id)
+        pos = bisect_left(self._id_hashes, target)
+        while pos < len(self._id_hashes) and self._id_hashes[pos] == target:
+            recno = self._id_recnos[pos]
+            if self.record_id(recno) == record_id:
+                return self[recno]
+            pos += 1
+        for recno in range(self._indexed, self._count):
+            if self.record_id(recno) == record_id:
+                return self[recno]
+        return None
+
+    def between(self, start: datetime | None = None, end: datetime | None = None) -> Iterator[dict[str, Any]]:
+        """Records with a timestamp in ``[start, end)``, oldest first."""
+        lo = to_epoch_micros(start) if start is not None else -(2**63)
+        hi = to_epoch_micros(end) if end is not None else 2**63 - 1
+        recnos = [
+            self._time_recnos[i]
+            for i in range(bisect_left(self._times, lo), bisect_left(self._times, hi))
+        ]
+        tail = [
+            (created, recno)
+            for recno in range(self._indexed, self._count)
+            if lo <= (created := self._record(recno)[0]) < hi
+        ]
+        if tail:
+            merged = sorted([(self._record(r)[0], r) for r in recnos] + tail)
+            recnos = [r for _, r in merged]
+        for recno in recnos:
+            yield self[recno]
+
+    def to_numpy(self) -> np.ndarray:
+        """Zero-copy NumPy view of the fixed-width columns.
+
+        The view borrows the reader's memory map; drop it before :meth:`close`.
+        Decode ``currency``/``chain``/``from_wallet``/``to_wallet`` codes with
+        :attr:`strings`; ``amount`` is in minor units of :attr:`scale`.
+        """
+        np = _require_numpy()
+        dtype = np.dtype([
+            ("created_at", "<i8"), ("amount", "<i8"), ("currency", "<i4"), ("chain", "<i4"),
+            ("from_wallet", "<i4"), ("to_wallet", "<i4"), ("kind", "<i4"),
+            ("payload_length", "<u4"), ("payload_offset", "<u8"),
+        ])
+        return np.frombuffer(self._data, dtype=dtype, count=self._count, offset=_HEADER.size)
+
+    def close(self) -> None:
+        """Release the memory maps."""
+        for view in (self._id_hashes, self._id_recnos, self._times, self._time_recnos, self._index_view):
+            view.release()
+        for mapped in (self._data, self._heap, self._index):
+            if mapped is not None:
+                mapped.close()
+
+
+_CONTAINER_KEYS = ("entries", "events", "packets", "decisions", "items")
+
+
+def _iter_export(data: Any) -> Iterator[dict[str, Any]]:
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_export(item)
+    elif isinstance(data, dict):
+        for key in _CONTAINER_KEYS:
+            if isinstance(data.get(key), list):
+                yield from _iter_export(data[key])
+                return
+        yield data
+
+
+def convert_json_exports(
+    sources: Iterable[str | os.PathLike[str]],
+    path: str | os.PathLike[str],
+    scale: int = DEFAULT_SCALE,
+) -> int:
+    """Append existing JSON/JSONL exports to an archive.
+
+    Accepts ledger listings (``{"entries": [...]}`` or a list), single audit
+    packets, and event exports (``{"events": [...]}``). Records with
+    ``tx_id``, ``amount`` and ``currency`` are stored as ledger entries;
+    everything else as audit packets.
+
+    Args:
+        sources: JSON or JSONL files
+        path: Archive base path (created or appended to)
+        scale: Fractional digits kept for amounts
+
+    Returns:
+        Number of records appended
+    """
+    appended = 0
+    with ArchiveWriter(path, scale=scale) as writer:
+        for source in sources:
+            with open(source) as f:
+                if str(source).endswith(".jsonl"):
+                    documents = (json.loads(line) for line in f if line.strip())
+                else:
+                    documents = iter([json.load(f)])
+                for document in documents:
+                    for record in _iter_export(document):
+                        if {"tx_id", "amount", "currency"} <= record.keys():
+                            writer.append_ledger_entry(record)
+                        else:
+                            writer.append_audit_packet(record)
+                        appended += 1
+    return appended
+
+
+__all__ = [
+    "FORMAT_VERSION",
+    "RECORD_KINDS",
+    "ArchiveReader",
+    "ArchiveWriter",
+    "convert_json_exports",
+]
@@ -0,0 +1,488 @@
+"""
+Parallel verification of signed audit packets.
+
+``evidence.export_decision``, ``facility_gate.export_audit`` and
+``facility_gate.export_events`` return packets from Sardis' append-only
+signed audit trail. :class:`AuditVerifier` and :class:`AsyncAuditVerifier`
+check a stream of them:
+
+- each packet's ``hash`` is the SHA-256 of its canonical JSON (sorted keys,
+  compact separators, without ``hash`` and ``signature``)
+- each packet's ``prev_hash`` equals the previous packet's ``hash``
+- each ``signature`` is a valid Ed25519 signature of the claimed ``hash``
+  digest by the key named in ``key_id``
+
+The stream is cut into segments that are verified in worker processes; the
+links between segments are checked as segments are dispatched. Public keys
+are fetched once through ``evidence.get_signing_key`` and kept in a
+:class:`SigningKeyCache`, which can persist to disk.
+
+Signature checks require ``cryptography`` (``pip install "sardis[audit]"``).
+
+Example:
+    ```python
+    verifier = AuditVerifier(client.evidence, key_cache=SigningKeyCache(path="keys.json"))
+    report = verifier.verify(
+        client.facility_gate.export_events(occurred_from="2026-01-01", limit=500)["events"]
+    )
+    assert report.ok, report.failures[:10]
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .archive import _iter_export
+from .models.errors import NotFoundError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Iterable, Iterator, Mapping
+
+    from .resources.evidence import AsyncEvidenceResource, EvidenceResource
+
+# Fields not covered by a packet's own hash.
+HASH_EXCLUDED_FIELDS = frozenset({"hash", "signature"})
+
+_ID_FIELDS = ("packet_id", "event_id", "decision_id", "request_id", "id")
+
+
+def _require_cryptography() -> Any:
+    try:
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+    except ImportError:
+        raise ImportError(
+            "cryptography is required for audit signature verification. "
+            "Install with: pip install 'sardis[audit]'"
+        )
+    return ed25519
+
+
+def _decode(value: str | bytes) -> bytes:
+    """Decode a hex (optionally 0x-prefixed) or base64/base64url string."""
+    if isinstance(value, bytes):
+        return value
+    text = value.removeprefix("0x")
+    try:
+        return bytes.fromhex(text)
+    except ValueError:
+        pass
+    try:
+        return base64.urlsafe_b64decode(text.replace("+", "-").replace("/", "_") + "=" * (-len(text) % 4))
+    except (binascii.Error, ValueError):
+        raise ValueError(f"Not a hex or base64 value: {value[:16]!r}...")
+
+
+def packet_hash(packet: dict[str, Any]) -> bytes:
+    """SHA-256 digest of a packet's canonical JSON."""
+    body = {k: v for k, v in packet.items() if k not in HASH_EXCLUDED_FIELDS}
+    return hashlib.sha256(json.dumps(body, sort_keys=True, separators=(",", ":"), default=str).encode()).digest()
+
+
+def _packet_id(packet: dict[str, Any]) -> str | None:
+    return next((str(packet[f]) for f in _ID_FIELDS if packet.get(f)), None)
+
+
+def _same_hash(a: str | None, b: str | None) -> bool:
+    if a is None or b is None:
+        return False
+    try:
+        return _decode(a) == _decode(b)
+    except ValueError:
+        return a == b
+
+
+def _verify_segment(
+    packets: list[dict[str, Any]],
+    indices: list[int],
+    keys: dict[str, bytes | None],
+    verify_signatures: bool,
+) -> list[tuple[int, str | None, str]]:
+    """Verify hashes, in-segment chain links and signatures.
+
+    Top-level so it can run in a worker process. Returns
+    ``(stream index, packet id, reason)`` for every failure.
+    """
+    failures: list[tuple[int, str | None, str]] = []
+    public_keys: dict[str, Any] = {}
+    if verify_signatures:
+        ed25519 = _require_cryptography()
+        from cryptography.exceptions import InvalidSignature
+
+    previous: str | None = None
+    for position, (index, packet) in enumerate(zip(indices, packets, strict=True)):
+        pid = _packet_id(packet)
+        claimed = packet.get("hash")
+        signed: bytes | None = None
+        try:
+            if not claimed:
+                failures.append((index, pid, "packet has no hash"))
+            else:
+                signed = _decode(claimed)
+                if signed != packet_hash(packet):
+                    failures.append((index, pid, "hash does not match packet contents"))
+        except ValueError:
+            failures.append((index, pid, "hash is not hex or base64"))
+
+        if position and not _same_hash(packet.get("prev_hash"), previous):
+            failures.append((index, pid, "prev_hash does not link to the previous packet"))
+        previous = claimed
+
+        if not verify_signatures or signed is None:
+            continue
+        signature, key_id = packet.get("signature"), packet.get("key_id")
+        if not signature:
+            failures.append((index, pid, "packet is not signed"))
+            continue
+        raw_key = keys.get(key_id) if key_id else None
+        if raw_key is None:
+            failures.append((index, pid, f"unknown signing key {key_id!r}"))
+            continue
+        if key_id not in public_keys:
+            public_keys[key_id] = ed25519.Ed25519PublicKey.from_public_bytes(raw_key)
+        try:
+            public_keys[key_id].verify(_decode(signature), signed)
+        except (InvalidSignature, ValueError):
+            failures.append((index, pid, "invalid signature"))
+    return failures
+
+
+class SigningKeyCache:
+    """Raw Ed25519 public keys by ``key_id``, optionally persisted as JSON.
+
+    Args:
+        keys: Keys to trust up front (hex, base64 or PEM)
+        path: JSON file to load from and :meth:`save` to
+    """
+
+    def __init__(
+        self,
+        keys: Mapping[str, str | bytes] | None = None,
+        path: str | os.PathLike[str] | None = None,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self._keys: dict[str, bytes] = {}
+        if self.path is not None and self.path.exists():
+            for key_id, value in json.loads(self.path.read_text()).items():
+                self._keys[key_id] = bytes.fromhex(value)
+        for key_id, value in (keys or {}).items():
+            self.put(key_id, value)
+
+    def __contains__(self, key_id: object) -> bool:
+        return key_id in self._keys
+
+    def get(self, key_id: str) -> bytes | None:
+        """Raw public key bytes, or None if unknown."""
+        return self._keys.get(key_id)
+
+    def put(self, key_id: str, material: str | bytes) -> None:
+        """Add a key given as raw bytes, hex, base64 or PEM."""
+        if isinstance(material, str) and material.lstrip().startswith("-----BEGIN"):
+            _require_cryptography()
+            from cryptography.hazmat.primitives import serialization
+
+            key = serialization.load_pem_public_key(material.encode())
+            raw = key.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+        else:
+            raw = _decode(material)
+        if len(raw) != 32:
+            raise ValueError(f"Signing key {key_id!r} is not a 32-byte Ed25519 public key")
+        self._keys[key_id] = raw
+
+    def save(self) -> None:
+        """Write the cache to its path, atomically."""
+        if self.path is None:
+            raise ValueError("SigningKeyCache has no path")
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        tmp.write_text(json.dumps({k: v.hex() for k, v in self._keys.items()}, indent=2))
+        os.replace(tmp, self.path)
+
+
+def _key_material(response: dict[str, Any]) -> str | None:
+    return response.get("public_key") or response.get("key")
+
+
+@dataclass(frozen=True)
+class AuditFailure:
+    """A packet that failed verification.
+
+    Attributes:
+        index: Position of the packet in the verified stream
+        packet_id: Packet identifier, if it has one
+        reason: Why verification failed
+    """
+
+    index: int
+    packet_id: str | None
+    reason: str
+
+
+@dataclass
+class AuditVerificationReport:
+    """Outcome of verifying an audit packet stream.
+
+    Attributes:
+        checked: Packets checked
+        segments: Segments dispatched to workers
+        failures: Packets that failed, in stream order
+    """
+
+    checked: int = 0
+    segments: int = 0
+    failures: list[AuditFailure] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every packet verified."""
+        return not self.failures
+
+
+@dataclass
+class _Chain:
+    packets: list[dict[str, Any]] = field(default_factory=list)
+    indices: list[int] = field(default_factory=list)
+    last_hash: str | None = None
+
+
+class _AuditVerifierBase:
+    def __init__(
+        self,
+        key_cache: SigningKeyCache | None,
+        max_workers: int | None,
+        segment_size: int,
+        verify_signatures: bool,
+        chain_field: str | None,
+    ) -> None:
+        self.key_cache = key_cache if key_cache is not None else SigningKeyCache()
+        self.max_workers = max_workers
+        self.segment_size = segment_size
+        self.verify_signatures = verify_signatures
+        self.chain_field = chain_field
+        if verify_signatures:
+            _require_cryptography()
+
+    def _executor(self) -> Executor | None:
+        # max_workers=0 verifies in the calling process (small exports, tests).
+        return None if self.max_workers == 0 else ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _chain_of(self, chains: dict[Any, _Chain], packet: dict[str, Any]) -> _Chain:
+        key = packet.get(self.chain_field) if self.chain_field else None
+        return chains.setdefault(key, _Chain())
+
+    def _cut(self, chain: _Chain, report: AuditVerificationReport) -> tuple[list[dict[str, Any]], list[int], set[str]]:
+        """Take the chain's buffered segment, checking its link to the previous one."""
+        packets, indices = chain.packets, chain.indices
+        chain.packets, chain.indices = [], []
+        first = packets[0]
+        if chain.last_hash is not None and not _same_hash(first.get("prev_hash"), chain.last_hash):
+            report.failures.append(
+                AuditFailure(indices[0], _packet_id(first), "prev_hash does not link to the previous packet")
+            )
+        chain.last_hash = packets[-1].get("hash")
+        report.segments += 1
+        key_ids = {p["key_id"] for p in packets if p.get("key_id")} if self.verify_signatures else set()
+        return packets, indices, key_ids
+
+    def _keys_for(self, key_ids: set[str]) -> dict[str, bytes | None]:
+        return {key_id: self.key_cache.get(key_id) for key_id in key_ids}
+
+    @staticmethod
+    def _collect(report: AuditVerificationReport, failures: list[tuple[int, str | None, str]]) -> None:
+        report.failures.extend(AuditFailure(*failure) for failure in failures)
+
+    @staticmethod
+    def _finish(report: AuditVerificationReport) -> AuditVerificationReport:
+        report.failures.sort(key=lambda f: f.index)
+        return report
+
+
+def _flatten(items: Iterable[Any]) -> Iterator[dict[str, Any]]:
+    for item in items:
+        yield from _iter_export(item)
+
+
+class AuditVerifier(_AuditVerifierBase):
+    """Verifies audit packet hash chains and signatures (sync client).
+
+    Args:
+        evidence: ``client.evidence`` used to fetch unknown signing keys, or
+            None to rely on ``key_cache`` alone
+        key_cache: Public key cache (a fresh in-memory cache by default)
+        max_workers: Worker processes (``None`` = CPU count, ``0`` = in process)
+        segment_size: Packets per worker task
+        verify_signatures: Also verify Ed25519 signatures
+        chain_field: Packet field that separates independent chains (one chain
+            per value); by default the whole stream is one chain
+    """
+
+    def __init__(
+        self,
+        evidence: EvidenceResource | None = None,
+        key_cache: SigningKeyCache | None = None,
+        max_workers: int | None = None,
+        segment_size: int = 10_000,
+        verify_signatures: bool = True,
+        chain_field: str | None = None,
+    ) -> None:
+        super().__init__(key_cache, max_workers, segment_size, verify_signatures, chain_field)
+        self._evidence = evidence
+
+    def _resolve(self, key_ids: set[str]) -> dict[str, bytes | None]:
+        for key_id in key_ids:
+            if key_id in self.key_cache or self._evidence is None:
+                continue
+            try:
+                material = _key_material(self._evidence.get_signing_key(key_id))
+            except NotFoundError:
+                continue
+            if material:
+                self.key_cache.put(key_id, material)
+        return self._keys_for(key_ids)
+
+    def verify(self, packets: Iterable[Any]) -> AuditVerificationReport:
+        """Verify packets or export responses (``{"events": [...]}`` etc.) in stream order.
+
+        Returns:
+            Report of checked packets and failures
+        """
+        report = AuditVerificationReport()
+        chains: dict[Any, _Chain] = {}
+        executor = self._executor()
+        futures: list[Future[list[tuple[int, str | None, str]]]] = []
+
+        def dispatch(chain: _Chain) -> None:
+            segment, indices, key_ids = self._cut(chain, report)
+            job = (segment, indices, self._resolve(key_ids), self.verify_signatures)
+            if executor is None:
+                self._collect(report, _verify_segment(*job))
+            else:
+                futures.append(executor.submit(_verify_segment, *job))
+
+        try:
+            for index, packet in enumerate(_flatten(packets)):
+                chain = self._chain_of(chains, packet)
+                chain.packets.append(packet)
+                chain.indices.append(index)
+                report.checked += 1
+                if len(chain.packets) >= self.segment_size:
+                    dispatch(chain)
+            for chain in chains.values():
+                if chain.packets:
+                    dispatch(chain)
+            for future in futures:
+                self._collect(report, future.result())
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        return self._finish(report)
+
+
+class AsyncAuditVerifier(_AuditVerifierBase):
+    """Verifies audit packet hash chains and signatures (async client).
+
+    Args:
+        evidence: ``client.evidence`` used to fetch unknown signing keys, or
+            None to rely on ``key_cache`` alone
+        key_cache: Public key cache (a fresh in-memory cache by default)
+        max_workers: Worker processes (``None`` = CPU count, ``0`` = in process)
+        segment_size: Packets per worker task
+        verify_signatures: Also verify Ed25519 signatures
+        chain_field: Packet field that separates independent chains (one chain
+            per value); by default the whole stream is one chain
+    """
+
+    def __init__(
+        self,
+        evidence: AsyncEvidenceResource | None = None,
+        key_cache: SigningKeyCache | None = None,
+        max_workers: int | None = None,
+        segment_size: int = 10_000,
+        verify_signatures: bool = True,
+        chain_field: str | None = None,
+    ) -> None:
+        super().__init__(key_cache, max_workers, segment_size, verify_signatures, chain_field)
+        self._evidence = evidence
+
+    async def _resolve(self, key_ids: set[str]) -> dict[str, bytes | None]:
+        missing = [k for k in key_ids if k not in self.key_cache]
+        if missing and self._evidence is not None:
+            responses = await asyncio.gather(
+                *(self._evidence.get_signing_key(k) for k in missing), return_exceptions=True
+            )
+            for key_id, response in zip(missing, responses, strict=True):
+                if isinstance(response, NotFoundError):
+                    continue
+                if isinstance(response, BaseException):
+                    raise response
+                material = _key_material(response)
+                if material:
+                    self.key_cache.put(key_id, material)
+        return self._keys_for(key_ids)
+
+    async def verify(self, packets: Iterable[Any] | AsyncIterable[Any]) -> AuditVerificationReport:
+        """Verify packets or export responses in stream order.
+
+        Accepts a plain iterable or an async iterable, so packets can be
+        verified while an export is still streaming in.
+
+        Returns:
+            Report of checked packets and failures
+        """
+        report = AuditVerificationReport()
+        chains: dict[Any, _Chain] = {}
+        executor = self._executor()
+        loop = asyncio.get_running_loop()
+        pending: list[asyncio.Future[list[tuple[int, str | None, str]]]] = []
+        index = 0
+
+        async def dispatch(chain: _Chain) -> None:
+            segment, indices, key_ids = self._cut(chain, report)
+            job = (segment, indices, await self._resolve(key_ids), self.verify_signatures)
+            pending.append(loop.run_in_executor(executor, _verify_segment, *job))
+
+        async def add(item: Any) -> None:
+            nonlocal index
+            for packet in _iter_export(item):
+                chain = self._chain_of(chains, packet)
+                chain.packets.append(packet)
+                chain.indices.append(index)
+                index += 1
+                report.checked += 1
+                if len(chain.packets) >= self.segment_size:
+                    await dispatch(chain)
+
+        try:
+            if hasattr(packets, "__aiter__"):
+                async for item in packets:
+                    await add(item)
+            else:
+                for item in packets:
+                    await add(item)
+            for chain in chains.values():
+                if chain.packets:
+                    await dispatch(chain)
+            for failures in await asyncio.gather(*pending):
+                self._collect(report, failures)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+        return self._finish(report)
+
+
+__all__ = [
+    "HASH_EXCLUDED_FIELDS",
+    "AsyncAuditVerifier",
+    "AuditFailure",
+    "AuditVerificationReport",
+    "AuditVerifier",
+    "SigningKeyCache",
+    "packet_hash",
+]
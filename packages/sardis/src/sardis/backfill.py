@@ -0,0 +1,582 @@
+"""
+Backfilling webhook deliveries after an outage.
+
+A :class:`WebhookBackfill` (or :class:`AsyncWebhookBackfill`) pages through
+``webhooks.paginate_deliveries`` for several webhooks at once, bounded by
+``concurrency``, and keeps the attempts made within a time window. From
+those it finds two kinds of gap:
+
+- **failed**: every attempt to deliver an event to a webhook failed.
+- **missing**: an event reached one of the scanned webhooks but never
+  another that subscribes to its type.
+
+Gaps are then either replayed into the local handler pipeline (a
+:class:`~sardis.webhooks.WebhookReceiver` or any callable taking a
+:class:`~sardis.models.webhook.WebhookEvent`) or sent again by Sardis
+through ``webhooks.redeliver``. Both run with bounded concurrency.
+
+Processing is idempotent. Replay handles each event once, however many
+webhooks missed it, and once its handlers succeed marks it seen in the
+receiver's dedupe LRU so a late live delivery is not handled twice. Replay
+needs the event payload recorded with a delivery; items without one fail
+with :class:`BackfillPayloadMissingError` and should be redelivered
+instead. With ``state_path`` set,
+completed items are appended to a file and skipped when the backfill is
+run again. Progress (deliveries scanned, items processed, rates) is
+available from :meth:`~WebhookBackfill.progress` and pushed to
+``on_progress``.
+
+Example:
+    ```python
+    async with AsyncSardis(api_key="...") as client:
+        backfill = AsyncWebhookBackfill(
+            client,
+            ["wh_orders", "wh_ledger"],
+            since=outage_start,
+            until=outage_end,
+            state_path="backfill.state",
+            on_progress=lambda p: print(f"{p.processed}/{p.found} ({p.items_per_second:.0f}/s)"),
+        )
+        await backfill.scan()
+        result = await backfill.replay(receiver)    # or: await backfill.redeliver()
+        print(len(result.processed), "replayed,", len(result.failed), "failed")
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .models.errors import NotFoundError, SardisError
+from .models.webhook import Webhook, WebhookDelivery, WebhookEvent
+from .webhooks import WebhookReceiver
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from .client import AsyncSardis, Sardis
+
+logger = logging.getLogger("sardis_sdk.backfill")
+
+
+@dataclass(frozen=True)
+class BackfillItem:
+    """An event that did not reach a webhook.
+
+    Attributes:
+        webhook_id: Webhook the event should have reached
+        event_id: The event
+        event_type: The event's type
+        reason: ``"failed"`` (every attempt failed) or ``"missing"`` (no
+            attempt to this webhook, but one to another)
+        delivery: Latest attempt to this webhook, or for ``"missing"`` an
+            attempt to another webhook
+    """
+
+    webhook_id: str
+    event_id: str
+    event_type: str
+    reason: str
+    delivery: WebhookDelivery
+
+    def to_event(self) -> WebhookEvent:
+        """The event as handlers receive it.
+
+        Raises:
+            BackfillPayloadMissingError: If the delivery recorded no payload
+        """
+        if self.delivery.payload is None:
+            raise BackfillPayloadMissingError(
+                f"No payload recorded for {self.event_id}; use redeliver() to have Sardis send it again",
+                details={"event_id": self.event_id, "webhook_id": self.webhook_id},
+            )
+        return WebhookEvent.model_validate({
+            "id": self.event_id,
+            "event_type": self.event_type,
+            "payload": self.delivery.payload,
+            "created_at": self.delivery.created_at,
+        })
+
+
+@dataclass(frozen=True)
+class BackfillProgress:
+    """Point-in-time progress of a backfill.
+
+    Attributes:
+        webhooks: Webhooks fully scanned
+        deliveries: Delivery attempts scanned inside the window
+        found: Items found by the scan
+        processed: Items replayed or redelivered
+        skipped: Items skipped because they were already processed
+        failed: Items whose replay or redelivery failed
+        elapsed: Seconds since the backfill started
+    """
+
+    webhooks: int
+    deliveries: int
+    found: int
+    processed: int
+    skipped: int
+    failed: int
+    elapsed: float
+
+    @property
+    def deliveries_per_second(self) -> float:
+        """Scan throughput."""
+        return self.deliveries / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        """Replay or redelivery throughput."""
+        return (self.processed + self.failed) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class BackfillResult:
+    """Outcome of :meth:`~WebhookBackfill.replay` or :meth:`~WebhookBackfill.redeliver`."""
+
+    processed: list[BackfillItem] = field(default_factory=list)
+    skipped: list[BackfillItem] = field(default_factory=list)
+    failed: list[tuple[BackfillItem, Exception]] = field(default_factory=list)
+
+
+class BackfillHandlerError(SardisError):
+    """A receiver's handlers failed for a replayed event (details are in the receiver's log)."""
+
+    default_message = "Webhook handlers failed for a replayed event"
+
+
+class BackfillPayloadMissingError(SardisError):
+    """A missed event cannot be replayed because no delivery recorded its payload."""
+
+    default_message = "No payload recorded for the event; redeliver it instead"
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+class _BackfillBase:
+    def __init__(
+        self,
+        webhook_ids: Iterable[str],
+        since: datetime,
+        until: datetime | None,
+        concurrency: int,
+        page_size: int,
+        state_path: str | os.PathLike[str] | None,
+        on_progress: Callable[[BackfillProgress], None] | None,
+        clock: Callable[[], float],
+    ) -> None:
+        self.webhook_ids = list(dict.fromkeys(webhook_ids))
+        self.since = _aware(since)
+        self.until = _aware(until) if until is not None else None
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.items: list[BackfillItem] = []
+        self._state_path = Path(state_path).expanduser() if state_path is not None else None
+        self._done: set[str] = set()
+        if self._state_path is not None and self._state_path.exists():
+            self._done = {line for line in self._state_path.read_text().splitlines() if line}
+        self._on_progress = on_progress
+        self._clock = clock
+        self._started = clock()
+        self._lock = threading.Lock()
+        self._webhooks_scanned = 0
+        self._deliveries = 0
+        self._processed = 0
+        self._skipped = 0
+        self._failed = 0
+
+    def progress(self) -> BackfillProgress:
+        """Current progress."""
+        with self._lock:
+            return BackfillProgress(
+                webhooks=self._webhooks_scanned,
+                deliveries=self._deliveries,
+                found=len(self.items),
+                processed=self._processed,
+                skipped=self._skipped,
+                failed=self._failed,
+                elapsed=self._clock() - self._started,
+            )
+
+    def _report(self) -> None:
+        if self._on_progress is not None:
+            self._on_progress(self.progress())
+
+    def _in_window(self, delivery: WebhookDelivery) -> bool:
+        created = _aware(delivery.created_at)
+        return created >= self.since and (self.until is None or created < self.until)
+
+    def _scanned_page(self, count: int) -> None:
+        with self._lock:
+            self._deliveries += count
+        self._report()
+
+    def _scanned_webhook(self) -> None:
+        with self._lock:
+            self._webhooks_scanned += 1
+        self._report()
+
+    def _analyse(
+        self,
+        webhooks: dict[str, Webhook | None],
+        deliveries: dict[str, list[WebhookDelivery]],
+    ) -> list[BackfillItem]:
+        items: list[BackfillItem] = []
+        events: dict[str, WebhookDelivery] = {}
+        by_webhook: dict[str, dict[str, list[WebhookDelivery]]] = {}
+        for webhook_id in self.webhook_ids:
+            attempts: dict[str, list[WebhookDelivery]] = {}
+            for delivery in deliveries.get(webhook_id, []):
+                attempts.setdefault(delivery.event_id, []).append(delivery)
+                known = events.get(delivery.event_id)
+                if known is None or (known.payload is None and delivery.payload is not None):
+                    events[delivery.event_id] = delivery
+            by_webhook[webhook_id] = attempts
+            for event_id, tries in attempts.items():
+                if not any(t.success for t in tries):
+                    latest = max(tries, key=lambda t: (t.attempt_number, _aware(t.created_at)))
+                    items.append(BackfillItem(webhook_id, event_id, latest.event_type, "failed", latest))
+
+        for webhook_id in self.webhook_ids:
+            webhook = webhooks.get(webhook_id)
+            if webhook is None:
+                continue
+            subscribed = set(webhook.events)
+            for event_id, delivery in events.items():
+                if event_id in by_webhook[webhook_id]:
+                    continue
+                if "*" in subscribed or delivery.event_type in subscribed:
+                    items.append(BackfillItem(webhook_id, event_id, delivery.event_type, "missing", delivery))
+
+        items.sort(key=lambda item: _aware(item.delivery.created_at))
+        return items
+
+    def _pending(self, items: list[BackfillItem] | None, replay: bool, result: BackfillResult) -> list[tuple[str, BackfillItem]]:
+        """Items still to process with their idempotency keys; others go to ``result.skipped``."""
+        pending: dict[str, BackfillItem] = {}
+        for item in self.items if items is None else items:
+            # Replay handles an event once for all webhooks; redelivery is per webhook.
+            key = f"replay:{item.event_id}" if replay else f"redeliver:{item.webhook_id}:{item.event_id}"
+            known = pending.get(key)
+            if key in self._done:
+                self._skip(item, result)
+            elif known is None:
+                pending[key] = item
+            elif replay and known.delivery.payload is None and item.delivery.payload is not None:
+                # Replay the copy that carries the event's payload.
+                pending[key] = item
+                self._skip(known, result)
+            else:
+                self._skip(item, result)
+        return list(pending.items())
+
+    def _record(self, key: str) -> None:
+        """Mark an item done (caller holds the lock)."""
+        self._done.add(key)
+        if self._state_path is not None:
+            with self._state_path.open("a") as f:
+                f.write(key + "\n")
+
+    def _skip(self, item: BackfillItem, result: BackfillResult, key: str | None = None) -> None:
+        result.skipped.append(item)
+        with self._lock:
+            self._skipped += 1
+            if key is not None:
+                self._record(key)
+
+    def _finish(self, key: str, item: BackfillItem, error: Exception | None, result: BackfillResult) -> None:
+        with self._lock:
+            if error is None:
+                self._record(key)
+                result.processed.append(item)
+                self._processed += 1
+            else:
+                result.failed.append((item, error))
+                self._failed += 1
+        if error is not None:
+            logger.debug("backfill of %s to %s failed", item.event_id, item.webhook_id, exc_info=error)
+        self._report()
+
+
+class WebhookBackfill(_BackfillBase):
+    """Find and re-drive missed webhook deliveries (sync client).
+
+    Args:
+        client: A sync :class:`~sardis.Sardis` client
+        webhook_ids: Webhooks to scan
+        since: Start of the window (naive datetimes are UTC)
+        until: End of the window (exclusive); None for now
+        concurrency: Webhooks scanned and items processed at the same time
+        page_size: Deliveries fetched per request
+        state_path: File recording processed items across runs
+        on_progress: Called with a :class:`BackfillProgress` after every
+            page and every processed item
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        client: Sardis,
+        webhook_ids: Iterable[str],
+        since: datetime,
+        until: datetime | None = None,
+        *,
+        concurrency: int = 8,
+        page_size: int = 100,
+        state_path: str | os.PathLike[str] | None = None,
+        on_progress: Callable[[BackfillProgress], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(webhook_ids, since, until, concurrency, page_size, state_path, on_progress, clock)
+        self._client = client
+
+    def _scan_one(self, webhook_id: str) -> tuple[Webhook | None, list[WebhookDelivery]]:
+        try:
+            webhook: Webhook | None = self._client.webhooks.get(webhook_id)
+        except NotFoundError:
+            logger.warning("webhook %s not found; checking failed deliveries only", webhook_id)
+            webhook = None
+        kept: list[WebhookDelivery] = []
+        paginator = self._client.webhooks.paginate_deliveries(
+            webhook_id, created_from=self.since, created_to=self.until, page_size=self.page_size
+        )
+        for page in paginator.pages():
+            batch = [d for d in page.items if self._in_window(d)]
+            kept.extend(batch)
+            self._scanned_page(len(batch))
+        self._scanned_webhook()
+        return webhook, kept
+
+    def scan(self) -> list[BackfillItem]:
+        """Page through every webhook's deliveries and find the gaps.
+
+        Returns:
+            Failed and missing items, oldest first (also kept in ``items``)
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            scanned = list(pool.map(self._scan_one, self.webhook_ids))
+        self.items = self._analyse(
+            {w: s[0] for w, s in zip(self.webhook_ids, scanned, strict=True)},
+            {w: s[1] for w, s in zip(self.webhook_ids, scanned, strict=True)},
+        )
+        self._report()
+        return self.items
+
+    def _process(
+        self,
+        pending: list[tuple[str, BackfillItem]],
+        action: Callable[[BackfillItem], Any],
+        result: BackfillResult,
+    ) -> BackfillResult:
+        def run(entry: tuple[str, BackfillItem]) -> None:
+            key, item = entry
+            try:
+                action(item)
+            except Exception as e:
+                self._finish(key, item, e, result)
+            else:
+                self._finish(key, item, None, result)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            list(pool.map(run, pending))
+        return result
+
+    def replay(
+        self,
+        handler: Callable[[WebhookEvent], Any],
+        items: list[BackfillItem] | None = None,
+    ) -> BackfillResult:
+        """Pass each missed event to ``handler``, once per event.
+
+        Args:
+            handler: Called with the :class:`~sardis.models.webhook.WebhookEvent`;
+                raising marks the item failed
+            items: Items to replay (defaults to the last :meth:`scan`)
+
+        Items without a recorded payload fail with
+        :class:`BackfillPayloadMissingError`; pass them to :meth:`redeliver`.
+        """
+        result = BackfillResult()
+        return self._process(self._pending(items, True, result), lambda item: handler(item.to_event()), result)
+
+    def redeliver(self, items: list[BackfillItem] | None = None) -> BackfillResult:
+        """Have Sardis deliver each missed event to its webhook again.
+
+        Args:
+            items: Items to redeliver (defaults to the last :meth:`scan`)
+        """
+        result = BackfillResult()
+        return self._process(
+            self._pending(items, False, result),
+            lambda item: self._client.webhooks.redeliver(item.webhook_id, item.delivery.delivery_id),
+            result,
+        )
+
+
+class AsyncWebhookBackfill(_BackfillBase):
+    """Find and re-drive missed webhook deliveries (async client).
+
+    Args:
+        client: An :class:`~sardis.AsyncSardis` client
+        webhook_ids: Webhooks to scan
+        since: Start of the window (naive datetimes are UTC)
+        until: End of the window (exclusive); None for now
+        concurrency: Webhooks scanned and items processed at the same time
+        page_size: Deliveries fetched per request
+        state_path: File recording processed items across runs
+        on_progress: Called with a :class:`BackfillProgress` after every
+            page and every processed item
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        client: AsyncSardis,
+        webhook_ids: Iterable[str],
+        since: datetime,
+        until: datetime | None = None,
+        *,
+        concurrency: int = 8,
+        page_size: int = 100,
+        state_path: str | os.PathLike[str] | None = None,
+        on_progress: Callable[[BackfillProgress], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(webhook_ids, since, until, concurrency, page_size, state_path, on_progress, clock)
+        self._client = client
+
+    async def _scan_one(
+        self, webhook_id: str, semaphore: asyncio.Semaphore
+    ) -> tuple[Webhook | None, list[WebhookDelivery]]:
+        async with semaphore:
+            try:
+                webhook: Webhook | None = await self._client.webhooks.get(webhook_id)
+            except NotFoundError:
+                logger.warning("webhook %s not found; checking failed deliveries only", webhook_id)
+                webhook = None
+            kept: list[WebhookDelivery] = []
+            paginator = self._client.webhooks.paginate_deliveries(
+                webhook_id, created_from=self.since, created_to=self.until, page_size=self.page_size
+            )
+            async for page in paginator.pages():
+                batch = [d for d in page.items if self._in_window(d)]
+                kept.extend(batch)
+                self._scanned_page(len(batch))
+            self._scanned_webhook()
+            return webhook, kept
+
+    async def scan(self) -> list[BackfillItem]:
+        """Page through every webhook's deliveries concurrently and find the gaps.
+
+        Returns:
+            Failed and missing items, oldest first (also kept in ``items``)
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        scanned = await asyncio.gather(*(self._scan_one(w, semaphore) for w in self.webhook_ids))
+        self.items = self._analyse(
+            {w: s[0] for w, s in zip(self.webhook_ids, scanned, strict=True)},
+            {w: s[1] for w, s in zip(self.webhook_ids, scanned, strict=True)},
+        )
+        self._report()
+        return self.items
+
+    async def _process(
+        self,
+        pending: list[tuple[str, BackfillItem]],
+        action: Callable[[BackfillItem], Any],
+        result: BackfillResult,
+    ) -> BackfillResult:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(key: str, item: BackfillItem) -> None:
+            async with semaphore:
+                try:
+                    outcome = action(item)
+                    if inspect.isawaitable(outcome):
+                        await outcome
+                except Exception as e:
+                    self._finish(key, item, e, result)
+                else:
+                    self._finish(key, item, None, result)
+
+        await asyncio.gather(*(run(key, item) for key, item in pending))
+        return result
+
+    async def replay(
+        self,
+        target: WebhookReceiver | Callable[[WebhookEvent], Any],
+        items: list[BackfillItem] | None = None,
+    ) -> BackfillResult:
+        """Pass each missed event to the local handler pipeline, once per event.
+
+        With a :class:`~sardis.webhooks.WebhookReceiver`, events it has
+        already seen are skipped. The others are dispatched to its handlers
+        directly, bypassing the signature check and queue, and marked seen
+        once the handlers succeed; a failed event stays unseen so a later
+        live redelivery is still handled.
+
+        Args:
+            target: A receiver, or a callable (sync or async) taking the
+                :class:`~sardis.models.webhook.WebhookEvent`; raising marks
+                the item failed
+            items: Items to replay (defaults to the last :meth:`scan`)
+
+        Items without a recorded payload fail with
+        :class:`BackfillPayloadMissingError`; pass them to :meth:`redeliver`.
+        """
+        result = BackfillResult()
+        pending = self._pending(items, True, result)
+
+        if isinstance(target, WebhookReceiver):
+            receiver = target
+            fresh: list[tuple[str, BackfillItem]] = []
+            for key, item in pending:
+                if receiver.has_seen(item.event_id):
+                    self._skip(item, result, key)
+                else:
+                    fresh.append((key, item))
+            pending = fresh
+
+            async def dispatch(item: BackfillItem) -> None:
+                if not await receiver.dispatch(item.to_event()):
+                    raise BackfillHandlerError(f"handlers failed for {item.event_id}")
+                receiver.mark_seen(item.event_id)
+
+            return await self._process(pending, dispatch, result)
+        return await self._process(pending, lambda item: target(item.to_event()), result)
+
+    async def redeliver(self, items: list[BackfillItem] | None = None) -> BackfillResult:
+        """Have Sardis deliver each missed event to its webhook again.
+
+        Args:
+            items: Items to redeliver (defaults to the last :meth:`scan`)
+        """
+        result = BackfillResult()
+        return await self._process(
+            self._pending(items, False, result),
+            lambda item: self._client.webhooks.redeliver(item.webhook_id, item.delivery.delivery_id),
+            result,
+        )
+
+
+__all__ = [
+    "AsyncWebhookBackfill",
+    "BackfillHandlerError",
+    "BackfillItem",
+    "BackfillPayloadMissingError",
+    "BackfillProgress",
+    "BackfillResult",
+    "WebhookBackfill",
+]
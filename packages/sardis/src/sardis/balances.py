@@ -0,0 +1,260 @@
+"""
+Opt-in wallet balance cache for the Sardis SDK.
+
+Agent tools call ``wallets.get_balance`` before and after nearly every
+payment. With a :class:`BalanceCache` attached to the client, balances are
+served from memory for ``ttl`` seconds, and the client keeps the cache
+honest on its own writes:
+
+- ``wallets.transfer`` debits the cached balance of the sending wallet
+- ``holds.create``, ``holds.capture`` and ``holds.void`` drop the wallet's entries
+- ``pay.execute``, ``batch.execute`` and the ``payments.execute_*`` methods
+  (which do not name a wallet) drop every entry
+
+A write that raises (a timeout, or a 5xx after the server committed) may
+still have moved funds, so it drops the affected entries too. Each of these
+also bumps the wallet's generation (:meth:`BalanceCache.generation`), and a
+balance fetched under an older generation is not stored, so a GET that was
+in flight during a payment cannot write the pre-payment balance back.
+
+Webhook events can refresh it as well via :meth:`BalanceCache.apply_event`.
+
+Example:
+    ```python
+    client = AsyncSardis(api_key="...", balance_cache=True)
+    await client.wallets.get_balance("wallet_123")   # GET
+    await client.wallets.get_balance("wallet_123")   # cached
+    await client.wallets.transfer("wallet_123", destination="0x...", amount=Decimal("5"))
+    await client.wallets.get_balance("wallet_123")   # cached, 5 lower
+
+    # In a webhook handler
+    client.balance_cache.apply_event(event)
+    ```
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from .models.wallet import WalletBalance
+from .models.webhook import WebhookEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+_Key = tuple[str, str, str]
+
+# Webhook events that change a wallet's balance.
+BALANCE_EVENTS = frozenset({
+    "payment.completed",
+    "hold.created",
+    "hold.captured",
+    "hold.voided",
+    "hold.expired",
+    "wallet.funded",
+    "wallet.low_balance",
+})
+
+
+def _key(wallet_id: str, chain: str, token: str) -> _Key:
+    return wallet_id, chain.lower(), token.upper()
+
+
+@contextmanager
+def _invalidate_after(
+    cache: BalanceCache | None,
+    wallet_id: str | None = None,
+    *,
+    on_success: bool = True,
+) -> Iterator[None]:
+    """Drop cached balances of ``wallet_id`` around a write.
+
+    Writes that do not name the paying wallet (``pay``, ``batch`` and the
+    ``payments.execute_*`` methods) pass None, which drops every wallet.
+
+    Entries are dropped when the block raises as well as when it succeeds;
+    with ``on_success=False`` the caller updates the cache itself on success.
+    """
+    try:
+        yield
+    except BaseException:
+        if cache is not None:
+            cache.invalidate(wallet_id)
+        raise
+    if on_success and cache is not None:
+        cache.invalidate(wallet_id)
+
+
+class BalanceCache:
+    """TTL cache of wallet balances keyed by wallet, chain and token.
+
+    Thread-safe; one cache may be shared by several clients.
+
+    Args:
+        ttl: Seconds a fetched balance is served from the cache
+        max_entries: Least recently used entries beyond this are evicted
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 5.0,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[_Key, tuple[WalletBalance, float]] = OrderedDict()
+        # Bumped per wallet by debit/invalidate, and globally by clear.
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, wallet_id: str, chain: str, token: str) -> WalletBalance | None:
+        """Cached balance, or ``None`` if missing or expired."""
+        key = _key(wallet_id, chain, token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def generation(self, wallet_id: str) -> tuple[int, int]:
+        """Token to take before fetching a balance and pass to :meth:`put`."""
+        with self._lock:
+            return self._epoch, self._generations.get(wallet_id, 0)
+
+    def _bump(self, wallet_id: str | None) -> None:
+        """Supersede fetches in flight for a wallet (every wallet if None); caller holds the lock."""
+        if wallet_id is None:
+            self._epoch += 1
+        else:
+            self._generations[wallet_id] = self._generations.get(wallet_id, 0) + 1
+
+    def put(
+        self,
+        balance: WalletBalance,
+        wallet_id: str | None = None,
+        chain: str | None = None,
+        token: str | None = None,
+        *,
+        generation: tuple[int, int] | None = None,
+    ) -> bool:
+        """Store a freshly fetched balance.
+
+        The key defaults to the balance's own wallet, chain and token; pass
+        the requested values when the server may normalize them.
+
+        Args:
+            balance: The balance
+            wallet_id: Wallet the balance was requested for
+            chain: Chain it was requested for
+            token: Token it was requested for
+            generation: :meth:`generation` taken before the fetch. The balance
+                is dropped if the wallet was debited or invalidated since.
+                Without it the store is unconditional and supersedes fetches
+                in flight.
+
+        Returns:
+            Whether the balance was stored
+        """
+        key = _key(wallet_id or balance.wallet_id, chain or balance.chain, token or balance.token)
+        with self._lock:
+            if generation is None:
+                self._bump(key[0])
+            elif generation != (self._epoch, self._generations.get(key[0], 0)):
+                return False
+            self._entries[key] = (balance, self._clock() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def debit(self, wallet_id: str, chain: str, token: str, amount: Decimal) -> None:
+        """Subtract an outgoing amount from a cached balance, if one is cached."""
+        key = _key(wallet_id, chain, token)
+        with self._lock:
+            self._bump(key[0])
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            balance, expires = entry
+            adjusted = balance.model_copy(update={"balance": max(balance.balance - amount, Decimal(0))})
+            self._entries[key] = (adjusted, expires)
+
+    def invalidate(self, wallet_id: str | None = None, chain: str | None = None, token: str | None = None) -> int:
+        """Drop entries matching every given filter (all entries if none is given).
+
+        Returns:
+            Number of entries dropped
+        """
+        chain = chain.lower() if chain else None
+        token = token.upper() if token else None
+        with self._lock:
+            self._bump(wallet_id)
+            doomed = [
+                key for key in self._entries
+                if (wallet_id is None or key[0] == wallet_id)
+                and (chain is None or key[1] == chain)
+                and (token is None or key[2] == token)
+            ]
+            for key in doomed:
+                del self._entries[key]
+        return len(doomed)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._bump(None)
+            self._entries.clear()
+
+    def apply_event(self, event: WebhookEvent | dict[str, Any]) -> None:
+        """Update the cache from a webhook event.
+
+        Events carrying ``balance``, ``chain`` and ``token`` for a wallet
+        refresh the entry; other balance-changing events drop the wallet's
+        entries, or every entry when the event names no wallet.
+        """
+        if isinstance(event, WebhookEvent):
+            event_type, payload = event.event_type, event.payload
+        else:
+            event_type = event.get("event_type") or event.get("type") or ""
+            payload = event.get("payload") or event.get("data") or {}
+        if event_type not in BALANCE_EVENTS:
+            return
+
+        wallet_id = payload.get("wallet_id")
+        if wallet_id is None:
+            self.clear()
+            return
+        if all(payload.get(k) is not None for k in ("balance", "chain", "token")):
+            self.put(WalletBalance(
+                wallet_id=wallet_id,
+                chain=payload["chain"],
+                token=payload["token"],
+                balance=payload["balance"],
+                address=payload.get("address", ""),
+            ))
+        else:
+            self.invalidate(wallet_id)
+
+
+__all__ = [
+    "BALANCE_EVENTS",
+    "BalanceCache",
+]
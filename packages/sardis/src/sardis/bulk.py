@@ -26,6 +26,24 @@ T = TypeVar("T")  # Input type
 R = TypeVar("R")  # Result type
 
 
+@dataclass(frozen=True)
+class Missing:
+    """Placeholder for an ID that ``get_many`` could not find or fetch.
+
+    Falsy, so ``[item for item in results if item]`` keeps only found items.
+
+    Attributes:
+        id: The requested ID
+        error: Why the ID could not be fetched, or None if it does not exist
+    """
+
+    id: str
+    error: Exception | None = None
+
+    def __bool__(self) -> bool:
+        return False
+
+
 class OperationStatus(str, Enum):
     """Status of a bulk operation item."""
 
@@ -529,6 +547,7 @@ __all__ = [
     "BulkConfig",
     "BulkOperationResult",
     "BulkOperationSummary",
+    "Missing",
     "OperationResult",
     "OperationStatus",
     "SyncBulkExecutor",
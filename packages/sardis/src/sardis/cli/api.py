@@ -1,6 +1,7 @@
 """API client for Sardis CLI."""
 from __future__ import annotations
 
+import threading
 from typing import Any
 
 import httpx
@@ -24,24 +25,36 @@ class SardisAPIClient:
         base_url: str,
         api_key: str | None = None,
         timeout: float = 30.0,
+        max_connections: int | None = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
+        self.max_connections = max_connections
         self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
 
     @property
     def client(self) -> httpx.Client:
-        """Get or create HTTP client."""
-        if self._client is None:
+        """Get or create HTTP client (safe to call from worker threads)."""
+        if self._client is not None:
+            return self._client
+        with self._client_lock:
+            if self._client is not None:
+                return self._client
             headers = {"Content-Type": "application/json"}
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
 
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ) if self.max_connections else httpx.Limits()
             self._client = httpx.Client(
                 base_url=self.base_url,
                 headers=headers,
                 timeout=self.timeout,
+                limits=limits,
             )
         return self._client
 
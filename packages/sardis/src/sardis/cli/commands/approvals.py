@@ -1,7 +1,11 @@
 """Approval management commands."""
 from __future__ import annotations
 
+import asyncio
+import json
+
 import click
+import httpx
 from rich.console import Console
 from rich.table import Table
 
@@ -100,3 +104,47 @@ def deny(ctx, approval_id: str, reason: str):
         console.print(f"[red]Error: {e.message}[/red]")
     finally:
         client.close()
+
+
+@approvals.command()
+@click.option("--poll-interval", type=float, default=2.0, show_default=True,
+              help="Polling interval (seconds) if the server has no event stream")
+@click.option("--new-only", is_flag=True, help="Skip approvals that are already pending")
+@click.option("--format", "output_format", type=click.Choice(["table", "json"]), default="table")
+@click.pass_context
+def watch(ctx, poll_interval: float, new_only: bool, output_format: str):
+    """Show pending approvals as they arrive (Ctrl-C to stop)."""
+    config = ctx.obj["config"]
+    api_key = config.get("api_key")
+    if not api_key:
+        console.print("[yellow]Not authenticated. Run 'sardis login' first.[/yellow]")
+        return
+
+    from sardis import AsyncSardis
+
+    from ...inbox import ApprovalWatcher, approval_id
+    from ...models.errors import SardisError
+
+    async def run() -> None:
+        async with AsyncSardis(api_key=api_key, base_url=config.get("api_base_url", "https://api.sardis.sh")) as client:
+            client.events.configure(poll_interval=poll_interval, max_poll_interval=max(poll_interval * 8, 15.0))
+            async for a in ApprovalWatcher(client, include_existing=not new_only):
+                if output_format == "json":
+                    click.echo(json.dumps(a, default=str))
+                    continue
+                console.print(
+                    f"[cyan]{approval_id(a)}[/cyan]  [green]{a.get('agent_id', '')}[/green]  "
+                    f"[yellow]${a.get('amount', '0')}[/yellow]  {a.get('merchant', '')}  "
+                    f"[dim]{(a.get('reason', '') or '')[:60]}[/dim]"
+                )
+
+    if output_format == "table":
+        console.print("[dim]Watching for pending approvals (Ctrl-C to stop)...[/dim]")
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        console.print("[dim]Stopped.[/dim]")
+    except SardisError as e:
+        console.print(f"[red]Error: {e.message}[/red]")
+    except httpx.TransportError as e:
+        console.print(f"[red]Network error: {str(e) or type(e).__name__}[/red]")
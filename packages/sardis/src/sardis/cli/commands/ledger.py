@@ -2,13 +2,27 @@
 from __future__ import annotations
 
 import csv
-import io
+import json
+import os
 import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
 
 import click
+import httpx
 from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+)
 from rich.table import Table
 
+from ...pagination import PaginationCheckpoint
 from ..api import APIError, SardisAPIClient
 
 console = Console()
@@ -75,52 +89,288 @@ def list_entries(ctx, wallet: str | None, group: str | None, limit: int):
         client.close()
 
 
+
+
+EXPORT_FIELDS = [
+    "tx_id", "timestamp", "agent_name", "amount", "currency",
+    "merchant", "status", "wallet_id", "group_id", "purpose",
+]
+
+
+class _FileSink(ABC):
+    """Appends rows to a text file; ``offset`` is the size of the complete output."""
+
+    def __init__(self, path: str | None, offset: int | None, rows: int):
+        if path is None:
+            self._file = sys.stdout
+        elif offset is None:
+            self._file = open(path, "w", newline="")  # noqa: SIM115 - closed by close()
+        else:
+            # Drop anything written after the last checkpoint, then append.
+            self._file = open(path, "r+", newline="")  # noqa: SIM115
+            self._file.truncate(offset)
+            self._file.seek(offset)
+        self.rows = rows
+        self.pending = 0
+        if offset is None:
+            self.start()
+
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    def write(self, rows: list[dict]) -> None:
+        """Append rows and count them in ``rows``."""
+
+    def flush(self) -> int | None:
+        """Flush to disk and return the byte offset of the complete output."""
+        self._file.flush()
+        if self._file is sys.stdout:
+            return None
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+    def finish(self) -> None:
+        pass
+
+    def close(self) -> None:
+        if self._file is not sys.stdout:
+            self._file.close()
+
+
+class _CsvSink(_FileSink):
+    def start(self) -> None:
+        csv.DictWriter(self._file, fieldnames=EXPORT_FIELDS).writeheader()
+
+    def write(self, rows: list[dict]) -> None:
+        csv.DictWriter(self._file, fieldnames=EXPORT_FIELDS, extrasaction="ignore").writerows(rows)
+        self.rows += len(rows)
+
+
+class _JsonlSink(_FileSink):
+    def write(self, rows: list[dict]) -> None:
+        self._file.writelines(json.dumps(row, default=str) + "\n" for row in rows)
+        self.rows += len(rows)
+
+
+class _JsonSink(_FileSink):
+    """A JSON array written incrementally; the closing bracket is added by :meth:`finish`."""
+
+    def start(self) -> None:
+        self._file.write("[")
+
+    def write(self, rows: list[dict]) -> None:
+        for row in rows:
+            self._file.write(",\n  " if self.rows else "\n  ")
+            self._file.write(json.dumps(row, default=str))
+            self.rows += 1
+
+    def finish(self) -> None:
+        self._file.write("\n]\n" if self.rows else "]\n")
+
+
+class _ParquetSink:
+    """Writes a Parquet dataset directory, one part file per ``part_rows`` rows.
+
+    Parquet files cannot be appended to once a writer dies, so each part is
+    written to a temporary name and renamed when complete; a checkpoint only
+    ever refers to completed parts.
+    """
+
+    def __init__(self, path: str, part: int, rows: int, part_rows: int):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise click.ClickException(
+                "pyarrow is required for Parquet export. Install with: pip install 'sardis[analytics]'"
+            )
+        self._pa, self._pq = pa, pq
+        self._schema = pa.schema([(name, pa.string()) for name in EXPORT_FIELDS])
+        self._dir = Path(path)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        for stale in self._dir.glob(".part-*.parquet.tmp"):
+            stale.unlink()
+        self._part_rows = part_rows
+        self._buffer: list[dict] = []
+        self.part = part
+        self.rows = rows
+
+    @property
+    def pending(self) -> int:
+        """Rows buffered for the next part file."""
+        return len(self._buffer)
+
+    def write(self, rows: list[dict]) -> None:
+        self._buffer.extend(rows)
+
+    def flush(self, force: bool = False) -> int | None:
+        """Write a part if enough rows are buffered; return the next part number if one was written."""
+        if not self._buffer or (len(self._buffer) < self._part_rows and not force):
+            return None
+        columns = {
+            name: [None if row.get(name) is None else str(row[name]) for row in self._buffer]
+            for name in EXPORT_FIELDS
+        }
+        table = self._pa.table(columns, schema=self._schema)
+        final = self._dir / f"part-{self.part:05d}.parquet"
+        tmp = self._dir / f".{final.name}.tmp"
+        self._pq.write_table(table, tmp)
+        os.replace(tmp, final)
+        self.rows += len(self._buffer)
+        self._buffer = []
+        self.part += 1
+        return self.part
+
+    def finish(self) -> None:
+        self.flush(force=True)
+
+    def close(self) -> None:
+        pass
+
+
+def _fetch_page(client: SardisAPIClient, params: dict, cursor: str | None) -> tuple[list[dict], str | None, bool | None, int | None]:
+    """Fetch one export page; returns (entries, next_cursor, has_more, total)."""
+    request = dict(params)
+    if cursor:
+        request.pop("offset", None)
+        request["cursor"] = cursor
+    result = client.get("/api/v2/ledger", params=request)
+    has_more = result.get("has_more", result.get("has_next"))
+    total = result.get("total", result.get("total_count"))
+    return result.get("entries", []), result.get("next_cursor"), has_more, total
+
+
 @ledger.command()
 @click.option("--wallet", help="Filter by wallet ID")
 @click.option("--group", help="Filter by group ID")
-@click.option("--format", "fmt", type=click.Choice(["csv", "json"]), default="csv", help="Export format")
+@click.option(
+    "--format", "fmt",
+    type=click.Choice(["csv", "json", "jsonl", "parquet"]), default="csv",
+    help="Export format (parquet writes a directory of part files)",
+)
 @click.option("--output", "-o", type=click.Path(), help="Output file (default: stdout)")
+@click.option("--page-size", type=click.IntRange(1, 10000), default=1000, help="Entries per request (default: 1000)")
+@click.option("--part-rows", type=int, default=100_000, help="Rows per Parquet part file (default: 100000)")
+@click.option("--resume", is_flag=True, help="Continue an interrupted export from its checkpoint")
+@click.option("--checkpoint", "checkpoint_path", type=click.Path(), help="Checkpoint file (default: <output>.checkpoint)")
 @click.pass_context
-def export(ctx, wallet: str | None, group: str | None, fmt: str, output: str | None):
-    """Export ledger entries to CSV or JSON."""
+def export(
+    ctx,
+    wallet: str | None,
+    group: str | None,
+    fmt: str,
+    output: str | None,
+    page_size: int,
+    part_rows: int,
+    resume: bool,
+    checkpoint_path: str | None,
+):
+    """Export the full ledger to CSV, JSON, JSONL or Parquet.
+
+    Pages through every entry and streams rows to the output as they arrive,
+    so memory stays bounded regardless of ledger size. When writing to a file
+    a checkpoint is saved after every page; rerun with --resume to continue an
+    interrupted export.
+    """
     config = ctx.obj["config"]
     api_key = config.get("api_key")
     if not api_key:
         console.print("[yellow]Not authenticated.[/yellow]")
         return
+    if output is None and (resume or fmt == "parquet"):
+        raise click.UsageError("--output is required for --resume and for Parquet export")
+
+    params: dict[str, str | int] = {"limit": page_size, "offset": 0}
+    if wallet:
+        params["wallet_id"] = wallet
+    if group:
+        params["group_id"] = group
+
+    ckpt_file = Path(checkpoint_path or f"{output}.checkpoint") if output else None
+    checkpoint = PaginationCheckpoint(params=params, metadata={"format": fmt})
+    if resume:
+        saved = PaginationCheckpoint.load(ckpt_file)
+        if saved is None:
+            raise click.ClickException(f"No checkpoint found at {ckpt_file}")
+        if saved.filters != checkpoint.filters or saved.metadata.get("format") != fmt:
+            raise click.ClickException("Checkpoint was written for a different export (filters or format differ)")
+        if saved.exhausted:
+            console.print(f"[dim]Export to {output} already complete ({saved.items_fetched} entries).[/dim]")
+            return
+        checkpoint = saved
+    elif ckpt_file is not None and ckpt_file.exists():
+        ckpt_file.unlink()
+
+    meta = checkpoint.metadata
+    if fmt == "parquet":
+        sink = _ParquetSink(output, meta.get("part", 0), checkpoint.items_fetched, part_rows)
+    else:
+        sink_cls = {"csv": _CsvSink, "json": _JsonSink, "jsonl": _JsonlSink}[fmt]
+        sink = sink_cls(output, meta.get("output_bytes") if resume else None, checkpoint.items_fetched)
+
+    def save() -> None:
+        if ckpt_file is not None:
+            checkpoint.items_fetched = sink.rows
+            checkpoint.save(ckpt_file)
 
     client = SardisAPIClient(base_url=config.get("api_base_url"), api_key=api_key)
+    progress_console = Console(stderr=True)
+    started = time.monotonic()
+    exported_at_start = checkpoint.items_fetched
     try:
-        params: dict[str, str | int] = {"limit": 10000}
-        if wallet:
-            params["wallet_id"] = wallet
-        if group:
-            params["group_id"] = group
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TextColumn("{task.fields[rate]:,.0f} entries/s"),
+            TimeElapsedColumn(),
+            console=progress_console,
+            transient=output is None,
+        ) as progress:
+            task = progress.add_task("Exporting ledger", total=None, completed=checkpoint.items_fetched, rate=0.0)
+            while True:
+                entries, next_cursor, has_more, total = _fetch_page(client, checkpoint.params, checkpoint.cursor)
+                sink.write(entries)
+                checkpoint.pages_fetched += 1
+                checkpoint.params["offset"] = int(checkpoint.params.get("offset", 0)) + len(entries)
+                checkpoint.cursor = next_cursor
+                if has_more is None:
+                    # Servers may cap limit below page_size, so a short page
+                    # does not mean the end; only an empty page does.
+                    has_more = bool(next_cursor) or bool(entries)
+                checkpoint.exhausted = not entries or not has_more
 
-        result = client.get("/api/v2/ledger", params=params)
-        items = result.get("entries", [])
-        if not items:
-            console.print("[dim]No entries to export.[/dim]")
-            return
+                if checkpoint.exhausted:
+                    sink.finish()
+                if fmt == "parquet":
+                    next_part = sink.flush(force=checkpoint.exhausted)
+                    if next_part is not None or checkpoint.exhausted:
+                        meta["part"] = sink.part
+                        save()
+                else:
+                    meta["output_bytes"] = sink.flush()
+                    save()
 
-        if fmt == "json":
-            import json
-            data = json.dumps(items, indent=2)
-        else:
-            buf = io.StringIO()
-            fields = ["tx_id", "timestamp", "agent_name", "amount", "currency", "merchant", "status", "wallet_id", "group_id", "purpose"]
-            writer = csv.DictWriter(buf, fieldnames=fields, extrasaction="ignore")
-            writer.writeheader()
-            writer.writerows(items)
-            data = buf.getvalue()
-
-        if output:
-            with open(output, "w") as f:
-                f.write(data)
-            console.print(f"[green]Exported {len(items)} entries to {output}[/green]")
-        else:
-            sys.stdout.write(data)
-    except APIError as e:
-        console.print(f"[red]Error: {e.message}[/red]")
+                done = sink.rows + sink.pending
+                elapsed = max(time.monotonic() - started, 1e-9)
+                progress.update(task, completed=done, total=total, rate=(done - exported_at_start) / elapsed)
+                if checkpoint.exhausted:
+                    break
+    except (APIError, httpx.TransportError) as e:
+        if output is not None:
+            console.print(f"[dim]{output} holds the first {sink.rows} entries.[/dim]")
+        if ckpt_file is not None:
+            console.print(f"[dim]Rerun with --resume to continue from {sink.rows} entries.[/dim]")
+        raise click.ClickException(e.message if isinstance(e, APIError) else f"Network error: {str(e) or type(e).__name__}")
     finally:
+        sink.close()
         client.close()
+
+    if output:
+        elapsed = time.monotonic() - started
+        console.print(
+            f"[green]Exported {sink.rows} entries to {output}[/green] "
+            f"[dim]({(sink.rows - exported_at_start) / max(elapsed, 1e-9):,.0f} entries/s)[/dim]"
+        )
@@ -1,10 +1,19 @@
 """Policy management commands."""
 from __future__ import annotations
 
+import csv
 import json
+import math
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 
 import click
+import httpx
 from rich.console import Console
+from rich.progress import MofNCompleteColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
 from ..api import APIError, SardisAPIClient
@@ -229,12 +238,231 @@ def set_policy(
         client.close()
 
 
+# Fields written for each simulated transaction.
+SIMULATION_FIELDS = ["index", "amount", "token", "destination", "purpose", "allowed", "reason", "latency_ms", "error"]
+
+# Status codes worth retrying; anything else is a real answer from the API.
+_RETRY_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+
+_LAYOUT_ERROR = 'JSON file must contain an array or {"transactions": [...]}'
+
+
+class _JsonStream:
+    """Incremental reader for JSON values from a text file."""
+
+    def __init__(self, f, chunk_size: int):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+
+    def _fill(self) -> bool:
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at the end of the input."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos].isspace():
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed JSON: expected {char!r}, found {found or 'end of file'!r}")
+        self._pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number cut at the chunk edge decodes as a shorter number, so only
+            # accept a value that ends at the buffer edge once the input is exhausted.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return item
+
+
+def _iter_json_array(f, chunk_size: int = 1 << 16):
+    """Yield the items of a top-level JSON array without loading the whole file.
+
+    Accepts ``[...]`` or an object whose ``"transactions"`` key holds the
+    array; other top-level keys are skipped.
+    """
+    stream = _JsonStream(f, chunk_size)
+    first = stream.peek()
+    if first == "{":
+        stream.expect("{")
+        while True:
+            if stream.peek() == "}":
+                raise ValueError(_LAYOUT_ERROR)
+            key = stream.value()
+            stream.expect(":")
+            if key == "transactions" and stream.peek() == "[":
+                break
+            stream.value()
+            if stream.peek() != "}":
+                stream.expect(",")
+    elif first != "[":
+        raise ValueError(_LAYOUT_ERROR)
+
+    stream.expect("[")
+    if stream.peek() == "]":
+        return
+    while True:
+        yield stream.value()
+        if stream.peek() == "]":
+            return
+        stream.expect(",")
+
+
+def _iter_transactions(file_path: str):
+    """Stream transactions from a JSON, JSON Lines or CSV file."""
+    suffix = Path(file_path).suffix.lower()
+    with open(file_path, newline="") as f:
+        if suffix == ".csv":
+            yield from csv.DictReader(f)
+            return
+        if suffix in (".jsonl", ".ndjson"):
+            items = (json.loads(line) for line in f if line.strip())
+        else:
+            items = _iter_json_array(f)
+        for i, item in enumerate(items, 1):
+            if not isinstance(item, dict):
+                raise ValueError(f"Transaction {i} is not a JSON object: {json.dumps(item)[:80]}")
+            yield item
+
+
+def _check_transaction(client: SardisAPIClient, agent: str, index: int, tx: dict, retries: int) -> dict:
+    """Post one transaction to the policy check endpoint, retrying transient failures."""
+    payload: dict = {
+        "agent_id": agent,
+        "amount": tx.get("amount", 0),
+        "token": tx.get("token") or "USDC",
+    }
+    if tx.get("destination"):
+        payload["destination"] = tx["destination"]
+    if tx.get("purpose"):
+        payload["purpose"] = tx["purpose"]
+    row = {
+        "index": index,
+        "amount": payload["amount"],
+        "token": payload["token"],
+        "destination": tx.get("destination") or "",
+        "purpose": tx.get("purpose") or "",
+        "allowed": None,
+        "reason": "",
+        "latency_ms": None,
+        "error": "",
+    }
+
+    for attempt in range(retries + 1):
+        started = time.perf_counter()
+        try:
+            result = client.post("/api/v2/policies/check", payload)
+        except APIError as e:
+            if e.status_code in _RETRY_STATUS and attempt < retries:
+                time.sleep(min(0.25 * 2**attempt, 5.0))
+                continue
+            row["error"] = e.message
+            return row
+        except httpx.TransportError as e:
+            if attempt < retries:
+                time.sleep(min(0.25 * 2**attempt, 5.0))
+                continue
+            row["error"] = str(e) or type(e).__name__
+            return row
+        row["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        row["allowed"] = bool(result.get("allowed", False))
+        row["reason"] = result.get("reason", "")
+        return row
+    return row
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of sorted ``values``."""
+    return values[min(len(values) - 1, max(0, math.ceil(q / 100 * len(values)) - 1))]
+
+
+def _prompt_transactions() -> list[dict]:
+    console.print("[bold blue]Interactive Simulation Mode[/bold blue]")
+    console.print("Enter transactions one by one. Type 'done' to finish.\n")
+
+    transactions: list[dict] = []
+    while True:
+        amount_str = click.prompt("Amount (or 'done')", default="done")
+        if amount_str.lower() == "done":
+            break
+
+        try:
+            amount = float(amount_str)
+        except ValueError:
+            console.print("[red]Invalid amount, skipping[/red]")
+            continue
+
+        destination = click.prompt("Destination (optional, press Enter to skip)", default="", show_default=False)
+        token = click.prompt("Token", default="USDC")
+        purpose = click.prompt("Purpose (optional, press Enter to skip)", default="", show_default=False)
+
+        tx: dict = {"amount": amount, "token": token}
+        if destination:
+            tx["destination"] = destination
+        if purpose:
+            tx["purpose"] = purpose
+
+        transactions.append(tx)
+        console.print(f"  [dim]Added transaction #{len(transactions)}[/dim]\n")
+    return transactions
+
+
 @policies.command()
 @click.option("--agent", required=True, help="Agent ID")
-@click.option("--file", "file_path", default=None, type=click.Path(exists=True), help="JSON file with transactions array")
+@click.option(
+    "--file", "file_path", default=None, type=click.Path(exists=True),
+    help="Transactions as a JSON array (or {\"transactions\": [...]}), JSON Lines (.jsonl) or CSV (.csv)",
+)
+@click.option("--concurrency", type=click.IntRange(1, 64), default=8, help="Checks in flight (default: 8)")
+@click.option("--retries", type=click.IntRange(0, 10), default=2, help="Retries for transient failures (default: 2)")
+@click.option(
+    "--format", "fmt", type=click.Choice(["table", "jsonl", "csv"]), default=None,
+    help="Result format (default: table on the terminal, jsonl with --output)",
+)
+@click.option("--output", "-o", type=click.Path(), help="Stream results to a file")
+@click.option("--table-rows", type=int, default=100, help="Rows shown in table output (default: 100)")
 @click.pass_context
-def simulate(ctx, agent: str, file_path: str | None):
-    """Simulate a series of transactions against a policy."""
+def simulate(
+    ctx,
+    agent: str,
+    file_path: str | None,
+    concurrency: int,
+    retries: int,
+    fmt: str | None,
+    output: str | None,
+    table_rows: int,
+):
+    """Simulate a series of transactions against a policy.
+
+    Transactions are streamed from the input file and checked concurrently;
+    results are written in input order as they complete, followed by a
+    summary of pass/fail counts, denial reasons and check latency.
+    """
     config = ctx.obj["config"]
     api_key = config.get("api_key")
 
@@ -242,56 +470,22 @@ def simulate(ctx, agent: str, file_path: str | None):
         console.print("[yellow]Not authenticated[/yellow]")
         return
 
+    fmt = fmt or ("jsonl" if output else "table")
+    if fmt == "table" and output:
+        raise click.UsageError("--output requires --format jsonl or csv")
+
+    transactions = iter(_prompt_transactions()) if file_path is None else _iter_transactions(file_path)
+
     client = SardisAPIClient(
         base_url=config.get("api_base_url"),
         api_key=api_key,
+        max_connections=concurrency,
     )
 
-    transactions: list[dict] = []
-
-    if file_path:
-        with open(file_path) as f:
-            data = json.load(f)
-        if isinstance(data, list):
-            transactions = data
-        elif isinstance(data, dict) and "transactions" in data:
-            transactions = data["transactions"]
-        else:
-            console.print("[red]Error: JSON file must contain an array or {\"transactions\": [...]}[/red]")
-            client.close()
-            return
-    else:
-        console.print("[bold blue]Interactive Simulation Mode[/bold blue]")
-        console.print("Enter transactions one by one. Type 'done' to finish.\n")
-
-        while True:
-            amount_str = click.prompt("Amount (or 'done')", default="done")
-            if amount_str.lower() == "done":
-                break
-
-            try:
-                amount = float(amount_str)
-            except ValueError:
-                console.print("[red]Invalid amount, skipping[/red]")
-                continue
-
-            destination = click.prompt("Destination (optional, press Enter to skip)", default="", show_default=False)
-            token = click.prompt("Token", default="USDC")
-            purpose = click.prompt("Purpose (optional, press Enter to skip)", default="", show_default=False)
-
-            tx: dict = {"amount": amount, "token": token}
-            if destination:
-                tx["destination"] = destination
-            if purpose:
-                tx["purpose"] = purpose
-
-            transactions.append(tx)
-            console.print(f"  [dim]Added transaction #{len(transactions)}[/dim]\n")
-
-    if not transactions:
-        console.print("[dim]No transactions to simulate[/dim]")
-        client.close()
-        return
+    out = open(output, "w", newline="") if output else sys.stdout  # noqa: SIM115 - closed below
+    csv_writer = csv.DictWriter(out, fieldnames=SIMULATION_FIELDS) if fmt == "csv" else None
+    if csv_writer is not None:
+        csv_writer.writeheader()
 
     table = Table(title=f"Policy Simulation for Agent {agent}")
     table.add_column("#", style="dim", justify="right")
@@ -302,41 +496,107 @@ def simulate(ctx, agent: str, file_path: str | None):
     table.add_column("Result")
     table.add_column("Reason")
 
-    try:
-        for i, tx in enumerate(transactions, 1):
-            payload: dict = {
-                "agent_id": agent,
-                "amount": tx.get("amount", 0),
-                "token": tx.get("token", "USDC"),
-            }
-            if tx.get("destination"):
-                payload["destination"] = tx["destination"]
-            if tx.get("purpose"):
-                payload["purpose"] = tx["purpose"]
-
-            try:
-                result = client.post("/api/v2/policies/check", payload)
-                allowed = result.get("allowed", False)
-                reason = result.get("reason", "")
-
-                result_display = "[green]PASS[/green]" if allowed else "[red]FAIL[/red]"
-            except APIError as e:
-                result_display = "[red]ERROR[/red]"
-                reason = e.message
+    counts = {"pass": 0, "fail": 0, "error": 0}
+    reasons: Counter[str] = Counter()
+    latencies: list[float] = []
 
+    def emit(row: dict) -> None:
+        if row["error"]:
+            counts["error"] += 1
+        elif row["allowed"]:
+            counts["pass"] += 1
+        else:
+            counts["fail"] += 1
+            reasons[row["reason"] or "(no reason)"] += 1
+        if row["latency_ms"] is not None:
+            latencies.append(row["latency_ms"])
+
+        if fmt == "jsonl":
+            out.write(json.dumps(row, default=str) + "\n")
+        elif csv_writer is not None:
+            csv_writer.writerow(row)
+        elif table.row_count < table_rows:
+            if row["error"]:
+                result_display, reason = "[red]ERROR[/red]", row["error"]
+            else:
+                result_display = "[green]PASS[/green]" if row["allowed"] else "[red]FAIL[/red]"
+                reason = row["reason"]
             table.add_row(
-                str(i),
-                str(tx.get("amount", 0)),
-                tx.get("token", "USDC"),
-                tx.get("destination", "-"),
-                tx.get("purpose", "-"),
+                str(row["index"]),
+                str(row["amount"]),
+                row["token"],
+                row["destination"] or "-",
+                row["purpose"] or "-",
                 result_display,
                 reason,
             )
 
-        console.print(table)
-
-    except APIError as e:
-        console.print(f"[red]Error: {e.message}[/red]")
+    # Keep a bounded window of checks in flight so the input is never fully loaded,
+    # and drain it in submission order so output follows input order.
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="sardis-simulate")
+    pending: deque[Future] = deque()
+    started = time.monotonic()
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            MofNCompleteColumn(),
+            TextColumn("{task.fields[rate]:,.0f} checks/s"),
+            TimeElapsedColumn(),
+            console=Console(stderr=True),
+            transient=True,
+        ) as progress:
+            task = progress.add_task("Simulating", total=None, rate=0.0)
+
+            def drain(limit: int) -> None:
+                while len(pending) > limit:
+                    emit(pending.popleft().result())
+                    done = sum(counts.values())
+                    progress.update(task, completed=done, rate=done / max(time.monotonic() - started, 1e-9))
+
+            for i, tx in enumerate(transactions, 1):
+                pending.append(executor.submit(_check_transaction, client, agent, i, tx, retries))
+                drain(concurrency * 4)
+            drain(0)
+    except (ValueError, OSError) as e:
+        console.print(f"[red]Error reading transactions: {e}[/red]")
+        return
     finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        if out is not sys.stdout:
+            out.close()
+        else:
+            out.flush()
         client.close()
+
+    total = sum(counts.values())
+    if not total:
+        console.print("[dim]No transactions to simulate[/dim]")
+        return
+
+    if fmt == "table":
+        console.print(table)
+        if total > table.row_count:
+            console.print(f"[dim]Showing {table.row_count} of {total} results; use --output for all of them.[/dim]")
+
+    summary = Console(stderr=fmt != "table")
+    summary.print(f"\n[bold blue]Simulation Summary[/bold blue] ({total} transactions)")
+    summary.print(
+        f"  [green]Pass: {counts['pass']}[/green]  [red]Fail: {counts['fail']}[/red]  Errors: {counts['error']}"
+    )
+    if latencies:
+        latencies.sort()
+        summary.print(
+            "  Latency: "
+            + "  ".join(f"p{q} {_percentile(latencies, q):.1f} ms" for q in (50, 95, 99))
+        )
+    if reasons:
+        histogram = Table(title="Denial reasons")
+        histogram.add_column("Reason")
+        histogram.add_column("Count", justify="right")
+        histogram.add_column("Share", justify="right")
+        for reason, count in reasons.most_common(10):
+            histogram.add_row(reason, str(count), f"{count / counts['fail']:.1%}")
+        summary.print(histogram)
+    if output:
+        summary.print(f"[green]Results written to {output}[/green]")
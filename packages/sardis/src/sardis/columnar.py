@@ -0,0 +1,309 @@
+"""
+Columnar export of ledger data for the Sardis SDK.
+
+This module builds column buffers straight from raw ledger pages, without
+constructing a Pydantic model per entry, so analytics jobs can pull tens of
+millions of entries into memory and process them vectorized.
+
+Layout:
+    - amounts are int64 minor units with a fixed ``scale`` (``amount / 10**scale``);
+      at the default scale of 6 that caps amounts at about 9.2e12, and an
+      amount with more than ``scale`` decimals is rejected unless a rounding
+      mode is given
+    - timestamps are int64 microseconds since the Unix epoch (UTC)
+    - currency, chain and wallet columns are dictionary encoded (int32 codes
+      into a list of categories, ``-1`` for missing values)
+
+The buffers are stdlib ``array.array`` objects; NumPy and PyArrow are only
+needed for :meth:`LedgerColumns.to_numpy` and :meth:`LedgerColumns.to_arrow`
+(``pip install "sardis[analytics]"``).
+
+Example:
+    ```python
+    async with AsyncSardis(api_key="...") as client:
+        columns = await client.ledger.to_columns(wallet_id="wallet_123")
+        table = columns.to_arrow()
+    ```
+"""
+from __future__ import annotations
+
+from array import array
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy as np
+    import pyarrow as pa
+
+# USDC/EURC/PYUSD use 6 decimals, which makes micro-units lossless for them.
+DEFAULT_SCALE = 6
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "numpy is required for NumPy export. Install with: pip install 'sardis[analytics]'"
+        )
+    return numpy
+
+
+def _require_pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for Arrow export. Install with: pip install 'sardis[analytics]'"
+        )
+    return pyarrow
+
+
+def to_minor_units(
+    value: str | int | float | Decimal,
+    scale: int = DEFAULT_SCALE,
+    rounding: str | None = None,
+) -> int:
+    """Convert a decimal amount to integer minor units.
+
+    Args:
+        value: Amount as returned by the API (usually a decimal string)
+        scale: Number of fractional digits to keep
+        rounding: A :mod:`decimal` rounding mode (e.g. ``decimal.ROUND_HALF_EVEN``)
+            for amounts with more precision than ``scale``; by default such
+            amounts are rejected rather than silently rounded
+
+    Returns:
+        ``value * 10**scale`` as an integer, exact unless ``rounding`` applied
+
+    Raises:
+        ValueError: If the amount is not a number, or has more precision than
+            ``scale`` and no ``rounding`` is given
+    """
+    if isinstance(value, int):
+        return value * 10**scale
+
+    text = value if isinstance(value, str) else str(value)
+    sign = -1 if text.startswith("-") else 1
+    whole, _, frac = text.lstrip("+-").partition(".")
+    frac = frac.rstrip("0")
+    # Fast path for plain decimal strings; anything else goes through Decimal.
+    if (whole.isdigit() or (not whole and frac)) and (not frac or frac.isdigit()) and len(frac) <= scale:
+        return sign * (int(whole or "0") * 10**scale + int(frac.ljust(scale, "0") or "0"))
+
+    try:
+        scaled = Decimal(text).scaleb(scale)
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {value!r}")
+    if rounding is not None and scaled.is_finite():
+        scaled = scaled.to_integral_value(rounding=rounding)
+    if not scaled.is_finite() or scaled != scaled.to_integral_value():
+        raise ValueError(f"Amount {value!r} does not fit scale {scale}")
+    return int(scaled)
+
+
+def to_epoch_micros(value: str | datetime) -> int:
+    """Convert an ISO-8601 timestamp (naive values are UTC) to epoch microseconds."""
+    dt = value if isinstance(value, datetime) else datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+class CategoricalColumn:
+    """Dictionary-encoded string column.
+
+    Attributes:
+        codes: int32 index into ``categories`` per row, ``-1`` for missing
+        categories: Distinct values in order of first appearance
+    """
+
+    __slots__ = ("_index", "categories", "codes")
+
+    def __init__(self) -> None:
+        self.codes = array("i")
+        self.categories: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def append(self, value: str | None) -> None:
+        """Append a value, interning it if it has not been seen before."""
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def code_of(self, value: str) -> int:
+        """Code for ``value``, or ``-1`` if it never occurs in the column."""
+        return self._index.get(value, -1)
+
+    def values(self) -> list[str | None]:
+        """Decode the column back to strings."""
+        categories = self.categories
+        return [categories[c] if c >= 0 else None for c in self.codes]
+
+    def to_arrow(self) -> pa.DictionaryArray:
+        """Convert to a PyArrow dictionary array."""
+        pa = _require_pyarrow()
+        np = _require_numpy()
+        codes = np.frombuffer(self.codes, dtype=np.int32)
+        indices = pa.array(codes, type=pa.int32(), mask=codes < 0)
+        return pa.DictionaryArray.from_arrays(indices, pa.array(self.categories, type=pa.string()))
+
+
+class LedgerColumns:
+    """Column buffers for ledger entries.
+
+    Build one incrementally with :meth:`extend` (raw API dictionaries) or get
+    one from ``client.ledger.to_columns()``.
+
+    Rows are validated before anything is appended: an amount that needs
+    rounding (without ``rounding``) or overflows int64, or an unparseable
+    timestamp, raises ``ValueError`` naming the entry and leaves the columns
+    unchanged.
+
+    Attributes:
+        scale: Fractional digits encoded in ``amount``
+        rounding: Decimal rounding mode for amounts finer than ``scale``
+        tx_id: Transaction IDs
+        amount: int64 amounts in minor units
+        created_at: int64 timestamps, microseconds since the epoch (UTC)
+        currency: Dictionary-encoded currency codes
+        chain: Dictionary-encoded chain names
+        from_wallet: Dictionary-encoded source wallet IDs
+        to_wallet: Dictionary-encoded destination wallet IDs
+        mandate_id: Mandate IDs (None when absent)
+        chain_tx_hash: On-chain transaction hashes (None when absent)
+        audit_anchor: Audit anchors (None when absent)
+    """
+
+    def __init__(self, scale: int = DEFAULT_SCALE, rounding: str | None = None) -> None:
+        self.scale = scale
+        self.rounding = rounding
+        self.tx_id: list[str] = []
+        self.amount = array("q")
+        self.created_at = array("q")
+        self.currency = CategoricalColumn()
+        self.chain = CategoricalColumn()
+        self.from_wallet = CategoricalColumn()
+        self.to_wallet = CategoricalColumn()
+        self.mandate_id: list[str | None] = []
+        self.chain_tx_hash: list[str | None] = []
+        self.audit_anchor: list[str | None] = []
+
+    def __len__(self) -> int:
+        return len(self.tx_id)
+
+    def append(self, entry: dict[str, Any]) -> None:
+        """Append one raw ledger entry as returned by the API.
+
+        Raises:
+            ValueError: If the amount or timestamp cannot be encoded
+        """
+        try:
+            amount = to_minor_units(entry["amount"], self.scale, self.rounding)
+            if not _INT64_MIN <= amount <= _INT64_MAX:
+                raise ValueError(f"Amount {entry['amount']!r} overflows int64 at scale {self.scale}")
+            created_at = to_epoch_micros(entry["created_at"])
+        except ValueError as e:
+            raise ValueError(f"Ledger entry {entry.get('tx_id')!r}: {e}") from e
+        self.amount.append(amount)
+        self.created_at.append(created_at)
+        self.tx_id.append(entry["tx_id"])
+        self.currency.append(entry.get("currency"))
+        self.chain.append(entry.get("chain"))
+        self.from_wallet.append(entry.get("from_wallet"))
+        self.to_wallet.append(entry.get("to_wallet"))
+        self.mandate_id.append(entry.get("mandate_id"))
+        self.chain_tx_hash.append(entry.get("chain_tx_hash"))
+        self.audit_anchor.append(entry.get("audit_anchor"))
+
+    def extend(self, entries: Iterable[dict[str, Any]]) -> None:
+        """Append raw ledger entries, e.g. one page of ``/ledger/entries``."""
+        for entry in entries:
+            self.append(entry)
+
+    def amount_at(self, index: int) -> Decimal:
+        """Amount of one row as a Decimal."""
+        return Decimal(self.amount[index]).scaleb(-self.scale)
+
+    def to_numpy(self) -> np.ndarray:
+        """Convert to a NumPy structured array.
+
+        Dictionary-encoded columns hold their int32 codes; decode them with the
+        matching column's ``categories``. Timestamps use ``datetime64[us]``.
+        """
+        np = _require_numpy()
+
+        def width(values: list[str | None]) -> int:
+            return max((len(v) for v in values if v), default=1)
+
+        dtype = np.dtype([
+            ("tx_id", f"U{width(self.tx_id)}"),
+            ("created_at", "datetime64[us]"),
+            ("amount", "i8"),
+            ("currency", "i4"),
+            ("chain", "i4"),
+            ("from_wallet", "i4"),
+            ("to_wallet", "i4"),
+            ("mandate_id", f"U{width(self.mandate_id)}"),
+            ("chain_tx_hash", f"U{width(self.chain_tx_hash)}"),
+            ("audit_anchor", f"U{width(self.audit_anchor)}"),
+        ])
+        out = np.empty(len(self), dtype=dtype)
+        out["tx_id"] = self.tx_id
+        out["created_at"] = np.frombuffer(self.created_at, dtype=np.int64).view("datetime64[us]")
+        out["amount"] = np.frombuffer(self.amount, dtype=np.int64)
+        for name in ("currency", "chain", "from_wallet", "to_wallet"):
+            out[name] = np.frombuffer(getattr(self, name).codes, dtype=np.int32)
+        for name in ("mandate_id", "chain_tx_hash", "audit_anchor"):
+            out[name] = [v or "" for v in getattr(self, name)]
+        return out
+
+    def to_arrow(self) -> pa.Table:
+        """Convert to a PyArrow table.
+
+        ``amount`` is int64 minor units; the scale is recorded in the schema
+        metadata under ``amount_scale``.
+        """
+        pa = _require_pyarrow()
+        np = _require_numpy()
+        table = pa.table({
+            "tx_id": pa.array(self.tx_id, type=pa.string()),
+            "created_at": pa.array(
+                np.frombuffer(self.created_at, dtype=np.int64), type=pa.int64()
+            ).cast(pa.timestamp("us", tz="UTC")),
+            "amount": pa.array(np.frombuffer(self.amount, dtype=np.int64), type=pa.int64()),
+            "currency": self.currency.to_arrow(),
+            "chain": self.chain.to_arrow(),
+            "from_wallet": self.from_wallet.to_arrow(),
+            "to_wallet": self.to_wallet.to_arrow(),
+            "mandate_id": pa.array(self.mandate_id, type=pa.string()),
+            "chain_tx_hash": pa.array(self.chain_tx_hash, type=pa.string()),
+            "audit_anchor": pa.array(self.audit_anchor, type=pa.string()),
+        })
+        return table.replace_schema_metadata({"amount_scale": str(self.scale)})
+
+
+__all__ = [
+    "DEFAULT_SCALE",
+    "CategoricalColumn",
+    "LedgerColumns",
+    "to_epoch_micros",
+    "to_minor_units",
+]
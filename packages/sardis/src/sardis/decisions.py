@@ -0,0 +1,332 @@
+"""
+Local analytics index over policy decisions.
+
+:class:`DecisionIndex` ingests policy decision records (from
+``evidence.list_policy_decisions`` or ``evidence.stream_policy_decisions``)
+incrementally and keeps inverted indexes from rule, agent, merchant,
+outcome, reason and policy to the decisions that carry them. Aggregate
+questions such as "top deny reasons for this agent over the last 24h" or
+"deny rate per hour this week" are answered from those posting lists
+without any API calls.
+
+Decision payloads vary between endpoints, so each indexed field is read from
+the first present key in :data:`FIELD_ALIASES`, and outcomes are normalized
+to ``"allow"``/``"deny"`` where the payload makes that clear.
+
+Example:
+    ```python
+    index = DecisionIndex()
+    await index.consume(client.evidence.stream_policy_decisions(
+        created_from=datetime.now(UTC) - timedelta(days=7), created_to=datetime.now(UTC),
+    ))
+    index.top("reason", agent="agent_123", outcome="deny", since=timedelta(hours=24))
+    ```
+"""
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from .columnar import _EPOCH, _MICROSECOND, to_epoch_micros
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Iterable
+
+# Indexed field -> candidate payload keys, in order of preference.
+FIELD_ALIASES: dict[str, tuple[str, ...]] = {
+    "agent": ("agent_id", "agent"),
+    "merchant": ("merchant_id", "merchant", "merchant_name", "vendor"),
+    "outcome": ("outcome", "decision", "result", "allowed"),
+    "reason": ("deny_reason", "reason"),
+    "policy": ("policy_id",),
+    "rule": ("matched_rules", "rules_fired", "rule_ids", "rules"),
+}
+INDEXED_FIELDS = tuple(FIELD_ALIASES)
+
+_ID_KEYS = ("decision_id", "id")
+_TIME_KEYS = ("created_at", "decided_at", "timestamp")
+_LATENCY_KEYS = ("latency_ms", "evaluation_ms", "duration_ms")
+
+_DENY = {"deny", "denied", "block", "blocked", "reject", "rejected", "false"}
+_ALLOW = {"allow", "allowed", "approve", "approved", "pass", "passed", "true"}
+
+
+def _normalize_outcome(value: Any) -> str:
+    text = str(value).lower()
+    if text in _DENY:
+        return "deny"
+    if text in _ALLOW:
+        return "allow"
+    return text
+
+
+def _rule_names(value: Any) -> list[str]:
+    if not value:
+        return []
+    if not isinstance(value, list):
+        value = [value]
+    names = []
+    for rule in value:
+        if isinstance(rule, dict):
+            rule = rule.get("rule_id") or rule.get("id") or rule.get("name")
+        if rule:
+            names.append(str(rule))
+    return names
+
+
+@dataclass(frozen=True)
+class RateBucket:
+    """Deny rate within one time bucket.
+
+    Attributes:
+        start: Bucket start (UTC)
+        total: Decisions in the bucket
+        denied: Denied decisions in the bucket
+    """
+
+    start: datetime
+    total: int
+    denied: int
+
+    @property
+    def deny_rate(self) -> float:
+        """Fraction of decisions denied."""
+        return self.denied / self.total if self.total else 0.0
+
+
+class _Postings:
+    """Row ids for one indexed value, kept in time order."""
+
+    __slots__ = ("dirty", "rows")
+
+    def __init__(self) -> None:
+        self.rows = array("i")
+        self.dirty = False
+
+
+class DecisionIndex:
+    """Incrementally built inverted index over policy decisions."""
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._times = array("q")
+        self._latency = array("d")
+        # Per field, value -> code and code -> value.
+        self._codes: dict[str, dict[str, int]] = {f: {} for f in INDEXED_FIELDS}
+        self._names: dict[str, list[str]] = {f: [] for f in INDEXED_FIELDS}
+        self._postings: dict[str, dict[int, _Postings]] = {f: {} for f in INDEXED_FIELDS}
+        # Per row, the value codes it is posted under for each field.
+        self._row_codes: dict[str, list[tuple[int, ...]]] = {f: [] for f in INDEXED_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def add(self, decision: dict[str, Any]) -> bool:
+        """Index one decision.
+
+        Returns:
+            False if a decision with the same ID was already indexed
+        """
+        decision_id = next((str(decision[k]) for k in _ID_KEYS if decision.get(k)), None)
+        if decision_id is not None and decision_id in self._ids:
+            return False
+
+        # Parse everything first, so a malformed decision leaves no trace and
+        # a corrected retry is still indexed.
+        when = next((decision[k] for k in _TIME_KEYS if decision.get(k)), None)
+        micros = to_epoch_micros(when) if when is not None else 0
+        latency = next((decision[k] for k in _LATENCY_KEYS if decision.get(k) is not None), None)
+        latency_ms = float(latency) if latency is not None else math.nan
+        fields: dict[str, list[str]] = {}
+        for name, keys in FIELD_ALIASES.items():
+            raw = next((decision[k] for k in keys if decision.get(k) is not None), None)
+            if name == "rule":
+                fields[name] = _rule_names(raw)
+            elif raw is None:
+                fields[name] = []
+            else:
+                fields[name] = [_normalize_outcome(raw) if name == "outcome" else str(raw)]
+
+        row = len(self._times)
+        if decision_id is not None:
+            self._ids[decision_id] = row
+        self._times.append(micros)
+        self._latency.append(latency_ms)
+        for name, values in fields.items():
+            codes = []
+            known, names = self._codes[name], self._names[name]
+            for value in dict.fromkeys(values):
+                code = known.get(value)
+                if code is None:
+                    code = known[value] = len(names)
+                    names.append(value)
+                codes.append(code)
+                self._post(name, code, row)
+            self._row_codes[name].append(tuple(codes))
+        return True
+
+    def extend(self, decisions: Iterable[dict[str, Any]]) -> int:
+        """Index many decisions; returns how many were new."""
+        return sum(self.add(d) for d in decisions)
+
+    async def consume(self, decisions: AsyncIterable[dict[str, Any]]) -> int:
+        """Index an async stream of decisions; returns how many were new."""
+        added = 0
+        async for decision in decisions:
+            added += self.add(decision)
+        return added
+
+    def _post(self, field: str, code: int, row: int) -> None:
+        postings = self._postings[field].get(code)
+        if postings is None:
+            postings = self._postings[field][code] = _Postings()
+        rows = postings.rows
+        if rows and self._times[rows[-1]] > self._times[row]:
+            postings.dirty = True
+        rows.append(row)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _sorted(self, postings: _Postings) -> array[int]:
+        if postings.dirty:
+            times = self._times
+            postings.rows = array("i", sorted(postings.rows, key=lambda r: (times[r], r)))
+            postings.dirty = False
+        return postings.rows
+
+    @staticmethod
+    def _bound(value: datetime | timedelta | None, default: int) -> int:
+        if value is None:
+            return default
+        if isinstance(value, timedelta):
+            value = datetime.now(UTC) - value
+        return to_epoch_micros(value)
+
+    def rows(
+        self,
+        since: datetime | timedelta | None = None,
+        until: datetime | None = None,
+        **filters: str,
+    ) -> list[int]:
+        """Row ids matching every filter within ``[since, until)``, in time order.
+
+        Args:
+            since: Start time, or a look-back window relative to now
+            until: End time
+            **filters: Indexed field values, e.g. ``agent="a1", outcome="deny"``
+
+        Raises:
+            ValueError: If a filter names a field that is not indexed
+        """
+        lo = self._bound(since, -(2**63))
+        hi = self._bound(until, 2**63 - 1)
+        times = self._times
+
+        lists = []
+        for name, value in filters.items():
+            if name not in self._codes:
+                raise ValueError(f"Unknown decision field {name!r}; indexed: {INDEXED_FIELDS}")
+            if name == "outcome":
+                value = _normalize_outcome(value)
+            postings = self._postings[name].get(self._codes[name].get(value, -1))
+            if postings is None:
+                return []
+            rows = self._sorted(postings)
+            start = bisect_left(rows, lo, key=times.__getitem__)
+            end = bisect_left(rows, hi, lo=start, key=times.__getitem__)
+            lists.append(rows[start:end])
+
+        if not lists:
+            return sorted((r for r in range(len(times)) if lo <= times[r] < hi), key=lambda r: (times[r], r))
+        lists.sort(key=len)
+        matched = set(lists[0])
+        for other in lists[1:]:
+            matched.intersection_update(other)
+            if not matched:
+                return []
+        return [r for r in lists[0] if r in matched]
+
+    def count(self, since: datetime | timedelta | None = None, until: datetime | None = None, **filters: str) -> int:
+        """Number of decisions matching the filters."""
+        return len(self.rows(since, until, **filters))
+
+    def top(
+        self,
+        field: str,
+        n: int = 10,
+        since: datetime | timedelta | None = None,
+        until: datetime | None = None,
+        **filters: str,
+    ) -> list[tuple[str, int]]:
+        """Most frequent values of ``field`` among matching decisions.
+
+        Example:
+            ``index.top("reason", agent="a1", outcome="deny", since=timedelta(hours=24))``
+        """
+        if field not in self._codes:
+            raise ValueError(f"Unknown decision field {field!r}; indexed: {INDEXED_FIELDS}")
+        codes = self._row_codes[field]
+        counts: Counter[int] = Counter()
+        for row in self.rows(since, until, **filters):
+            counts.update(codes[row])
+        names = self._names[field]
+        return [(names[code], count) for code, count in counts.most_common(n)]
+
+    def deny_rates(
+        self,
+        bucket: timedelta = timedelta(hours=1),
+        since: datetime | timedelta | None = None,
+        until: datetime | None = None,
+        **filters: str,
+    ) -> list[RateBucket]:
+        """Deny rate per time bucket, oldest first (empty buckets omitted)."""
+        width = bucket // _MICROSECOND
+        deny_code = self._codes["outcome"].get("deny", -1)
+        outcomes = self._row_codes["outcome"]
+        totals: dict[int, list[int]] = {}
+        for row in self.rows(since, until, **filters):
+            slot = totals.setdefault(self._times[row] // width, [0, 0])
+            slot[0] += 1
+            slot[1] += deny_code in outcomes[row]
+        return [
+            RateBucket(start=_EPOCH + key * width * _MICROSECOND, total=total, denied=denied)
+            for key, (total, denied) in sorted(totals.items())
+        ]
+
+    def latency_percentiles(
+        self,
+        q: Iterable[float] = (50, 95, 99),
+        since: datetime | timedelta | None = None,
+        until: datetime | None = None,
+        **filters: str,
+    ) -> dict[float, float]:
+        """Evaluation latency percentiles (nearest rank) of matching decisions."""
+        values = sorted(
+            v for v in (self._latency[r] for r in self.rows(since, until, **filters)) if not math.isnan(v)
+        )
+        if not values:
+            return {}
+        return {p: values[min(len(values) - 1, max(0, math.ceil(p / 100 * len(values)) - 1))] for p in q}
+
+    def values(self, field: str) -> list[str]:
+        """Distinct values seen for an indexed field."""
+        return list(self._names[field])
+
+
+__all__ = [
+    "FIELD_ALIASES",
+    "INDEXED_FIELDS",
+    "DecisionIndex",
+    "RateBucket",
+]
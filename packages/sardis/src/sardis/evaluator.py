@@ -0,0 +1,534 @@
+"""
+Offline, deterministic policy evaluation for what-if analysis.
+
+``policies.check`` and ``simulation.simulate`` cost one round trip per
+transaction, which makes replaying a month of history against a proposed
+policy impractical. :class:`PolicyEvaluator` evaluates an
+:class:`OfflinePolicy` locally over a batch of transactions (ledger entries,
+raw dicts, or simulation inputs), and :func:`what_if` reports which
+transactions would flip between allow and deny under a new policy.
+
+Evaluation is deterministic: transactions are replayed in
+``(created_at, tx_id)`` order, amounts are compared as exact integer minor
+units, and period limits use calendar UTC days, ISO weeks and months. Only
+allowed transactions count towards totals, and the global daily, monthly and
+total caps are USD amounts that only USD-pegged tokens (:data:`USD_TOKENS`)
+count towards; spend in other currencies is never summed into them. Checks
+run in this order and the first failure is the reason:
+
+1. token allow-list, 2. destination block/allow lists, 3. purpose required,
+4. per-transaction limit, 5. merchant (vendor pattern) limits,
+6. global daily/monthly/total limits, 7. approval threshold (``"review"``).
+
+The server remains authoritative. :func:`check_parity_async` and
+:func:`check_parity_sync` re-check a random sample with ``policies.check`` and
+report disagreements; period limits are evaluated by the server against live
+spend, so parity is only meaningful for stateless checks or a fresh agent.
+
+Example:
+    ```python
+    proposed = OfflinePolicy.from_parsed(await client.policies.parse(text))
+    entries = [e async for e in client.ledger.paginate_entries(wallet_id="wallet_123")]
+    report = what_if(proposed, entries, current=OfflinePolicy.from_dict(await client.policies.get("agent_123")))
+    print(len(report.newly_denied), report.reasons())
+    ```
+"""
+from __future__ import annotations
+
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from decimal import Decimal
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from .columnar import DEFAULT_SCALE, to_epoch_micros, to_minor_units
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .models.policy import ParsedPolicy
+    from .resources.policies import AsyncPoliciesResource, PoliciesResource
+
+# Tokens counted against limits denominated in USD.
+USD_TOKENS = frozenset({"USD", "USDC", "USDT", "PYUSD", "USDG"})
+
+_DAY_MICROS = 86_400_000_000
+_PERIOD_ALIASES = {
+    "transaction": "per_transaction", "per_transaction": "per_transaction", "per_tx": "per_transaction",
+    "day": "daily", "daily": "daily",
+    "week": "weekly", "weekly": "weekly",
+    "month": "monthly", "monthly": "monthly",
+    "total": "total", "lifetime": "total", "all_time": "total",
+}
+
+
+def _amount(value: Any) -> Decimal | None:
+    return None if value is None else Decimal(str(value))
+
+
+def _names(value: Any) -> frozenset[str] | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(",")
+    return frozenset(str(v).strip().lower() for v in value if str(v).strip())
+
+
+@dataclass(frozen=True)
+class PeriodLimit:
+    """A spending cap on transactions matching a vendor pattern.
+
+    Attributes:
+        amount: Maximum spend per period
+        period: ``per_transaction``, ``daily``, ``weekly``, ``monthly`` or ``total``
+        pattern: Case-insensitive glob matched against the merchant or
+            destination (``None`` matches everything)
+        currency: Limit currency (``None`` counts every currency)
+    """
+
+    amount: Decimal
+    period: str
+    pattern: str | None = None
+    currency: str | None = None
+
+    def __post_init__(self) -> None:
+        period = _PERIOD_ALIASES.get(self.period.lower())
+        if period is None:
+            raise ValueError(f"Unknown limit period {self.period!r}")
+        object.__setattr__(self, "period", period)
+
+    def applies_to(self, merchant: str, currency: str) -> bool:
+        """Whether a transaction to ``merchant`` in ``currency`` counts towards this limit."""
+        if self.currency is not None:
+            limit = self.currency.upper()
+            if currency != limit and not (limit == "USD" and currency in USD_TOKENS):
+                return False
+        return self.pattern is None or self.pattern in ("*", "") or fnmatchcase(merchant, self.pattern.lower())
+
+
+@dataclass(frozen=True)
+class OfflinePolicy:
+    """A spending policy in a form that can be evaluated locally.
+
+    Attributes:
+        max_per_tx: Per-transaction cap
+        max_total: Lifetime cap on USD-token spend
+        daily_limit: Calendar-day (UTC) cap on USD-token spend
+        monthly_limit: Calendar-month (UTC) cap on USD-token spend
+        limits: Vendor-scoped limits
+        allowed_destinations: If set, only these destinations/merchants are allowed
+        blocked_destinations: Destinations/merchants that are always denied
+        allowed_tokens: If set, only these tokens/currencies are allowed
+        approval_threshold: Amounts above this need manual approval
+        require_purpose: Whether every payment needs a purpose
+        policy_id: Server policy ID, if any
+    """
+
+    max_per_tx: Decimal | None = None
+    max_total: Decimal | None = None
+    daily_limit: Decimal | None = None
+    monthly_limit: Decimal | None = None
+    limits: tuple[PeriodLimit, ...] = ()
+    allowed_destinations: frozenset[str] | None = None
+    blocked_destinations: frozenset[str] = frozenset()
+    allowed_tokens: frozenset[str] | None = None
+    approval_threshold: Decimal | None = None
+    require_purpose: bool = False
+    policy_id: str | None = None
+
+    @classmethod
+    def from_parsed(cls, parsed: ParsedPolicy) -> OfflinePolicy:
+        """Build from a policy returned by ``policies.parse``/``policies.preview``.
+
+        :class:`~sardis.models.policy.ParsedPolicy` has no ``max_per_tx``
+        field, so the result leaves it unset: a parsed per-transaction cap
+        arrives as a ``spending_limits`` entry with period
+        ``per_transaction`` and is enforced through ``limits`` (step 5,
+        reason ``merchant_limit:*:per_transaction``) instead of step 4.
+        """
+        return cls(
+            daily_limit=_amount(parsed.global_daily_limit),
+            monthly_limit=_amount(parsed.global_monthly_limit),
+            limits=tuple(
+                PeriodLimit(
+                    amount=Decimal(str(limit.max_amount)),
+                    period=limit.period,
+                    pattern=limit.vendor_pattern,
+                    currency=limit.currency,
+                )
+                for limit in parsed.spending_limits
+            ),
+            approval_threshold=_amount(parsed.requires_approval_above),
+            policy_id=parsed.policy_id,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> OfflinePolicy:
+        """Build from a ``policies.get`` response or a ``policies set`` payload.
+
+        Keys follow the CLI: ``max_per_tx``, ``max_total``, ``allowed_destinations``,
+        ``blocked_destinations``, ``allowed_tokens``, ``approval_threshold`` and
+        ``require_purpose``; ``spending_limits``, ``global_daily_limit`` and
+        ``global_monthly_limit`` are read as in :class:`~sardis.models.policy.ParsedPolicy`.
+        """
+        return cls(
+            max_per_tx=_amount(data.get("max_per_tx", data.get("limit_per_tx"))),
+            max_total=_amount(data.get("max_total", data.get("limit_total"))),
+            daily_limit=_amount(data.get("global_daily_limit", data.get("daily_limit"))),
+            monthly_limit=_amount(data.get("global_monthly_limit", data.get("monthly_limit"))),
+            limits=tuple(
+                PeriodLimit(
+                    amount=Decimal(str(limit["max_amount"])),
+                    period=limit.get("period", "per_transaction"),
+                    pattern=limit.get("vendor_pattern"),
+                    currency=limit.get("currency"),
+                )
+                for limit in data.get("spending_limits") or ()
+            ),
+            allowed_destinations=_names(data.get("allowed_destinations") or None),
+            blocked_destinations=_names(data.get("blocked_destinations")) or frozenset(),
+            allowed_tokens=_names(data.get("allowed_tokens") or None),
+            approval_threshold=_amount(data.get("approval_threshold", data.get("requires_approval_above"))),
+            require_purpose=bool(data.get("require_purpose", False)),
+            policy_id=data.get("policy_id"),
+        )
+
+
+@dataclass(frozen=True)
+class PolicyVerdict:
+    """Local decision for one transaction.
+
+    Attributes:
+        tx_id: Transaction ID (or input position when the input has none)
+        outcome: ``"allow"``, ``"deny"`` or ``"review"`` (needs approval)
+        reason: Failed check, or ``"ok"``
+    """
+
+    tx_id: str
+    outcome: str
+    reason: str
+
+    @property
+    def allowed(self) -> bool:
+        """Whether the transaction is allowed without approval."""
+        return self.outcome == "allow"
+
+
+@dataclass(frozen=True)
+class _Tx:
+    tx_id: str
+    micros: int
+    minor: int
+    amount: Decimal
+    currency: str
+    merchant: str
+    purpose: bool
+    source: dict[str, Any]
+
+
+def _prepare(transactions: Iterable[Any], scale: int) -> list[_Tx]:
+    prepared = []
+    for position, tx in enumerate(transactions):
+        if isinstance(tx, BaseModel):
+            tx = tx.model_dump(mode="json")
+        amount = tx.get("amount", 0)
+        when = tx.get("created_at") or tx.get("timestamp")
+        merchant = tx.get("merchant_id") or tx.get("destination") or tx.get("to_wallet") or ""
+        prepared.append(_Tx(
+            tx_id=str(tx.get("tx_id") or tx.get("id") or position),
+            micros=to_epoch_micros(when) if when else 0,
+            minor=to_minor_units(amount if isinstance(amount, (int, Decimal)) else str(amount), scale),
+            amount=Decimal(str(amount)),
+            currency=str(tx.get("currency") or tx.get("token") or "USDC").upper(),
+            merchant=str(merchant).lower(),
+            purpose=bool(tx.get("purpose")),
+            source=tx,
+        ))
+    prepared.sort(key=lambda t: (t.micros, t.tx_id))
+    return prepared
+
+
+def _period_key(period: str, micros: int) -> Any:
+    if period == "daily":
+        return micros // _DAY_MICROS
+    if period == "weekly":
+        # 1970-01-01 was a Thursday; shift so weeks start on Monday.
+        return (micros // _DAY_MICROS + 3) // 7
+    if period == "monthly":
+        when = datetime.fromtimestamp(micros / 1_000_000, UTC)
+        return when.year * 12 + when.month
+    return 0
+
+
+class PolicyEvaluator:
+    """Evaluates an :class:`OfflinePolicy` over transactions, locally.
+
+    Args:
+        policy: Policy to evaluate
+        scale: Fractional digits amounts are compared at
+    """
+
+    def __init__(self, policy: OfflinePolicy, scale: int = DEFAULT_SCALE) -> None:
+        self.policy = policy
+        self.scale = scale
+
+    def _minor(self, value: Decimal | None) -> int | None:
+        return None if value is None else to_minor_units(value, self.scale)
+
+    def evaluate(self, transactions: Iterable[Any]) -> list[PolicyVerdict]:
+        """Replay transactions in time order and decide each one.
+
+        Args:
+            transactions: Ledger entries, raw dicts or simulation inputs with
+                ``amount``, ``currency``/``token``, ``created_at`` and
+                ``merchant_id``/``destination``/``to_wallet``
+
+        Returns:
+            Verdicts in replay order
+        """
+        return self._run(_prepare(transactions, self.scale))
+
+    def _run(self, rows: list[_Tx]) -> list[PolicyVerdict]:
+        policy = self.policy
+        max_per_tx = self._minor(policy.max_per_tx)
+        approval = self._minor(policy.approval_threshold)
+        # (label, cap, period, limit): global caps are USD limits on every merchant.
+        windows: list[tuple[str, int, str, PeriodLimit]] = []
+        for name, cap, period in (
+            ("daily_limit", policy.daily_limit, "daily"),
+            ("monthly_limit", policy.monthly_limit, "monthly"),
+            ("total_limit", policy.max_total, "total"),
+        ):
+            if cap is not None:
+                windows.append((name, to_minor_units(cap, self.scale), period, PeriodLimit(cap, period, currency="USD")))
+        scoped = [
+            (f"merchant_limit:{limit.pattern or '*'}:{limit.period}", to_minor_units(limit.amount, self.scale),
+             limit.period, limit)
+            for limit in policy.limits
+        ]
+        spent: dict[tuple[str, Any], int] = {}
+
+        verdicts = []
+        for tx in rows:
+            reason = None
+            if policy.allowed_tokens is not None and tx.currency.lower() not in policy.allowed_tokens:
+                reason = "token_not_allowed"
+            elif tx.merchant in policy.blocked_destinations:
+                reason = "destination_blocked"
+            elif policy.allowed_destinations is not None and tx.merchant not in policy.allowed_destinations:
+                reason = "destination_not_allowed"
+            elif policy.require_purpose and not tx.purpose:
+                reason = "purpose_required"
+            elif max_per_tx is not None and tx.minor > max_per_tx:
+                reason = "per_transaction_limit"
+
+            keys = []
+            if reason is None:
+                for label, cap, period, limit in scoped + windows:
+                    if not limit.applies_to(tx.merchant, tx.currency):
+                        continue
+                    if period == "per_transaction":
+                        if tx.minor > cap:
+                            reason = label
+                            break
+                        continue
+                    key = (label, _period_key(period, tx.micros))
+                    if spent.get(key, 0) + tx.minor > cap:
+                        reason = label
+                        break
+                    keys.append(key)
+
+            if reason is not None:
+                verdicts.append(PolicyVerdict(tx.tx_id, "deny", reason))
+            elif approval is not None and tx.minor > approval:
+                verdicts.append(PolicyVerdict(tx.tx_id, "review", "requires_approval"))
+            else:
+                for key in keys:
+                    spent[key] = spent.get(key, 0) + tx.minor
+                verdicts.append(PolicyVerdict(tx.tx_id, "allow", "ok"))
+        return verdicts
+
+
+@dataclass(frozen=True)
+class Flip:
+    """A transaction whose outcome differs between two policies.
+
+    Attributes:
+        tx_id: Transaction ID
+        before: Verdict under the current policy (or history)
+        after: Verdict under the proposed policy
+    """
+
+    tx_id: str
+    before: PolicyVerdict
+    after: PolicyVerdict
+
+
+@dataclass
+class WhatIfReport:
+    """Outcome of replaying transactions under a proposed policy.
+
+    Attributes:
+        verdicts: Verdicts under the proposed policy, in replay order
+        flips: Transactions whose outcome changed
+    """
+
+    verdicts: list[PolicyVerdict] = field(default_factory=list)
+    flips: list[Flip] = field(default_factory=list)
+
+    @property
+    def newly_denied(self) -> list[Flip]:
+        """Previously allowed transactions the proposed policy would not allow."""
+        return [f for f in self.flips if f.before.allowed and not f.after.allowed]
+
+    @property
+    def newly_allowed(self) -> list[Flip]:
+        """Previously blocked transactions the proposed policy would allow."""
+        return [f for f in self.flips if f.after.allowed and not f.before.allowed]
+
+    def reasons(self) -> Counter[str]:
+        """Histogram of reasons among non-allowed verdicts."""
+        return Counter(v.reason for v in self.verdicts if not v.allowed)
+
+
+def what_if(
+    proposed: OfflinePolicy,
+    transactions: Iterable[Any],
+    current: OfflinePolicy | None = None,
+    scale: int = DEFAULT_SCALE,
+) -> WhatIfReport:
+    """Replay transactions under ``proposed`` and report outcome flips.
+
+    Args:
+        proposed: Policy being evaluated
+        transactions: Historical transactions (see :meth:`PolicyEvaluator.evaluate`)
+        current: Policy to compare against; ``None`` treats every transaction
+            as allowed, which is right for executed ledger history
+        scale: Fractional digits amounts are compared at
+
+    Returns:
+        Proposed verdicts and the transactions that flip
+    """
+    rows = _prepare(transactions, scale)
+    after = PolicyEvaluator(proposed, scale)._run(rows)
+    if current is None:
+        before = [PolicyVerdict(tx.tx_id, "allow", "ok") for tx in rows]
+    else:
+        before = PolicyEvaluator(current, scale)._run(rows)
+    flips = [Flip(b.tx_id, b, a) for b, a in zip(before, after, strict=True) if b.outcome != a.outcome]
+    return WhatIfReport(verdicts=after, flips=flips)
+
+
+@dataclass(frozen=True)
+class ParityMismatch:
+    """A sampled transaction where the local and server decisions differ.
+
+    Attributes:
+        tx_id: Transaction ID
+        local: Local verdict
+        server_allowed: ``allowed`` returned by ``policies.check``
+        server_reason: ``reason`` returned by ``policies.check``
+    """
+
+    tx_id: str
+    local: PolicyVerdict
+    server_allowed: bool
+    server_reason: str
+
+
+@dataclass
+class ParityReport:
+    """Outcome of a local/server parity check.
+
+    Attributes:
+        checked: Transactions re-checked on the server
+        mismatches: Disagreements
+    """
+
+    checked: int = 0
+    mismatches: list[ParityMismatch] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every sampled decision matched."""
+        return not self.mismatches
+
+
+def _sample(
+    policy: OfflinePolicy, transactions: Iterable[Any], sample: int, seed: int, scale: int,
+) -> list[tuple[_Tx, PolicyVerdict]]:
+    rows = _prepare(transactions, scale)
+    pairs = list(zip(rows, PolicyEvaluator(policy, scale)._run(rows), strict=True))
+    return random.Random(seed).sample(pairs, min(sample, len(pairs)))
+
+
+def _check_kwargs(agent_id: str, tx: _Tx) -> dict[str, Any]:
+    return {
+        "agent_id": agent_id,
+        "amount": tx.amount,
+        "currency": tx.currency,
+        "merchant_id": tx.source.get("merchant_id") or tx.source.get("destination") or tx.source.get("to_wallet"),
+        "merchant_category": tx.source.get("merchant_category"),
+        "mcc_code": tx.source.get("mcc_code"),
+    }
+
+
+async def check_parity_async(
+    policies: AsyncPoliciesResource,
+    agent_id: str,
+    policy: OfflinePolicy,
+    transactions: Iterable[Any],
+    sample: int = 50,
+    seed: int = 0,
+    scale: int = DEFAULT_SCALE,
+) -> ParityReport:
+    """Re-check a random sample with ``policies.check`` and compare decisions.
+
+    ``policy`` should be the agent's policy as currently applied on the server.
+    """
+    report = ParityReport()
+    for tx, verdict in _sample(policy, transactions, sample, seed, scale):
+        result = await policies.check(**_check_kwargs(agent_id, tx))
+        report.checked += 1
+        if result.allowed != verdict.allowed:
+            report.mismatches.append(ParityMismatch(tx.tx_id, verdict, result.allowed, result.reason))
+    return report
+
+
+def check_parity_sync(
+    policies: PoliciesResource,
+    agent_id: str,
+    policy: OfflinePolicy,
+    transactions: Iterable[Any],
+    sample: int = 50,
+    seed: int = 0,
+    scale: int = DEFAULT_SCALE,
+) -> ParityReport:
+    """Synchronous version of :func:`check_parity_async`."""
+    report = ParityReport()
+    for tx, verdict in _sample(policy, transactions, sample, seed, scale):
+        result = policies.check(**_check_kwargs(agent_id, tx))
+        report.checked += 1
+        if result.allowed != verdict.allowed:
+            report.mismatches.append(ParityMismatch(tx.tx_id, verdict, result.allowed, result.reason))
+    return report
+
+
+__all__ = [
+    "USD_TOKENS",
+    "Flip",
+    "OfflinePolicy",
+    "ParityMismatch",
+    "ParityReport",
+    "PeriodLimit",
+    "PolicyEvaluator",
+    "PolicyVerdict",
+    "WhatIfReport",
+    "check_parity_async",
+    "check_parity_sync",
+    "what_if",
+]
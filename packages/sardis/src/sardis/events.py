@@ -0,0 +1,558 @@
+"""
+Real-time account events over server-sent events, with a polling fallback.
+
+``client.events.subscribe(types=[...])`` returns an async iterator of
+:class:`StreamEvent`. All subscriptions of a client share one
+:class:`EventStream`, which keeps a single ``GET events/stream`` connection
+open and fans each event out to the subscribers whose types match. Each
+subscriber has its own bounded queue, so a slow consumer loses its oldest
+events (counted in ``dropped``) instead of stalling the others.
+
+The connection reconnects with exponential backoff and resumes from the
+last event received through ``Last-Event-ID``. The server's comment
+heartbeats keep it alive; a connection silent for ``heartbeat_timeout``
+seconds is treated as dead and reopened. Subscribers created with
+``heartbeats=True`` also receive a ``"heartbeat"`` event for every server
+heartbeat (or poll round), so they can tell a quiet stream from a broken
+one.
+
+Servers without the stream endpoint (404/405/501) are polled instead,
+behind the same API. Only the sources some subscriber needs are polled:
+``approvals/pending``, active holds, ``kill-switch/status`` and open
+``exceptions``. Requests carry ``If-None-Match`` and unchanged bodies are
+not parsed, and the interval grows while nothing changes and snaps back
+when something does. Changes become ``approval.requested`` /
+``approval.resolved``, ``hold.created`` / ``hold.closed``,
+``exception.created`` / ``exception.resolved`` and ``kill_switch.changed``
+events. The first poll only records the current state, matching the
+stream, which only delivers events that happen after connecting. The
+stream endpoint is probed again every ``stream_retry`` seconds.
+
+Type filters accept exact types, prefixes such as ``"approval.*"`` and
+``"*"``.
+
+Example:
+    ```python
+    async with AsyncSardis(api_key="...") as client:
+        async with client.events.subscribe(types=["approval.*", "kill_switch.changed"]) as events:
+            async for event in events:
+                print(event.type, event.data)
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import itertools
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from .models.errors import APIError, SardisError
+from .resources.base import NO_BATCH_STATUS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .client import AsyncSardis
+
+logger = logging.getLogger("sardis_sdk.events")
+
+EVENTS_PATH = "events/stream"
+HEARTBEAT = "heartbeat"
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """One event from the stream (or synthesized by the polling fallback).
+
+    Attributes:
+        type: Event type, e.g. ``"approval.requested"``
+        data: Event body (parsed JSON where possible)
+        id: Event ID used for ``Last-Event-ID`` resume; polling events have
+            local IDs
+        received_at: Unix time the event was received
+    """
+
+    type: str
+    data: Any = None
+    id: str | None = None
+    received_at: float = field(default_factory=time.time)
+
+
+@dataclass(frozen=True)
+class PollSource:
+    """A list or status endpoint the polling fallback diffs for changes.
+
+    Attributes:
+        name: Source name
+        path: API path
+        created: Event type for items that appeared (or any change, for a
+            status source)
+        removed: Event type for items that disappeared; None for a status
+            source, which is compared as a whole
+        items_keys: Response keys that may hold the item list
+        id_fields: Item fields that may hold the item ID
+        params: Query parameters
+    """
+
+    name: str
+    path: str
+    created: str
+    removed: str | None = None
+    items_keys: tuple[str, ...] = ("items",)
+    id_fields: tuple[str, ...] = ("id",)
+    params: dict[str, Any] = field(default_factory=dict)
+
+    def event_types(self) -> tuple[str, ...]:
+        return (self.created,) if self.removed is None else (self.created, self.removed)
+
+
+POLL_SOURCES: tuple[PollSource, ...] = (
+    PollSource(
+        "approvals", "approvals/pending", "approval.requested", "approval.resolved",
+        items_keys=("approvals", "items"), id_fields=("approval_id", "id"),
+    ),
+    PollSource(
+        "holds", "/api/v2/holds", "hold.created", "hold.closed",
+        items_keys=("holds", "items"), id_fields=("hold_id", "id"),
+    ),
+    PollSource(
+        "exceptions", "exceptions", "exception.created", "exception.resolved",
+        items_keys=("exceptions", "items"), id_fields=("exception_id", "id"), params={"status": "open"},
+    ),
+    PollSource("kill_switch", "kill-switch/status", "kill_switch.changed"),
+)
+
+
+def matches(types: frozenset[str] | None, event_type: str) -> bool:
+    """Whether ``event_type`` passes a type filter (None passes everything)."""
+    if types is None or event_type in types or "*" in types:
+        return True
+    return any(t.endswith(".*") and event_type.startswith(t[:-1]) for t in types)
+
+
+def _transient(error: Exception) -> bool:
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, APIError) and (error.status_code in (408, 425, 429) or error.status_code >= 500):
+        return True
+    return isinstance(error, SardisError) and error.retryable
+
+
+class _StreamUnsupported(Exception):
+    """The server has no event stream endpoint."""
+
+
+class _SSEParser:
+    """Incremental parser for the ``text/event-stream`` format."""
+
+    def __init__(self) -> None:
+        self.last_event_id: str | None = None
+        self.retry: float | None = None
+        self._data: list[str] = []
+        self._type = ""
+
+    def feed(self, line: str) -> StreamEvent | str | None:
+        """Feed one line; returns a complete event, :data:`HEARTBEAT` for a comment, or None."""
+        if not line:
+            if not self._data:
+                self._type = ""
+                return None
+            raw = "\n".join(self._data)
+            event_type, self._data, self._type = self._type, [], ""
+            try:
+                data: Any = json.loads(raw)
+            except ValueError:
+                data = raw
+            if not event_type or event_type == "message":
+                event_type = (data.get("type") or data.get("event_type") if isinstance(data, dict) else None) or "message"
+            return StreamEvent(type=event_type, data=data, id=self.last_event_id)
+        if line.startswith(":"):
+            return HEARTBEAT
+        name, _, value = line.partition(":")
+        value = value.removeprefix(" ")
+        if name == "data":
+            self._data.append(value)
+        elif name == "event":
+            self._type = value
+        elif name == "id" and "\0" not in value:
+            self.last_event_id = value or None
+        elif name == "retry" and value.isdigit():
+            self.retry = int(value) / 1000
+        return None
+
+
+class EventSubscription:
+    """A local subscriber to an :class:`EventStream`.
+
+    Iterate it with ``async for``; iteration ends when the subscription is
+    closed and raises if the stream failed permanently (for example with
+    an authentication error).
+    """
+
+    def __init__(
+        self,
+        stream: EventStream,
+        types: frozenset[str] | None,
+        heartbeats: bool,
+        max_queue: int,
+    ) -> None:
+        self.types = types
+        self.heartbeats = heartbeats
+        self.dropped = 0
+        self._stream = stream
+        self._queue: asyncio.Queue[StreamEvent | BaseException | None] = asyncio.Queue(max_queue)
+        self._closed = False
+
+    def accepts(self, event: StreamEvent) -> bool:
+        """Whether this subscriber wants ``event``."""
+        if event.type == HEARTBEAT:
+            return self.heartbeats
+        return matches(self.types, event.type)
+
+    def _put(self, item: StreamEvent | BaseException | None) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except asyncio.QueueFull:
+                self._queue.get_nowait()
+                self.dropped += 1
+
+    def __aiter__(self) -> EventSubscription:
+        return self
+
+    async def __anext__(self) -> StreamEvent:
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        item = await self._queue.get()
+        if item is None:
+            raise StopAsyncIteration
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    async def wait_connected(self) -> None:
+        """Wait until events that happen from now on will be delivered.
+
+        Returns once the stream is connected or, when polling, once the first
+        poll has recorded its baseline. Also returns if the stream failed
+        permanently; iterating then raises the error.
+        """
+        await self._stream.wait_connected()
+
+    async def close(self) -> None:
+        """Stop receiving events."""
+        if not self._closed:
+            self._closed = True
+            self._put(None)
+            await self._stream._unsubscribe(self)
+
+    async def __aenter__(self) -> EventSubscription:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+class EventStream:
+    """One upstream event connection shared by many local subscribers.
+
+    Created by ``client.events``; the connection is opened with the first
+    subscription and closed with the last.
+
+    Args:
+        client: An :class:`~sardis.AsyncSardis` client
+        path: Stream endpoint
+        reconnect_delay: First delay before reconnecting (the server's
+            ``retry`` field overrides it)
+        max_reconnect_delay: Upper bound of the reconnect backoff
+        heartbeat_timeout: Seconds without any data before the connection
+            counts as dead
+        poll_interval: Fallback polling interval while things change
+        max_poll_interval: Fallback polling interval after a quiet period
+        stream_retry: Seconds between attempts to return from polling to
+            the stream
+        sources: Endpoints polled in fallback mode
+    """
+
+    def __init__(
+        self,
+        client: AsyncSardis,
+        *,
+        path: str = EVENTS_PATH,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        heartbeat_timeout: float = 45.0,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 30.0,
+        stream_retry: float = 300.0,
+        sources: Iterable[PollSource] = POLL_SOURCES,
+    ) -> None:
+        self._client = client
+        self.path = path
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.heartbeat_timeout = heartbeat_timeout
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.stream_retry = stream_retry
+        self.sources = tuple(sources)
+        self.mode: str | None = None  # "stream" or "poll" once known
+        self.last_event_id: str | None = None
+        self._subscribers: list[EventSubscription] = []
+        self._task: asyncio.Task[None] | None = None
+        # Set once the current task delivers events (stream open or polling baseline recorded).
+        self._connected = asyncio.Event()
+        self._types: frozenset[str] | None = frozenset()
+        self._server_retry: float | None = None
+        self._seq = itertools.count(1)
+        # per-source polling state: ETag, body digest, items by ID (or the status body)
+        self._etags: dict[str, str] = {}
+        self._digests: dict[str, bytes] = {}
+        self._snapshots: dict[str, dict[str, Any]] = {}
+
+    @property
+    def subscribers(self) -> int:
+        """Number of active subscriptions."""
+        return len(self._subscribers)
+
+    def subscribe(
+        self,
+        types: Iterable[str] | None = None,
+        *,
+        heartbeats: bool = False,
+        max_queue: int = 1000,
+    ) -> EventSubscription:
+        """Add a local subscriber; see :meth:`~sardis.resources.events.AsyncEventsResource.subscribe`."""
+        subscription = EventSubscription(
+            self, frozenset(types) if types is not None else None, heartbeats, max_queue
+        )
+        self._subscribers.append(subscription)
+        wanted = self._wanted()
+        if self._task is None or self._task.done():
+            self._types = wanted
+            self._connected.clear()
+            self._task = asyncio.create_task(self._run())
+        elif not self._covers(self._types, wanted):
+            # Reconnect with the wider filter; Last-Event-ID avoids losing events.
+            self._types = wanted
+            self._connected.clear()
+            self._task.cancel()
+            self._task = asyncio.create_task(self._run())
+        return subscription
+
+    async def wait_connected(self) -> None:
+        """Wait until the connection delivers events; see :meth:`EventSubscription.wait_connected`."""
+        while not self._connected.is_set() and self._task is not None and not self._task.done():
+            task = self._task
+            connected = asyncio.ensure_future(self._connected.wait())
+            try:
+                await asyncio.wait({connected, task}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                connected.cancel()
+
+    async def _unsubscribe(self, subscription: EventSubscription) -> None:
+        if subscription in self._subscribers:
+            self._subscribers.remove(subscription)
+        if not self._subscribers:
+            await self._stop()
+
+    async def close(self) -> None:
+        """Close every subscription and the upstream connection."""
+        for subscription in list(self._subscribers):
+            subscription._closed = True
+            subscription._put(None)
+        self._subscribers.clear()
+        await self._stop()
+
+    async def _stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def _wanted(self) -> frozenset[str] | None:
+        types: set[str] = set()
+        for subscription in self._subscribers:
+            if subscription.types is None:
+                return None
+            types |= subscription.types
+        return frozenset(types)
+
+    @staticmethod
+    def _covers(current: frozenset[str] | None, wanted: frozenset[str] | None) -> bool:
+        if current is None:
+            return True
+        if wanted is None:
+            return False
+        return all(matches(current, t) for t in wanted)
+
+    def _publish(self, event: StreamEvent) -> None:
+        for subscription in self._subscribers:
+            if subscription.accepts(event):
+                subscription._put(event)
+
+    def _fail(self, error: BaseException) -> None:
+        for subscription in self._subscribers:
+            subscription._put(error)
+
+    # ------------------------------------------------------------------
+    # Connection loop
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        while True:
+            if self.mode == "poll":
+                if not await self._poll_loop():
+                    return
+                self.mode = None  # time to probe the stream again
+                continue
+            try:
+                if await self._stream():
+                    delay = self.reconnect_delay
+            except _StreamUnsupported:
+                logger.info("event stream unavailable; polling instead")
+                self.mode = "poll"
+                continue
+            except Exception as e:
+                if not _transient(e):
+                    self._fail(e)
+                    return
+                logger.debug("event stream disconnected", exc_info=True)
+            await asyncio.sleep(self._server_retry or delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _stream(self) -> bool:
+        """Read the stream until it ends; True if the connection was established."""
+        http = await self._client._get_client()
+        extra = {"Accept": "text/event-stream", "Cache-Control": "no-cache"}
+        if self.last_event_id:
+            extra["Last-Event-ID"] = self.last_event_id
+        params = {"types": ",".join(sorted(self._types))} if self._types else None
+        timeout = httpx.Timeout(10.0, read=self.heartbeat_timeout)
+        async with http.stream(
+            "GET",
+            self._client._build_url(self.path),
+            params=params,
+            headers=self._client._get_headers(extra_headers=extra),
+            timeout=timeout,
+        ) as response:
+            if response.status_code in NO_BATCH_STATUS:
+                raise _StreamUnsupported
+            if response.status_code >= 400:
+                await response.aread()
+                self._client._handle_error_response(response)
+            if "text/event-stream" not in response.headers.get("content-type", ""):
+                raise _StreamUnsupported
+            self.mode = "stream"
+            self._connected.set()
+            parser = _SSEParser()
+            parser.last_event_id = self.last_event_id
+            async for line in response.aiter_lines():
+                item = parser.feed(line.rstrip("\r"))
+                self._server_retry = parser.retry or self._server_retry
+                if item == HEARTBEAT:
+                    self._publish(StreamEvent(type=HEARTBEAT))
+                elif isinstance(item, StreamEvent):
+                    self.last_event_id = parser.last_event_id
+                    self._publish(item)
+        return True
+
+    # ------------------------------------------------------------------
+    # Polling fallback
+    # ------------------------------------------------------------------
+
+    async def _poll_loop(self) -> bool:
+        """Poll until ``stream_retry`` has passed; False after a permanent error."""
+        interval = self.poll_interval
+        started = time.monotonic()
+        while time.monotonic() - started < self.stream_retry:
+            sources = [s for s in self.sources if any(matches(self._types, t) for t in s.event_types())]
+            results = await asyncio.gather(*(self._poll(s) for s in sources), return_exceptions=True)
+            changed = False
+            for source, result in zip(sources, results, strict=True):
+                if isinstance(result, BaseException):
+                    if isinstance(result, Exception) and _transient(result):
+                        logger.debug("polling %s failed", source.name, exc_info=result)
+                        continue
+                    self._fail(result)
+                    return False
+                changed |= result
+            if all(source.name in self._snapshots for source in sources):
+                self._connected.set()
+            self._publish(StreamEvent(type=HEARTBEAT))
+            interval = self.poll_interval if changed else min(interval * 1.5, self.max_poll_interval)
+            await asyncio.sleep(interval)
+        return True
+
+    async def _poll(self, source: PollSource) -> bool:
+        """Poll one source and publish its changes; True if anything changed."""
+        http = await self._client._get_client()
+        extra = {"If-None-Match": self._etags[source.name]} if source.name in self._etags else None
+        response = await http.get(
+            self._client._build_url(source.path),
+            params=source.params or None,
+            headers=self._client._get_headers(extra_headers=extra),
+        )
+        if response.status_code == 304:
+            return False
+        if response.status_code >= 400:
+            self._client._handle_error_response(response)
+        if etag := response.headers.get("etag"):
+            self._etags[source.name] = etag
+        digest = hashlib.sha256(response.content).digest()
+        if self._digests.get(source.name) == digest:
+            return False
+        self._digests[source.name] = digest
+
+        data = response.json()
+        first = source.name not in self._snapshots
+        previous = self._snapshots.get(source.name, {})
+        if source.removed is None:
+            self._snapshots[source.name] = {"": data}
+            if not first:
+                self._emit(source.created, data)
+            return not first
+
+        items = data if isinstance(data, list) else next(
+            (data[k] for k in source.items_keys if isinstance(data.get(k), list)), []
+        )
+        current = {}
+        for item in items:
+            item_id = next((item[f] for f in source.id_fields if item.get(f) is not None), None)
+            if item_id is not None:
+                current[str(item_id)] = item
+        self._snapshots[source.name] = current
+        if first:
+            return False
+        added = [item for key, item in current.items() if key not in previous]
+        gone = [item for key, item in previous.items() if key not in current]
+        for item in added:
+            self._emit(source.created, item)
+        for item in gone:
+            self._emit(source.removed, item)
+        return bool(added or gone)
+
+    def _emit(self, event_type: str, data: Any) -> None:
+        self._publish(StreamEvent(type=event_type, data=data, id=f"poll_{next(self._seq)}"))
+
+
+__all__ = [
+    "EVENTS_PATH",
+    "HEARTBEAT",
+    "POLL_SOURCES",
+    "EventStream",
+    "EventSubscription",
+    "PollSource",
+    "StreamEvent",
+    "matches",
+]
@@ -0,0 +1,321 @@
+"""
+Time-partitioned parallel export for time-filtered list endpoints.
+
+Endpoints such as ``facility_gate.export_events`` and
+``evidence.list_policy_decisions`` return at most ``limit`` records for a
+time window. The exporters here cut ``[start, end)`` into partitions, fetch
+them concurrently, split any window that comes back full into halves until
+every window fits, and yield the merged records in time order.
+
+Every record is assigned to exactly one partition by its own timestamp
+(windows are half-open), and records sharing a timestamp are de-duplicated
+by ID, so records at partition boundaries are emitted once even when the
+server treats both ends of a window as inclusive.
+
+Splitting only works if the endpoint really filters by time. Every response
+is checked against its window, and a record outside it raises
+:class:`PartitionFilterError` at once instead of halving windows that can
+never shrink.
+
+Most callers use the resource helpers built on these classes,
+``facility_gate.stream_events`` and ``evidence.stream_policy_decisions``.
+
+Example:
+    ```python
+    async for event in client.facility_gate.stream_events(
+        occurred_from=datetime(2026, 1, 1, tzinfo=UTC),
+        occurred_to=datetime(2026, 4, 1, tzinfo=UTC),
+    ):
+        ...
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from .columnar import to_epoch_micros
+from .models.errors import SardisError
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+
+# Record fields tried, in order, for the timestamp and the de-duplication key.
+TIME_FIELDS = ("occurred_at", "created_at", "timestamp")
+ID_FIELDS = ("event_id", "decision_id", "packet_id", "id")
+
+
+class PartitionOverflowError(SardisError):
+    """A window of the minimum width still returned ``limit`` records."""
+
+
+class PartitionFilterError(SardisError):
+    """The endpoint returned records outside the requested time window."""
+
+
+@dataclass(frozen=True)
+class _Window:
+    start: datetime
+    end: datetime
+
+    def halves(self) -> tuple[_Window, _Window]:
+        middle = self.start + (self.end - self.start) / 2
+        return _Window(self.start, middle), _Window(middle, self.end)
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+def _first(record: dict[str, Any], fields: tuple[str, ...]) -> Any:
+    return next((record[f] for f in fields if record.get(f) is not None), None)
+
+
+class _PartitionedExporterBase:
+    def __init__(
+        self,
+        limit: int,
+        partitions: int,
+        concurrency: int,
+        min_window: timedelta,
+        time_fields: tuple[str, ...],
+        id_fields: tuple[str, ...],
+    ) -> None:
+        if limit < 2:
+            raise ValueError("limit must be at least 2")
+        self.limit = limit
+        self.partitions = partitions
+        self.concurrency = concurrency
+        self.min_window = min_window
+        self.time_fields = time_fields
+        self.id_fields = id_fields
+
+    def _windows(self, start: datetime, end: datetime) -> list[_Window]:
+        start, end = _aware(start), _aware(end)
+        if end <= start:
+            return []
+        step = (end - start) / self.partitions
+        bounds = [start + step * i for i in range(self.partitions)] + [end]
+        return [_Window(lo, hi) for lo, hi in zip(bounds, bounds[1:], strict=False) if hi > lo]
+
+    def _settle(self, window: _Window, records: list[dict[str, Any]]) -> list[dict[str, Any]] | None:
+        """Records of a fetched window in time order, or None if it must be split."""
+        lo, hi = to_epoch_micros(window.start), to_epoch_micros(window.end)
+        stamps = []
+        for record in records:
+            when = _first(record, self.time_fields)
+            micros = to_epoch_micros(when) if when is not None else lo
+            # The end is allowed too, for servers that treat it as inclusive.
+            if not lo <= micros <= hi:
+                raise PartitionFilterError(
+                    f"Record at {when} returned for window {window.start.isoformat()} to "
+                    f"{window.end.isoformat()}; the endpoint does not apply the time filter, "
+                    "so it cannot be exported by partition"
+                )
+            stamps.append(micros)
+        if len(records) >= self.limit:
+            if window.end - window.start <= self.min_window:
+                raise PartitionOverflowError(
+                    f"{len(records)} records between {window.start.isoformat()} and "
+                    f"{window.end.isoformat()}; raise limit or lower min_window"
+                )
+            return None
+        keyed = [
+            (micros, str(_first(record, self.id_fields) or ""), record)
+            for micros, record in zip(stamps, records, strict=True)
+            if micros < hi
+        ]
+        keyed.sort(key=lambda item: item[:2])
+        return [record for *_, record in keyed]
+
+
+class _Dedupe:
+    """Drops repeated IDs among records that share the latest timestamp."""
+
+    def __init__(self, exporter: _PartitionedExporterBase) -> None:
+        self._exporter = exporter
+        self._time: Any = object()
+        self._ids: set[str] = set()
+
+    def __call__(self, records: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        for record in records:
+            when = _first(record, self._exporter.time_fields)
+            record_id = _first(record, self._exporter.id_fields)
+            if when != self._time:
+                self._time, self._ids = when, set()
+            if record_id is not None:
+                if record_id in self._ids:
+                    continue
+                self._ids.add(record_id)
+            yield record
+
+
+class AsyncTimePartitionedExporter(_PartitionedExporterBase):
+    """Concurrent, adaptively split export of a time-filtered endpoint.
+
+    Args:
+        fetch: ``await fetch(start, end, limit)`` returning the records of
+            one window
+        limit: Records per request; a window returning this many is split
+        partitions: Initial number of equal-width windows
+        concurrency: Requests in flight
+        min_window: Narrowest window that may be split further
+        time_fields: Record fields holding the timestamp
+        id_fields: Record fields holding the de-duplication key
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[datetime, datetime, int], Awaitable[list[dict[str, Any]]]],
+        limit: int = 500,
+        partitions: int = 8,
+        concurrency: int = 4,
+        min_window: timedelta = timedelta(milliseconds=1),
+        time_fields: tuple[str, ...] = TIME_FIELDS,
+        id_fields: tuple[str, ...] = ID_FIELDS,
+    ) -> None:
+        super().__init__(limit, partitions, concurrency, min_window, time_fields, id_fields)
+        self._fetch = fetch
+
+    async def iter(self, start: datetime, end: datetime) -> AsyncIterator[dict[str, Any]]:
+        """Yield every record in ``[start, end)`` in time order."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        # Every task, including split children, so abandoning the iteration cancels them all.
+        spawned: set[asyncio.Task[Any]] = set()
+
+        def spawn(window: _Window) -> asyncio.Task[Any]:
+            task = asyncio.create_task(run(window))
+            spawned.add(task)
+            task.add_done_callback(spawned.discard)
+            return task
+
+        async def run(window: _Window) -> tuple[list[dict[str, Any]] | None, list[asyncio.Task[Any]]]:
+            async with semaphore:
+                records = await self._fetch(window.start, window.end, self.limit)
+            settled = self._settle(window, records)
+            if settled is not None:
+                return settled, []
+            return None, [spawn(half) for half in window.halves()]
+
+        async def drain(task: asyncio.Task[Any]) -> AsyncIterator[list[dict[str, Any]]]:
+            records, children = await task
+            if records is not None:
+                yield records
+            for child in children:
+                async for chunk in drain(child):
+                    yield chunk
+
+        windows = self._windows(start, end)
+        # Keep a bounded number of top-level windows in flight ahead of the consumer.
+        lookahead = max(self.concurrency * 2, 1)
+        tasks = [spawn(w) for w in windows[:lookahead]]
+        dedupe = _Dedupe(self)
+        try:
+            for i in range(len(windows)):
+                if i + lookahead < len(windows):
+                    tasks.append(spawn(windows[i + lookahead]))
+                async for chunk in drain(tasks[i]):
+                    for record in dedupe(chunk):
+                        yield record
+        finally:
+            for task in list(spawned):
+                task.cancel()
+
+    async def to_jsonl(self, path: str | os.PathLike[str], start: datetime, end: datetime) -> int:
+        """Stream the export to a JSON Lines file.
+
+        Returns:
+            Number of records written
+        """
+        count = 0
+        with open(path, "w") as f:
+            async for record in self.iter(start, end):
+                f.write(json.dumps(record, default=str) + "\n")
+                count += 1
+        return count
+
+
+class TimePartitionedExporter(_PartitionedExporterBase):
+    """Concurrent, adaptively split export of a time-filtered endpoint (threads).
+
+    Args:
+        fetch: ``fetch(start, end, limit)`` returning the records of one window
+        limit: Records per request; a window returning this many is split
+        partitions: Initial number of equal-width windows
+        concurrency: Worker threads
+        min_window: Narrowest window that may be split further
+        time_fields: Record fields holding the timestamp
+        id_fields: Record fields holding the de-duplication key
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[datetime, datetime, int], list[dict[str, Any]]],
+        limit: int = 500,
+        partitions: int = 8,
+        concurrency: int = 4,
+        min_window: timedelta = timedelta(milliseconds=1),
+        time_fields: tuple[str, ...] = TIME_FIELDS,
+        id_fields: tuple[str, ...] = ID_FIELDS,
+    ) -> None:
+        super().__init__(limit, partitions, concurrency, min_window, time_fields, id_fields)
+        self._fetch = fetch
+
+    def iter(self, start: datetime, end: datetime) -> Iterator[dict[str, Any]]:
+        """Yield every record in ``[start, end)`` in time order."""
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="sardis-export")
+
+        def run(window: _Window) -> tuple[list[dict[str, Any]] | None, list[Future[Any]]]:
+            settled = self._settle(window, self._fetch(window.start, window.end, self.limit))
+            if settled is not None:
+                return settled, []
+            # Children are queued, not awaited, so a full pool cannot deadlock.
+            return None, [executor.submit(run, half) for half in window.halves()]
+
+        def drain(future: Future[Any]) -> Iterator[list[dict[str, Any]]]:
+            records, children = future.result()
+            if records is not None:
+                yield records
+            for child in children:
+                yield from drain(child)
+
+        windows = self._windows(start, end)
+        lookahead = max(self.concurrency * 2, 1)
+        futures = [executor.submit(run, w) for w in windows[:lookahead]]
+        dedupe = _Dedupe(self)
+        try:
+            for i in range(len(windows)):
+                if i + lookahead < len(windows):
+                    futures.append(executor.submit(run, windows[i + lookahead]))
+                for chunk in drain(futures[i]):
+                    yield from dedupe(chunk)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def to_jsonl(self, path: str | os.PathLike[str], start: datetime, end: datetime) -> int:
+        """Stream the export to a JSON Lines file.
+
+        Returns:
+            Number of records written
+        """
+        count = 0
+        with open(path, "w") as f:
+            for record in self.iter(start, end):
+                f.write(json.dumps(record, default=str) + "\n")
+                count += 1
+        return count
+
+
+__all__ = [
+    "ID_FIELDS",
+    "TIME_FIELDS",
+    "AsyncTimePartitionedExporter",
+    "PartitionFilterError",
+    "PartitionOverflowError",
+    "TimePartitionedExporter",
+]
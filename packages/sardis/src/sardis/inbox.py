@@ -0,0 +1,141 @@
+"""
+Watching the approval inbox.
+
+Agent payments above a policy threshold wait for a human, so approval
+latency is often the slowest step of a payment. An :class:`ApprovalWatcher`
+yields each pending approval as soon as it appears. It subscribes to
+``approval.requested`` and ``approval.resolved`` on ``client.events`` and
+waits until the subscription is connected (or, when polling, has recorded
+its first snapshot) before listing what is already pending, so an approval
+requested between the two is either listed or announced. The event stream reconnects and resumes on its own, and
+on servers without it the same subscription polls ``approvals/pending``
+conditionally, faster while approvals arrive and slower while the inbox is
+quiet (see :mod:`sardis.events`).
+
+Decisions can then be made in bulk with ``client.approvals.approve_many``
+and ``deny_many``, which run with bounded concurrency and report a result
+per approval.
+
+Example:
+    ```python
+    async with AsyncSardis(api_key="...") as client:
+        async with ApprovalWatcher(client) as inbox:
+            async for approval in inbox:
+                print(approval["approval_id"], approval.get("amount"))
+
+        result = await client.approvals.approve_many(ids, notes="batch review")
+        for item in result.failed_results:
+            print(item.input, item.error)
+    ```
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from .client import AsyncSardis
+    from .events import EventSubscription
+
+APPROVAL_EVENTS = ("approval.requested", "approval.resolved")
+
+# Approval IDs remembered so a re-announced approval is not yielded twice.
+_SEEN_LIMIT = 10_000
+
+
+def approval_id(approval: dict[str, Any]) -> str | None:
+    """ID of an approval dictionary (``approval_id`` or ``id``)."""
+    value = approval.get("approval_id") or approval.get("id")
+    return str(value) if value is not None else None
+
+
+def _approval(data: Any) -> dict[str, Any]:
+    """The approval carried by an event body (bare, or under ``approval``/``payload``/``data``)."""
+    if not isinstance(data, dict):
+        return {}
+    if approval_id(data) is not None:
+        return data
+    for key in ("approval", "payload", "data"):
+        if isinstance(data.get(key), dict):
+            return data[key]
+    return data
+
+
+class ApprovalWatcher:
+    """Async iterator over approvals as they become pending.
+
+    Args:
+        client: An :class:`~sardis.AsyncSardis` client
+        include_existing: First yield the approvals already pending
+        max_queue: Events buffered while the consumer is busy
+    """
+
+    def __init__(
+        self,
+        client: AsyncSardis,
+        *,
+        include_existing: bool = True,
+        max_queue: int = 1000,
+    ) -> None:
+        self._client = client
+        self.include_existing = include_existing
+        self.max_queue = max_queue
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._subscription: EventSubscription | None = None
+
+    @property
+    def pending(self) -> list[dict[str, Any]]:
+        """Approvals seen as pending and not resolved since, oldest first."""
+        return list(self._pending.values())
+
+    def _add(self, approval: dict[str, Any]) -> bool:
+        """Record a pending approval; False if it was already yielded."""
+        key = approval_id(approval)
+        if key is None or key in self._seen:
+            return False
+        self._seen[key] = None
+        if len(self._seen) > _SEEN_LIMIT:
+            self._seen.popitem(last=False)
+        self._pending[key] = approval
+        return True
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        subscription = self._client.events.subscribe(types=APPROVAL_EVENTS, max_queue=self.max_queue)
+        self._subscription = subscription
+        try:
+            if self.include_existing:
+                await subscription.wait_connected()
+                for approval in await self._client.approvals.list_pending():
+                    if self._add(approval):
+                        yield approval
+            async for event in subscription:
+                approval = _approval(event.data)
+                if event.type == "approval.requested":
+                    if self._add(approval):
+                        yield approval
+                elif (key := approval_id(approval)) is not None:
+                    self._pending.pop(key, None)
+        finally:
+            self._subscription = None
+            await subscription.close()
+
+    async def close(self) -> None:
+        """Stop watching; an ``async for`` over the watcher ends."""
+        if self._subscription is not None:
+            await self._subscription.close()
+
+    async def __aenter__(self) -> ApprovalWatcher:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+__all__ = [
+    "APPROVAL_EVENTS",
+    "ApprovalWatcher",
+    "approval_id",
+]
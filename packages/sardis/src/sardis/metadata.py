@@ -0,0 +1,335 @@
+"""
+Chain and token metadata registry with a persistent on-disk cache.
+
+Routing code looks up supported chains and tokens on nearly every payment,
+and a fresh process (a serverless worker in particular) would otherwise
+call ``transactions.list_chains`` and ``transactions.list_tokens`` before
+its first payment. A :class:`ChainRegistry` (or :class:`AsyncChainRegistry`)
+loads the last snapshot from a versioned JSON file at construction, answers
+lookups from memory, and refreshes the snapshot in the background,
+rewriting the file atomically after each refresh.
+
+Gas estimates change far more often than metadata, so they are cached
+separately: a client created with ``gas_cache=True`` (or a
+:class:`GasEstimateCache`) reuses ``transactions.estimate_gas`` results per
+chain and token for a short TTL.
+
+Example:
+    ```python
+    with Sardis(api_key="...", gas_cache=True) as client:
+        registry = ChainRegistry(client.transactions, path="~/.cache/sardis/chains.json")
+        registry.start(interval=3600)  # refreshes at once if the file is stale
+
+        base = registry.chain("base")
+        usdc = registry.token("base", "USDC")
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .resources.transactions import ChainInfo, GasEstimate
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .resources.transactions import AsyncTransactionsResource, TransactionsResource
+
+logger = logging.getLogger("sardis_sdk.metadata")
+
+# Bump when the file layout changes; files with another version are ignored.
+CACHE_VERSION = 1
+
+
+class GasEstimateCache:
+    """TTL cache of gas estimates keyed by chain and token.
+
+    Gas for a token transfer hardly depends on the amount or recipient, so
+    one estimate per chain and token is reused for ``ttl`` seconds.
+    Thread-safe.
+
+    Args:
+        ttl: Seconds an estimate is reused
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(self, ttl: float = 15.0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: dict[tuple[str, str], tuple[GasEstimate, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, chain: str, token: str) -> GasEstimate | None:
+        """Cached estimate, or ``None`` if missing or expired."""
+        key = chain.lower(), token.upper()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= self._clock():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[0]
+
+    def put(self, chain: str, token: str, estimate: GasEstimate) -> None:
+        """Store a fresh estimate."""
+        with self._lock:
+            self._entries[chain.lower(), token.upper()] = (estimate, self._clock() + self.ttl)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class _RegistryStore:
+    """In-memory snapshot and file persistence shared by both registries."""
+
+    def __init__(self, base_url: str, path: str | os.PathLike[str] | None, max_age: float) -> None:
+        self.base_url = base_url
+        self.path = Path(path).expanduser() if path is not None else None
+        self.max_age = max_age
+        self.fetched_at: float | None = None
+        self._chains: dict[str, ChainInfo] = {}
+        self._by_id: dict[int, ChainInfo] = {}
+        self._tokens: dict[str, list[dict[str, Any]]] = {}
+        self.load()
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    @property
+    def stale(self) -> bool:
+        """Whether the snapshot is missing or older than ``max_age``."""
+        return self.fetched_at is None or time.time() - self.fetched_at >= self.max_age
+
+    def chains(self) -> list[ChainInfo]:
+        """Every known chain."""
+        return list(self._chains.values())
+
+    def chain(self, name: str) -> ChainInfo | None:
+        """Chain by name (case-insensitive)."""
+        return self._chains.get(name.lower())
+
+    def chain_by_id(self, chain_id: int) -> ChainInfo | None:
+        """Chain by EVM chain ID."""
+        return self._by_id.get(chain_id)
+
+    def tokens(self, chain: str) -> list[dict[str, Any]]:
+        """Tokens supported on a chain."""
+        return list(self._tokens.get(chain.lower(), []))
+
+    def token(self, chain: str, symbol: str) -> dict[str, Any] | None:
+        """Token on a chain by symbol (case-insensitive)."""
+        symbol = symbol.upper()
+        return next(
+            (t for t in self._tokens.get(chain.lower(), []) if str(t.get("symbol", "")).upper() == symbol),
+            None,
+        )
+
+    # ------------------------------------------------------------------
+    # Snapshot handling
+    # ------------------------------------------------------------------
+
+    def _install(
+        self,
+        chains: list[ChainInfo],
+        tokens: dict[str, list[dict[str, Any]]],
+        fetched_at: float,
+    ) -> None:
+        # Swap whole dicts so readers on other threads never see a partial snapshot.
+        self._chains = {c.name.lower(): c for c in chains}
+        self._by_id = {c.chain_id: c for c in chains}
+        self._tokens = {name.lower(): list(items) for name, items in tokens.items()}
+        self.fetched_at = fetched_at
+
+    def load(self) -> bool:
+        """Load the snapshot file; False if it is missing, unreadable or foreign."""
+        if self.path is None or not self.path.exists():
+            return False
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") != CACHE_VERSION or data.get("base_url") != self.base_url:
+                return False
+            chains = [ChainInfo.model_validate(c) for c in data["chains"]]
+            self._install(chains, data["tokens"], float(data["fetched_at"]))
+        except Exception:
+            logger.debug("ignoring unreadable metadata cache %s", self.path, exc_info=True)
+            return False
+        return True
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        data = {
+            "version": CACHE_VERSION,
+            "base_url": self.base_url,
+            "fetched_at": self.fetched_at,
+            "chains": [c.model_dump(mode="json") for c in self._chains.values()],
+            "tokens": self._tokens,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _store(self, chains: list[ChainInfo], tokens: dict[str, list[dict[str, Any]]]) -> None:
+        self._install(chains, tokens, time.time())
+        try:
+            self._save()
+        except OSError:
+            logger.debug("could not write metadata cache %s", self.path, exc_info=True)
+
+
+class ChainRegistry(_RegistryStore):
+    """In-memory chain and token metadata backed by a file (sync client).
+
+    Args:
+        transactions: ``client.transactions`` of a sync :class:`~sardis.Sardis` client
+        path: Snapshot file; None keeps the registry in memory only
+        max_age: Seconds after which a loaded snapshot counts as stale
+    """
+
+    def __init__(
+        self,
+        transactions: TransactionsResource,
+        path: str | os.PathLike[str] | None = None,
+        max_age: float = 86_400.0,
+    ) -> None:
+        super().__init__(transactions._client._base_url, path, max_age)
+        self._transactions = transactions
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._timer: threading.Timer | None = None
+
+    def refresh(self) -> None:
+        """Fetch chains and their tokens and replace the snapshot."""
+        with self._refresh_lock:
+            chains = self._transactions.list_chains()
+            tokens = {c.name: self._transactions.list_tokens(c.name) for c in chains}
+            self._store(chains, tokens)
+
+    def ensure(self) -> None:
+        """Refresh now if no snapshot has been loaded or fetched yet."""
+        if self.fetched_at is None:
+            self.refresh()
+
+    def start(self, interval: float = 3600.0) -> None:
+        """Refresh every ``interval`` seconds on a daemon thread until :meth:`stop`.
+
+        The first refresh runs immediately if the snapshot is stale.
+        """
+        self._stop.clear()
+        self._schedule(0.0 if self.stale else interval, interval)
+
+    def _schedule(self, delay: float, interval: float) -> None:
+        if self._stop.is_set():
+            return
+        self._timer = threading.Timer(delay, self._tick, args=(interval,))
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _tick(self, interval: float) -> None:
+        if self._stop.is_set():
+            return
+        try:
+            self.refresh()
+        except Exception:
+            logger.debug("metadata refresh failed", exc_info=True)
+        self._schedule(interval, interval)
+
+    def stop(self) -> None:
+        """Stop background refresh."""
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+class AsyncChainRegistry(_RegistryStore):
+    """In-memory chain and token metadata backed by a file (async client).
+
+    Lookups are plain synchronous methods answered from memory.
+
+    Args:
+        transactions: ``client.transactions`` of an :class:`~sardis.AsyncSardis` client
+        path: Snapshot file; None keeps the registry in memory only
+        max_age: Seconds after which a loaded snapshot counts as stale
+    """
+
+    def __init__(
+        self,
+        transactions: AsyncTransactionsResource,
+        path: str | os.PathLike[str] | None = None,
+        max_age: float = 86_400.0,
+    ) -> None:
+        super().__init__(transactions._client._base_url, path, max_age)
+        self._transactions = transactions
+        self._refresh_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    async def refresh(self) -> None:
+        """Fetch chains and their tokens concurrently and replace the snapshot."""
+        async with self._refresh_lock:
+            chains = await self._transactions.list_chains()
+            token_lists = await asyncio.gather(*(self._transactions.list_tokens(c.name) for c in chains))
+            self._store(chains, {c.name: tokens for c, tokens in zip(chains, token_lists, strict=True)})
+
+    async def ensure(self) -> None:
+        """Refresh now if no snapshot has been loaded or fetched yet."""
+        if self.fetched_at is None:
+            await self.refresh()
+
+    def start(self, interval: float = 3600.0) -> None:
+        """Refresh every ``interval`` seconds in a background task until :meth:`stop`.
+
+        The first refresh runs immediately if the snapshot is stale.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop(0.0 if self.stale else interval, interval))
+
+    async def _refresh_loop(self, delay: float, interval: float) -> None:
+        while True:
+            await asyncio.sleep(delay)
+            delay = interval
+            try:
+                await self.refresh()
+            except Exception:
+                logger.debug("metadata refresh (async) failed", exc_info=True)
+
+    async def stop(self) -> None:
+        """Stop background refresh."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+__all__ = [
+    "CACHE_VERSION",
+    "AsyncChainRegistry",
+    "ChainRegistry",
+    "GasEstimateCache",
+]
@@ -0,0 +1,408 @@
+"""
+Client-side metering for streaming payments.
+
+``streaming.consume`` is one POST per call, which is far too chatty for
+services that bill per token or per API call. A :class:`StreamMeter` (or
+:class:`AsyncStreamMeter`) buffers consumed units per stream in memory and
+sends one aggregated ``consume`` per stream when ``flush_units`` units are
+pending or every ``flush_interval`` seconds, whichever comes first.
+
+Each aggregated call carries an idempotency key derived from the meter and a
+per-stream sequence number. A batch that fails is retried with the same key
+and the same units, so a retry after a lost response cannot double-charge.
+
+Streams registered with :meth:`~StreamMeter.track` have their ``max_amount``
+enforced locally. :meth:`~StreamMeter.record` raises
+:class:`StreamLimitExceededError` instead of buffering units the stream
+could not pay for. :meth:`~StreamMeter.settle` and :meth:`~StreamMeter.close`
+flush before returning. The sync meter also flushes at interpreter exit.
+
+Example:
+    ```python
+    async with AsyncSardis(api_key="...") as client:
+        stream = await client.streaming.open(
+            from_wallet="wal_abc", to="0xdef...", token="USDC",
+            max_amount="100.00", rate_per_unit="0.0001",
+        )
+        async with AsyncStreamMeter(client.streaming, flush_units=10_000) as meter:
+            meter.track(stream)
+            for chunk in generate():
+                meter.record(stream["stream_id"], len(chunk.tokens))
+            await meter.settle(stream["stream_id"])
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from decimal import ROUND_FLOOR, Decimal
+from typing import TYPE_CHECKING, Any
+
+from .models.errors import SardisError
+
+if TYPE_CHECKING:
+    from .resources.streaming import AsyncStreamingResource, StreamingResource
+
+logger = logging.getLogger("sardis_sdk.metering")
+
+
+class StreamLimitExceededError(SardisError):
+    """Recording the units would exceed the stream's ``max_amount``."""
+
+    default_message = "Stream limit exceeded"
+
+
+@dataclass
+class _StreamState:
+    max_units: int | None = None
+    # Units acknowledged by the server (or consumed before tracking began).
+    consumed: int = 0
+    # Units recorded since the last batch was cut.
+    pending: int = 0
+    # Batch being sent or awaiting retry: (units, idempotency key).
+    inflight: tuple[int, str] | None = None
+    seq: int = 0
+
+    @property
+    def committed(self) -> int:
+        return self.consumed + self.pending + (self.inflight[0] if self.inflight else 0)
+
+
+def max_units_for(max_amount: str | Decimal, rate_per_unit: str | Decimal) -> int:
+    """Largest whole number of units ``max_amount`` pays for at ``rate_per_unit``."""
+    return int((Decimal(max_amount) / Decimal(rate_per_unit)).to_integral_value(rounding=ROUND_FLOOR))
+
+
+class _MeterBase(ABC):
+    def __init__(self, flush_units: int, flush_interval: float) -> None:
+        if flush_units < 1:
+            raise ValueError("flush_units must be at least 1")
+        self.flush_units = flush_units
+        self.flush_interval = flush_interval
+        self._meter_id = uuid.uuid4().hex[:12]
+        self._streams: dict[str, _StreamState] = {}
+        self._lock = threading.Lock()
+
+    def track(
+        self,
+        stream: dict[str, Any] | str,
+        *,
+        max_amount: str | Decimal | None = None,
+        rate_per_unit: str | Decimal | None = None,
+        max_units: int | None = None,
+        consumed_units: int = 0,
+    ) -> None:
+        """Register a stream so its limit is enforced locally.
+
+        Args:
+            stream: Response of ``streaming.open``, or a stream ID
+            max_amount: Stream cap (read from ``stream`` when it is a dict)
+            rate_per_unit: Price per unit (read from ``stream`` when it is a dict)
+            max_units: Explicit unit cap, overriding ``max_amount``/``rate_per_unit``
+            consumed_units: Units already consumed on the stream
+        """
+        if isinstance(stream, dict):
+            stream_id = stream["stream_id"]
+            max_amount = max_amount if max_amount is not None else stream.get("max_amount")
+            rate_per_unit = rate_per_unit if rate_per_unit is not None else stream.get("rate_per_unit")
+        else:
+            stream_id = stream
+        if max_units is None and max_amount is not None and rate_per_unit:
+            max_units = max_units_for(max_amount, rate_per_unit)
+        with self._lock:
+            state = self._streams.setdefault(stream_id, _StreamState())
+            state.max_units = max_units
+            state.consumed = max(state.consumed, consumed_units)
+
+    def record(self, stream_id: str, units: int = 1) -> None:
+        """Buffer consumed units; never blocks on the network.
+
+        Raises:
+            StreamLimitExceededError: If the stream is tracked and the units
+                would take it past its cap
+            ValueError: If ``units`` is not positive
+        """
+        if units <= 0:
+            raise ValueError("units must be positive")
+        with self._lock:
+            state = self._streams.get(stream_id)
+            if state is None:
+                state = self._streams[stream_id] = _StreamState()
+            if state.max_units is not None and state.committed + units > state.max_units:
+                raise StreamLimitExceededError(
+                    f"Stream {stream_id} has {state.max_units - state.committed} of {state.max_units} units left",
+                    details={"stream_id": stream_id, "requested": units, "max_units": state.max_units},
+                )
+            state.pending += units
+            full = state.pending >= self.flush_units
+        if full:
+            self._wake()
+
+    def remaining(self, stream_id: str) -> int | None:
+        """Units a tracked stream can still take, or None if it has no cap."""
+        with self._lock:
+            state = self._streams.get(stream_id)
+            if state is None or state.max_units is None:
+                return None
+            return state.max_units - state.committed
+
+    def pending(self, stream_id: str | None = None) -> int:
+        """Units recorded but not yet acknowledged by the server."""
+        with self._lock:
+            if stream_id is None:
+                states = list(self._streams.values())
+            else:
+                states = [self._streams[stream_id]] if stream_id in self._streams else []
+            return sum(s.committed - s.consumed for s in states)
+
+    @abstractmethod
+    def _wake(self) -> None:
+        """Make the flusher send full batches now instead of at its next interval."""
+
+    def _next_batch(self, stream_id: str) -> tuple[int, str] | None:
+        """The batch to send for a stream: a batch awaiting retry, or a new one."""
+        with self._lock:
+            state = self._streams.get(stream_id)
+            if state is None:
+                return None
+            if state.inflight is None and state.pending:
+                state.inflight = (state.pending, f"meter_{self._meter_id}_{stream_id}_{state.seq}")
+                state.seq += 1
+                state.pending = 0
+            return state.inflight
+
+    def _acknowledge(self, stream_id: str) -> None:
+        with self._lock:
+            state = self._streams[stream_id]
+            if state.inflight is not None:
+                state.consumed += state.inflight[0]
+                state.inflight = None
+
+    def _due(self) -> list[str]:
+        with self._lock:
+            return [sid for sid, s in self._streams.items() if s.pending or s.inflight]
+
+    def _full(self) -> list[str]:
+        with self._lock:
+            return [sid for sid, s in self._streams.items() if s.pending >= self.flush_units]
+
+
+class StreamMeter(_MeterBase):
+    """Aggregates ``streaming.consume`` calls (sync client).
+
+    A daemon thread flushes in the background; :meth:`record` only updates
+    counters under a lock.
+
+    Args:
+        streaming: ``client.streaming`` of a sync :class:`~sardis.Sardis` client
+        flush_units: Pending units that trigger a flush of a stream
+        flush_interval: Seconds between flushes of every stream
+    """
+
+    def __init__(self, streaming: StreamingResource, flush_units: int = 1000, flush_interval: float = 1.0) -> None:
+        super().__init__(flush_units, flush_interval)
+        self._streaming = streaming
+        self._cond = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="sardis-stream-meter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __enter__(self) -> StreamMeter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _wake(self) -> None:
+        with self._cond:
+            self._cond.notify()
+
+    def _run(self) -> None:
+        next_full_flush = time.monotonic() + self.flush_interval
+        while not self._closed:
+            with self._cond:
+                if not self._full():
+                    self._cond.wait(max(next_full_flush - time.monotonic(), 0.0))
+            only_full = time.monotonic() < next_full_flush
+            if not only_full:
+                next_full_flush = time.monotonic() + self.flush_interval
+            try:
+                self.flush(only_full=only_full)
+            except Exception:
+                logger.debug("stream meter flush failed", exc_info=True)
+
+    def flush(self, stream_id: str | None = None, *, only_full: bool = False) -> None:
+        """Send pending units now.
+
+        Args:
+            stream_id: Only this stream (default: every stream)
+            only_full: Only streams with at least ``flush_units`` pending
+
+        Raises:
+            APIError: If a consume call fails; its batch is kept and
+                retried with the same idempotency key on the next flush
+        """
+        if stream_id is not None:
+            stream_ids = [stream_id]
+        else:
+            stream_ids = self._full() if only_full else self._due()
+        error: Exception | None = None
+        with self._send_lock:
+            for sid in stream_ids:
+                # A batch awaiting retry goes first, then whatever accrued since.
+                while (batch := self._next_batch(sid)) is not None:
+                    try:
+                        self._streaming.consume(sid, batch[0], idempotency_key=batch[1])
+                    except Exception as e:
+                        error = error or e
+                        break
+                    self._acknowledge(sid)
+        if error is not None:
+            raise error
+
+    def settle(self, stream_id: str) -> dict[str, Any]:
+        """Flush a stream's pending units, then settle it."""
+        self.flush(stream_id)
+        result = self._streaming.settle(stream_id)
+        with self._lock:
+            self._streams.pop(stream_id, None)
+        return result
+
+    def close(self) -> None:
+        """Flush every stream and stop the background thread."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._wake()
+        self._thread.join(timeout=self.flush_interval + 1)
+        self.flush()
+
+
+class AsyncStreamMeter(_MeterBase):
+    """Aggregates ``streaming.consume`` calls (async client).
+
+    The background flush task starts with the first :meth:`record` (or on
+    ``async with``), so the meter may be created outside an event loop.
+
+    Args:
+        streaming: ``client.streaming`` of an :class:`~sardis.AsyncSardis` client
+        flush_units: Pending units that trigger a flush of a stream
+        flush_interval: Seconds between flushes of every stream
+    """
+
+    def __init__(
+        self,
+        streaming: AsyncStreamingResource,
+        flush_units: int = 1000,
+        flush_interval: float = 1.0,
+    ) -> None:
+        super().__init__(flush_units, flush_interval)
+        self._streaming = streaming
+        self._task: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._send_lock: asyncio.Lock | None = None
+
+    async def __aenter__(self) -> AsyncStreamMeter:
+        self._ensure_task()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    def record(self, stream_id: str, units: int = 1) -> None:
+        self._ensure_task()
+        super().record(stream_id, units)
+
+    record.__doc__ = _MeterBase.record.__doc__
+
+    def _ensure_task(self) -> None:
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_full_flush = loop.time() + self.flush_interval
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), max(next_full_flush - loop.time(), 0.0))
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            only_full = loop.time() < next_full_flush
+            if not only_full:
+                next_full_flush = loop.time() + self.flush_interval
+            try:
+                await self.flush(only_full=only_full)
+            except Exception:
+                logger.debug("stream meter flush (async) failed", exc_info=True)
+
+    async def flush(self, stream_id: str | None = None, *, only_full: bool = False) -> None:
+        """Send pending units now, one concurrent call per stream.
+
+        Args:
+            stream_id: Only this stream (default: every stream)
+            only_full: Only streams with at least ``flush_units`` pending
+
+        Raises:
+            APIError: If a consume call fails; its batch is kept and
+                retried with the same idempotency key on the next flush
+        """
+        if stream_id is not None:
+            stream_ids = [stream_id]
+        else:
+            stream_ids = self._full() if only_full else self._due()
+        if self._send_lock is None:
+            self._send_lock = asyncio.Lock()
+
+        async def send(sid: str) -> None:
+            # A batch awaiting retry goes first, then whatever accrued since.
+            while (batch := self._next_batch(sid)) is not None:
+                await self._streaming.consume(sid, batch[0], idempotency_key=batch[1])
+                self._acknowledge(sid)
+
+        async with self._send_lock:
+            results = await asyncio.gather(*(send(sid) for sid in stream_ids), return_exceptions=True)
+        error = next((r for r in results if isinstance(r, BaseException)), None)
+        if error is not None:
+            raise error
+
+    async def settle(self, stream_id: str) -> dict[str, Any]:
+        """Flush a stream's pending units, then settle it."""
+        await self.flush(stream_id)
+        result = await self._streaming.settle(stream_id)
+        with self._lock:
+            self._streams.pop(stream_id, None)
+        return result
+
+    async def close(self) -> None:
+        """Stop the background task and flush every stream."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+__all__ = [
+    "AsyncStreamMeter",
+    "StreamLimitExceededError",
+    "StreamMeter",
+    "max_units_for",
+]
@@ -34,6 +34,7 @@ from .payment import (
 from .policy import (
     ApplyPolicyFromNLResponse,
     ParsedPolicy,
+    PolicyCheckCandidate,
     PolicyCheckResponse,
     PolicyExample,
     PolicyPreviewResponse,
@@ -105,6 +106,7 @@ __all__ = [
     "Payment",
     "PaymentMandate",
     "PaymentStatus",
+    "PolicyCheckCandidate",
     "PolicyCheckResponse",
     "PolicyExample",
     "PolicyPreviewResponse",
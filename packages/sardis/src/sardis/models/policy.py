@@ -1,6 +1,7 @@
 """Policy models for Sardis SDK."""
 from __future__ import annotations
 
+from decimal import Decimal
 from typing import Any
 
 from pydantic import Field
@@ -46,10 +47,23 @@ class ApplyPolicyFromNLResponse(SardisModel):
     message: str | None = None
 
 
+class PolicyCheckCandidate(SardisModel):
+    """A candidate payment for ``policies.check_many``."""
+
+    agent_id: str
+    amount: Decimal
+    currency: str = "USD"
+    merchant_id: str | None = None
+    merchant_category: str | None = None
+    mcc_code: str | None = None
+
+
 class PolicyCheckResponse(SardisModel):
     allowed: bool
     reason: str
     policy_id: str | None = None
+    # True when the SDK rejected the candidate locally without asking the API.
+    prefiltered: bool = False
 
 
 class PolicyExample(SardisModel):
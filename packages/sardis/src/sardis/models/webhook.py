@@ -64,6 +64,7 @@ class WebhookDelivery(SardisModel):
     error: str | None = None
     duration_ms: int = 0
     attempt_number: int = 1
+    payload: dict[str, Any] | None = None
     created_at: datetime
 
 
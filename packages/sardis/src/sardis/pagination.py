@@ -6,15 +6,24 @@ including automatic iteration, cursor management, and bulk fetching.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import json
+import os
+import tempfile
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
     TypeVar,
+    overload,
 )
 
+from pydantic import BaseModel, TypeAdapter
+
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
 
 # Type variable for paginated items
 T = TypeVar("T")
@@ -73,12 +82,12 @@ class Page[T]:
     """A single page of results.
 
     Attributes:
-        items: List of items on this page
+        items: Items on this page (a LazyModelList for lazy listings)
         page_info: Pagination metadata
         raw_response: The raw API response (for debugging)
     """
 
-    items: list[T]
+    items: Sequence[T]
     page_info: PageInfo
     raw_response: dict[str, Any] | None = None
 
@@ -112,7 +121,222 @@ class Page[T]:
         return self.page_info.total_count
 
 
-class AsyncPaginator[T]:
+# Request parameters that describe a position in the result set rather than
+# the query itself. Everything else in a paginator's params is a filter.
+_POSITION_PARAMS = frozenset({"cursor", "offset"})
+
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class PaginationCheckpoint:
+    """Serializable position of a paginator within a result set.
+
+    A checkpoint captures everything needed to continue a scan in a new
+    process: the request parameters for the next page (filters plus
+    ``offset``), the cursor (for cursor-based endpoints), and how many
+    items of that page were already consumed.
+
+    Attributes:
+        params: Request parameters for the next page, including filters
+        cursor: Cursor for the next page (cursor-based pagination)
+        skip: Items of the next page that were already consumed
+        items_fetched: Items yielded so far across all runs
+        pages_fetched: Pages fetched so far across all runs
+        exhausted: Whether the scan reached the end of the result set
+        metadata: Caller-defined state saved alongside the position
+            (e.g. how many bytes of an output file are complete)
+        version: Checkpoint format version
+    """
+
+    params: dict[str, Any] = field(default_factory=dict)
+    cursor: str | None = None
+    skip: int = 0
+    items_fetched: int = 0
+    pages_fetched: int = 0
+    exhausted: bool = False
+    metadata: dict[str, Any] = field(default_factory=dict)
+    version: int = CHECKPOINT_VERSION
+
+    @property
+    def filters(self) -> dict[str, Any]:
+        """Request parameters excluding position (cursor/offset)."""
+        return {k: v for k, v in self.params.items() if k not in _POSITION_PARAMS}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PaginationCheckpoint:
+        """Create a checkpoint from its dictionary form.
+
+        Raises:
+            ValueError: If the checkpoint was written by an unknown format version
+        """
+        version = data.get("version", CHECKPOINT_VERSION)
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported pagination checkpoint version: {version}")
+        return cls(
+            params=dict(data.get("params") or {}),
+            cursor=data.get("cursor"),
+            skip=int(data.get("skip", 0)),
+            items_fetched=int(data.get("items_fetched", 0)),
+            pages_fetched=int(data.get("pages_fetched", 0)),
+            exhausted=bool(data.get("exhausted", False)),
+            metadata=dict(data.get("metadata") or {}),
+        )
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Persist the checkpoint atomically.
+
+        The checkpoint is written to a temporary file in the same directory,
+        flushed to disk and renamed over ``path``, so a crash mid-write never
+        leaves a truncated checkpoint behind.
+
+        Args:
+            path: Destination file
+        """
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{target.name}.", dir=target.parent)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.to_dict(), f, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, target)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> PaginationCheckpoint | None:
+        """Load a checkpoint from disk.
+
+        Args:
+            path: Checkpoint file
+
+        Returns:
+            The checkpoint, or None if the file does not exist
+        """
+        try:
+            with open(path) as f:
+                return cls.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+
+
+def _normalize(params: dict[str, Any]) -> dict[str, Any]:
+    """Round-trip params through JSON so in-memory and on-disk filters compare equal."""
+    return json.loads(json.dumps(params, default=str))
+
+
+class _PaginatorState:
+    """Checkpoint bookkeeping shared by the async and sync paginators."""
+
+    def __init__(
+        self,
+        initial_params: dict[str, Any] | None,
+        checkpoint_path: str | os.PathLike[str] | None,
+    ) -> None:
+        self._initial_params = initial_params or {}
+        self._checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        # Every iteration starts from ``_start``; ``_checkpoint`` tracks the
+        # live position of the iteration in progress.
+        self._start = PaginationCheckpoint(params=dict(self._initial_params))
+        if self._checkpoint_path is not None:
+            saved = PaginationCheckpoint.load(self._checkpoint_path)
+            if saved is not None:
+                self._apply_checkpoint(saved)
+        self._checkpoint = PaginationCheckpoint.from_dict(self._start.to_dict())
+
+    @property
+    def checkpoint(self) -> PaginationCheckpoint:
+        """A snapshot of the current position, safe to persist and resume from."""
+        return PaginationCheckpoint.from_dict(self._checkpoint.to_dict())
+
+    def save_checkpoint(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Persist the current position to ``path`` or the configured checkpoint_path.
+
+        Raises:
+            ValueError: If no path is given and none was configured
+        """
+        target = path or self._checkpoint_path
+        if target is None:
+            raise ValueError("No checkpoint path given and checkpoint_path is not configured")
+        self._checkpoint.save(target)
+
+    def _apply_checkpoint(self, checkpoint: PaginationCheckpoint) -> None:
+        expected = _normalize({k: v for k, v in self._initial_params.items() if k not in _POSITION_PARAMS})
+        actual = _normalize(checkpoint.filters)
+        if expected != actual:
+            raise ValueError(
+                f"Checkpoint filters do not match this paginator: {actual!r} != {expected!r}"
+            )
+        self._start = PaginationCheckpoint.from_dict(checkpoint.to_dict())
+        self._checkpoint = PaginationCheckpoint.from_dict(checkpoint.to_dict())
+
+    def _begin(self) -> None:
+        """Reset the live position to the start position."""
+        self._checkpoint = PaginationCheckpoint.from_dict(self._start.to_dict())
+        self._items_fetched = self._start.items_fetched
+        self._pages_fetched = self._start.pages_fetched
+
+    def _request_params(self) -> dict[str, Any]:
+        params = dict(self._checkpoint.params)
+        if self._checkpoint.cursor:
+            params["cursor"] = self._checkpoint.cursor
+        return params
+
+    def _trim_page(self, page: Page[T]) -> Page[T]:
+        """Drop items of a resumed page that were consumed before the checkpoint."""
+        skip = self._checkpoint.skip
+        if not skip:
+            return page
+        return Page(items=page.items[skip:], page_info=page.page_info, raw_response=page.raw_response)
+
+    def _advance(self, page: Page[T], fetched: int) -> bool:
+        """Move the checkpoint past a fully consumed page.
+
+        Args:
+            page: The page as returned by the API (untrimmed)
+            fetched: Number of items the API returned for the page
+
+        Returns:
+            True if there is a next page to fetch
+        """
+        state = self._checkpoint
+        state.skip = 0
+        state.pages_fetched = self._pages_fetched
+        has_next = page.has_next and fetched > 0
+        if has_next and page.page_info.next_cursor:
+            state.cursor = page.page_info.next_cursor
+        elif has_next and "offset" in state.params:
+            state.params["offset"] = state.params.get("offset", 0) + fetched
+        else:
+            has_next = False
+        state.exhausted = not has_next
+        self._persist()
+        return has_next
+
+    def _consumed(self, consumed_in_page: int) -> None:
+        """Count an item once the consumer has received it.
+
+        Runs when the generator resumes or is closed after yielding the item;
+        the item iterators persist the position when they stop, so a consumer
+        that stops mid-page resumes after the last item it received.
+        """
+        self._items_fetched += 1
+        self._checkpoint.skip = consumed_in_page
+        self._checkpoint.items_fetched = self._items_fetched
+
+    def _persist(self) -> None:
+        if self._checkpoint_path is not None:
+            self._checkpoint.save(self._checkpoint_path)
+
+
+class AsyncPaginator[T](_PaginatorState):
     """Async paginator for iterating through paginated results.
 
     This class provides an async iterator that automatically fetches
@@ -131,6 +355,11 @@ class AsyncPaginator[T]:
         # Or fetch pages one at a time
         async for page in paginator.pages():
             print(f"Page {page.page_info.current_page}: {len(page)} items")
+
+        # Long scans can persist progress and pick up where they stopped
+        paginator = client.ledger.paginate_entries(checkpoint_path="scan.ckpt")
+        async for entry in paginator:
+            process(entry)
         ```
     """
 
@@ -140,6 +369,7 @@ class AsyncPaginator[T]:
         initial_params: dict[str, Any] | None = None,
         max_items: int | None = None,
         max_pages: int | None = None,
+        checkpoint_path: str | os.PathLike[str] | None = None,
     ):
         """Initialize the paginator.
 
@@ -148,57 +378,71 @@ class AsyncPaginator[T]:
             initial_params: Initial parameters for the first request
             max_items: Maximum number of items to fetch (None for unlimited)
             max_pages: Maximum number of pages to fetch (None for unlimited)
+            checkpoint_path: Optional file to persist progress to after every
+                page and when item iteration stops. If the file already
+                exists, iteration resumes from it.
         """
         self._fetch_page = fetch_page
-        self._initial_params = initial_params or {}
         self._max_items = max_items
         self._max_pages = max_pages
         self._current_page: Page[T] | None = None
         self._items_fetched = 0
         self._pages_fetched = 0
+        super().__init__(initial_params, checkpoint_path)
+
+    def resume(self, checkpoint: PaginationCheckpoint | dict[str, Any]) -> AsyncPaginator[T]:
+        """Continue iteration from a previously saved checkpoint.
+
+        Args:
+            checkpoint: A checkpoint (or its dictionary form) taken from a
+                paginator with the same filters
+
+        Returns:
+            This paginator, positioned at the checkpoint
+
+        Raises:
+            ValueError: If the checkpoint's filters differ from this paginator's
+        """
+        if isinstance(checkpoint, dict):
+            checkpoint = PaginationCheckpoint.from_dict(checkpoint)
+        self._apply_checkpoint(checkpoint)
+        return self
 
     async def __aiter__(self) -> AsyncIterator[T]:
         """Async iterator over all items across all pages."""
-        async for page in self.pages():
-            for item in page.items:
-                if self._max_items and self._items_fetched >= self._max_items:
-                    return
-                yield item
-                self._items_fetched += 1
+        try:
+            async for page in self.pages():
+                base = self._checkpoint.skip
+                for i, item in enumerate(page.items):
+                    if self._max_items and self._items_fetched >= self._max_items:
+                        return
+                    try:
+                        yield item
+                    finally:
+                        self._consumed(base + i + 1)
+        finally:
+            self._persist()
 
     async def pages(self) -> AsyncIterator[Page[T]]:
-        """Async iterator over pages."""
-        params = self._initial_params.copy()
-        cursor: str | None = None
+        """Async iterator over pages.
 
-        while True:
+        The checkpoint advances past a page once the consumer asks for the
+        next one, so a failure while fetching never skips unconsumed items.
+        """
+        self._begin()
+        while not self._checkpoint.exhausted:
             if self._max_pages and self._pages_fetched >= self._max_pages:
                 break
 
-            if cursor:
-                params["cursor"] = cursor
-            elif "offset" in params:
-                # Offset-based pagination
-                pass
-            else:
-                # First page, no cursor needed
-                pass
-
-            page = await self._fetch_page(**params)
+            page = await self._fetch_page(**self._request_params())
+            fetched = len(page.items)
+            page = self._trim_page(page)
             self._current_page = page
             self._pages_fetched += 1
 
             yield page
 
-            if not page.has_next or page.is_empty:
-                break
-
-            # Update cursor or offset for next page
-            if page.page_info.next_cursor:
-                cursor = page.page_info.next_cursor
-            elif "offset" in params:
-                params["offset"] = params.get("offset", 0) + len(page.items)
-            else:
+            if not self._advance(page, fetched):
                 break
 
     async def first_page(self) -> Page[T]:
@@ -266,7 +510,7 @@ class AsyncPaginator[T]:
         return total
 
 
-class SyncPaginator[T]:
+class SyncPaginator[T](_PaginatorState):
     """Sync paginator for iterating through paginated results.
 
     This class provides a synchronous iterator that automatically fetches
@@ -285,6 +529,11 @@ class SyncPaginator[T]:
         # Or fetch pages one at a time
         for page in paginator.pages():
             print(f"Page {page.page_info.current_page}: {len(page)} items")
+
+        # Long scans can persist progress and pick up where they stopped
+        paginator = client.ledger.paginate_entries(checkpoint_path="scan.ckpt")
+        for entry in paginator:
+            process(entry)
         ```
     """
 
@@ -294,6 +543,7 @@ class SyncPaginator[T]:
         initial_params: dict[str, Any] | None = None,
         max_items: int | None = None,
         max_pages: int | None = None,
+        checkpoint_path: str | os.PathLike[str] | None = None,
     ):
         """Initialize the paginator.
 
@@ -302,57 +552,71 @@ class SyncPaginator[T]:
             initial_params: Initial parameters for the first request
             max_items: Maximum number of items to fetch (None for unlimited)
             max_pages: Maximum number of pages to fetch (None for unlimited)
+            checkpoint_path: Optional file to persist progress to after every
+                page and when item iteration stops. If the file already
+                exists, iteration resumes from it.
         """
         self._fetch_page = fetch_page
-        self._initial_params = initial_params or {}
         self._max_items = max_items
         self._max_pages = max_pages
         self._current_page: Page[T] | None = None
         self._items_fetched = 0
         self._pages_fetched = 0
+        super().__init__(initial_params, checkpoint_path)
+
+    def resume(self, checkpoint: PaginationCheckpoint | dict[str, Any]) -> SyncPaginator[T]:
+        """Continue iteration from a previously saved checkpoint.
+
+        Args:
+            checkpoint: A checkpoint (or its dictionary form) taken from a
+                paginator with the same filters
+
+        Returns:
+            This paginator, positioned at the checkpoint
+
+        Raises:
+            ValueError: If the checkpoint's filters differ from this paginator's
+        """
+        if isinstance(checkpoint, dict):
+            checkpoint = PaginationCheckpoint.from_dict(checkpoint)
+        self._apply_checkpoint(checkpoint)
+        return self
 
     def __iter__(self) -> Iterator[T]:
         """Iterator over all items across all pages."""
-        for page in self.pages():
-            for item in page.items:
-                if self._max_items and self._items_fetched >= self._max_items:
-                    return
-                yield item
-                self._items_fetched += 1
+        try:
+            for page in self.pages():
+                base = self._checkpoint.skip
+                for i, item in enumerate(page.items):
+                    if self._max_items and self._items_fetched >= self._max_items:
+                        return
+                    try:
+                        yield item
+                    finally:
+                        self._consumed(base + i + 1)
+        finally:
+            self._persist()
 
     def pages(self) -> Iterator[Page[T]]:
-        """Iterator over pages."""
-        params = self._initial_params.copy()
-        cursor: str | None = None
+        """Iterator over pages.
 
-        while True:
+        The checkpoint advances past a page once the consumer asks for the
+        next one, so a failure while fetching never skips unconsumed items.
+        """
+        self._begin()
+        while not self._checkpoint.exhausted:
             if self._max_pages and self._pages_fetched >= self._max_pages:
                 break
 
-            if cursor:
-                params["cursor"] = cursor
-            elif "offset" in params:
-                # Offset-based pagination
-                pass
-            else:
-                # First page, no cursor needed
-                pass
-
-            page = self._fetch_page(**params)
+            page = self._fetch_page(**self._request_params())
+            fetched = len(page.items)
+            page = self._trim_page(page)
             self._current_page = page
             self._pages_fetched += 1
 
             yield page
 
-            if not page.has_next or page.is_empty:
-                break
-
-            # Update cursor or offset for next page
-            if page.page_info.next_cursor:
-                cursor = page.page_info.next_cursor
-            elif "offset" in params:
-                params["offset"] = params.get("offset", 0) + len(page.items)
-            else:
+            if not self._advance(page, fetched):
                 break
 
     def first_page(self) -> Page[T]:
@@ -417,10 +681,124 @@ class SyncPaginator[T]:
         return total
 
 
+@functools.cache
+def _list_adapter[M: BaseModel](model: type[M]) -> TypeAdapter[list[M]]:
+    """Compiled validator for a list of ``model``, built once per model."""
+    return TypeAdapter(list[model])
+
+
+class LazyModelList[M: BaseModel](Sequence[M]):
+    """A list of API items that are validated on first access.
+
+    Holds the raw response dictionaries and runs ``model_validate`` only for
+    the items that are actually read, caching the result. Consumers that look
+    at a handful of rows, or only need a couple of raw fields via
+    :meth:`column`, skip model construction (``Decimal``/``datetime``
+    parsing included) for everything else.
+
+    Example:
+        ```python
+        entries = await client.ledger.list_entries(limit=10_000, lazy=True)
+        ids = entries.column("tx_id")   # no validation at all
+        first = entries[0]              # validates one entry
+        ```
+    """
+
+    __slots__ = ("_cache", "_model", "_raw")
+
+    def __init__(self, model: type[M], raw_items: Iterable[dict[str, Any]]) -> None:
+        self._model = model
+        self._raw = list(raw_items)
+        self._cache: list[M | None] = [None] * len(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    @overload
+    def __getitem__(self, index: int) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> LazyModelList[M]: ...
+
+    def __getitem__(self, index: int | slice) -> M | LazyModelList[M]:
+        if isinstance(index, slice):
+            sliced = LazyModelList(self._model, self._raw[index])
+            sliced._cache = self._cache[index]
+            return sliced
+        item = self._cache[index]
+        if item is None:
+            item = self._model.model_validate(self._raw[index])
+            self._cache[index] = item
+        return item
+
+    def __iter__(self) -> Iterator[M]:
+        for i in range(len(self._raw)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        validated = sum(1 for item in self._cache if item is not None)
+        return f"LazyModelList[{self._model.__name__}](len={len(self._raw)}, validated={validated})"
+
+    @property
+    def raw(self) -> list[dict[str, Any]]:
+        """The unvalidated response dictionaries."""
+        return self._raw
+
+    def column(self, name: str, default: Any = None) -> list[Any]:
+        """Read one raw field from every item without validating anything.
+
+        Args:
+            name: Field name as it appears in the API response
+            default: Value for items that lack the field
+
+        Returns:
+            The raw values, in item order
+        """
+        return [item.get(name, default) for item in self._raw]
+
+    def materialize(self) -> list[M]:
+        """Validate every remaining item and return a plain list."""
+        pending = [i for i, item in enumerate(self._cache) if item is None]
+        if pending:
+            validated = _list_adapter(self._model).validate_python([self._raw[i] for i in pending])
+            for i, item in zip(pending, validated, strict=True):
+                self._cache[i] = item
+        return list(self._cache)  # type: ignore[arg-type]
+
+
+def parse_model_list[M: BaseModel](
+    raw_items: Iterable[dict[str, Any]],
+    model: type[M],
+    lazy: bool = False,
+) -> list[M] | LazyModelList[M]:
+    """Parse a list of API items into models.
+
+    Eager parsing validates the whole list in one pass of a compiled
+    ``TypeAdapter``, which avoids per-item Python overhead compared with
+    calling ``model_validate`` in a loop.
+
+    Args:
+        raw_items: Items from the API response
+        model: Model class to validate into
+        lazy: Defer validation of each item until it is accessed
+
+    Returns:
+        A list of models, or a LazyModelList when ``lazy`` is set
+    """
+    if lazy:
+        return LazyModelList(model, raw_items)
+    return _list_adapter(model).validate_python(
+        raw_items if isinstance(raw_items, list) else list(raw_items)
+    )
+
+
 def create_page_from_response[T](
     data: dict[str, Any],
     items_key: str,
-    item_parser: Callable[[dict[str, Any]], T],
+    item_parser: Callable[[dict[str, Any]], T] | None = None,
+    page_size: int | None = None,
+    model: type[T] | None = None,
+    lazy: bool = False,
 ) -> Page[T]:
     """Create a Page from an API response.
 
@@ -428,13 +806,24 @@ def create_page_from_response[T](
         data: Raw API response
         items_key: Key containing the list of items
         item_parser: Function to parse each item
+        page_size: Requested page size, used to infer has_next when the
+            response carries no pagination metadata
+        model: Model class to validate items into (instead of item_parser)
+        lazy: With ``model``, validate each item only when it is accessed
 
     Returns:
         Page instance with parsed items
     """
     raw_items = data.get(items_key, [])
-    items = [item_parser(item) for item in raw_items]
+    if model is not None:
+        items = parse_model_list(raw_items, model, lazy=lazy)
+    elif item_parser is not None:
+        items = [item_parser(item) for item in raw_items]
+    else:
+        raise ValueError("Either item_parser or model is required")
     page_info = PageInfo.from_response(data)
+    if not page_info.page_size and page_size:
+        page_info.page_size = page_size
 
     # Infer has_next from response if not explicitly provided
     if not page_info.has_next and len(items) == page_info.page_size:
@@ -449,8 +838,11 @@ def create_page_from_response[T](
 
 __all__ = [
     "AsyncPaginator",
+    "LazyModelList",
     "Page",
     "PageInfo",
+    "PaginationCheckpoint",
     "SyncPaginator",
     "create_page_from_response",
+    "parse_model_list",
 ]
@@ -0,0 +1,488 @@
+"""
+Client-side FX rate table and quote reuse for the Sardis SDK.
+
+Two separate caches cover the two ways agents use FX:
+
+- **Indicative prices** ("what would this cost in EURC?") need no quote.
+  :class:`FXRateCache` (or :class:`AsyncFXRateCache`) keeps the table from
+  ``fx.rates`` in memory, refreshes it on a schedule, and converts locally
+  through :class:`RateTable`, including whole columns of amounts at once.
+- **Execution** needs a real quote, and a quote can be executed only once.
+  A client created with ``quote_cache=True`` (or a :class:`QuoteCache`)
+  lets ``fx.quote`` hand out a quote that an earlier caller released
+  unexecuted with :meth:`QuoteCache.release`, for the same pair and amount
+  bucket until shortly before it expires. Each quote is held by one caller
+  at a time; ``fx.execute`` drops the executed quote.
+
+Example:
+    ```python
+    async with AsyncSardis(api_key="...", quote_cache=True) as client:
+        rates = AsyncFXRateCache(client.fx, max_age=60)
+        rates.start()
+        table = await rates.get_table()
+        prices_eur = table.convert_many(prices_usdc, "USDC", "EURC")
+
+        quote = await client.fx.quote("USDC", "EURC", Decimal("250"))  # POST
+        client.quote_cache.release(quote["id"])                         # not executed
+        quote = await client.fx.quote("USDC", "EURC", Decimal("250"))  # reused
+        await client.fx.execute(quote["id"])
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from decimal import ROUND_FLOOR, Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Any
+
+from .columnar import to_epoch_micros
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from .resources.fx import AsyncFXResource, FXResource
+
+logger = logging.getLogger("sardis_sdk.rates")
+
+# Currencies tried as the intermediate leg when a pair has no direct rate.
+DEFAULT_PIVOTS = ("USD", "USDC")
+
+_PAIR_SEPARATORS = ("/", "_", "-", ":")
+_RATE_KEYS = ("rate", "mid", "price", "value")
+_EXPIRY_KEYS = ("expires_at", "valid_until", "expiry")
+
+
+def _decimal(value: Any) -> Decimal | None:
+    try:
+        rate = Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return None
+    return rate if rate.is_finite() and rate > 0 else None
+
+
+def _split_pair(pair: str) -> tuple[str, str] | None:
+    for separator in _PAIR_SEPARATORS:
+        parts = pair.split(separator)
+        if len(parts) == 2 and all(parts):
+            return parts[0].upper(), parts[1].upper()
+    return None
+
+
+def _parse_rates(data: Any) -> dict[tuple[str, str], Decimal]:
+    """Read the pairs of an ``fx.rates`` response, whichever layout it uses.
+
+    Accepts a list of ``{"from_currency", "to_currency", "rate"}`` items, a
+    mapping of ``"USDC/EURC"``-style pairs to rates (or to objects with a
+    ``rate``), or nested ``{"USDC": {"EURC": rate}}`` mappings.
+    """
+    body = data.get("rates", data) if isinstance(data, dict) else data
+    rates: dict[tuple[str, str], Decimal] = {}
+
+    if isinstance(body, list):
+        for item in body:
+            source = item.get("from_currency") or item.get("base") or item.get("from")
+            target = item.get("to_currency") or item.get("quote") or item.get("to")
+            pair = (source.upper(), target.upper()) if source and target else _split_pair(str(item.get("pair", "")))
+            rate = next((_decimal(item[k]) for k in _RATE_KEYS if item.get(k) is not None), None)
+            if pair and rate:
+                rates[pair] = rate
+        return rates
+
+    for key, value in body.items():
+        if isinstance(value, dict) and not any(k in value for k in _RATE_KEYS):
+            for target, nested in value.items():
+                rate = _decimal(nested)
+                if rate:
+                    rates[str(key).upper(), str(target).upper()] = rate
+            continue
+        pair = _split_pair(str(key))
+        if isinstance(value, dict):
+            value = next((value[k] for k in _RATE_KEYS if value.get(k) is not None), None)
+        rate = _decimal(value)
+        if pair and rate:
+            rates[pair] = rate
+    return rates
+
+
+class RateTable:
+    """Immutable snapshot of FX rates with local conversion.
+
+    Pairs missing from the table are derived from their inverse or through
+    a pivot currency.
+
+    Args:
+        rates: Rate per ``(from_currency, to_currency)`` pair
+        fetched_at: Wall-clock time the rates were fetched
+        pivots: Currencies tried as the intermediate leg of cross rates
+    """
+
+    def __init__(
+        self,
+        rates: dict[tuple[str, str], Decimal],
+        fetched_at: float | None = None,
+        pivots: Iterable[str] = DEFAULT_PIVOTS,
+    ) -> None:
+        self._rates = {(a.upper(), b.upper()): Decimal(r) for (a, b), r in rates.items()}
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self.pivots = tuple(p.upper() for p in pivots)
+        self._resolved: dict[tuple[str, str], Decimal | None] = {}
+
+    @classmethod
+    def from_response(cls, data: Any, pivots: Iterable[str] = DEFAULT_PIVOTS) -> RateTable:
+        """Build a table from an ``fx.rates`` response."""
+        return cls(_parse_rates(data), pivots=pivots)
+
+    def __len__(self) -> int:
+        return len(self._rates)
+
+    @property
+    def pairs(self) -> list[tuple[str, str]]:
+        """Pairs quoted directly by the server."""
+        return list(self._rates)
+
+    def _lookup(self, pair: tuple[str, str]) -> Decimal | None:
+        if pair[0] == pair[1]:
+            return Decimal(1)
+        direct = self._rates.get(pair)
+        if direct is not None:
+            return direct
+        inverse = self._rates.get((pair[1], pair[0]))
+        if inverse is not None:
+            return 1 / inverse
+        return None
+
+    def rate(self, from_currency: str, to_currency: str) -> Decimal:
+        """Units of ``to_currency`` per unit of ``from_currency``.
+
+        Raises:
+            KeyError: If no direct, inverse or pivoted rate exists
+        """
+        pair = from_currency.upper(), to_currency.upper()
+        if pair not in self._resolved:
+            rate = self._lookup(pair)
+            for pivot in self.pivots:
+                if rate is not None:
+                    break
+                first, second = self._lookup((pair[0], pivot)), self._lookup((pivot, pair[1]))
+                if first is not None and second is not None:
+                    rate = first * second
+            self._resolved[pair] = rate
+        rate = self._resolved[pair]
+        if rate is None:
+            raise KeyError(f"No FX rate for {pair[0]}/{pair[1]}")
+        return rate
+
+    def convert(self, amount: Decimal, from_currency: str, to_currency: str) -> Decimal:
+        """Indicative value of ``amount`` in ``to_currency``."""
+        return Decimal(amount) * self.rate(from_currency, to_currency)
+
+    def convert_many(self, amounts: Any, from_currency: str, to_currency: str) -> Any:
+        """Convert many amounts of one pair with a single rate lookup.
+
+        A NumPy array (e.g. a ledger ``amount`` column) is multiplied as a
+        whole and an array of the same shape is returned; any other iterable
+        gives a list of Decimals.
+        """
+        rate = self.rate(from_currency, to_currency)
+        if hasattr(amounts, "__array__") and hasattr(amounts, "dtype"):
+            if amounts.dtype.kind in "iuf":
+                return amounts * float(rate)
+            return amounts * rate
+        return [Decimal(a) * rate for a in amounts]
+
+
+class _RateCacheBase:
+    def __init__(self, max_age: float, pivots: Iterable[str]) -> None:
+        self.max_age = max_age
+        self.pivots = tuple(pivots)
+        self._table: RateTable | None = None
+
+    @property
+    def table(self) -> RateTable | None:
+        """Latest snapshot, or None before the first refresh."""
+        return self._table
+
+    @property
+    def stale(self) -> bool:
+        """Whether there is no snapshot or it is older than ``max_age``."""
+        return self._table is None or time.time() - self._table.fetched_at >= self.max_age
+
+
+class FXRateCache(_RateCacheBase):
+    """FX rate table refreshed from ``fx.rates`` (sync client).
+
+    Args:
+        fx: ``client.fx`` of a sync :class:`~sardis.Sardis` client
+        max_age: Seconds a snapshot is used before :meth:`get_table` refetches it
+        pivots: Currencies tried as the intermediate leg of cross rates
+    """
+
+    def __init__(self, fx: FXResource, max_age: float = 60.0, pivots: Iterable[str] = DEFAULT_PIVOTS) -> None:
+        super().__init__(max_age, pivots)
+        self._fx = fx
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._timer: threading.Timer | None = None
+
+    def refresh(self) -> RateTable:
+        """Fetch the rate table now."""
+        with self._refresh_lock:
+            self._table = RateTable.from_response(self._fx.rates(), pivots=self.pivots)
+            return self._table
+
+    def get_table(self) -> RateTable:
+        """Current snapshot, refetched first if it is missing or stale."""
+        table = self._table
+        if table is None or self.stale:
+            return self.refresh()
+        return table
+
+    def convert(self, amount: Decimal, from_currency: str, to_currency: str) -> Decimal:
+        """Indicative value of ``amount`` in ``to_currency``."""
+        return self.get_table().convert(amount, from_currency, to_currency)
+
+    def start(self, interval: float | None = None) -> None:
+        """Refresh every ``interval`` seconds (default ``max_age``) on a daemon thread until :meth:`stop`."""
+        self._stop.clear()
+        self._schedule(0.0 if self.stale else interval or self.max_age, interval or self.max_age)
+
+    def _schedule(self, delay: float, interval: float) -> None:
+        if self._stop.is_set():
+            return
+        self._timer = threading.Timer(delay, self._tick, args=(interval,))
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _tick(self, interval: float) -> None:
+        if self._stop.is_set():
+            return
+        try:
+            self.refresh()
+        except Exception:
+            logger.debug("fx rate refresh failed", exc_info=True)
+        self._schedule(interval, interval)
+
+    def stop(self) -> None:
+        """Stop background refresh."""
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+class AsyncFXRateCache(_RateCacheBase):
+    """FX rate table refreshed from ``fx.rates`` (async client).
+
+    Args:
+        fx: ``client.fx`` of an :class:`~sardis.AsyncSardis` client
+        max_age: Seconds a snapshot is used before :meth:`get_table` refetches it
+        pivots: Currencies tried as the intermediate leg of cross rates
+    """
+
+    def __init__(
+        self,
+        fx: AsyncFXResource,
+        max_age: float = 60.0,
+        pivots: Iterable[str] = DEFAULT_PIVOTS,
+    ) -> None:
+        super().__init__(max_age, pivots)
+        self._fx = fx
+        self._refresh_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    async def refresh(self) -> RateTable:
+        """Fetch the rate table now."""
+        async with self._refresh_lock:
+            self._table = RateTable.from_response(await self._fx.rates(), pivots=self.pivots)
+            return self._table
+
+    async def get_table(self) -> RateTable:
+        """Current snapshot, refetched first if it is missing or stale."""
+        table = self._table
+        if table is None or self.stale:
+            return await self.refresh()
+        return table
+
+    async def convert(self, amount: Decimal, from_currency: str, to_currency: str) -> Decimal:
+        """Indicative value of ``amount`` in ``to_currency``."""
+        return (await self.get_table()).convert(amount, from_currency, to_currency)
+
+    def start(self, interval: float | None = None) -> None:
+        """Refresh every ``interval`` seconds (default ``max_age``) in a background task until :meth:`stop`."""
+        if self._task is None or self._task.done():
+            interval = interval or self.max_age
+            self._task = asyncio.create_task(self._refresh_loop(0.0 if self.stale else interval, interval))
+
+    async def _refresh_loop(self, delay: float, interval: float) -> None:
+        while True:
+            await asyncio.sleep(delay)
+            delay = interval
+            try:
+                await self.refresh()
+            except Exception:
+                logger.debug("fx rate refresh (async) failed", exc_info=True)
+
+    async def stop(self) -> None:
+        """Stop background refresh."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def _quote_id(quote: dict[str, Any]) -> str | None:
+    value = quote.get("id", quote.get("quote_id"))
+    return str(value) if value is not None else None
+
+
+def _expires_at(quote: dict[str, Any]) -> float | None:
+    """Expiry of a quote as wall-clock seconds, if the quote states one."""
+    value = next((quote[k] for k in _EXPIRY_KEYS if quote.get(k) is not None), None)
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        # Epoch milliseconds are larger than any plausible epoch seconds.
+        return value / 1000 if value > 1e11 else float(value)
+    try:
+        return to_epoch_micros(str(value)) / 1_000_000
+    except ValueError:
+        return None
+
+
+class QuoteCache:
+    """Hands ``fx.quote`` results that were released unexecuted to the next caller.
+
+    A quote is single-use, so each one is held by one caller at a time: a
+    freshly fetched quote belongs to the caller that requested it, and it
+    becomes available to others only after :meth:`release`. :meth:`take`
+    removes the quote it returns from the cache.
+
+    Amounts are grouped into buckets of width ``bucket`` (floor), so with
+    the default width only identical amounts share a quote; widen it when
+    a quote for a nearby amount is acceptable. Quotes without an ID or a
+    parseable expiry are never cached. Thread-safe.
+
+    Args:
+        bucket: Width of an amount bucket in source-currency units
+        margin: Seconds before expiry at which a quote stops being reused
+        max_entries: Least recently used quotes beyond this are evicted, both
+            among released quotes and among quotes held by callers
+        clock: Wall clock (quotes expire at absolute times)
+    """
+
+    def __init__(
+        self,
+        bucket: Decimal = Decimal("0.000001"),
+        margin: float = 5.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.bucket = Decimal(bucket)
+        self.margin = margin
+        self.max_entries = max_entries
+        self._clock = clock
+        # Released quotes, available to the next caller.
+        self._entries: OrderedDict[tuple[str, str, str, int], tuple[dict[str, Any], float]] = OrderedDict()
+        # Quotes held by a caller, by quote ID, until released or discarded.
+        self._held: OrderedDict[str, tuple[tuple[str, str, str, int], dict[str, Any], float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of released quotes available for reuse."""
+        return len(self._entries)
+
+    def _key(self, from_currency: str, to_currency: str, amount: Decimal, chain: str | None) -> tuple[str, str, str, int]:
+        slot = int((Decimal(amount) / self.bucket).to_integral_value(rounding=ROUND_FLOOR))
+        return from_currency.upper(), to_currency.upper(), (chain or "").lower(), slot
+
+    def _hold(self, key: tuple[str, str, str, int], quote: dict[str, Any], expires: float) -> None:
+        quote_id = _quote_id(quote)
+        if quote_id is None:
+            return
+        self._held[quote_id] = (key, quote, expires)
+        self._held.move_to_end(quote_id)
+        while len(self._held) > self.max_entries:
+            self._held.popitem(last=False)
+
+    def take(
+        self,
+        from_currency: str,
+        to_currency: str,
+        amount: Decimal,
+        chain: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Hand out a still-valid released quote for the bucket, or ``None``.
+
+        The quote leaves the cache, so no other caller receives it unless it
+        is released again.
+        """
+        key = self._key(from_currency, to_currency, amount, chain)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or entry[1] - self.margin <= self._clock():
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._hold(key, *entry)
+            return entry[0]
+
+    def put(
+        self,
+        from_currency: str,
+        to_currency: str,
+        amount: Decimal,
+        quote: dict[str, Any],
+        chain: str | None = None,
+    ) -> None:
+        """Record a fresh quote as held by the caller that requested it.
+
+        Ignored if the quote states no ID or expiry.
+        """
+        expires = _expires_at(quote)
+        if expires is None:
+            return
+        key = self._key(from_currency, to_currency, amount, chain)
+        with self._lock:
+            self._hold(key, quote, expires)
+
+    def release(self, quote_id: str) -> None:
+        """Make a held quote that will not be executed available to the next caller."""
+        with self._lock:
+            held = self._held.pop(quote_id, None)
+            if held is None:
+                return
+            key, quote, expires = held
+            self._entries[key] = (quote, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, quote_id: str) -> None:
+        """Forget a quote, e.g. once it has been executed."""
+        with self._lock:
+            self._held.pop(quote_id, None)
+            for key in [k for k, (q, _) in self._entries.items() if _quote_id(q) == quote_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Forget every quote."""
+        with self._lock:
+            self._entries.clear()
+            self._held.clear()
+
+
+__all__ = [
+    "DEFAULT_PIVOTS",
+    "AsyncFXRateCache",
+    "FXRateCache",
+    "QuoteCache",
+    "RateTable",
+]
@@ -0,0 +1,462 @@
+"""
+Local SQLite replica of the Sardis ledger.
+
+Reconciliation and reporting jobs that repeatedly scan the ledger can keep a
+:class:`LedgerReplica` (or :class:`AsyncLedgerReplica`) instead: the first
+:meth:`~LedgerReplica.sync` downloads the ledger once, later syncs fetch only
+entries past the high-water mark, and queries by transaction, wallet,
+mandate or time range are answered from indexed local tables.
+
+The ledger is append-only, so the high-water mark is the number of entries
+already replicated (the next ``offset``), plus the newest ``created_at`` and
+the ``tx_id`` at the boundary. Every sync re-reads the boundary entry; if it
+moved, the server-side ordering changed and the replica rescans from the
+start (upserts by ``tx_id`` make that idempotent). A sync pages until a
+page brings no new entries or the response explicitly reports no next
+page; a short page does not end it, since servers may cap ``limit``.
+
+This requires ``/ledger/entries`` to return entries oldest first (append
+order); the endpoint has no sort parameter to request it explicitly. A page
+whose ``created_at`` values go backwards raises :class:`LedgerOrderError`
+instead of silently degrading every sync into a full rescan.
+
+Example:
+    ```python
+    with Sardis(api_key="...") as client:
+        replica = LedgerReplica(client.ledger, path="ledger.db")
+        replica.sync()
+        replica.start(interval=5.0)  # keep within seconds of the server
+
+        entries = replica.entries_for_wallet("wallet_123", start=month_start)
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from .columnar import _EPOCH, _MICROSECOND, to_epoch_micros
+from .models.errors import SardisError
+from .resources.ledger import LedgerEntry
+
+if TYPE_CHECKING:
+    import os
+
+    from .pagination import Page
+    from .resources.ledger import AsyncLedgerResource, LedgerResource
+
+logger = logging.getLogger("sardis_sdk.replica")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ledger_entries (
+    tx_id TEXT PRIMARY KEY,
+    mandate_id TEXT,
+    from_wallet TEXT,
+    to_wallet TEXT,
+    amount TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    chain TEXT,
+    chain_tx_hash TEXT,
+    audit_anchor TEXT,
+    created_at INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_ledger_from_wallet ON ledger_entries (from_wallet, created_at);
+CREATE INDEX IF NOT EXISTS ix_ledger_to_wallet ON ledger_entries (to_wallet, created_at);
+CREATE INDEX IF NOT EXISTS ix_ledger_mandate ON ledger_entries (mandate_id, created_at);
+CREATE INDEX IF NOT EXISTS ix_ledger_created_at ON ledger_entries (created_at);
+CREATE TABLE IF NOT EXISTS replica_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class LedgerOrderError(SardisError):
+    """The ledger returned entries newest first; the replica needs oldest first."""
+
+    default_message = "Ledger entries are not ordered oldest first"
+
+
+_COLUMNS = (
+    "tx_id", "mandate_id", "from_wallet", "to_wallet", "amount",
+    "currency", "chain", "chain_tx_hash", "audit_anchor", "created_at",
+)
+
+
+class _ReplicaStore:
+    """SQLite storage and queries shared by the sync and async replicas."""
+
+    def __init__(self, path: str | os.PathLike[str], wallet_id: str | None, page_size: int) -> None:
+        self.wallet_id = wallet_id
+        self.page_size = page_size
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        scope = self._state("wallet_id")
+        if scope is not None and scope != (wallet_id or ""):
+            raise ValueError(f"Replica at {path} was built for wallet_id={scope or None!r}, not {wallet_id!r}")
+        self._set_state("wallet_id", wallet_id or "")
+
+    def _state(self, key: str) -> str | None:
+        row = self._conn.execute("SELECT value FROM replica_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key: str, value: str | int) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO replica_state (key, value) VALUES (?, ?)", (key, str(value)))
+
+    # -- high-water mark ---------------------------------------------------
+
+    @property
+    def offset(self) -> int:
+        """Number of server-side entries already replicated."""
+        with self._lock:
+            return int(self._state("offset") or 0)
+
+    @property
+    def high_water_mark(self) -> datetime | None:
+        """Newest ``created_at`` in the replica."""
+        with self._lock:
+            value = self._state("max_created_at")
+        return None if value is None else _EPOCH + int(value) * _MICROSECOND
+
+    def _page_params(self) -> tuple[int, str | None, int]:
+        """Offset to fetch from, the boundary ``tx_id`` expected first (if any) and the limit."""
+        with self._lock:
+            offset = int(self._state("offset") or 0)
+            boundary = self._state("boundary_tx_id")
+        if offset and boundary:
+            # One extra entry so a page still brings new ones with page_size=1.
+            return offset - 1, boundary, self.page_size + 1
+        return offset, None, self.page_size
+
+    @staticmethod
+    def _last_page(page: Page[Any]) -> bool:
+        """Whether the response explicitly reports that no page follows."""
+        data = page.raw_response or {}
+        meta = data.get("pagination", data.get("meta", {}))
+        return any(source.get(key) is False for source in (meta, data) for key in ("has_next", "has_more"))
+
+    def _reset(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM replica_state WHERE key IN ('offset', 'boundary_tx_id')")
+
+    def _apply_page(self, offset: int, rows: list[dict[str, Any]]) -> None:
+        """Upsert one page and advance the high-water mark in the same transaction."""
+        values = [
+            (
+                row["tx_id"], row.get("mandate_id"), row.get("from_wallet"), row.get("to_wallet"),
+                str(row["amount"]), row["currency"], row.get("chain"), row.get("chain_tx_hash"),
+                row.get("audit_anchor"), to_epoch_micros(row["created_at"]),
+            )
+            for row in rows
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO ledger_entries ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                    values,
+                )
+                newest = max(v[-1] for v in values)
+                current = self._state("max_created_at")
+                if current is None or newest > int(current):
+                    self._set_state("max_created_at", newest)
+                self._set_state("offset", offset + len(rows))
+                self._set_state("boundary_tx_id", rows[-1]["tx_id"])
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _handle_page(self, offset: int, boundary: str | None, rows: list[dict[str, Any]]) -> int | None:
+        """Apply a fetched page.
+
+        Returns:
+            Number of new entries, or None if the boundary moved and the
+            replica must rescan from the start
+
+        Raises:
+            LedgerOrderError: If the page is not ordered oldest first
+        """
+        stamps = [to_epoch_micros(row["created_at"]) for row in rows]
+        if any(later < earlier for earlier, later in itertools.pairwise(stamps)):
+            raise LedgerOrderError(
+                f"Ledger page at offset {offset} is not ordered oldest first; "
+                "the replica's high-water mark requires ascending created_at"
+            )
+        if boundary is not None:
+            if not rows or rows[0].get("tx_id") != boundary:
+                logger.debug("Ledger replica boundary %s moved; rescanning", boundary)
+                return None
+            rows = rows[1:]
+            offset += 1
+        if rows:
+            self._apply_page(offset, rows)
+        return len(rows)
+
+    # -- queries -----------------------------------------------------------
+
+    def _query(self, sql: str, params: tuple[Any, ...]) -> list[LedgerEntry]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            LedgerEntry.model_validate({
+                **dict(zip(_COLUMNS, row, strict=True)),
+                "created_at": _EPOCH + row[-1] * _MICROSECOND,
+            })
+            for row in rows
+        ]
+
+    @staticmethod
+    def _range(start: datetime | None, end: datetime | None) -> tuple[int, int]:
+        return (
+            to_epoch_micros(start) if start is not None else -(2**63),
+            to_epoch_micros(end) if end is not None else 2**63 - 1,
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM ledger_entries").fetchone()[0]
+
+    def get(self, tx_id: str) -> LedgerEntry | None:
+        """Look up one entry by transaction ID."""
+        entries = self._query(f"SELECT {', '.join(_COLUMNS)} FROM ledger_entries WHERE tx_id = ?", (tx_id,))
+        return entries[0] if entries else None
+
+    def entries_for_wallet(
+        self,
+        wallet_id: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[LedgerEntry]:
+        """Entries sent or received by a wallet in ``[start, end)``, oldest first."""
+        lo, hi = self._range(start, end)
+        cols = ", ".join(_COLUMNS)
+        return self._query(
+            f"SELECT {cols} FROM ledger_entries WHERE from_wallet = ? AND created_at >= ? AND created_at < ? "
+            f"UNION SELECT {cols} FROM ledger_entries WHERE to_wallet = ? AND created_at >= ? AND created_at < ? "
+            "ORDER BY created_at, tx_id LIMIT ?",
+            (wallet_id, lo, hi, wallet_id, lo, hi, -1 if limit is None else limit),
+        )
+
+    def entries_for_mandate(
+        self,
+        mandate_id: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[LedgerEntry]:
+        """Entries executed under a mandate in ``[start, end)``, oldest first."""
+        lo, hi = self._range(start, end)
+        return self._query(
+            f"SELECT {', '.join(_COLUMNS)} FROM ledger_entries "
+            "WHERE mandate_id = ? AND created_at >= ? AND created_at < ? ORDER BY created_at, tx_id LIMIT ?",
+            (mandate_id, lo, hi, -1 if limit is None else limit),
+        )
+
+    def entries_between(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[LedgerEntry]:
+        """All entries in ``[start, end)``, oldest first."""
+        lo, hi = self._range(start, end)
+        return self._query(
+            f"SELECT {', '.join(_COLUMNS)} FROM ledger_entries "
+            "WHERE created_at >= ? AND created_at < ? ORDER BY created_at, tx_id LIMIT ?",
+            (lo, hi, -1 if limit is None else limit),
+        )
+
+    def execute(self, sql: str, params: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+        """Run a read-only SQL query against the ``ledger_entries`` table."""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class LedgerReplica(_ReplicaStore):
+    """Incrementally synced local copy of the ledger (sync client).
+
+    Args:
+        ledger: ``client.ledger`` of a sync :class:`~sardis.Sardis` client
+        path: SQLite database file (``":memory:"`` for a throwaway replica)
+        wallet_id: Only replicate entries for this wallet
+        page_size: Entries fetched per request while syncing
+    """
+
+    def __init__(
+        self,
+        ledger: LedgerResource,
+        path: str | os.PathLike[str] = ":memory:",
+        wallet_id: str | None = None,
+        page_size: int = 1000,
+    ) -> None:
+        super().__init__(path, wallet_id, page_size)
+        self._ledger = ledger
+        self._sync_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._timer: threading.Timer | None = None
+
+    def __enter__(self) -> LedgerReplica:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def sync(self) -> int:
+        """Fetch entries past the high-water mark.
+
+        Returns:
+            Number of entries added (or re-added after a rescan)
+        """
+        with self._sync_lock:
+            added = 0
+            while True:
+                offset, boundary, limit = self._page_params()
+                page = self._ledger.list_entries_page(
+                    wallet_id=self.wallet_id, limit=limit, offset=offset, lazy=True
+                )
+                new = self._handle_page(offset, boundary, list(page.items.raw))
+                if new is None:
+                    self._reset()
+                    continue
+                added += new
+                if not new or self._last_page(page):
+                    return added
+
+    def start(self, interval: float = 5.0) -> None:
+        """Sync every ``interval`` seconds on a daemon thread until :meth:`stop`."""
+        self._stop.clear()
+        self._schedule(interval)
+
+    def _schedule(self, interval: float) -> None:
+        if self._stop.is_set():
+            return
+        self._timer = threading.Timer(interval, self._tick, args=(interval,))
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _tick(self, interval: float) -> None:
+        if self._stop.is_set():
+            return
+        try:
+            self.sync()
+        except Exception:
+            logger.debug("ledger replica refresh failed", exc_info=True)
+        self._schedule(interval)
+
+    def stop(self) -> None:
+        """Stop background refresh."""
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def close(self) -> None:
+        """Stop background refresh and close the database."""
+        self.stop()
+        with self._sync_lock:
+            super().close()
+
+
+class AsyncLedgerReplica(_ReplicaStore):
+    """Incrementally synced local copy of the ledger (async client).
+
+    Queries are plain synchronous methods: they hit local SQLite indexes and
+    return in microseconds.
+
+    Args:
+        ledger: ``client.ledger`` of an :class:`~sardis.AsyncSardis` client
+        path: SQLite database file (``":memory:"`` for a throwaway replica)
+        wallet_id: Only replicate entries for this wallet
+        page_size: Entries fetched per request while syncing
+    """
+
+    def __init__(
+        self,
+        ledger: AsyncLedgerResource,
+        path: str | os.PathLike[str] = ":memory:",
+        wallet_id: str | None = None,
+        page_size: int = 1000,
+    ) -> None:
+        super().__init__(path, wallet_id, page_size)
+        self._ledger = ledger
+        self._sync_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> AsyncLedgerReplica:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def sync(self) -> int:
+        """Fetch entries past the high-water mark.
+
+        Returns:
+            Number of entries added (or re-added after a rescan)
+        """
+        async with self._sync_lock:
+            added = 0
+            while True:
+                offset, boundary, limit = self._page_params()
+                page = await self._ledger.list_entries_page(
+                    wallet_id=self.wallet_id, limit=limit, offset=offset, lazy=True
+                )
+                new = self._handle_page(offset, boundary, list(page.items.raw))
+                if new is None:
+                    self._reset()
+                    continue
+                added += new
+                if not new or self._last_page(page):
+                    return added
+
+    def start(self, interval: float = 5.0) -> None:
+        """Sync every ``interval`` seconds in a background task until :meth:`stop`."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop(interval))
+
+    async def _refresh_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.sync()
+            except Exception:
+                logger.debug("ledger replica refresh (async) failed", exc_info=True)
+
+    async def stop(self) -> None:
+        """Stop background refresh."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def aclose(self) -> None:
+        """Stop background refresh and close the database."""
+        await self.stop()
+        async with self._sync_lock:
+            self.close()
+
+
+__all__ = [
+    "AsyncLedgerReplica",
+    "LedgerOrderError",
+    "LedgerReplica",
+]
@@ -0,0 +1,585 @@
+"""
+Buffered, batched usage reporting.
+
+``usage.report`` and ``subscriptions_v2.report_usage`` are one POST per
+event. A :class:`UsageReporter` (or :class:`AsyncUsageReporter`) accepts
+events with a dictionary increment under a lock. It sums them per meter and
+subscription over fixed time windows, and a background worker sends one
+report per meter, subscription and window once the window closes.
+
+Delivery properties:
+
+- **Idempotent.** Each report's idempotency key is derived from the
+  reporter ID, subscription, meter and window. Retries and spool replays
+  reuse the key, so the server counts each window at most once. Pass a
+  stable ``reporter_id`` (for example the hostname) to keep keys stable
+  across restarts.
+- **Bounded.** At most ``max_entries`` aggregated reports are held in
+  memory. With ``overflow="drop"``, a new meter/window beyond that is
+  dropped and counted. With ``overflow="block"``, the sync :meth:`~UsageReporter.add`
+  and the async :meth:`~AsyncUsageReporter.put` wait for space.
+- **Spooled.** With ``spool_path`` set, reports that fail with a retryable
+  error are appended to a JSON Lines file. They are replayed after the
+  next successful send, not held in memory.
+
+Plain meter reports go through ``POST usage/report/batch`` when the server
+has it, and fall back to one ``usage.report`` per entry otherwise.
+
+Example:
+    ```python
+    with Sardis(api_key="...") as client:
+        with UsageReporter(client, window=10.0, spool_path="usage.spool") as reporter:
+            for request in requests:
+                reporter.add("mtr_api_calls")
+                reporter.add("tokens", request.tokens, subscription_id="sub_123")
+            print(reporter.stats())
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from .models.errors import APIError, SardisError
+from .resources.base import NO_BATCH_STATUS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .client import AsyncSardis, Sardis
+
+logger = logging.getLogger("sardis_sdk.reporter")
+
+REPORT_BATCH_SIZE = 100
+
+_Key = tuple[str | None, str, int]
+
+
+@dataclass
+class UsageReport:
+    """Usage of one meter (and subscription) over one window."""
+
+    meter_id: str
+    quantity: int
+    window_start: float
+    idempotency_key: str
+    subscription_id: str | None = None
+
+    @property
+    def timestamp(self) -> str:
+        return datetime.fromtimestamp(self.window_start, UTC).isoformat()
+
+
+@dataclass(frozen=True)
+class ReporterStats:
+    """Point-in-time counters of a usage reporter.
+
+    Attributes:
+        accepted: Events accepted by ``add``/``put``
+        dropped: Events dropped because memory was full
+        failed: Reports given up on: rejected by the server, or evicted
+            from a full retry queue
+        sent: Reports acknowledged by the server
+        spooled: Reports currently waiting in the spool file
+        pending: Aggregated reports held in memory (open and unsent)
+        lag: Seconds since the end of the oldest unsent closed window
+    """
+
+    accepted: int
+    dropped: int
+    failed: int
+    sent: int
+    spooled: int
+    pending: int
+    lag: float
+
+
+def _retryable(error: Exception) -> bool:
+    if isinstance(error, APIError) and (error.status_code in (408, 425, 429) or error.status_code >= 500):
+        return True
+    return isinstance(error, SardisError) and error.retryable
+
+
+class _ReporterBase:
+    def __init__(
+        self,
+        window: float,
+        max_entries: int,
+        overflow: Literal["drop", "block"],
+        spool_path: str | os.PathLike[str] | None,
+        reporter_id: str | None,
+        clock: Callable[[], float],
+    ) -> None:
+        if overflow not in ("drop", "block"):
+            raise ValueError("overflow must be 'drop' or 'block'")
+        self.window = window
+        self.max_entries = max_entries
+        self.overflow = overflow
+        self.spool_path = Path(spool_path) if spool_path is not None else None
+        self.reporter_id = reporter_id or uuid.uuid4().hex[:12]
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)
+        # Open windows: (subscription, meter, window index) -> quantity.
+        self._open: dict[_Key, int] = {}
+        # Reports of windows sealed before they closed (by flush), to keep keys unique.
+        self._early: dict[_Key, int] = {}
+        self._pending: deque[UsageReport] = deque()
+        self._batch_supported: bool | None = None
+        self._accepted = 0
+        self._dropped = 0
+        self._failed = 0
+        self._sent = 0
+        self._spooled = self._count_spool()
+
+    def _window_index(self, now: float) -> int:
+        return math.floor(now / self.window)
+
+    def _held(self) -> int:
+        return len(self._open) + len(self._pending)
+
+    def _try_add(self, meter_id: str, quantity: int, subscription_id: str | None) -> bool | None:
+        """Add under the lock; None if there is no room for a new entry."""
+        key = subscription_id, meter_id, self._window_index(self._clock())
+        if key in self._open:
+            self._open[key] += quantity
+        elif self._held() >= self.max_entries:
+            return None
+        else:
+            self._open[key] = quantity
+        self._accepted += 1
+        return True
+
+    def _drop(self) -> bool:
+        self._dropped += 1
+        return False
+
+    def _seal(self, everything: bool = False) -> None:
+        """Move closed windows (or all of them) to the send queue. Lock held."""
+        current = self._window_index(self._clock())
+        for key in [k for k in self._open if everything or k[2] < current]:
+            quantity = self._open.pop(key)
+            subscription_id, meter_id, index = key
+            part = self._early.get(key, 0)
+            if index >= current:
+                self._early[key] = part + 1
+            suffix = f".{part}" if part else ""
+            self._pending.append(UsageReport(
+                meter_id=meter_id,
+                quantity=quantity,
+                window_start=index * self.window,
+                idempotency_key=f"usage_{self.reporter_id}_{subscription_id or '-'}_{meter_id}_{index}{suffix}",
+                subscription_id=subscription_id,
+            ))
+        for key in [k for k in self._early if k[2] < current]:
+            del self._early[key]
+
+    def _take(self) -> list[UsageReport]:
+        with self._lock:
+            self._seal()
+            batch = [self._pending.popleft() for _ in range(min(REPORT_BATCH_SIZE, len(self._pending)))]
+            self._space.notify_all()
+            return batch
+
+    def _settle(self, failed: list[tuple[UsageReport, Exception]], sent: int) -> bool:
+        """Account for a sent batch; True if there was no retryable failure."""
+        retry = [r for r, e in failed if _retryable(e)]
+        for report, error in failed:
+            if not _retryable(error):
+                logger.warning("usage report %s rejected: %s", report.idempotency_key, error)
+                with self._lock:
+                    self._failed += 1
+        with self._lock:
+            self._sent += sent
+            if retry and self.spool_path is None:
+                # Keep for the next cycle, oldest first; drop what no longer fits.
+                self._pending.extendleft(reversed(retry))
+                while self._held() > self.max_entries and self._pending:
+                    self._pending.pop()
+                    self._failed += 1
+        if retry and self.spool_path is not None:
+            self._spool(retry)
+        return not retry
+
+    # ------------------------------------------------------------------
+    # Spool
+    # ------------------------------------------------------------------
+
+    @property
+    def _replay_path(self) -> Path:
+        """Where the spool is moved while it is being resent."""
+        return self.spool_path.with_name(self.spool_path.name + ".replay")
+
+    def _count_spool(self) -> int:
+        if self.spool_path is None:
+            return 0
+        count = 0
+        for path in (self.spool_path, self._replay_path):
+            if path.exists():
+                with open(path) as f:
+                    count += sum(1 for line in f if line.strip())
+        return count
+
+    def _spool(self, reports: list[UsageReport]) -> None:
+        self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.spool_path, "a") as f:
+            for report in reports:
+                f.write(json.dumps(asdict(report)) + "\n")
+        with self._lock:
+            self._spooled += len(reports)
+
+    def _unspool(self) -> list[UsageReport]:
+        """Move the spool aside and read it for resending.
+
+        The moved file is deleted by :meth:`_replayed` once every report in it
+        has been sent or re-spooled. If the resend is interrupted, the file
+        is read again on the next replay; idempotency keys make that safe.
+        """
+        if not self._spooled or self.spool_path is None:
+            return []
+        replay = self._replay_path
+        if self.spool_path.exists():
+            if replay.exists():
+                # Left over from an interrupted resend: replay both.
+                with open(self.spool_path) as f, open(replay, "a") as out:
+                    out.write(f.read())
+                os.unlink(self.spool_path)
+            else:
+                os.replace(self.spool_path, replay)
+        if not replay.exists():
+            return []
+        with open(replay) as f:
+            return [UsageReport(**json.loads(line)) for line in f if line.strip()]
+
+    def _replayed(self, reports: list[UsageReport]) -> None:
+        """Delete the moved spool after ``reports`` were resent."""
+        self._replay_path.unlink(missing_ok=True)
+        with self._lock:
+            self._spooled = max(self._spooled - len(reports), 0)
+
+    def stats(self) -> ReporterStats:
+        """Current counters."""
+        with self._lock:
+            oldest = self._pending[0].window_start if self._pending else None
+            if oldest is None and self._open:
+                closed = [k[2] for k in self._open if k[2] < self._window_index(self._clock())]
+                oldest = min(closed) * self.window if closed else None
+            lag = max(self._clock() - (oldest + self.window), 0.0) if oldest is not None else 0.0
+            return ReporterStats(
+                accepted=self._accepted,
+                dropped=self._dropped,
+                failed=self._failed,
+                sent=self._sent,
+                spooled=self._spooled,
+                pending=self._held(),
+                lag=lag,
+            )
+
+    @staticmethod
+    def _event(report: UsageReport) -> dict[str, Any]:
+        return {
+            "meter_id": report.meter_id,
+            "quantity": report.quantity,
+            "timestamp": report.timestamp,
+            "idempotency_key": report.idempotency_key,
+        }
+
+    def _batch_unavailable(self, error: Exception) -> bool:
+        if isinstance(error, APIError) and error.status_code in NO_BATCH_STATUS and self._batch_supported is None:
+            self._batch_supported = False
+            return True
+        return False
+
+
+class UsageReporter(_ReporterBase):
+    """Aggregating background usage reporter (sync client).
+
+    Args:
+        client: A sync :class:`~sardis.Sardis` client
+        window: Seconds of usage summed into one report
+        max_entries: Aggregated reports held in memory at most
+        overflow: ``"drop"`` or ``"block"`` when memory is full
+        block_timeout: Longest ``add`` waits under ``"block"`` before dropping
+        spool_path: JSON Lines file for reports that could not be sent
+        reporter_id: Stable ID used in idempotency keys
+        clock: Wall clock (windows are aligned to epoch time)
+    """
+
+    def __init__(
+        self,
+        client: Sardis,
+        window: float = 10.0,
+        max_entries: int = 100_000,
+        overflow: Literal["drop", "block"] = "drop",
+        block_timeout: float = 5.0,
+        spool_path: str | os.PathLike[str] | None = None,
+        reporter_id: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(window, max_entries, overflow, spool_path, reporter_id, clock)
+        self._client = client
+        self.block_timeout = block_timeout
+        self._send_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sardis-usage-reporter", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> UsageReporter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def add(self, meter_id: str, quantity: int = 1, subscription_id: str | None = None) -> bool:
+        """Record usage; returns False if the event was dropped."""
+        with self._lock:
+            if self._try_add(meter_id, quantity, subscription_id):
+                return True
+            if self.overflow == "drop":
+                return self._drop()
+            deadline = time.monotonic() + self.block_timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._stop.is_set():
+                    return self._drop()
+                self._space.wait(remaining)
+                if self._try_add(meter_id, quantity, subscription_id):
+                    return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(min(self.window, 1.0)):
+            try:
+                self.flush(everything=False)
+            except Exception:
+                logger.debug("usage report flush failed", exc_info=True)
+
+    def flush(self, everything: bool = True) -> None:
+        """Send queued reports now.
+
+        Args:
+            everything: Also seal windows that are still open
+        """
+        with self._send_lock:
+            if everything:
+                with self._lock:
+                    self._seal(everything=True)
+            healthy = True
+            while healthy and (batch := self._take()):
+                healthy = self._settle(*self._send(batch))
+            if healthy and self._spooled:
+                spooled = self._unspool()
+                for start in range(0, len(spooled), REPORT_BATCH_SIZE):
+                    self._settle(*self._send(spooled[start:start + REPORT_BATCH_SIZE]))
+                self._replayed(spooled)
+
+    def _send(self, batch: list[UsageReport]) -> tuple[list[tuple[UsageReport, Exception]], int]:
+        failed: list[tuple[UsageReport, Exception]] = []
+        sent = 0
+        plain = [r for r in batch if r.subscription_id is None]
+        if plain and self._batch_supported is not False:
+            try:
+                self._client._request("POST", "usage/report/batch", json={"events": [self._event(r) for r in plain]})
+            except Exception as e:
+                if not self._batch_unavailable(e):
+                    failed.extend((r, e) for r in plain)
+                    plain = []
+            else:
+                self._batch_supported = True
+                sent += len(plain)
+                plain = []
+        for report in plain + [r for r in batch if r.subscription_id is not None]:
+            try:
+                if report.subscription_id is None:
+                    self._client.usage.report(
+                        report.meter_id, report.quantity,
+                        timestamp=report.timestamp, idempotency_key=report.idempotency_key,
+                    )
+                else:
+                    self._client.subscriptions_v2.report_usage(
+                        report.subscription_id, report.meter_id, report.quantity,
+                        timestamp=report.timestamp, idempotency_key=report.idempotency_key,
+                    )
+            except Exception as e:
+                failed.append((report, e))
+            else:
+                sent += 1
+        return failed, sent
+
+    def close(self) -> None:
+        """Stop the worker and send everything still held."""
+        self._stop.set()
+        with self._lock:
+            self._space.notify_all()
+        self._thread.join()
+        self.flush()
+
+
+class AsyncUsageReporter(_ReporterBase):
+    """Aggregating background usage reporter (async client).
+
+    :meth:`add` is synchronous and never waits; use :meth:`put` to wait for
+    space under ``overflow="block"``. The worker task starts with the first
+    event (or on ``async with``).
+
+    Args:
+        client: An :class:`~sardis.AsyncSardis` client
+        window: Seconds of usage summed into one report
+        max_entries: Aggregated reports held in memory at most
+        overflow: ``"drop"`` or ``"block"`` when memory is full
+        spool_path: JSON Lines file for reports that could not be sent
+        reporter_id: Stable ID used in idempotency keys
+        concurrency: Report requests in flight when not using the batch endpoint
+        clock: Wall clock (windows are aligned to epoch time)
+    """
+
+    def __init__(
+        self,
+        client: AsyncSardis,
+        window: float = 10.0,
+        max_entries: int = 100_000,
+        overflow: Literal["drop", "block"] = "drop",
+        spool_path: str | os.PathLike[str] | None = None,
+        reporter_id: str | None = None,
+        concurrency: int = 8,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(window, max_entries, overflow, spool_path, reporter_id, clock)
+        self._client = client
+        self.concurrency = concurrency
+        self._task: asyncio.Task[None] | None = None
+        self._send_lock: asyncio.Lock | None = None
+        self._drained: asyncio.Event | None = None
+
+    async def __aenter__(self) -> AsyncUsageReporter:
+        self._ensure_task()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    def _ensure_task(self) -> None:
+        if self._task is None or self._task.done():
+            self._send_lock = self._send_lock or asyncio.Lock()
+            self._drained = self._drained or asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    def add(self, meter_id: str, quantity: int = 1, subscription_id: str | None = None) -> bool:
+        """Record usage without waiting; returns False if the event was dropped."""
+        self._ensure_task()
+        with self._lock:
+            return bool(self._try_add(meter_id, quantity, subscription_id)) or self._drop()
+
+    async def put(self, meter_id: str, quantity: int = 1, subscription_id: str | None = None) -> bool:
+        """Record usage, waiting for space under ``overflow="block"``."""
+        self._ensure_task()
+        while True:
+            with self._lock:
+                if self._try_add(meter_id, quantity, subscription_id):
+                    return True
+                if self.overflow == "drop":
+                    return self._drop()
+            self._drained.clear()
+            await self._drained.wait()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(min(self.window, 1.0))
+            try:
+                await self.flush(everything=False)
+            except Exception:
+                logger.debug("usage report flush (async) failed", exc_info=True)
+
+    async def flush(self, everything: bool = True) -> None:
+        """Send queued reports now.
+
+        Args:
+            everything: Also seal windows that are still open
+        """
+        self._send_lock = self._send_lock or asyncio.Lock()
+        async with self._send_lock:
+            if everything:
+                with self._lock:
+                    self._seal(everything=True)
+            healthy = True
+            while healthy and (batch := self._take()):
+                if self._drained is not None:
+                    self._drained.set()
+                healthy = self._settle(*await self._send(batch))
+            if healthy and self._spooled:
+                spooled = self._unspool()
+                for start in range(0, len(spooled), REPORT_BATCH_SIZE):
+                    self._settle(*await self._send(spooled[start:start + REPORT_BATCH_SIZE]))
+                self._replayed(spooled)
+
+    async def _send(self, batch: list[UsageReport]) -> tuple[list[tuple[UsageReport, Exception]], int]:
+        failed: list[tuple[UsageReport, Exception]] = []
+        plain = [r for r in batch if r.subscription_id is None]
+        sent = 0
+        if plain and self._batch_supported is not False:
+            try:
+                await self._client._request(
+                    "POST", "usage/report/batch", json={"events": [self._event(r) for r in plain]}
+                )
+            except Exception as e:
+                if not self._batch_unavailable(e):
+                    failed.extend((r, e) for r in plain)
+                    plain = []
+            else:
+                self._batch_supported = True
+                sent += len(plain)
+                plain = []
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def send_one(report: UsageReport) -> None:
+            nonlocal sent
+            async with semaphore:
+                try:
+                    if report.subscription_id is None:
+                        await self._client.usage.report(
+                            report.meter_id, report.quantity,
+                            timestamp=report.timestamp, idempotency_key=report.idempotency_key,
+                        )
+                    else:
+                        await self._client.subscriptions_v2.report_usage(
+                            report.subscription_id, report.meter_id, report.quantity,
+                            timestamp=report.timestamp, idempotency_key=report.idempotency_key,
+                        )
+                except Exception as e:
+                    failed.append((report, e))
+                else:
+                    sent += 1
+
+        await asyncio.gather(*(send_one(r) for r in plain + [r for r in batch if r.subscription_id is not None]))
+        return failed, sent
+
+    async def close(self) -> None:
+        """Stop the worker task and send everything still held."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+__all__ = [
+    "REPORT_BATCH_SIZE",
+    "AsyncUsageReporter",
+    "ReporterStats",
+    "UsageReport",
+    "UsageReporter",
+]
@@ -8,6 +8,7 @@ from .approvals import ApprovalsResource, AsyncApprovalsResource
 from .base import AsyncBaseResource, BaseResource, Resource, SyncBaseResource
 from .cards import AsyncCardsResource, CardsResource
 from .escrow import AsyncEscrowResource, EscrowResource
+from .events import AsyncEventsResource
 from .evidence import AsyncEvidenceResource, EvidenceResource
 from .exceptions import AsyncExceptionsResource, ExceptionsResource
 from .facility_gate import AsyncFacilityGateResource, FacilityGateResource
@@ -22,6 +23,7 @@ from .payment_objects import AsyncPaymentObjectsResource, PaymentObjectsResource
 from .payments import AsyncPaymentsResource, PaymentsResource
 from .policies import AsyncPoliciesResource, PoliciesResource
 from .simulation import AsyncSimulationResource, SimulationResource
+from .streaming import AsyncStreamingResource, StreamingResource
 from .subscriptions_v2 import AsyncSubscriptionsV2Resource, SubscriptionsV2Resource
 from .transactions import (
     AsyncTransactionsResource,
@@ -31,6 +33,7 @@ from .transactions import (
     TransactionStatus,
 )
 from .treasury import AsyncTreasuryResource, TreasuryResource
+from .usage import AsyncUsageResource, UsageResource
 from .wallets import AsyncWalletsResource, WalletsResource
 from .webhooks import AsyncWebhooksResource, WebhooksResource
 
@@ -42,6 +45,7 @@ __all__ = [
     "AsyncBaseResource",
     "AsyncCardsResource",
     "AsyncEscrowResource",
+    "AsyncEventsResource",
     "AsyncEvidenceResource",
     "AsyncExceptionsResource",
     "AsyncFXResource",
@@ -56,9 +60,11 @@ __all__ = [
     "AsyncPaymentsResource",
     "AsyncPoliciesResource",
     "AsyncSimulationResource",
+    "AsyncStreamingResource",
     "AsyncSubscriptionsV2Resource",
     "AsyncTransactionsResource",
     "AsyncTreasuryResource",
+    "AsyncUsageResource",
     "AsyncWalletsResource",
     "AsyncWebhooksResource",
     "BaseResource",
@@ -82,11 +88,13 @@ __all__ = [
     "PoliciesResource",
     "Resource",
     "SimulationResource",
+    "StreamingResource",
     "SubscriptionsV2Resource",
     "SyncBaseResource",
     "TransactionStatus",
     "TransactionsResource",
     "TreasuryResource",
+    "UsageResource",
     "WalletsResource",
     "WebhooksResource",
 ]
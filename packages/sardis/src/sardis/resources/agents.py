@@ -7,14 +7,16 @@ issue mandates, and be subject to policies.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
+from ..bulk import Missing
 from ..models import Agent
-from ..pagination import Page, create_page_from_response
+from ..pagination import LazyModelList, Page, create_page_from_response, parse_model_list
 from .base import AsyncBaseResource, SyncBaseResource
 
 if TYPE_CHECKING:
     import builtins
+    from collections.abc import Iterable
 
     from ..client import TimeoutConfig
 
@@ -103,18 +105,73 @@ class AsyncAgentsResource(AsyncBaseResource):
         data = await self._get(f"agents/{agent_id}", timeout=timeout)
         return Agent.model_validate(data)
 
+    async def get_many(
+        self,
+        agent_ids: Iterable[str],
+        *,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> builtins.list[Agent | Missing]:
+        """Get many agents by ID.
+
+        Uses the batch endpoint when the server has one, otherwise fetches
+        concurrently. Results are aligned with ``agent_ids``; IDs that do not
+        exist yield a falsy :class:`~sardis.bulk.Missing` instead of raising,
+        and IDs whose request fails yield one with ``error`` set.
+
+        Args:
+            agent_ids: IDs to fetch (duplicates are fetched once)
+            concurrency: Requests in flight when the batch endpoint is unavailable
+            timeout: Optional request timeout
+
+        Returns:
+            One Agent or Missing per requested ID
+        """
+        return await self._get_many(
+            agent_ids,
+            path="agents",
+            model=Agent,
+            id_field="id",
+            items_key="agents",
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+
+    @overload
+    async def list(
+        self,
+        limit: int = 100,
+        offset: int | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> builtins.list[Agent]: ...
+
+    @overload
+    async def list(
+        self,
+        limit: int = 100,
+        offset: int | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[Agent]: ...
+
     async def list(
         self,
         limit: int = 100,
         offset: int | None = None,
         timeout: float | TimeoutConfig | None = None,
-    ) -> builtins.list[Agent]:
+        *,
+        lazy: bool = False,
+    ) -> builtins.list[Agent] | LazyModelList[Agent]:
         """List all agents.
 
         Args:
             limit: Maximum number of agents to return
             offset: Pagination offset
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             List of Agent objects
@@ -127,14 +184,16 @@ class AsyncAgentsResource(AsyncBaseResource):
 
         # Handle both list response and paginated response
         if isinstance(data, list):
-            return [Agent.model_validate(item) for item in data]
-        return [Agent.model_validate(item) for item in data.get("agents", data.get("items", []))]
+            return parse_model_list(data, Agent, lazy=lazy)
+        return parse_model_list(data.get("agents", data.get("items", [])), Agent, lazy=lazy)
 
     async def list_page(
         self,
         limit: int = 100,
         offset: int = 0,
         timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
     ) -> Page[Agent]:
         """List agents with pagination info.
 
@@ -142,6 +201,7 @@ class AsyncAgentsResource(AsyncBaseResource):
             limit: Maximum number of agents per page
             offset: Pagination offset
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             Page of Agent objects with pagination metadata
@@ -152,7 +212,8 @@ class AsyncAgentsResource(AsyncBaseResource):
         return create_page_from_response(
             data=data,
             items_key="agents",
-            item_parser=lambda x: Agent.model_validate(x),
+            model=Agent,
+            lazy=lazy,
         )
 
     async def update(
@@ -288,18 +349,73 @@ class AgentsResource(SyncBaseResource):
         data = self._get(f"agents/{agent_id}", timeout=timeout)
         return Agent.model_validate(data)
 
+    def get_many(
+        self,
+        agent_ids: Iterable[str],
+        *,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> builtins.list[Agent | Missing]:
+        """Get many agents by ID.
+
+        Uses the batch endpoint when the server has one, otherwise fetches
+        concurrently. Results are aligned with ``agent_ids``; IDs that do not
+        exist yield a falsy :class:`~sardis.bulk.Missing` instead of raising,
+        and IDs whose request fails yield one with ``error`` set.
+
+        Args:
+            agent_ids: IDs to fetch (duplicates are fetched once)
+            concurrency: Requests in flight when the batch endpoint is unavailable
+            timeout: Optional request timeout
+
+        Returns:
+            One Agent or Missing per requested ID
+        """
+        return self._get_many(
+            agent_ids,
+            path="agents",
+            model=Agent,
+            id_field="id",
+            items_key="agents",
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+
+    @overload
+    def list(
+        self,
+        limit: int = 100,
+        offset: int | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> builtins.list[Agent]: ...
+
+    @overload
+    def list(
+        self,
+        limit: int = 100,
+        offset: int | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[Agent]: ...
+
     def list(
         self,
         limit: int = 100,
         offset: int | None = None,
         timeout: float | TimeoutConfig | None = None,
-    ) -> builtins.list[Agent]:
+        *,
+        lazy: bool = False,
+    ) -> builtins.list[Agent] | LazyModelList[Agent]:
         """List all agents.
 
         Args:
             limit: Maximum number of agents to return
             offset: Pagination offset
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             List of Agent objects
@@ -312,14 +428,16 @@ class AgentsResource(SyncBaseResource):
 
         # Handle both list response and paginated response
         if isinstance(data, list):
-            return [Agent.model_validate(item) for item in data]
-        return [Agent.model_validate(item) for item in data.get("agents", data.get("items", []))]
+            return parse_model_list(data, Agent, lazy=lazy)
+        return parse_model_list(data.get("agents", data.get("items", [])), Agent, lazy=lazy)
 
     def list_page(
         self,
         limit: int = 100,
         offset: int = 0,
         timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
     ) -> Page[Agent]:
         """List agents with pagination info.
 
@@ -327,6 +445,7 @@ class AgentsResource(SyncBaseResource):
             limit: Maximum number of agents per page
             offset: Pagination offset
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             Page of Agent objects with pagination metadata
@@ -337,7 +456,8 @@ class AgentsResource(SyncBaseResource):
         return create_page_from_response(
             data=data,
             items_key="agents",
-            item_parser=lambda x: Agent.model_validate(x),
+            model=Agent,
+            lazy=lazy,
         )
 
     def update(
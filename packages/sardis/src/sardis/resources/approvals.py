@@ -1,15 +1,40 @@
 """Approvals resource for Sardis SDK."""
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from ..bulk import (
+    AsyncBulkExecutor,
+    BulkConfig,
+    BulkOperationResult,
+    BulkOperationSummary,
+    OperationResult,
+    OperationStatus,
+)
+from ..models.errors import SardisError
 from .base import AsyncBaseResource, SyncBaseResource
 
 if TYPE_CHECKING:
     import builtins
+    from collections.abc import Callable, Iterable
 
     from ..client import TimeoutConfig
 
+_Decisions = BulkOperationResult[str, dict[str, Any]]
+
+
+def _bulk_config(count: int, concurrency: int) -> BulkConfig:
+    # One batch, no retries: the HTTP client already retries transient failures.
+    return BulkConfig(
+        batch_size=max(count, 1),
+        max_concurrency=concurrency,
+        retry_failed=False,
+        delay_between_batches=0,
+    )
+
 
 class AsyncApprovalsResource(AsyncBaseResource):
     """Manage approval workflows."""
@@ -74,6 +99,60 @@ class AsyncApprovalsResource(AsyncBaseResource):
             payload["reason"] = reason
         return await self._post(f"approvals/{approval_id}/reject", payload, timeout=timeout)
 
+    async def approve_many(
+        self,
+        approval_ids: Iterable[str],
+        *,
+        notes: str | None = None,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> _Decisions:
+        """Approve several pending approvals concurrently.
+
+        Args:
+            approval_ids: Approvals to approve
+            notes: Notes attached to every approval
+            concurrency: Maximum requests in flight
+            timeout: Optional per-request timeout
+
+        Returns:
+            Per-approval results (in input order) and a summary; one
+            failure does not stop the others
+        """
+        ids = list(approval_ids)
+        executor = AsyncBulkExecutor(
+            lambda approval_id: self.approve(approval_id, notes=notes, timeout=timeout),
+            _bulk_config(len(ids), concurrency),
+        )
+        return await executor.execute(ids)
+
+    async def deny_many(
+        self,
+        approval_ids: Iterable[str],
+        *,
+        reason: str | None = None,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> _Decisions:
+        """Deny several pending approvals concurrently.
+
+        Args:
+            approval_ids: Approvals to deny
+            reason: Reason attached to every denial
+            concurrency: Maximum requests in flight
+            timeout: Optional per-request timeout
+
+        Returns:
+            Per-approval results (in input order) and a summary; one
+            failure does not stop the others
+        """
+        ids = list(approval_ids)
+        executor = AsyncBulkExecutor(
+            lambda approval_id: self.deny(approval_id, reason=reason, timeout=timeout),
+            _bulk_config(len(ids), concurrency),
+        )
+        return await executor.execute(ids)
+
 
 class ApprovalsResource(SyncBaseResource):
     """Manage approval workflows."""
@@ -137,3 +216,89 @@ class ApprovalsResource(SyncBaseResource):
         if reason:
             payload["reason"] = reason
         return self._post(f"approvals/{approval_id}/reject", payload, timeout=timeout)
+
+    def _decide_many(
+        self,
+        approval_ids: Iterable[str],
+        decide: Callable[[str], dict[str, Any]],
+        concurrency: int,
+    ) -> _Decisions:
+        started_at = datetime.now(UTC)
+        started = time.monotonic()
+        results: builtins.list[OperationResult[str, dict[str, Any]]] = [
+            OperationResult(input=approval_id, index=i) for i, approval_id in enumerate(approval_ids)
+        ]
+
+        def run(result: OperationResult[str, dict[str, Any]]) -> None:
+            began = time.monotonic()
+            try:
+                result.output = decide(result.input)
+                result.status = OperationStatus.SUCCESS
+            except SardisError as e:
+                result.error = e
+                result.status = OperationStatus.FAILED
+            except Exception as e:
+                result.error = SardisError(str(e))
+                result.status = OperationStatus.FAILED
+            result.duration_ms = (time.monotonic() - began) * 1000
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(run, results))
+
+        summary = BulkOperationSummary(
+            total=len(results),
+            successful=sum(1 for r in results if r.is_success),
+            failed=sum(1 for r in results if r.is_failed),
+            total_duration_ms=(time.monotonic() - started) * 1000,
+            started_at=started_at,
+            completed_at=datetime.now(UTC),
+        )
+        return BulkOperationResult(results=results, summary=summary)
+
+    def approve_many(
+        self,
+        approval_ids: Iterable[str],
+        *,
+        notes: str | None = None,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> _Decisions:
+        """Approve several pending approvals concurrently.
+
+        Args:
+            approval_ids: Approvals to approve
+            notes: Notes attached to every approval
+            concurrency: Maximum requests in flight
+            timeout: Optional per-request timeout
+
+        Returns:
+            Per-approval results (in input order) and a summary; one
+            failure does not stop the others
+        """
+        return self._decide_many(
+            approval_ids, lambda approval_id: self.approve(approval_id, notes=notes, timeout=timeout), concurrency
+        )
+
+    def deny_many(
+        self,
+        approval_ids: Iterable[str],
+        *,
+        reason: str | None = None,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> _Decisions:
+        """Deny several pending approvals concurrently.
+
+        Args:
+            approval_ids: Approvals to deny
+            reason: Reason attached to every denial
+            concurrency: Maximum requests in flight
+            timeout: Optional per-request timeout
+
+        Returns:
+            Per-approval results (in input order) and a summary; one
+            failure does not stop the others
+        """
+        return self._decide_many(
+            approval_ids, lambda approval_id: self.deny(approval_id, reason=reason, timeout=timeout), concurrency
+        )
@@ -6,24 +6,59 @@ supporting both synchronous and asynchronous clients with full type hints.
 """
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     Any,
     TypeVar,
 )
 
+from ..bulk import Missing
+from ..models.errors import APIError, NotFoundError
 from ..pagination import AsyncPaginator, Page, SyncPaginator
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    import os
+    from collections.abc import Callable, Iterable
+
+    from pydantic import BaseModel
 
     from ..client import AsyncSardis, RequestContext, Sardis, TimeoutConfig
 
 # Type variable for model types
 T = TypeVar("T")
+M = TypeVar("M", bound="BaseModel")
+
+# Status codes meaning the server has no batch endpoint for a request.
+NO_BATCH_STATUS = frozenset({404, 405, 501})
+BATCH_GET_SIZE = 100
+
+
+class _GetManyMixin:
+    """Shared planning for ``get_many`` on async and sync resources."""
+
+    _batch_get_supported: bool | None = None
+
+    @staticmethod
+    def _unique_ids(ids: Iterable[str]) -> list[str]:
+        return list(dict.fromkeys(ids))
 
+    @staticmethod
+    def _batch_items(data: Any, items_key: str) -> list[dict[str, Any]]:
+        if isinstance(data, list):
+            return data
+        return data.get(items_key, data.get("items", []))
 
-class AsyncBaseResource:
+    def _batch_get_unavailable(self, error: APIError) -> bool:
+        """Whether ``error`` means the batch endpoint does not exist (remembered)."""
+        if error.status_code in NO_BATCH_STATUS and self._batch_get_supported is None:
+            self._batch_get_supported = False
+            return True
+        return False
+
+
+class AsyncBaseResource(_GetManyMixin):
     """Base class for async API resources.
 
     Provides common methods for making HTTP requests to the API.
@@ -169,12 +204,82 @@ class AsyncBaseResource:
             context=context,
         )
 
+    async def _get_many(
+        self,
+        ids: Iterable[str],
+        *,
+        path: str,
+        model: type[M],
+        id_field: str,
+        items_key: str,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> list[M | Missing]:
+        """Fetch many objects by ID, aligned with ``ids``.
+
+        Tries ``POST {path}/batch-get`` first and, if the server has no such
+        endpoint, falls back to concurrent ``GET {path}/{id}``. Duplicate IDs
+        are fetched once; unknown IDs yield :class:`~sardis.bulk.Missing`, and
+        an ID whose request fails yields one carrying the error, so a single
+        failure does not abort the rest.
+
+        Args:
+            ids: Requested IDs
+            path: Collection path, e.g. ``"agents"``
+            model: Model to validate each object with
+            id_field: Raw field holding an object's ID
+            items_key: Key of the object list in a batch response
+            concurrency: Requests in flight when fanning out
+            timeout: Optional timeout override per request
+        """
+        ids = list(ids)
+        unique = self._unique_ids(ids)
+        found: dict[str, M] = {}
+
+        errors: dict[str, Exception] = {}
+
+        fetched = False
+        if self._batch_get_supported is not False and unique:
+            for start in range(0, len(unique), BATCH_GET_SIZE):
+                chunk = unique[start:start + BATCH_GET_SIZE]
+                try:
+                    data = await self._post(f"{path}/batch-get", {"ids": chunk}, timeout=timeout)
+                except Exception as e:
+                    if isinstance(e, APIError) and self._batch_get_unavailable(e):
+                        break
+                    errors.update(dict.fromkeys(chunk, e))
+                    continue
+                self._batch_get_supported = True
+                for item in self._batch_items(data, items_key):
+                    found[str(item.get(id_field, item.get("id")))] = model.model_validate(item)
+            else:
+                fetched = True
+
+        if not fetched:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(object_id: str) -> None:
+                async with semaphore:
+                    try:
+                        data = await self._get(f"{path}/{object_id}", timeout=timeout)
+                    except NotFoundError:
+                        return
+                    except Exception as e:
+                        errors[object_id] = e
+                        return
+                found[object_id] = model.model_validate(data)
+
+            await asyncio.gather(*(fetch(object_id) for object_id in unique))
+
+        return [found.get(object_id) or Missing(object_id, errors.get(object_id)) for object_id in ids]
+
     def _create_paginator(
         self,
         fetch_page: Callable[..., Page[T]],
         initial_params: dict[str, Any] | None = None,
         max_items: int | None = None,
         max_pages: int | None = None,
+        checkpoint_path: str | os.PathLike[str] | None = None,
     ) -> AsyncPaginator[T]:
         """Create an async paginator for list operations.
 
@@ -183,6 +288,7 @@ class AsyncBaseResource:
             initial_params: Initial parameters for pagination
             max_items: Maximum items to fetch
             max_pages: Maximum pages to fetch
+            checkpoint_path: Optional file to persist pagination progress to
 
         Returns:
             AsyncPaginator instance
@@ -192,10 +298,11 @@ class AsyncBaseResource:
             initial_params=initial_params,
             max_items=max_items,
             max_pages=max_pages,
+            checkpoint_path=checkpoint_path,
         )
 
 
-class SyncBaseResource:
+class SyncBaseResource(_GetManyMixin):
     """Base class for sync API resources.
 
     Provides common methods for making HTTP requests to the API.
@@ -341,12 +448,80 @@ class SyncBaseResource:
             context=context,
         )
 
+    def _get_many(
+        self,
+        ids: Iterable[str],
+        *,
+        path: str,
+        model: type[M],
+        id_field: str,
+        items_key: str,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> list[M | Missing]:
+        """Fetch many objects by ID, aligned with ``ids``.
+
+        Tries ``POST {path}/batch-get`` first and, if the server has no such
+        endpoint, falls back to ``GET {path}/{id}`` on a thread pool. Duplicate
+        IDs are fetched once; unknown IDs yield :class:`~sardis.bulk.Missing`,
+        and an ID whose request fails yields one carrying the error, so a
+        single failure does not abort the rest.
+
+        Args:
+            ids: Requested IDs
+            path: Collection path, e.g. ``"agents"``
+            model: Model to validate each object with
+            id_field: Raw field holding an object's ID
+            items_key: Key of the object list in a batch response
+            concurrency: Worker threads when fanning out
+            timeout: Optional timeout override per request
+        """
+        ids = list(ids)
+        unique = self._unique_ids(ids)
+        found: dict[str, M] = {}
+
+        errors: dict[str, Exception] = {}
+
+        fetched = False
+        if self._batch_get_supported is not False and unique:
+            for start in range(0, len(unique), BATCH_GET_SIZE):
+                chunk = unique[start:start + BATCH_GET_SIZE]
+                try:
+                    data = self._post(f"{path}/batch-get", {"ids": chunk}, timeout=timeout)
+                except Exception as e:
+                    if isinstance(e, APIError) and self._batch_get_unavailable(e):
+                        break
+                    errors.update(dict.fromkeys(chunk, e))
+                    continue
+                self._batch_get_supported = True
+                for item in self._batch_items(data, items_key):
+                    found[str(item.get(id_field, item.get("id")))] = model.model_validate(item)
+            else:
+                fetched = True
+
+        if not fetched:
+            def fetch(object_id: str) -> None:
+                try:
+                    data = self._get(f"{path}/{object_id}", timeout=timeout)
+                except NotFoundError:
+                    return
+                except Exception as e:
+                    errors[object_id] = e
+                    return
+                found[object_id] = model.model_validate(data)
+
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="sardis-get-many") as executor:
+                list(executor.map(fetch, unique))
+
+        return [found.get(object_id) or Missing(object_id, errors.get(object_id)) for object_id in ids]
+
     def _create_paginator(
         self,
         fetch_page: Callable[..., Page[T]],
         initial_params: dict[str, Any] | None = None,
         max_items: int | None = None,
         max_pages: int | None = None,
+        checkpoint_path: str | os.PathLike[str] | None = None,
     ) -> SyncPaginator[T]:
         """Create a sync paginator for list operations.
 
@@ -355,6 +530,7 @@ class SyncBaseResource:
             initial_params: Initial parameters for pagination
             max_items: Maximum items to fetch
             max_pages: Maximum pages to fetch
+            checkpoint_path: Optional file to persist pagination progress to
 
         Returns:
             SyncPaginator instance
@@ -364,6 +540,7 @@ class SyncBaseResource:
             initial_params=initial_params,
             max_items=max_items,
             max_pages=max_pages,
+            checkpoint_path=checkpoint_path,
         )
 
 
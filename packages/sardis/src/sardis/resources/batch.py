@@ -11,6 +11,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from ..balances import _invalidate_after
 from .base import AsyncBaseResource, SyncBaseResource
 
 if TYPE_CHECKING:
@@ -69,7 +70,8 @@ class AsyncBatchResource(AsyncBaseResource):
         if mandate_id is not None:
             payload["mandate_id"] = mandate_id
 
-        return await self._post("payments/batch", payload, timeout=timeout)
+        with _invalidate_after(self._client.balance_cache):
+            return await self._post("payments/batch", payload, timeout=timeout)
 
 
 class BatchResource(SyncBaseResource):
@@ -124,7 +126,8 @@ class BatchResource(SyncBaseResource):
         if mandate_id is not None:
             payload["mandate_id"] = mandate_id
 
-        return self._post("payments/batch", payload, timeout=timeout)
+        with _invalidate_after(self._client.balance_cache):
+            return self._post("payments/batch", payload, timeout=timeout)
 
 
 __all__ = [
@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
+from ..bulk import Missing
 from ..models.card import Card, CardTransaction, SimulateCardPurchaseResponse
+from ..pagination import LazyModelList, parse_model_list
 from .base import AsyncBaseResource, SyncBaseResource
 
 if TYPE_CHECKING:
     import builtins
+    from collections.abc import Iterable
 
     from ..client import TimeoutConfig
 
@@ -38,18 +41,38 @@ class AsyncCardsResource(AsyncBaseResource):
         data = await self._post("cards", payload, timeout=timeout)
         return Card.model_validate(data)
 
+    @overload
     async def list(
         self,
         wallet_id: str | None = None,
         timeout: float | TimeoutConfig | None = None,
-    ) -> builtins.list[Card]:
+        *,
+        lazy: Literal[False] = False,
+    ) -> builtins.list[Card]: ...
+
+    @overload
+    async def list(
+        self,
+        wallet_id: str | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[Card]: ...
+
+    async def list(
+        self,
+        wallet_id: str | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
+    ) -> builtins.list[Card] | LazyModelList[Card]:
         params: dict[str, Any] = {}
         if wallet_id:
             params["wallet_id"] = wallet_id
         data = await self._get("cards", params=params or None, timeout=timeout)
         if isinstance(data, list):
-            return [Card.model_validate(item) for item in data]
-        return [Card.model_validate(item) for item in data.get("cards", [])]
+            return parse_model_list(data, Card, lazy=lazy)
+        return parse_model_list(data.get("cards", []), Card, lazy=lazy)
 
     async def get(
         self,
@@ -59,6 +82,38 @@ class AsyncCardsResource(AsyncBaseResource):
         data = await self._get(f"cards/{card_id}", timeout=timeout)
         return Card.model_validate(data)
 
+    async def get_many(
+        self,
+        card_ids: Iterable[str],
+        *,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> builtins.list[Card | Missing]:
+        """Get many cards by ID.
+
+        Uses the batch endpoint when the server has one, otherwise fetches
+        concurrently. Results are aligned with ``card_ids``; IDs that do not
+        exist yield a falsy :class:`~sardis.bulk.Missing` instead of raising,
+        and IDs whose request fails yield one with ``error`` set.
+
+        Args:
+            card_ids: IDs to fetch (duplicates are fetched once)
+            concurrency: Requests in flight when the batch endpoint is unavailable
+            timeout: Optional request timeout
+
+        Returns:
+            One Card or Missing per requested ID
+        """
+        return await self._get_many(
+            card_ids,
+            path="cards",
+            model=Card,
+            id_field="card_id",
+            items_key="cards",
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+
     async def freeze(
         self,
         card_id: str,
@@ -101,16 +156,38 @@ class AsyncCardsResource(AsyncBaseResource):
         data = await self._patch(f"cards/{card_id}/limits", payload, timeout=timeout)
         return Card.model_validate(data)
 
+    @overload
+    async def transactions(
+        self,
+        card_id: str,
+        limit: int = 50,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> builtins.list[CardTransaction]: ...
+
+    @overload
     async def transactions(
         self,
         card_id: str,
         limit: int = 50,
         timeout: float | TimeoutConfig | None = None,
-    ) -> builtins.list[CardTransaction]:
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[CardTransaction]: ...
+
+    async def transactions(
+        self,
+        card_id: str,
+        limit: int = 50,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
+    ) -> builtins.list[CardTransaction] | LazyModelList[CardTransaction]:
         data = await self._get(f"cards/{card_id}/transactions", params={"limit": limit}, timeout=timeout)
         if isinstance(data, list):
-            return [CardTransaction.model_validate(item) for item in data]
-        return [CardTransaction.model_validate(item) for item in data.get("transactions", [])]
+            return parse_model_list(data, CardTransaction, lazy=lazy)
+        return parse_model_list(data.get("transactions", []), CardTransaction, lazy=lazy)
 
     async def simulate_purchase(
         self,
@@ -161,18 +238,38 @@ class CardsResource(SyncBaseResource):
         data = self._post("cards", payload, timeout=timeout)
         return Card.model_validate(data)
 
+    @overload
     def list(
         self,
         wallet_id: str | None = None,
         timeout: float | TimeoutConfig | None = None,
-    ) -> builtins.list[Card]:
+        *,
+        lazy: Literal[False] = False,
+    ) -> builtins.list[Card]: ...
+
+    @overload
+    def list(
+        self,
+        wallet_id: str | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[Card]: ...
+
+    def list(
+        self,
+        wallet_id: str | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
+    ) -> builtins.list[Card] | LazyModelList[Card]:
         params: dict[str, Any] = {}
         if wallet_id:
             params["wallet_id"] = wallet_id
         data = self._get("cards", params=params or None, timeout=timeout)
         if isinstance(data, list):
-            return [Card.model_validate(item) for item in data]
-        return [Card.model_validate(item) for item in data.get("cards", [])]
+            return parse_model_list(data, Card, lazy=lazy)
+        return parse_model_list(data.get("cards", []), Card, lazy=lazy)
 
     def get(
         self,
@@ -182,6 +279,38 @@ class CardsResource(SyncBaseResource):
         data = self._get(f"cards/{card_id}", timeout=timeout)
         return Card.model_validate(data)
 
+    def get_many(
+        self,
+        card_ids: Iterable[str],
+        *,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> builtins.list[Card | Missing]:
+        """Get many cards by ID.
+
+        Uses the batch endpoint when the server has one, otherwise fetches
+        concurrently. Results are aligned with ``card_ids``; IDs that do not
+        exist yield a falsy :class:`~sardis.bulk.Missing` instead of raising,
+        and IDs whose request fails yield one with ``error`` set.
+
+        Args:
+            card_ids: IDs to fetch (duplicates are fetched once)
+            concurrency: Requests in flight when the batch endpoint is unavailable
+            timeout: Optional request timeout
+
+        Returns:
+            One Card or Missing per requested ID
+        """
+        return self._get_many(
+            card_ids,
+            path="cards",
+            model=Card,
+            id_field="card_id",
+            items_key="cards",
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+
     def freeze(
         self,
         card_id: str,
@@ -224,16 +353,38 @@ class CardsResource(SyncBaseResource):
         data = self._patch(f"cards/{card_id}/limits", payload, timeout=timeout)
         return Card.model_validate(data)
 
+    @overload
+    def transactions(
+        self,
+        card_id: str,
+        limit: int = 50,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> builtins.list[CardTransaction]: ...
+
+    @overload
     def transactions(
         self,
         card_id: str,
         limit: int = 50,
         timeout: float | TimeoutConfig | None = None,
-    ) -> builtins.list[CardTransaction]:
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[CardTransaction]: ...
+
+    def transactions(
+        self,
+        card_id: str,
+        limit: int = 50,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
+    ) -> builtins.list[CardTransaction] | LazyModelList[CardTransaction]:
         data = self._get(f"cards/{card_id}/transactions", params={"limit": limit}, timeout=timeout)
         if isinstance(data, list):
-            return [CardTransaction.model_validate(item) for item in data]
-        return [CardTransaction.model_validate(item) for item in data.get("transactions", [])]
+            return parse_model_list(data, CardTransaction, lazy=lazy)
+        return parse_model_list(data.get("transactions", []), CardTransaction, lazy=lazy)
 
     def simulate_purchase(
         self,
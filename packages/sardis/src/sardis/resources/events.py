@@ -0,0 +1,75 @@
+"""Events resource for Sardis SDK."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from ..events import EventStream
+from .base import AsyncBaseResource
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ..client import AsyncSardis
+    from ..events import EventSubscription
+
+
+class AsyncEventsResource(AsyncBaseResource):
+    """Real-time account events (approvals, holds, kill switch, exceptions).
+
+    Example:
+        ```python
+        async with AsyncSardis(api_key="...") as client:
+            async for event in client.events.subscribe(types=["approval.requested"]):
+                print(event.data["approval_id"])
+        ```
+    """
+
+    def __init__(self, client: AsyncSardis) -> None:
+        super().__init__(client)
+        self._stream: EventStream | None = None
+
+    @property
+    def stream(self) -> EventStream:
+        """The connection shared by this client's subscriptions."""
+        if self._stream is None:
+            self._stream = EventStream(self._client)
+        return self._stream
+
+    def configure(self, **options: Any) -> EventStream:
+        """Replace the shared connection with one using ``options``.
+
+        Takes the keyword arguments of :class:`~sardis.events.EventStream`
+        (reconnect backoff, heartbeat timeout, polling intervals). Call
+        before the first :meth:`subscribe`.
+        """
+        if self._stream is not None and self._stream.subscribers:
+            raise RuntimeError("configure() must be called before subscribing")
+        self._stream = EventStream(self._client, **options)
+        return self._stream
+
+    def subscribe(
+        self,
+        types: Iterable[str] | None = None,
+        *,
+        heartbeats: bool = False,
+        max_queue: int = 1000,
+    ) -> EventSubscription:
+        """Subscribe to account events.
+
+        Args:
+            types: Event types to receive; ``"approval.*"`` style prefixes
+                and ``"*"`` are allowed. None receives everything.
+            heartbeats: Also yield ``"heartbeat"`` events
+            max_queue: Events buffered for this subscriber before the oldest
+                are dropped
+
+        Returns:
+            An async iterator of :class:`~sardis.events.StreamEvent` (also an
+            async context manager that closes it)
+        """
+        return self.stream.subscribe(types, heartbeats=heartbeats, max_queue=max_queue)
+
+    async def close(self) -> None:
+        """Close every subscription and the upstream connection."""
+        if self._stream is not None:
+            await self._stream.close()
@@ -1,11 +1,15 @@
 """Evidence resource for Sardis SDK."""
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
 from .base import AsyncBaseResource, SyncBaseResource
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
     from ..client import TimeoutConfig
 
 
@@ -29,24 +33,75 @@ class AsyncEvidenceResource(AsyncBaseResource):
         self,
         *,
         agent_id: str | None = None,
+        created_from: datetime | str | None = None,
+        created_to: datetime | str | None = None,
         limit: int = 50,
         timeout: float | TimeoutConfig | None = None,
     ) -> list[dict[str, Any]]:
-        """List policy decisions with optional agent filter.
+        """List policy decisions with optional agent and time filters.
 
         Args:
             agent_id: Optional agent ID to filter decisions.
+            created_from: Only decisions created at or after this time
+                (on servers that support time filters).
+            created_to: Only decisions created before this time.
             limit: Maximum number of decisions to return.
             timeout: Optional timeout override.
         """
         params: dict[str, Any] = {"limit": limit}
         if agent_id:
             params["agent_id"] = agent_id
+        if created_from:
+            params["created_from"] = created_from.isoformat() if isinstance(created_from, datetime) else created_from
+        if created_to:
+            params["created_to"] = created_to.isoformat() if isinstance(created_to, datetime) else created_to
         data = await self._get("evidence/policy-decisions", params=params, timeout=timeout)
         if isinstance(data, list):
             return data
         return data.get("decisions", data.get("items", []))
 
+    def stream_policy_decisions(
+        self,
+        *,
+        created_from: datetime,
+        created_to: datetime,
+        agent_id: str | None = None,
+        limit: int = 500,
+        partitions: int = 8,
+        concurrency: int = 4,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream every policy decision in ``[created_from, created_to)`` in time order.
+
+        The range is fetched as concurrent time partitions; windows that hit
+        ``limit`` are split until they fit (see :mod:`sardis.exports`). This
+        needs a server that honours ``created_from``/``created_to``; if any
+        decision comes back outside its window, iteration raises
+        :class:`~sardis.exports.PartitionFilterError` straight away.
+
+        Args:
+            created_from: Start of the range (inclusive).
+            created_to: End of the range (exclusive).
+            agent_id: Optional agent ID to filter decisions.
+            limit: Decisions per request; full windows are split.
+            partitions: Initial number of time windows.
+            concurrency: Requests in flight.
+            timeout: Optional timeout override.
+        """
+        from ..exports import AsyncTimePartitionedExporter
+
+        async def fetch(start: datetime, end: datetime, page_limit: int) -> list[dict[str, Any]]:
+            return await self.list_policy_decisions(
+                agent_id=agent_id,
+                created_from=start,
+                created_to=end,
+                limit=page_limit,
+                timeout=timeout,
+            )
+
+        exporter = AsyncTimePartitionedExporter(fetch, limit=limit, partitions=partitions, concurrency=concurrency)
+        return exporter.iter(created_from, created_to)
+
     async def get_policy_decision(
         self,
         decision_id: str,
@@ -76,6 +131,19 @@ class AsyncEvidenceResource(AsyncBaseResource):
             timeout=timeout,
         )
 
+    async def get_signing_key(
+        self,
+        key_id: str,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> dict[str, Any]:
+        """Get a public key used to sign audit packets.
+
+        Args:
+            key_id: The ``key_id`` named by a signed packet.
+            timeout: Optional timeout override.
+        """
+        return await self._get(f"evidence/signing-keys/{quote(key_id, safe='')}", timeout=timeout)
+
 
 class EvidenceResource(SyncBaseResource):
     """Access audit evidence, transaction records, and policy decisions."""
@@ -97,24 +165,75 @@ class EvidenceResource(SyncBaseResource):
         self,
         *,
         agent_id: str | None = None,
+        created_from: datetime | str | None = None,
+        created_to: datetime | str | None = None,
         limit: int = 50,
         timeout: float | TimeoutConfig | None = None,
     ) -> list[dict[str, Any]]:
-        """List policy decisions with optional agent filter.
+        """List policy decisions with optional agent and time filters.
 
         Args:
             agent_id: Optional agent ID to filter decisions.
+            created_from: Only decisions created at or after this time
+                (on servers that support time filters).
+            created_to: Only decisions created before this time.
             limit: Maximum number of decisions to return.
             timeout: Optional timeout override.
         """
         params: dict[str, Any] = {"limit": limit}
         if agent_id:
             params["agent_id"] = agent_id
+        if created_from:
+            params["created_from"] = created_from.isoformat() if isinstance(created_from, datetime) else created_from
+        if created_to:
+            params["created_to"] = created_to.isoformat() if isinstance(created_to, datetime) else created_to
         data = self._get("evidence/policy-decisions", params=params, timeout=timeout)
         if isinstance(data, list):
             return data
         return data.get("decisions", data.get("items", []))
 
+    def stream_policy_decisions(
+        self,
+        *,
+        created_from: datetime,
+        created_to: datetime,
+        agent_id: str | None = None,
+        limit: int = 500,
+        partitions: int = 8,
+        concurrency: int = 4,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream every policy decision in ``[created_from, created_to)`` in time order.
+
+        The range is fetched as concurrent time partitions; windows that hit
+        ``limit`` are split until they fit (see :mod:`sardis.exports`). This
+        needs a server that honours ``created_from``/``created_to``; if any
+        decision comes back outside its window, iteration raises
+        :class:`~sardis.exports.PartitionFilterError` straight away.
+
+        Args:
+            created_from: Start of the range (inclusive).
+            created_to: End of the range (exclusive).
+            agent_id: Optional agent ID to filter decisions.
+            limit: Decisions per request; full windows are split.
+            partitions: Initial number of time windows.
+            concurrency: Requests in flight.
+            timeout: Optional timeout override.
+        """
+        from ..exports import TimePartitionedExporter
+
+        def fetch(start: datetime, end: datetime, page_limit: int) -> list[dict[str, Any]]:
+            return self.list_policy_decisions(
+                agent_id=agent_id,
+                created_from=start,
+                created_to=end,
+                limit=page_limit,
+                timeout=timeout,
+            )
+
+        exporter = TimePartitionedExporter(fetch, limit=limit, partitions=partitions, concurrency=concurrency)
+        return exporter.iter(created_from, created_to)
+
     def get_policy_decision(
         self,
         decision_id: str,
@@ -143,3 +262,16 @@ class EvidenceResource(SyncBaseResource):
             f"evidence/policy-decisions/{decision_id}/export",
             timeout=timeout,
         )
+
+    def get_signing_key(
+        self,
+        key_id: str,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> dict[str, Any]:
+        """Get a public key used to sign audit packets.
+
+        Args:
+            key_id: The ``key_id`` named by a signed packet.
+            timeout: Optional timeout override.
+        """
+        return self._get(f"evidence/signing-keys/{quote(key_id, safe='')}", timeout=timeout)
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING, Any
 from .base import AsyncBaseResource, SyncBaseResource
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
     from ..client import TimeoutConfig
 
 
@@ -27,6 +29,15 @@ def _audit_export_params(
     return params
 
 
+def _export_records(data: dict[str, Any] | list[dict[str, Any]]) -> list[dict[str, Any]]:
+    if isinstance(data, list):
+        return data
+    for key in ("events", "items", "packets", "records"):
+        if isinstance(data.get(key), list):
+            return data[key]
+    return []
+
+
 class AsyncFacilityGateResource(AsyncBaseResource):
     """Programmable facility access for agents."""
 
@@ -105,6 +116,36 @@ class AsyncFacilityGateResource(AsyncBaseResource):
             timeout=timeout,
         )
 
+    def stream_events(
+        self,
+        *,
+        occurred_from: datetime,
+        occurred_to: datetime,
+        event_type: str | None = None,
+        limit: int = 500,
+        partitions: int = 8,
+        concurrency: int = 4,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream every event in ``[occurred_from, occurred_to)`` in time order.
+
+        The range is fetched as concurrent time partitions; windows that hit
+        ``limit`` are split until they fit (see :mod:`sardis.exports`).
+        """
+        from ..exports import AsyncTimePartitionedExporter
+
+        async def fetch(start: datetime, end: datetime, page_limit: int) -> list[dict[str, Any]]:
+            return _export_records(await self.export_events(
+                occurred_from=start,
+                occurred_to=end,
+                event_type=event_type,
+                limit=page_limit,
+                timeout=timeout,
+            ))
+
+        exporter = AsyncTimePartitionedExporter(fetch, limit=limit, partitions=partitions, concurrency=concurrency)
+        return exporter.iter(occurred_from, occurred_to)
+
     async def list(
         self,
         *,
@@ -236,6 +277,36 @@ class FacilityGateResource(SyncBaseResource):
             timeout=timeout,
         )
 
+    def stream_events(
+        self,
+        *,
+        occurred_from: datetime,
+        occurred_to: datetime,
+        event_type: str | None = None,
+        limit: int = 500,
+        partitions: int = 8,
+        concurrency: int = 4,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream every event in ``[occurred_from, occurred_to)`` in time order.
+
+        The range is fetched as concurrent time partitions; windows that hit
+        ``limit`` are split until they fit (see :mod:`sardis.exports`).
+        """
+        from ..exports import TimePartitionedExporter
+
+        def fetch(start: datetime, end: datetime, page_limit: int) -> list[dict[str, Any]]:
+            return _export_records(self.export_events(
+                occurred_from=start,
+                occurred_to=end,
+                event_type=event_type,
+                limit=page_limit,
+                timeout=timeout,
+            ))
+
+        exporter = TimePartitionedExporter(fetch, limit=limit, partitions=partitions, concurrency=concurrency)
+        return exporter.iter(occurred_from, occurred_to)
+
     def list(self, *, limit: int = 50, timeout: float | TimeoutConfig | None = None) -> list[dict[str, Any]]:
         data = self._get("facility-requests", params={"limit": limit}, timeout=timeout)
         return data.get("requests", data.get("items", []))
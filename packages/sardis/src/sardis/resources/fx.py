@@ -55,19 +55,33 @@ class AsyncFXResource(AsyncBaseResource):
         from_amount: Decimal,
         chain: str | None = None,
         timeout: float | TimeoutConfig | None = None,
+        *,
+        cached: bool = True,
     ) -> dict[str, Any]:
         """Get a foreign exchange quote.
 
+        With the client's quote cache enabled, a quote for the same pair and
+        amount bucket that another caller released unexecuted (see
+        :meth:`~sardis.rates.QuoteCache.release`) is handed out instead of
+        requesting a new one, until shortly before it expires. A quote is
+        never handed to two callers at once.
+
         Args:
             from_currency: Source currency code (e.g., "USDC")
             to_currency: Target currency code (e.g., "EURC")
             from_amount: Amount to convert in source currency
             chain: Optional chain for on-chain swap routing
             timeout: Optional request timeout
+            cached: Allow a reused quote (set False to force a fresh one)
 
         Returns:
             Quote with exchange rate, output amount, and expiry
         """
+        cache = self._client.quote_cache
+        if cache is not None and cached:
+            hit = cache.take(from_currency, to_currency, from_amount, chain)
+            if hit is not None:
+                return hit
         payload: dict[str, Any] = {
             "from_currency": from_currency,
             "to_currency": to_currency,
@@ -77,7 +91,10 @@ class AsyncFXResource(AsyncBaseResource):
         if chain is not None:
             payload["chain"] = chain
 
-        return await self._post("fx/quote", payload, timeout=timeout)
+        quote = await self._post("fx/quote", payload, timeout=timeout)
+        if cache is not None:
+            cache.put(from_currency, to_currency, from_amount, quote, chain)
+        return quote
 
     async def execute(
         self,
@@ -97,6 +114,8 @@ class AsyncFXResource(AsyncBaseResource):
             "quote_id": quote_id,
         }
 
+        if self._client.quote_cache is not None:
+            self._client.quote_cache.discard(quote_id)
         return await self._post("fx/execute", payload, timeout=timeout)
 
     async def rates(
@@ -184,19 +203,33 @@ class FXResource(SyncBaseResource):
         from_amount: Decimal,
         chain: str | None = None,
         timeout: float | TimeoutConfig | None = None,
+        *,
+        cached: bool = True,
     ) -> dict[str, Any]:
         """Get a foreign exchange quote.
 
+        With the client's quote cache enabled, a quote for the same pair and
+        amount bucket that another caller released unexecuted (see
+        :meth:`~sardis.rates.QuoteCache.release`) is handed out instead of
+        requesting a new one, until shortly before it expires. A quote is
+        never handed to two callers at once.
+
         Args:
             from_currency: Source currency code (e.g., "USDC")
             to_currency: Target currency code (e.g., "EURC")
             from_amount: Amount to convert in source currency
             chain: Optional chain for on-chain swap routing
             timeout: Optional request timeout
+            cached: Allow a reused quote (set False to force a fresh one)
 
         Returns:
             Quote with exchange rate, output amount, and expiry
         """
+        cache = self._client.quote_cache
+        if cache is not None and cached:
+            hit = cache.take(from_currency, to_currency, from_amount, chain)
+            if hit is not None:
+                return hit
         payload: dict[str, Any] = {
             "from_currency": from_currency,
             "to_currency": to_currency,
@@ -206,7 +239,10 @@ class FXResource(SyncBaseResource):
         if chain is not None:
             payload["chain"] = chain
 
-        return self._post("fx/quote", payload, timeout=timeout)
+        quote = self._post("fx/quote", payload, timeout=timeout)
+        if cache is not None:
+            cache.put(from_currency, to_currency, from_amount, quote, chain)
+        return quote
 
     def execute(
         self,
@@ -226,6 +262,8 @@ class FXResource(SyncBaseResource):
             "quote_id": quote_id,
         }
 
+        if self._client.quote_cache is not None:
+            self._client.quote_cache.discard(quote_id)
         return self._post("fx/execute", payload, timeout=timeout)
 
     def rates(
@@ -6,9 +6,10 @@ Agent groups enable multi-agent governance with shared budgets and merchant poli
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 from ..models.group import AgentGroup
+from ..pagination import LazyModelList, parse_model_list
 from .base import AsyncBaseResource, SyncBaseResource
 
 if TYPE_CHECKING:
@@ -57,12 +58,34 @@ class AsyncGroupsResource(AsyncBaseResource):
         data = await self._get(f"groups/{group_id}", timeout=timeout)
         return AgentGroup.model_validate(data)
 
+    @overload
     async def list(
         self,
         limit: int = 50,
         offset: int | None = None,
         timeout: float | TimeoutConfig | None = None,
-    ) -> builtins.list[AgentGroup]:
+        *,
+        lazy: Literal[False] = False,
+    ) -> builtins.list[AgentGroup]: ...
+
+    @overload
+    async def list(
+        self,
+        limit: int = 50,
+        offset: int | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[AgentGroup]: ...
+
+    async def list(
+        self,
+        limit: int = 50,
+        offset: int | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
+    ) -> builtins.list[AgentGroup] | LazyModelList[AgentGroup]:
         """List all agent groups."""
         params: dict[str, Any] = {"limit": limit}
         if offset is not None:
@@ -70,8 +93,8 @@ class AsyncGroupsResource(AsyncBaseResource):
 
         data = await self._get("groups", params=params, timeout=timeout)
         if isinstance(data, list):
-            return [AgentGroup.model_validate(item) for item in data]
-        return [AgentGroup.model_validate(item) for item in data.get("groups", data.get("items", []))]
+            return parse_model_list(data, AgentGroup, lazy=lazy)
+        return parse_model_list(data.get("groups", data.get("items", [])), AgentGroup, lazy=lazy)
 
     async def update(
         self,
@@ -180,12 +203,34 @@ class GroupsResource(SyncBaseResource):
         data = self._get(f"groups/{group_id}", timeout=timeout)
         return AgentGroup.model_validate(data)
 
+    @overload
+    def list(
+        self,
+        limit: int = 50,
+        offset: int | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> builtins.list[AgentGroup]: ...
+
+    @overload
+    def list(
+        self,
+        limit: int = 50,
+        offset: int | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[AgentGroup]: ...
+
     def list(
         self,
         limit: int = 50,
         offset: int | None = None,
         timeout: float | TimeoutConfig | None = None,
-    ) -> builtins.list[AgentGroup]:
+        *,
+        lazy: bool = False,
+    ) -> builtins.list[AgentGroup] | LazyModelList[AgentGroup]:
         """List all agent groups."""
         params: dict[str, Any] = {"limit": limit}
         if offset is not None:
@@ -193,8 +238,8 @@ class GroupsResource(SyncBaseResource):
 
         data = self._get("groups", params=params, timeout=timeout)
         if isinstance(data, list):
-            return [AgentGroup.model_validate(item) for item in data]
-        return [AgentGroup.model_validate(item) for item in data.get("groups", data.get("items", []))]
+            return parse_model_list(data, AgentGroup, lazy=lazy)
+        return parse_model_list(data.get("groups", data.get("items", [])), AgentGroup, lazy=lazy)
 
     def update(
         self,
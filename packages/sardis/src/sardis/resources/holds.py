@@ -6,16 +6,21 @@ This module provides both async and sync interfaces for hold (pre-authorization)
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
+from ..balances import _invalidate_after
+from ..bulk import Missing
 from ..models.hold import (
     CreateHoldRequest,
     CreateHoldResponse,
     Hold,
 )
+from ..pagination import LazyModelList, parse_model_list
 from .base import AsyncBaseResource, SyncBaseResource
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ..client import TimeoutConfig
 
 
@@ -71,7 +76,8 @@ class AsyncHoldsResource(AsyncBaseResource):
             purpose=purpose,
             duration_hours=duration_hours,
         )
-        response = await self._post("/api/v2/holds", request.to_dict(), timeout=timeout)
+        with _invalidate_after(self._client.balance_cache, wallet_id):
+            response = await self._post("/api/v2/holds", request.to_dict(), timeout=timeout)
         return CreateHoldResponse.model_validate(response)
 
     async def get(
@@ -91,6 +97,38 @@ class AsyncHoldsResource(AsyncBaseResource):
         response = await self._get(f"/api/v2/holds/{hold_id}", timeout=timeout)
         return Hold.model_validate(response)
 
+    async def get_many(
+        self,
+        hold_ids: Iterable[str],
+        *,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> list[Hold | Missing]:
+        """Get many holds by ID.
+
+        Uses the batch endpoint when the server has one, otherwise fetches
+        concurrently. Results are aligned with ``hold_ids``; IDs that do not
+        exist yield a falsy :class:`~sardis.bulk.Missing` instead of raising,
+        and IDs whose request fails yield one with ``error`` set.
+
+        Args:
+            hold_ids: IDs to fetch (duplicates are fetched once)
+            concurrency: Requests in flight when the batch endpoint is unavailable
+            timeout: Optional request timeout
+
+        Returns:
+            One Hold or Missing per requested ID
+        """
+        return await self._get_many(
+            hold_ids,
+            path="/api/v2/holds",
+            model=Hold,
+            id_field="id",
+            items_key="holds",
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+
     async def capture(
         self,
         hold_id: str,
@@ -110,8 +148,13 @@ class AsyncHoldsResource(AsyncBaseResource):
         data: dict[str, Any] = {}
         if amount is not None:
             data["amount"] = str(amount)
-        response = await self._post(f"/api/v2/holds/{hold_id}/capture", data, timeout=timeout)
-        return Hold.model_validate(response)
+        # On failure the hold's wallet is unknown, so every cached balance is dropped.
+        with _invalidate_after(self._client.balance_cache, on_success=False):
+            response = await self._post(f"/api/v2/holds/{hold_id}/capture", data, timeout=timeout)
+            hold = Hold.model_validate(response)
+        if self._client.balance_cache is not None:
+            self._client.balance_cache.invalidate(hold.wallet_id)
+        return hold
 
     async def void(
         self,
@@ -127,40 +170,84 @@ class AsyncHoldsResource(AsyncBaseResource):
         Returns:
             Updated hold details
         """
-        response = await self._post(f"/api/v2/holds/{hold_id}/void", {}, timeout=timeout)
-        return Hold.model_validate(response)
+        with _invalidate_after(self._client.balance_cache, on_success=False):
+            response = await self._post(f"/api/v2/holds/{hold_id}/void", {}, timeout=timeout)
+            hold = Hold.model_validate(response)
+        if self._client.balance_cache is not None:
+            self._client.balance_cache.invalidate(hold.wallet_id)
+        return hold
+
+    @overload
+    async def list_by_wallet(
+        self,
+        wallet_id: str,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> list[Hold]: ...
+
+    @overload
+    async def list_by_wallet(
+        self,
+        wallet_id: str,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[Hold]: ...
 
     async def list_by_wallet(
         self,
         wallet_id: str,
         timeout: float | TimeoutConfig | None = None,
-    ) -> list[Hold]:
+        *,
+        lazy: bool = False,
+    ) -> list[Hold] | LazyModelList[Hold]:
         """List all holds for a wallet.
 
         Args:
             wallet_id: The wallet ID
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             List of holds
         """
         response = await self._get(f"/api/v2/holds/wallet/{wallet_id}", timeout=timeout)
-        return [Hold.model_validate(h) for h in response.get("holds", [])]
+        return parse_model_list(response.get("holds", []), Hold, lazy=lazy)
+
+    @overload
+    async def list_active(
+        self,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> list[Hold]: ...
+
+    @overload
+    async def list_active(
+        self,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[Hold]: ...
 
     async def list_active(
         self,
         timeout: float | TimeoutConfig | None = None,
-    ) -> list[Hold]:
+        *,
+        lazy: bool = False,
+    ) -> list[Hold] | LazyModelList[Hold]:
         """List all active holds.
 
         Args:
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             List of active holds
         """
         response = await self._get("/api/v2/holds", timeout=timeout)
-        return [Hold.model_validate(h) for h in response.get("holds", [])]
+        return parse_model_list(response.get("holds", []), Hold, lazy=lazy)
 
 
 class HoldsResource(SyncBaseResource):
@@ -215,7 +302,8 @@ class HoldsResource(SyncBaseResource):
             purpose=purpose,
             duration_hours=duration_hours,
         )
-        response = self._post("/api/v2/holds", request.to_dict(), timeout=timeout)
+        with _invalidate_after(self._client.balance_cache, wallet_id):
+            response = self._post("/api/v2/holds", request.to_dict(), timeout=timeout)
         return CreateHoldResponse.model_validate(response)
 
     def get(
@@ -235,6 +323,38 @@ class HoldsResource(SyncBaseResource):
         response = self._get(f"/api/v2/holds/{hold_id}", timeout=timeout)
         return Hold.model_validate(response)
 
+    def get_many(
+        self,
+        hold_ids: Iterable[str],
+        *,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> list[Hold | Missing]:
+        """Get many holds by ID.
+
+        Uses the batch endpoint when the server has one, otherwise fetches
+        concurrently. Results are aligned with ``hold_ids``; IDs that do not
+        exist yield a falsy :class:`~sardis.bulk.Missing` instead of raising,
+        and IDs whose request fails yield one with ``error`` set.
+
+        Args:
+            hold_ids: IDs to fetch (duplicates are fetched once)
+            concurrency: Requests in flight when the batch endpoint is unavailable
+            timeout: Optional request timeout
+
+        Returns:
+            One Hold or Missing per requested ID
+        """
+        return self._get_many(
+            hold_ids,
+            path="/api/v2/holds",
+            model=Hold,
+            id_field="id",
+            items_key="holds",
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+
     def capture(
         self,
         hold_id: str,
@@ -254,8 +374,13 @@ class HoldsResource(SyncBaseResource):
         data: dict[str, Any] = {}
         if amount is not None:
             data["amount"] = str(amount)
-        response = self._post(f"/api/v2/holds/{hold_id}/capture", data, timeout=timeout)
-        return Hold.model_validate(response)
+        # On failure the hold's wallet is unknown, so every cached balance is dropped.
+        with _invalidate_after(self._client.balance_cache, on_success=False):
+            response = self._post(f"/api/v2/holds/{hold_id}/capture", data, timeout=timeout)
+            hold = Hold.model_validate(response)
+        if self._client.balance_cache is not None:
+            self._client.balance_cache.invalidate(hold.wallet_id)
+        return hold
 
     def void(
         self,
@@ -271,40 +396,84 @@ class HoldsResource(SyncBaseResource):
         Returns:
             Updated hold details
         """
-        response = self._post(f"/api/v2/holds/{hold_id}/void", {}, timeout=timeout)
-        return Hold.model_validate(response)
+        with _invalidate_after(self._client.balance_cache, on_success=False):
+            response = self._post(f"/api/v2/holds/{hold_id}/void", {}, timeout=timeout)
+            hold = Hold.model_validate(response)
+        if self._client.balance_cache is not None:
+            self._client.balance_cache.invalidate(hold.wallet_id)
+        return hold
+
+    @overload
+    def list_by_wallet(
+        self,
+        wallet_id: str,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> list[Hold]: ...
+
+    @overload
+    def list_by_wallet(
+        self,
+        wallet_id: str,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[Hold]: ...
 
     def list_by_wallet(
         self,
         wallet_id: str,
         timeout: float | TimeoutConfig | None = None,
-    ) -> list[Hold]:
+        *,
+        lazy: bool = False,
+    ) -> list[Hold] | LazyModelList[Hold]:
         """List all holds for a wallet.
 
         Args:
             wallet_id: The wallet ID
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             List of holds
         """
         response = self._get(f"/api/v2/holds/wallet/{wallet_id}", timeout=timeout)
-        return [Hold.model_validate(h) for h in response.get("holds", [])]
+        return parse_model_list(response.get("holds", []), Hold, lazy=lazy)
+
+    @overload
+    def list_active(
+        self,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> list[Hold]: ...
+
+    @overload
+    def list_active(
+        self,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[Hold]: ...
 
     def list_active(
         self,
         timeout: float | TimeoutConfig | None = None,
-    ) -> list[Hold]:
+        *,
+        lazy: bool = False,
+    ) -> list[Hold] | LazyModelList[Hold]:
         """List all active holds.
 
         Args:
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             List of active holds
         """
         response = self._get("/api/v2/holds", timeout=timeout)
-        return [Hold.model_validate(h) for h in response.get("holds", [])]
+        return parse_model_list(response.get("holds", []), Hold, lazy=lazy)
 
 
 __all__ = [
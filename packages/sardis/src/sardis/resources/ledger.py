@@ -5,16 +5,25 @@ This module provides both async and sync interfaces for ledger operations.
 """
 from __future__ import annotations
 
+import functools
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, overload
+from urllib.parse import quote
 
 from pydantic import BaseModel
 
+from ..columnar import DEFAULT_SCALE, LedgerColumns
+from ..pagination import LazyModelList, Page, create_page_from_response, parse_model_list
 from .base import AsyncBaseResource, SyncBaseResource
 
 if TYPE_CHECKING:
+    import os
+
+    import pyarrow as pa
+
     from ..client import TimeoutConfig
+    from ..pagination import AsyncPaginator, SyncPaginator
 
 
 class LedgerEntry(BaseModel):
@@ -46,13 +55,37 @@ class AsyncLedgerResource(AsyncBaseResource):
         ```
     """
 
+    @overload
+    async def list_entries(
+        self,
+        wallet_id: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> list[LedgerEntry]: ...
+
+    @overload
     async def list_entries(
         self,
         wallet_id: str | None = None,
         limit: int = 50,
         offset: int = 0,
         timeout: float | TimeoutConfig | None = None,
-    ) -> list[LedgerEntry]:
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[LedgerEntry]: ...
+
+    async def list_entries(
+        self,
+        wallet_id: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
+    ) -> list[LedgerEntry] | LazyModelList[LedgerEntry]:
         """List ledger entries.
 
         Args:
@@ -60,6 +93,7 @@ class AsyncLedgerResource(AsyncBaseResource):
             limit: Maximum number of entries
             offset: Pagination offset
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             List of ledger entries
@@ -68,7 +102,137 @@ class AsyncLedgerResource(AsyncBaseResource):
         if wallet_id:
             params["wallet_id"] = wallet_id
         response = await self._get("/api/v2/ledger/entries", params=params, timeout=timeout)
-        return [LedgerEntry.model_validate(e) for e in response.get("entries", [])]
+        return parse_model_list(response.get("entries", []), LedgerEntry, lazy=lazy)
+
+    async def list_entries_page(
+        self,
+        wallet_id: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
+    ) -> Page[LedgerEntry]:
+        """List ledger entries with pagination info.
+
+        Args:
+            wallet_id: Filter by wallet ID
+            limit: Maximum number of entries per page
+            offset: Pagination offset
+            timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
+
+        Returns:
+            Page of ledger entries with pagination metadata
+        """
+        params: dict[str, Any] = {"limit": limit, "offset": offset}
+        if wallet_id:
+            params["wallet_id"] = wallet_id
+        response = await self._get("/api/v2/ledger/entries", params=params, timeout=timeout)
+        return create_page_from_response(
+            data=response,
+            items_key="entries",
+            model=LedgerEntry,
+            lazy=lazy,
+            page_size=limit,
+        )
+
+    def paginate_entries(
+        self,
+        wallet_id: str | None = None,
+        page_size: int = 500,
+        max_items: int | None = None,
+        checkpoint_path: str | os.PathLike[str] | None = None,
+        *,
+        lazy: bool = False,
+    ) -> AsyncPaginator[LedgerEntry]:
+        """Iterate over all ledger entries, page by page.
+
+        Args:
+            wallet_id: Filter by wallet ID
+            page_size: Entries fetched per request
+            max_items: Maximum number of entries to yield
+            checkpoint_path: Optional file to persist progress to after every
+                page; an existing checkpoint is resumed automatically
+            lazy: Validate each entry only when it is accessed
+
+        Returns:
+            AsyncPaginator over ledger entries
+        """
+        params: dict[str, Any] = {"limit": page_size, "offset": 0}
+        if wallet_id:
+            params["wallet_id"] = wallet_id
+        return self._create_paginator(
+            functools.partial(self.list_entries_page, lazy=lazy),
+            initial_params=params,
+            max_items=max_items,
+            checkpoint_path=checkpoint_path,
+        )
+
+    async def to_columns(
+        self,
+        wallet_id: str | None = None,
+        page_size: int = 1000,
+        max_items: int | None = None,
+        scale: int = DEFAULT_SCALE,
+        rounding: str | None = None,
+    ) -> LedgerColumns:
+        """Stream ledger entries into columnar buffers.
+
+        Pages are appended to the column buffers as raw dictionaries, so no
+        per-entry model is ever built. See :mod:`sardis.columnar` for the layout.
+
+        Args:
+            wallet_id: Filter by wallet ID
+            page_size: Entries fetched per request
+            max_items: Maximum number of entries to export
+            scale: Fractional digits kept in the int64 ``amount`` column
+            rounding: Decimal rounding mode for amounts finer than ``scale``
+                (by default they raise ``ValueError``)
+
+        Returns:
+            LedgerColumns holding every exported entry
+        """
+        columns = LedgerColumns(scale=scale, rounding=rounding)
+        paginator = self.paginate_entries(wallet_id=wallet_id, page_size=page_size, lazy=True)
+        async for page in paginator.pages():
+            rows = page.items.raw
+            if max_items is not None:
+                rows = rows[: max_items - len(columns)]
+            columns.extend(rows)
+            if max_items is not None and len(columns) >= max_items:
+                break
+        return columns
+
+    async def to_arrow(
+        self,
+        wallet_id: str | None = None,
+        page_size: int = 1000,
+        max_items: int | None = None,
+        scale: int = DEFAULT_SCALE,
+        rounding: str | None = None,
+    ) -> pa.Table:
+        """Export ledger entries as a PyArrow table (requires ``sardis[analytics]``).
+
+        Args:
+            wallet_id: Filter by wallet ID
+            page_size: Entries fetched per request
+            max_items: Maximum number of entries to export
+            scale: Fractional digits kept in the int64 ``amount`` column
+            rounding: Decimal rounding mode for amounts finer than ``scale``
+                (by default they raise ``ValueError``)
+
+        Returns:
+            A ``pyarrow.Table`` with dictionary-encoded currency, chain and wallet columns
+        """
+        columns = await self.to_columns(
+            wallet_id=wallet_id,
+            page_size=page_size,
+            max_items=max_items,
+            scale=scale,
+            rounding=rounding,
+        )
+        return columns.to_arrow()
 
     async def get_entry(
         self,
@@ -103,6 +267,26 @@ class AsyncLedgerResource(AsyncBaseResource):
         """
         return await self._get(f"/api/v2/ledger/entries/{tx_id}/verify", timeout=timeout)
 
+    async def get_anchor(
+        self,
+        anchor: str,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> dict[str, Any]:
+        """Get the Merkle material behind an audit anchor.
+
+        One response covers every entry committed under the anchor, so
+        :mod:`sardis.anchors` can verify a whole batch locally.
+
+        Args:
+            anchor: The ``audit_anchor`` of one or more ledger entries
+            timeout: Optional request timeout
+
+        Returns:
+            Anchor material: the Merkle ``root`` plus either ``proofs`` (per
+            ``tx_id`` sibling paths) or ``leaves`` (ordered leaf hashes)
+        """
+        return await self._get(f"/api/v2/ledger/anchors/{quote(anchor, safe='')}", timeout=timeout)
+
 
 class LedgerResource(SyncBaseResource):
     """Sync resource for ledger operations.
@@ -118,13 +302,37 @@ class LedgerResource(SyncBaseResource):
         ```
     """
 
+    @overload
+    def list_entries(
+        self,
+        wallet_id: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> list[LedgerEntry]: ...
+
+    @overload
+    def list_entries(
+        self,
+        wallet_id: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[LedgerEntry]: ...
+
     def list_entries(
         self,
         wallet_id: str | None = None,
         limit: int = 50,
         offset: int = 0,
         timeout: float | TimeoutConfig | None = None,
-    ) -> list[LedgerEntry]:
+        *,
+        lazy: bool = False,
+    ) -> list[LedgerEntry] | LazyModelList[LedgerEntry]:
         """List ledger entries.
 
         Args:
@@ -132,6 +340,7 @@ class LedgerResource(SyncBaseResource):
             limit: Maximum number of entries
             offset: Pagination offset
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             List of ledger entries
@@ -140,7 +349,137 @@ class LedgerResource(SyncBaseResource):
         if wallet_id:
             params["wallet_id"] = wallet_id
         response = self._get("/api/v2/ledger/entries", params=params, timeout=timeout)
-        return [LedgerEntry.model_validate(e) for e in response.get("entries", [])]
+        return parse_model_list(response.get("entries", []), LedgerEntry, lazy=lazy)
+
+    def list_entries_page(
+        self,
+        wallet_id: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
+    ) -> Page[LedgerEntry]:
+        """List ledger entries with pagination info.
+
+        Args:
+            wallet_id: Filter by wallet ID
+            limit: Maximum number of entries per page
+            offset: Pagination offset
+            timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
+
+        Returns:
+            Page of ledger entries with pagination metadata
+        """
+        params: dict[str, Any] = {"limit": limit, "offset": offset}
+        if wallet_id:
+            params["wallet_id"] = wallet_id
+        response = self._get("/api/v2/ledger/entries", params=params, timeout=timeout)
+        return create_page_from_response(
+            data=response,
+            items_key="entries",
+            model=LedgerEntry,
+            lazy=lazy,
+            page_size=limit,
+        )
+
+    def paginate_entries(
+        self,
+        wallet_id: str | None = None,
+        page_size: int = 500,
+        max_items: int | None = None,
+        checkpoint_path: str | os.PathLike[str] | None = None,
+        *,
+        lazy: bool = False,
+    ) -> SyncPaginator[LedgerEntry]:
+        """Iterate over all ledger entries, page by page.
+
+        Args:
+            wallet_id: Filter by wallet ID
+            page_size: Entries fetched per request
+            max_items: Maximum number of entries to yield
+            checkpoint_path: Optional file to persist progress to after every
+                page; an existing checkpoint is resumed automatically
+            lazy: Validate each entry only when it is accessed
+
+        Returns:
+            SyncPaginator over ledger entries
+        """
+        params: dict[str, Any] = {"limit": page_size, "offset": 0}
+        if wallet_id:
+            params["wallet_id"] = wallet_id
+        return self._create_paginator(
+            functools.partial(self.list_entries_page, lazy=lazy),
+            initial_params=params,
+            max_items=max_items,
+            checkpoint_path=checkpoint_path,
+        )
+
+    def to_columns(
+        self,
+        wallet_id: str | None = None,
+        page_size: int = 1000,
+        max_items: int | None = None,
+        scale: int = DEFAULT_SCALE,
+        rounding: str | None = None,
+    ) -> LedgerColumns:
+        """Stream ledger entries into columnar buffers.
+
+        Pages are appended to the column buffers as raw dictionaries, so no
+        per-entry model is ever built. See :mod:`sardis.columnar` for the layout.
+
+        Args:
+            wallet_id: Filter by wallet ID
+            page_size: Entries fetched per request
+            max_items: Maximum number of entries to export
+            scale: Fractional digits kept in the int64 ``amount`` column
+            rounding: Decimal rounding mode for amounts finer than ``scale``
+                (by default they raise ``ValueError``)
+
+        Returns:
+            LedgerColumns holding every exported entry
+        """
+        columns = LedgerColumns(scale=scale, rounding=rounding)
+        paginator = self.paginate_entries(wallet_id=wallet_id, page_size=page_size, lazy=True)
+        for page in paginator.pages():
+            rows = page.items.raw
+            if max_items is not None:
+                rows = rows[: max_items - len(columns)]
+            columns.extend(rows)
+            if max_items is not None and len(columns) >= max_items:
+                break
+        return columns
+
+    def to_arrow(
+        self,
+        wallet_id: str | None = None,
+        page_size: int = 1000,
+        max_items: int | None = None,
+        scale: int = DEFAULT_SCALE,
+        rounding: str | None = None,
+    ) -> pa.Table:
+        """Export ledger entries as a PyArrow table (requires ``sardis[analytics]``).
+
+        Args:
+            wallet_id: Filter by wallet ID
+            page_size: Entries fetched per request
+            max_items: Maximum number of entries to export
+            scale: Fractional digits kept in the int64 ``amount`` column
+            rounding: Decimal rounding mode for amounts finer than ``scale``
+                (by default they raise ``ValueError``)
+
+        Returns:
+            A ``pyarrow.Table`` with dictionary-encoded currency, chain and wallet columns
+        """
+        columns = self.to_columns(
+            wallet_id=wallet_id,
+            page_size=page_size,
+            max_items=max_items,
+            scale=scale,
+            rounding=rounding,
+        )
+        return columns.to_arrow()
 
     def get_entry(
         self,
@@ -175,6 +514,26 @@ class LedgerResource(SyncBaseResource):
         """
         return self._get(f"/api/v2/ledger/entries/{tx_id}/verify", timeout=timeout)
 
+    def get_anchor(
+        self,
+        anchor: str,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> dict[str, Any]:
+        """Get the Merkle material behind an audit anchor.
+
+        One response covers every entry committed under the anchor, so
+        :mod:`sardis.anchors` can verify a whole batch locally.
+
+        Args:
+            anchor: The ``audit_anchor`` of one or more ledger entries
+            timeout: Optional request timeout
+
+        Returns:
+            Anchor material: the Merkle ``root`` plus either ``proofs`` (per
+            ``tx_id`` sibling paths) or ``leaves`` (ordered leaf hashes)
+        """
+        return self._get(f"/api/v2/ledger/anchors/{quote(anchor, safe='')}", timeout=timeout)
+
 
 __all__ = [
     "AsyncLedgerResource",
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from ..balances import _invalidate_after
 from .base import AsyncBaseResource, SyncBaseResource
 
 if TYPE_CHECKING:
@@ -91,7 +92,8 @@ class AsyncPayResource(AsyncBaseResource):
         if mandate_id is not None:
             payload["mandate_id"] = mandate_id
 
-        return await self._post("pay", payload, timeout=timeout)
+        with _invalidate_after(self._client.balance_cache):
+            return await self._post("pay", payload, timeout=timeout)
 
 
 class PayResource(SyncBaseResource):
@@ -163,7 +165,8 @@ class PayResource(SyncBaseResource):
         if mandate_id is not None:
             payload["mandate_id"] = mandate_id
 
-        return self._post("pay", payload, timeout=timeout)
+        with _invalidate_after(self._client.balance_cache):
+            return self._post("pay", payload, timeout=timeout)
 
 
 __all__ = [
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from ..balances import _invalidate_after
 from ..models.payment import (
     ExecuteAP2Response,
     ExecutePaymentResponse,
@@ -49,7 +50,8 @@ class AsyncPaymentsResource(AsyncBaseResource):
         Returns:
             ExecutePaymentResponse with transaction details
         """
-        response = await self._post("mandates/execute", {"mandate": mandate}, timeout=timeout)
+        with _invalidate_after(self._client.balance_cache):
+            response = await self._post("mandates/execute", {"mandate": mandate}, timeout=timeout)
         return ExecutePaymentResponse.model_validate(response)
 
     async def execute_ap2(
@@ -70,11 +72,12 @@ class AsyncPaymentsResource(AsyncBaseResource):
         Returns:
             ExecuteAP2Response with transaction details
         """
-        response = await self._post(
-            "/api/v2/ap2/payments/execute",
-            {"intent": intent, "cart": cart, "payment": payment},
-            timeout=timeout,
-        )
+        with _invalidate_after(self._client.balance_cache):
+            response = await self._post(
+                "/api/v2/ap2/payments/execute",
+                {"intent": intent, "cart": cart, "payment": payment},
+                timeout=timeout,
+            )
         return ExecuteAP2Response.model_validate(response)
 
     async def execute_ap2_bundle(
@@ -131,7 +134,8 @@ class PaymentsResource(SyncBaseResource):
         Returns:
             ExecutePaymentResponse with transaction details
         """
-        response = self._post("mandates/execute", {"mandate": mandate}, timeout=timeout)
+        with _invalidate_after(self._client.balance_cache):
+            response = self._post("mandates/execute", {"mandate": mandate}, timeout=timeout)
         return ExecutePaymentResponse.model_validate(response)
 
     def execute_ap2(
@@ -152,11 +156,12 @@ class PaymentsResource(SyncBaseResource):
         Returns:
             ExecuteAP2Response with transaction details
         """
-        response = self._post(
-            "/api/v2/ap2/payments/execute",
-            {"intent": intent, "cart": cart, "payment": payment},
-            timeout=timeout,
-        )
+        with _invalidate_after(self._client.balance_cache):
+            response = self._post(
+                "/api/v2/ap2/payments/execute",
+                {"intent": intent, "cart": cart, "payment": payment},
+                timeout=timeout,
+            )
         return ExecuteAP2Response.model_validate(response)
 
     def execute_ap2_bundle(
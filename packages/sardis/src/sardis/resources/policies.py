@@ -1,24 +1,128 @@
 """Policies resource for Sardis SDK."""
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, InvalidOperation
 from typing import TYPE_CHECKING, Any
 
+from ..evaluator import USD_TOKENS
+from ..models.errors import APIError, SardisError
 from ..models.policy import (
     ApplyPolicyFromNLResponse,
     ParsedPolicy,
+    PolicyCheckCandidate,
     PolicyCheckResponse,
     PolicyExample,
     PolicyPreviewResponse,
 )
-from .base import AsyncBaseResource, SyncBaseResource
+from .base import NO_BATCH_STATUS, AsyncBaseResource, SyncBaseResource
 
 if TYPE_CHECKING:
-    from decimal import Decimal
+    from collections.abc import Sequence
 
-    from ..client import TimeoutConfig
+    from ..client import AsyncSardis, Sardis, TimeoutConfig
 
+_BATCH_SIZE = 100
+
+_CandidateKey = tuple[str, str, str, str | None, str | None, str | None]
+
+
+def _check_payload(candidate: PolicyCheckCandidate | dict[str, Any]) -> dict[str, Any]:
+    if not isinstance(candidate, PolicyCheckCandidate):
+        candidate = PolicyCheckCandidate.model_validate(candidate)
+    return {
+        "agent_id": candidate.agent_id,
+        "amount": str(candidate.amount),
+        "currency": candidate.currency,
+        "merchant_id": candidate.merchant_id,
+        "merchant_category": candidate.merchant_category,
+        "mcc_code": candidate.mcc_code,
+    }
+
+
+def _check_key(payload: dict[str, Any]) -> _CandidateKey:
+    return (
+        payload["agent_id"],
+        format(Decimal(payload["amount"]).normalize(), "f"),
+        payload["currency"].upper(),
+        payload["merchant_id"],
+        payload["merchant_category"],
+        payload["mcc_code"],
+    )
+
+
+def _per_tx_limit(data: dict[str, Any]) -> Decimal | None:
+    """Per-transaction limit from a ``policies.get`` or ``policies.apply`` response."""
+    if isinstance(data.get("policies"), list) and data["policies"]:
+        data = data["policies"][0]
+    value = data.get("max_per_tx", data.get("limit_per_tx"))
+    try:
+        return Decimal(str(value)) if value is not None else None
+    except InvalidOperation:
+        return None
+
+
+class _CheckManyMixin:
+    """Shared pre-filter and batch-support state for ``check_many``."""
+
+    def _init_check_many(self) -> None:
+        self._per_tx_limits: dict[str, Decimal] = {}
+        self._batch_supported: bool | None = None
+
+    def _remember_limit(self, agent_id: str, data: dict[str, Any]) -> None:
+        limit = _per_tx_limit(data)
+        if limit is None:
+            self._per_tx_limits.pop(agent_id, None)
+        else:
+            self._per_tx_limits[agent_id] = limit
+
+    def _prefilter(self, payload: dict[str, Any]) -> PolicyCheckResponse | None:
+        """Local rejection for a candidate over the cached per-tx limit; never approves."""
+        limit = self._per_tx_limits.get(payload["agent_id"])
+        if limit is None or payload["currency"].upper() not in USD_TOKENS:
+            return None
+        if Decimal(payload["amount"]) <= limit:
+            return None
+        return PolicyCheckResponse(
+            allowed=False,
+            reason=f"Amount exceeds per-transaction limit of {limit}",
+            prefiltered=True,
+        )
+
+    def _plan(
+        self, candidates: Sequence[PolicyCheckCandidate | dict[str, Any]], prefilter: bool,
+    ) -> tuple[list[PolicyCheckResponse | None], dict[_CandidateKey, tuple[dict[str, Any], list[int]]]]:
+        results: list[PolicyCheckResponse | None] = [None] * len(candidates)
+        unique: dict[_CandidateKey, tuple[dict[str, Any], list[int]]] = {}
+        for i, candidate in enumerate(candidates):
+            payload = _check_payload(candidate)
+            if prefilter and (local := self._prefilter(payload)) is not None:
+                results[i] = local
+                continue
+            unique.setdefault(_check_key(payload), (payload, []))[1].append(i)
+        return results, unique
+
+    @staticmethod
+    def _parse_batch(data: Any, expected: int) -> list[PolicyCheckResponse]:
+        items = data if isinstance(data, list) else data.get("results", [])
+        if len(items) != expected:
+            raise SardisError(f"Batch policy check returned {len(items)} results for {expected} candidates")
+        return [PolicyCheckResponse.model_validate(item) for item in items]
+
+    def _batch_unavailable(self, error: APIError) -> bool:
+        if error.status_code in NO_BATCH_STATUS and self._batch_supported is None:
+            self._batch_supported = False
+            return True
+        return False
+
+
+class AsyncPoliciesResource(_CheckManyMixin, AsyncBaseResource):
+    def __init__(self, client: AsyncSardis) -> None:
+        super().__init__(client)
+        self._init_check_many()
+        self._inflight: dict[_CandidateKey, asyncio.Future[PolicyCheckResponse]] = {}
 
-class AsyncPoliciesResource(AsyncBaseResource):
     async def parse(
         self,
         natural_language: str,
@@ -55,6 +159,7 @@ class AsyncPoliciesResource(AsyncBaseResource):
             {"natural_language": natural_language, "agent_id": agent_id, "confirm": True},
             timeout=timeout,
         )
+        self._remember_limit(agent_id, data)
         return ApplyPolicyFromNLResponse.model_validate(data)
 
     async def get(
@@ -62,7 +167,9 @@ class AsyncPoliciesResource(AsyncBaseResource):
         agent_id: str,
         timeout: float | TimeoutConfig | None = None,
     ) -> dict[str, Any]:
-        return await self._get(f"policies/{agent_id}", timeout=timeout)
+        data = await self._get(f"policies/{agent_id}", timeout=timeout)
+        self._remember_limit(agent_id, data)
+        return data
 
     async def check(
         self,
@@ -86,6 +193,73 @@ class AsyncPoliciesResource(AsyncBaseResource):
         data = await self._post("policies/check", payload, timeout=timeout)
         return PolicyCheckResponse.model_validate(data)
 
+    async def check_many(
+        self,
+        candidates: Sequence[PolicyCheckCandidate | dict[str, Any]],
+        *,
+        concurrency: int = 8,
+        prefilter: bool = True,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> list[PolicyCheckResponse]:
+        """Check many candidate payments at once.
+
+        Uses the batch check endpoint when the server has one, otherwise
+        checks concurrently. Identical candidates are checked once, including
+        across concurrent calls. Candidates over the agent's per-transaction
+        limit (cached by :meth:`get` and :meth:`apply`) are rejected locally
+        with ``prefiltered=True``; the pre-filter never approves.
+
+        Args:
+            candidates: Candidate payments (models or dicts)
+            concurrency: Checks in flight when fanning out
+            prefilter: Reject over-limit candidates without a request
+            timeout: Optional timeout override per request
+
+        Returns:
+            One response per candidate, in input order
+        """
+        results, unique = self._plan(candidates, prefilter)
+        keys = list(unique)
+        payloads = [unique[k][0] for k in keys]
+
+        answers: list[PolicyCheckResponse] | None = None
+        if self._batch_supported is not False and payloads:
+            try:
+                answers = []
+                for start in range(0, len(payloads), _BATCH_SIZE):
+                    chunk = payloads[start:start + _BATCH_SIZE]
+                    data = await self._post("policies/check/batch", {"checks": chunk}, timeout=timeout)
+                    answers.extend(self._parse_batch(data, len(chunk)))
+                self._batch_supported = True
+            except APIError as e:
+                if not self._batch_unavailable(e):
+                    raise
+                answers = None
+
+        if answers is None:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def run(payload: dict[str, Any]) -> PolicyCheckResponse:
+                async with semaphore:
+                    data = await self._post("policies/check", payload, timeout=timeout)
+                return PolicyCheckResponse.model_validate(data)
+
+            def single_flight(key: _CandidateKey, payload: dict[str, Any]) -> asyncio.Future[PolicyCheckResponse]:
+                future = self._inflight.get(key)
+                if future is None:
+                    future = self._inflight[key] = asyncio.ensure_future(run(payload))
+                    future.add_done_callback(lambda _: self._inflight.pop(key, None))
+                return future
+
+            answers = list(await asyncio.gather(*(
+                asyncio.shield(single_flight(key, payload)) for key, payload in zip(keys, payloads, strict=True)
+            )))
+
+        for key, answer in zip(keys, answers, strict=True):
+            for i in unique[key][1]:
+                results[i] = answer
+        return results  # type: ignore[return-value]
+
     async def examples(
         self,
         timeout: float | TimeoutConfig | None = None,
@@ -107,6 +281,7 @@ class AsyncPoliciesResource(AsyncBaseResource):
             {"natural_language": natural_language, "agent_id": agent_id, "confirm": True},
             timeout=timeout,
         )
+        self._remember_limit(agent_id, data)
         return ApplyPolicyFromNLResponse.model_validate(data)
 
     async def get_recommendations(
@@ -118,7 +293,11 @@ class AsyncPoliciesResource(AsyncBaseResource):
         return await self._get(f"policies/{agent_id}/recommendations", timeout=timeout)
 
 
-class PoliciesResource(SyncBaseResource):
+class PoliciesResource(_CheckManyMixin, SyncBaseResource):
+    def __init__(self, client: Sardis) -> None:
+        super().__init__(client)
+        self._init_check_many()
+
     def parse(
         self,
         natural_language: str,
@@ -155,6 +334,7 @@ class PoliciesResource(SyncBaseResource):
             {"natural_language": natural_language, "agent_id": agent_id, "confirm": True},
             timeout=timeout,
         )
+        self._remember_limit(agent_id, data)
         return ApplyPolicyFromNLResponse.model_validate(data)
 
     def get(
@@ -162,7 +342,9 @@ class PoliciesResource(SyncBaseResource):
         agent_id: str,
         timeout: float | TimeoutConfig | None = None,
     ) -> dict[str, Any]:
-        return self._get(f"policies/{agent_id}", timeout=timeout)
+        data = self._get(f"policies/{agent_id}", timeout=timeout)
+        self._remember_limit(agent_id, data)
+        return data
 
     def check(
         self,
@@ -186,6 +368,61 @@ class PoliciesResource(SyncBaseResource):
         data = self._post("policies/check", payload, timeout=timeout)
         return PolicyCheckResponse.model_validate(data)
 
+    def check_many(
+        self,
+        candidates: Sequence[PolicyCheckCandidate | dict[str, Any]],
+        *,
+        concurrency: int = 8,
+        prefilter: bool = True,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> list[PolicyCheckResponse]:
+        """Check many candidate payments at once.
+
+        Uses the batch check endpoint when the server has one, otherwise
+        checks on a thread pool. Identical candidates are checked once.
+        Candidates over the agent's per-transaction limit (cached by
+        :meth:`get` and :meth:`apply`) are rejected locally with
+        ``prefiltered=True``; the pre-filter never approves.
+
+        Args:
+            candidates: Candidate payments (models or dicts)
+            concurrency: Worker threads when fanning out
+            prefilter: Reject over-limit candidates without a request
+            timeout: Optional timeout override per request
+
+        Returns:
+            One response per candidate, in input order
+        """
+        results, unique = self._plan(candidates, prefilter)
+        keys = list(unique)
+        payloads = [unique[k][0] for k in keys]
+
+        answers: list[PolicyCheckResponse] | None = None
+        if self._batch_supported is not False and payloads:
+            try:
+                answers = []
+                for start in range(0, len(payloads), _BATCH_SIZE):
+                    chunk = payloads[start:start + _BATCH_SIZE]
+                    data = self._post("policies/check/batch", {"checks": chunk}, timeout=timeout)
+                    answers.extend(self._parse_batch(data, len(chunk)))
+                self._batch_supported = True
+            except APIError as e:
+                if not self._batch_unavailable(e):
+                    raise
+                answers = None
+
+        if answers is None:
+            def run(payload: dict[str, Any]) -> PolicyCheckResponse:
+                return PolicyCheckResponse.model_validate(self._post("policies/check", payload, timeout=timeout))
+
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="sardis-policy-check") as executor:
+                answers = list(executor.map(run, payloads))
+
+        for key, answer in zip(keys, answers, strict=True):
+            for i in unique[key][1]:
+                results[i] = answer
+        return results  # type: ignore[return-value]
+
     def examples(
         self,
         timeout: float | TimeoutConfig | None = None,
@@ -207,6 +444,7 @@ class PoliciesResource(SyncBaseResource):
             {"natural_language": natural_language, "agent_id": agent_id, "confirm": True},
             timeout=timeout,
         )
+        self._remember_limit(agent_id, data)
         return ApplyPolicyFromNLResponse.model_validate(data)
 
     def get_recommendations(
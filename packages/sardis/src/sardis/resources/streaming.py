@@ -107,17 +107,21 @@ class AsyncStreamingResource(AsyncBaseResource):
         units: int,
         memo: str | None = None,
         timeout: float | TimeoutConfig | None = None,
+        *,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         """Consume units from an active payment stream.
 
         Deducts the specified number of units from the stream at the
-        configured rate per unit.
+        configured rate per unit. For high-frequency metering, aggregate
+        calls with :class:`~sardis.metering.StreamMeter`.
 
         Args:
             stream_id: The stream ID to consume from
             units: Number of units to consume
             memo: Optional memo for the consumption
             timeout: Optional request timeout
+            idempotency_key: Optional key for deduplication
 
         Returns:
             Consumption result with updated balances
@@ -129,6 +133,9 @@ class AsyncStreamingResource(AsyncBaseResource):
         if memo is not None:
             payload["memo"] = memo
 
+        if idempotency_key is not None:
+            payload["idempotency_key"] = idempotency_key
+
         return await self._post(
             f"payments/stream/{stream_id}/consume", payload, timeout=timeout
         )
@@ -245,17 +252,21 @@ class StreamingResource(SyncBaseResource):
         units: int,
         memo: str | None = None,
         timeout: float | TimeoutConfig | None = None,
+        *,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         """Consume units from an active payment stream.
 
         Deducts the specified number of units from the stream at the
-        configured rate per unit.
+        configured rate per unit. For high-frequency metering, aggregate
+        calls with :class:`~sardis.metering.StreamMeter`.
 
         Args:
             stream_id: The stream ID to consume from
             units: Number of units to consume
             memo: Optional memo for the consumption
             timeout: Optional request timeout
+            idempotency_key: Optional key for deduplication
 
         Returns:
             Consumption result with updated balances
@@ -267,6 +278,9 @@ class StreamingResource(SyncBaseResource):
         if memo is not None:
             payload["memo"] = memo
 
+        if idempotency_key is not None:
+            payload["idempotency_key"] = idempotency_key
+
         return self._post(
             f"payments/stream/{stream_id}/consume", payload, timeout=timeout
         )
@@ -200,9 +200,14 @@ class AsyncSubscriptionsV2Resource(AsyncBaseResource):
         timestamp: str | None = None,
         metadata: dict[str, Any] | None = None,
         timeout: float | TimeoutConfig | None = None,
+        *,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         """Report metered usage for a usage-based subscription.
 
+        For high-volume metering, aggregate reports with
+        :class:`~sardis.reporter.UsageReporter`.
+
         Args:
             subscription_id: The subscription ID
             meter_id: Identifier for the usage meter (e.g., "api_calls")
@@ -210,6 +215,7 @@ class AsyncSubscriptionsV2Resource(AsyncBaseResource):
             timestamp: Optional ISO 8601 timestamp for the usage event
             metadata: Optional metadata for this usage event
             timeout: Optional request timeout
+            idempotency_key: Optional key for deduplication
 
         Returns:
             Usage record confirmation
@@ -223,6 +229,8 @@ class AsyncSubscriptionsV2Resource(AsyncBaseResource):
             payload["timestamp"] = timestamp
         if metadata is not None:
             payload["metadata"] = metadata
+        if idempotency_key is not None:
+            payload["idempotency_key"] = idempotency_key
 
         return await self._post(
             f"mandate-subscriptions/{subscription_id}/usage", payload, timeout=timeout
@@ -409,9 +417,14 @@ class SubscriptionsV2Resource(SyncBaseResource):
         timestamp: str | None = None,
         metadata: dict[str, Any] | None = None,
         timeout: float | TimeoutConfig | None = None,
+        *,
+        idempotency_key: str | None = None,
     ) -> dict[str, Any]:
         """Report metered usage for a usage-based subscription.
 
+        For high-volume metering, aggregate reports with
+        :class:`~sardis.reporter.UsageReporter`.
+
         Args:
             subscription_id: The subscription ID
             meter_id: Identifier for the usage meter (e.g., "api_calls")
@@ -419,6 +432,7 @@ class SubscriptionsV2Resource(SyncBaseResource):
             timestamp: Optional ISO 8601 timestamp for the usage event
             metadata: Optional metadata for this usage event
             timeout: Optional request timeout
+            idempotency_key: Optional key for deduplication
 
         Returns:
             Usage record confirmation
@@ -432,6 +446,8 @@ class SubscriptionsV2Resource(SyncBaseResource):
             payload["timestamp"] = timestamp
         if metadata is not None:
             payload["metadata"] = metadata
+        if idempotency_key is not None:
+            payload["idempotency_key"] = idempotency_key
 
         return self._post(
             f"mandate-subscriptions/{subscription_id}/usage", payload, timeout=timeout
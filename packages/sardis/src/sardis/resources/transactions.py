@@ -87,19 +87,30 @@ class AsyncTransactionsResource(AsyncBaseResource):
         amount: Decimal,
         token: str = "USDC",
         timeout: float | TimeoutConfig | None = None,
+        *,
+        cached: bool = True,
     ) -> GasEstimate:
         """Estimate gas for a transaction.
 
+        Served per chain and token from the client's gas cache when one is
+        enabled.
+
         Args:
             chain: Target chain (e.g., "base_sepolia")
             to_address: Recipient address
             amount: Amount to send
             token: Token type (default: USDC)
             timeout: Optional request timeout
+            cached: Allow a cached estimate (set False to force a fetch)
 
         Returns:
             Gas estimation
         """
+        cache = self._client.gas_cache
+        if cache is not None and cached:
+            hit = cache.get(chain, token)
+            if hit is not None:
+                return hit
         response = await self._post(
             "/api/v2/transactions/estimate-gas",
             {
@@ -110,7 +121,10 @@ class AsyncTransactionsResource(AsyncBaseResource):
             },
             timeout=timeout,
         )
-        return GasEstimate.model_validate(response)
+        estimate = GasEstimate.model_validate(response)
+        if cache is not None:
+            cache.put(chain, token, estimate)
+        return estimate
 
     async def get_status(
         self,
@@ -193,19 +207,30 @@ class TransactionsResource(SyncBaseResource):
         amount: Decimal,
         token: str = "USDC",
         timeout: float | TimeoutConfig | None = None,
+        *,
+        cached: bool = True,
     ) -> GasEstimate:
         """Estimate gas for a transaction.
 
+        Served per chain and token from the client's gas cache when one is
+        enabled.
+
         Args:
             chain: Target chain (e.g., "base_sepolia")
             to_address: Recipient address
             amount: Amount to send
             token: Token type (default: USDC)
             timeout: Optional request timeout
+            cached: Allow a cached estimate (set False to force a fetch)
 
         Returns:
             Gas estimation
         """
+        cache = self._client.gas_cache
+        if cache is not None and cached:
+            hit = cache.get(chain, token)
+            if hit is not None:
+                return hit
         response = self._post(
             "/api/v2/transactions/estimate-gas",
             {
@@ -216,7 +241,10 @@ class TransactionsResource(SyncBaseResource):
             },
             timeout=timeout,
         )
-        return GasEstimate.model_validate(response)
+        estimate = GasEstimate.model_validate(response)
+        if cache is not None:
+            cache.put(chain, token, estimate)
+        return estimate
 
     def get_status(
         self,
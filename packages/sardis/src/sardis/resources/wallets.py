@@ -6,17 +6,41 @@ Wallets hold funds and execute payments for agents.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
+from ..balances import _invalidate_after
+from ..bulk import Missing
 from ..models import Wallet, WalletBalance, WalletTransferResponse
+from ..pagination import LazyModelList, parse_model_list
 from .base import AsyncBaseResource, SyncBaseResource
 
 if TYPE_CHECKING:
     import builtins
+    from collections.abc import Iterable
     from decimal import Decimal
 
+    from ..balances import BalanceCache
     from ..client import TimeoutConfig
 
+# Transfer statuses after which no funds left the wallet.
+_FAILED_TRANSFER_STATUSES = {"failed", "rejected", "reverted", "cancelled"}
+
+
+def _update_balance_cache(
+    cache: BalanceCache | None,
+    wallet_id: str,
+    chain: str,
+    token: str,
+    amount: Decimal,
+    result: WalletTransferResponse,
+) -> None:
+    if cache is None:
+        return
+    if result.status.lower() in _FAILED_TRANSFER_STATUSES:
+        cache.invalidate(wallet_id, chain, token)
+    else:
+        cache.debit(wallet_id, chain, token, amount)
+
 
 class AsyncWalletsResource(AsyncBaseResource):
     """Async resource for managing wallets.
@@ -107,18 +131,73 @@ class AsyncWalletsResource(AsyncBaseResource):
         data = await self._get(f"wallets/{wallet_id}", timeout=timeout)
         return Wallet.model_validate(data)
 
+    async def get_many(
+        self,
+        wallet_ids: Iterable[str],
+        *,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> builtins.list[Wallet | Missing]:
+        """Get many wallets by ID.
+
+        Uses the batch endpoint when the server has one, otherwise fetches
+        concurrently. Results are aligned with ``wallet_ids``; IDs that do not
+        exist yield a falsy :class:`~sardis.bulk.Missing` instead of raising,
+        and IDs whose request fails yield one with ``error`` set.
+
+        Args:
+            wallet_ids: IDs to fetch (duplicates are fetched once)
+            concurrency: Requests in flight when the batch endpoint is unavailable
+            timeout: Optional request timeout
+
+        Returns:
+            One Wallet or Missing per requested ID
+        """
+        return await self._get_many(
+            wallet_ids,
+            path="wallets",
+            model=Wallet,
+            id_field="wallet_id",
+            items_key="wallets",
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+
+    @overload
     async def list(
         self,
         agent_id: str | None = None,
         limit: int = 100,
         timeout: float | TimeoutConfig | None = None,
-    ) -> builtins.list[Wallet]:
+        *,
+        lazy: Literal[False] = False,
+    ) -> builtins.list[Wallet]: ...
+
+    @overload
+    async def list(
+        self,
+        agent_id: str | None = None,
+        limit: int = 100,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[Wallet]: ...
+
+    async def list(
+        self,
+        agent_id: str | None = None,
+        limit: int = 100,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
+    ) -> builtins.list[Wallet] | LazyModelList[Wallet]:
         """List wallets.
 
         Args:
             agent_id: Filter by owner agent ID
             limit: Maximum number of wallets to return
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             List of Wallet objects
@@ -130,8 +209,8 @@ class AsyncWalletsResource(AsyncBaseResource):
         data = await self._get("wallets", params=params, timeout=timeout)
 
         if isinstance(data, list):
-            return [Wallet.model_validate(item) for item in data]
-        return [Wallet.model_validate(item) for item in data.get("wallets", data.get("items", []))]
+            return parse_model_list(data, Wallet, lazy=lazy)
+        return parse_model_list(data.get("wallets", data.get("items", [])), Wallet, lazy=lazy)
 
     async def get_balance(
         self,
@@ -139,21 +218,35 @@ class AsyncWalletsResource(AsyncBaseResource):
         chain: str = "base",
         token: str = "USDC",
         timeout: float | TimeoutConfig | None = None,
+        *,
+        cached: bool = True,
     ) -> WalletBalance:
         """Get wallet balance from chain (non-custodial, read-only).
 
+        Served from the client's balance cache when one is enabled.
+
         Args:
             wallet_id: The wallet ID
             chain: Chain identifier (e.g., "base", "polygon")
             token: The token symbol (e.g., USDC, USDT)
             timeout: Optional request timeout
+            cached: Allow a cached balance (set False to force a fetch)
 
         Returns:
             WalletBalance object with balance from chain
         """
+        cache = self._client.balance_cache
+        if cache is not None and cached:
+            hit = cache.get(wallet_id, chain, token)
+            if hit is not None:
+                return hit
+        generation = cache.generation(wallet_id) if cache is not None else None
         params = {"chain": chain, "token": token}
         data = await self._get(f"wallets/{wallet_id}/balance", params=params, timeout=timeout)
-        return WalletBalance.model_validate(data)
+        balance = WalletBalance.model_validate(data)
+        if cache is not None:
+            cache.put(balance, wallet_id, chain, token, generation=generation)
+        return balance
 
     async def get_addresses(
         self,
@@ -250,8 +343,11 @@ class AsyncWalletsResource(AsyncBaseResource):
         }
         if memo is not None:
             payload["memo"] = memo
-        data = await self._post(f"wallets/{wallet_id}/transfer", payload, timeout=timeout)
-        return WalletTransferResponse.model_validate(data)
+        with _invalidate_after(self._client.balance_cache, wallet_id, on_success=False):
+            data = await self._post(f"wallets/{wallet_id}/transfer", payload, timeout=timeout)
+            result = WalletTransferResponse.model_validate(data)
+        _update_balance_cache(self._client.balance_cache, wallet_id, chain, token, amount, result)
+        return result
 
     async def upgrade_smart_account(
         self,
@@ -362,18 +458,73 @@ class WalletsResource(SyncBaseResource):
         data = self._get(f"wallets/{wallet_id}", timeout=timeout)
         return Wallet.model_validate(data)
 
+    def get_many(
+        self,
+        wallet_ids: Iterable[str],
+        *,
+        concurrency: int = 8,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> builtins.list[Wallet | Missing]:
+        """Get many wallets by ID.
+
+        Uses the batch endpoint when the server has one, otherwise fetches
+        concurrently. Results are aligned with ``wallet_ids``; IDs that do not
+        exist yield a falsy :class:`~sardis.bulk.Missing` instead of raising,
+        and IDs whose request fails yield one with ``error`` set.
+
+        Args:
+            wallet_ids: IDs to fetch (duplicates are fetched once)
+            concurrency: Requests in flight when the batch endpoint is unavailable
+            timeout: Optional request timeout
+
+        Returns:
+            One Wallet or Missing per requested ID
+        """
+        return self._get_many(
+            wallet_ids,
+            path="wallets",
+            model=Wallet,
+            id_field="wallet_id",
+            items_key="wallets",
+            concurrency=concurrency,
+            timeout=timeout,
+        )
+
+    @overload
+    def list(
+        self,
+        agent_id: str | None = None,
+        limit: int = 100,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> builtins.list[Wallet]: ...
+
+    @overload
+    def list(
+        self,
+        agent_id: str | None = None,
+        limit: int = 100,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[Wallet]: ...
+
     def list(
         self,
         agent_id: str | None = None,
         limit: int = 100,
         timeout: float | TimeoutConfig | None = None,
-    ) -> builtins.list[Wallet]:
+        *,
+        lazy: bool = False,
+    ) -> builtins.list[Wallet] | LazyModelList[Wallet]:
         """List wallets.
 
         Args:
             agent_id: Filter by owner agent ID
             limit: Maximum number of wallets to return
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             List of Wallet objects
@@ -385,8 +536,8 @@ class WalletsResource(SyncBaseResource):
         data = self._get("wallets", params=params, timeout=timeout)
 
         if isinstance(data, list):
-            return [Wallet.model_validate(item) for item in data]
-        return [Wallet.model_validate(item) for item in data.get("wallets", data.get("items", []))]
+            return parse_model_list(data, Wallet, lazy=lazy)
+        return parse_model_list(data.get("wallets", data.get("items", [])), Wallet, lazy=lazy)
 
     def get_balance(
         self,
@@ -394,21 +545,35 @@ class WalletsResource(SyncBaseResource):
         chain: str = "base",
         token: str = "USDC",
         timeout: float | TimeoutConfig | None = None,
+        *,
+        cached: bool = True,
     ) -> WalletBalance:
         """Get wallet balance from chain (non-custodial, read-only).
 
+        Served from the client's balance cache when one is enabled.
+
         Args:
             wallet_id: The wallet ID
             chain: Chain identifier (e.g., "base", "polygon")
             token: The token symbol (e.g., USDC, USDT)
             timeout: Optional request timeout
+            cached: Allow a cached balance (set False to force a fetch)
 
         Returns:
             WalletBalance object with balance from chain
         """
+        cache = self._client.balance_cache
+        if cache is not None and cached:
+            hit = cache.get(wallet_id, chain, token)
+            if hit is not None:
+                return hit
+        generation = cache.generation(wallet_id) if cache is not None else None
         params = {"chain": chain, "token": token}
         data = self._get(f"wallets/{wallet_id}/balance", params=params, timeout=timeout)
-        return WalletBalance.model_validate(data)
+        balance = WalletBalance.model_validate(data)
+        if cache is not None:
+            cache.put(balance, wallet_id, chain, token, generation=generation)
+        return balance
 
     def get_addresses(
         self,
@@ -505,8 +670,11 @@ class WalletsResource(SyncBaseResource):
         }
         if memo is not None:
             payload["memo"] = memo
-        data = self._post(f"wallets/{wallet_id}/transfer", payload, timeout=timeout)
-        return WalletTransferResponse.model_validate(data)
+        with _invalidate_after(self._client.balance_cache, wallet_id, on_success=False):
+            data = self._post(f"wallets/{wallet_id}/transfer", payload, timeout=timeout)
+            result = WalletTransferResponse.model_validate(data)
+        _update_balance_cache(self._client.balance_cache, wallet_id, chain, token, amount, result)
+        return result
 
     def upgrade_smart_account(
         self,
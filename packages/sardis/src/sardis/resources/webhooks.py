@@ -5,7 +5,9 @@ This module provides both async and sync interfaces for webhook management.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 from ..models.webhook import (
     CreateWebhookRequest,
@@ -13,12 +15,29 @@ from ..models.webhook import (
     Webhook,
     WebhookDelivery,
 )
+from ..pagination import LazyModelList, Page, create_page_from_response, parse_model_list
 from .base import AsyncBaseResource, SyncBaseResource
 
 if TYPE_CHECKING:
     import builtins
+    import os
 
     from ..client import TimeoutConfig
+    from ..pagination import AsyncPaginator, SyncPaginator
+
+
+def _delivery_params(
+    limit: int,
+    offset: int,
+    created_from: datetime | str | None,
+    created_to: datetime | str | None,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {"limit": limit, "offset": offset}
+    if created_from is not None:
+        params["created_from"] = created_from.isoformat() if isinstance(created_from, datetime) else created_from
+    if created_to is not None:
+        params["created_to"] = created_to.isoformat() if isinstance(created_to, datetime) else created_to
+    return params
 
 
 class AsyncWebhooksResource(AsyncBaseResource):
@@ -179,18 +198,41 @@ class AsyncWebhooksResource(AsyncBaseResource):
         response = await self._post(f"/api/v2/webhooks/{webhook_id}/test", {}, timeout=timeout)
         return WebhookDelivery.model_validate(response)
 
+    @overload
+    async def list_deliveries(
+        self,
+        webhook_id: str,
+        limit: int = 50,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> builtins.list[WebhookDelivery]: ...
+
+    @overload
+    async def list_deliveries(
+        self,
+        webhook_id: str,
+        limit: int = 50,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[WebhookDelivery]: ...
+
     async def list_deliveries(
         self,
         webhook_id: str,
         limit: int = 50,
         timeout: float | TimeoutConfig | None = None,
-    ) -> builtins.list[WebhookDelivery]:
+        *,
+        lazy: bool = False,
+    ) -> builtins.list[WebhookDelivery] | LazyModelList[WebhookDelivery]:
         """List delivery attempts for a webhook.
 
         Args:
             webhook_id: The webhook ID
             limit: Maximum number of deliveries to return
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             List of delivery attempts
@@ -200,7 +242,99 @@ class AsyncWebhooksResource(AsyncBaseResource):
             params={"limit": limit},
             timeout=timeout,
         )
-        return [WebhookDelivery.model_validate(d) for d in response.get("deliveries", [])]
+        return parse_model_list(response.get("deliveries", []), WebhookDelivery, lazy=lazy)
+
+    async def list_deliveries_page(
+        self,
+        webhook_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        created_from: datetime | str | None = None,
+        created_to: datetime | str | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
+    ) -> Page[WebhookDelivery]:
+        """List delivery attempts for a webhook with pagination info.
+
+        Args:
+            webhook_id: The webhook ID
+            limit: Maximum number of deliveries per page
+            offset: Pagination offset
+            created_from: Only attempts made at or after this time
+            created_to: Only attempts made before this time
+            timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
+
+        Returns:
+            Page of delivery attempts with pagination metadata
+        """
+        response = await self._get(
+            f"/api/v2/webhooks/{webhook_id}/deliveries",
+            params=_delivery_params(limit, offset, created_from, created_to),
+            timeout=timeout,
+        )
+        return create_page_from_response(
+            data=response,
+            items_key="deliveries",
+            model=WebhookDelivery,
+            lazy=lazy,
+            page_size=limit,
+        )
+
+    def paginate_deliveries(
+        self,
+        webhook_id: str,
+        created_from: datetime | str | None = None,
+        created_to: datetime | str | None = None,
+        page_size: int = 100,
+        max_items: int | None = None,
+        checkpoint_path: str | os.PathLike[str] | None = None,
+        *,
+        lazy: bool = False,
+    ) -> AsyncPaginator[WebhookDelivery]:
+        """Iterate over every delivery attempt for a webhook, page by page.
+
+        Args:
+            webhook_id: The webhook ID
+            created_from: Only attempts made at or after this time
+            created_to: Only attempts made before this time
+            page_size: Deliveries fetched per request
+            max_items: Maximum number of deliveries to yield
+            checkpoint_path: Optional file to persist progress to after every
+                page; an existing checkpoint is resumed automatically
+            lazy: Validate each delivery only when it is accessed
+
+        Returns:
+            AsyncPaginator over delivery attempts
+        """
+        return self._create_paginator(
+            functools.partial(self.list_deliveries_page, webhook_id, lazy=lazy),
+            initial_params=_delivery_params(page_size, 0, created_from, created_to),
+            max_items=max_items,
+            checkpoint_path=checkpoint_path,
+        )
+
+    async def redeliver(
+        self,
+        webhook_id: str,
+        delivery_id: str,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> WebhookDelivery:
+        """Ask Sardis to deliver an event again.
+
+        Args:
+            webhook_id: The webhook ID
+            delivery_id: A previous delivery attempt of the event
+            timeout: Optional request timeout
+
+        Returns:
+            The new delivery attempt
+        """
+        response = await self._post(
+            f"/api/v2/webhooks/{webhook_id}/deliveries/{delivery_id}/redeliver", {}, timeout=timeout
+        )
+        return WebhookDelivery.model_validate(response)
 
     async def rotate_secret(
         self,
@@ -377,18 +511,41 @@ class WebhooksResource(SyncBaseResource):
         response = self._post(f"/api/v2/webhooks/{webhook_id}/test", {}, timeout=timeout)
         return WebhookDelivery.model_validate(response)
 
+    @overload
+    def list_deliveries(
+        self,
+        webhook_id: str,
+        limit: int = 50,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: Literal[False] = False,
+    ) -> builtins.list[WebhookDelivery]: ...
+
+    @overload
     def list_deliveries(
         self,
         webhook_id: str,
         limit: int = 50,
         timeout: float | TimeoutConfig | None = None,
-    ) -> builtins.list[WebhookDelivery]:
+        *,
+        lazy: Literal[True],
+    ) -> LazyModelList[WebhookDelivery]: ...
+
+    def list_deliveries(
+        self,
+        webhook_id: str,
+        limit: int = 50,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
+    ) -> builtins.list[WebhookDelivery] | LazyModelList[WebhookDelivery]:
         """List delivery attempts for a webhook.
 
         Args:
             webhook_id: The webhook ID
             limit: Maximum number of deliveries to return
             timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
 
         Returns:
             List of delivery attempts
@@ -398,7 +555,99 @@ class WebhooksResource(SyncBaseResource):
             params={"limit": limit},
             timeout=timeout,
         )
-        return [WebhookDelivery.model_validate(d) for d in response.get("deliveries", [])]
+        return parse_model_list(response.get("deliveries", []), WebhookDelivery, lazy=lazy)
+
+    def list_deliveries_page(
+        self,
+        webhook_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        created_from: datetime | str | None = None,
+        created_to: datetime | str | None = None,
+        timeout: float | TimeoutConfig | None = None,
+        *,
+        lazy: bool = False,
+    ) -> Page[WebhookDelivery]:
+        """List delivery attempts for a webhook with pagination info.
+
+        Args:
+            webhook_id: The webhook ID
+            limit: Maximum number of deliveries per page
+            offset: Pagination offset
+            created_from: Only attempts made at or after this time
+            created_to: Only attempts made before this time
+            timeout: Optional request timeout
+            lazy: Validate each item only when it is accessed
+
+        Returns:
+            Page of delivery attempts with pagination metadata
+        """
+        response = self._get(
+            f"/api/v2/webhooks/{webhook_id}/deliveries",
+            params=_delivery_params(limit, offset, created_from, created_to),
+            timeout=timeout,
+        )
+        return create_page_from_response(
+            data=response,
+            items_key="deliveries",
+            model=WebhookDelivery,
+            lazy=lazy,
+            page_size=limit,
+        )
+
+    def paginate_deliveries(
+        self,
+        webhook_id: str,
+        created_from: datetime | str | None = None,
+        created_to: datetime | str | None = None,
+        page_size: int = 100,
+        max_items: int | None = None,
+        checkpoint_path: str | os.PathLike[str] | None = None,
+        *,
+        lazy: bool = False,
+    ) -> SyncPaginator[WebhookDelivery]:
+        """Iterate over every delivery attempt for a webhook, page by page.
+
+        Args:
+            webhook_id: The webhook ID
+            created_from: Only attempts made at or after this time
+            created_to: Only attempts made before this time
+            page_size: Deliveries fetched per request
+            max_items: Maximum number of deliveries to yield
+            checkpoint_path: Optional file to persist progress to after every
+                page; an existing checkpoint is resumed automatically
+            lazy: Validate each delivery only when it is accessed
+
+        Returns:
+            SyncPaginator over delivery attempts
+        """
+        return self._create_paginator(
+            functools.partial(self.list_deliveries_page, webhook_id, lazy=lazy),
+            initial_params=_delivery_params(page_size, 0, created_from, created_to),
+            max_items=max_items,
+            checkpoint_path=checkpoint_path,
+        )
+
+    def redeliver(
+        self,
+        webhook_id: str,
+        delivery_id: str,
+        timeout: float | TimeoutConfig | None = None,
+    ) -> WebhookDelivery:
+        """Ask Sardis to deliver an event again.
+
+        Args:
+            webhook_id: The webhook ID
+            delivery_id: A previous delivery attempt of the event
+            timeout: Optional request timeout
+
+        Returns:
+            The new delivery attempt
+        """
+        response = self._post(
+            f"/api/v2/webhooks/{webhook_id}/deliveries/{delivery_id}/redeliver", {}, timeout=timeout
+        )
+        return WebhookDelivery.model_validate(response)
 
     def rotate_secret(
         self,
@@ -0,0 +1,619 @@
+"""
+Waiting for long-running operations with one shared polling scheduler.
+
+On-chain transactions, treasury ACH payments, facility requests and escrow
+disputes all settle asynchronously. ``client.wait_for`` registers an
+operation with the client's :class:`AsyncPollScheduler` (or
+:class:`PollScheduler` for the sync client), which polls every outstanding
+operation from a single task (thread): operations due at the same time are
+coalesced into one batched status call per kind, each operation backs off
+while its status is unchanged, and the returned future resolves with the
+final status once it reaches a terminal state.
+
+A status call answering 404 is retried for ``not_found_grace`` seconds
+after registration, since freshly submitted operations may not be visible
+yet; after that the future fails with :class:`NotFoundError`, so a
+mistyped ID does not poll forever.
+
+Tracking many operations therefore costs one heap entry each, not one
+sleeping coroutine each.
+
+Example:
+    ```python
+    async with AsyncSardis(api_key="...") as client:
+        futures = [
+            client.wait_for("transaction", tx_hash, chain="base", max_wait=600)
+            for tx_hash in tx_hashes
+        ]
+        statuses = await asyncio.gather(*futures)
+
+        # Callbacks instead of awaiting
+        client.wait_for("treasury_payment", token, callback=lambda f: print(f.result().status))
+
+        # Operations without a built-in kind
+        bridge = OperationKind("bridge_transfer", "bridge/transfers/{id}", frozenset({"completed", "failed"}))
+        await client.wait_for(bridge, transfer_id)
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .models.errors import APIError, NotFoundError, SardisError
+from .models.treasury import TreasuryPaymentResponse
+from .resources.base import NO_BATCH_STATUS
+from .resources.transactions import TransactionStatus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from pydantic import BaseModel
+
+    from .client import AsyncSardis, Sardis
+
+logger = logging.getLogger("sardis_sdk.waiters")
+
+STATUS_BATCH_SIZE = 100
+
+
+class WaitTimeoutError(SardisError):
+    """An operation did not reach a terminal state within ``max_wait``."""
+
+    default_message = "Operation did not complete in time"
+
+
+@dataclass(frozen=True)
+class OperationKind:
+    """How to poll one kind of long-running operation.
+
+    Attributes:
+        name: Kind name passed to ``wait_for``
+        path: Status path; ``{id}`` is replaced with the operation ID
+        terminal: Status values (lower case) that end the wait
+        batch_path: Endpoint taking ``POST {"operations": [{"id": ..., **params}]}``,
+            probed once and skipped if the server does not have it
+        id_field: Field identifying an operation in a batch response
+        status_field: Field holding the status
+        model: Model the final payload is validated with (raw dict if None)
+    """
+
+    name: str
+    path: str
+    terminal: frozenset[str]
+    batch_path: str | None = None
+    id_field: str = "id"
+    status_field: str = "status"
+    model: type[BaseModel] | None = None
+
+
+OPERATION_KINDS: dict[str, OperationKind] = {
+    kind.name: kind
+    for kind in (
+        OperationKind(
+            "transaction",
+            "transactions/status/{id}",
+            frozenset({"confirmed", "failed"}),
+            batch_path="transactions/status/batch",
+            id_field="tx_hash",
+            model=TransactionStatus,
+        ),
+        OperationKind(
+            "treasury_payment",
+            "treasury/payments/{id}",
+            frozenset({"settled", "declined", "returned", "reversed", "failed", "canceled"}),
+            batch_path="treasury/payments/status/batch",
+            id_field="payment_token",
+            model=TreasuryPaymentResponse,
+        ),
+        OperationKind(
+            "facility_request",
+            "facility-requests/{id}/audit",
+            frozenset({"executed", "denied", "rejected", "revoked", "failed", "expired"}),
+            id_field="request_id",
+        ),
+        OperationKind(
+            "escrow_dispute",
+            "escrow/disputes/{id}",
+            frozenset({"resolved", "closed", "withdrawn", "expired"}),
+            id_field="dispute_id",
+        ),
+    )
+}
+
+
+def _transient(error: Exception) -> bool:
+    """Whether polling should simply be retried after ``error``."""
+    if isinstance(error, APIError) and (error.status_code in (408, 425, 429) or error.status_code >= 500):
+        return True
+    return isinstance(error, SardisError) and error.retryable
+
+
+@dataclass(eq=False)
+class _Operation:
+    kind: OperationKind
+    operation_id: str
+    params: dict[str, Any]
+    interval: float
+    registered: float
+    # (future, absolute deadline or None) per caller waiting on this operation.
+    waiters: list[tuple[Any, float | None]] = field(default_factory=list)
+    status: str | None = None
+    # When the next poll is due; None while a poll is in flight.
+    due: float | None = None
+
+    @property
+    def key(self) -> tuple[str, str, tuple[tuple[str, Any], ...]]:
+        return self.kind.name, self.operation_id, tuple(sorted(self.params.items()))
+
+
+class _SchedulerBase:
+    def __init__(
+        self,
+        initial_interval: float,
+        max_interval: float,
+        backoff: float,
+        concurrency: int,
+        not_found_grace: float,
+        clock: Callable[[], float],
+    ) -> None:
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.concurrency = concurrency
+        self.not_found_grace = not_found_grace
+        self._clock = clock
+        self._ops: dict[Any, _Operation] = {}
+        self._heap: list[tuple[float, int, _Operation]] = []
+        self._seq = itertools.count()
+        self._batch_supported: dict[str, bool] = {}
+        # Start of the current polling round; next polls are scheduled from it
+        # so operations polled together stay due together.
+        self._round_start = clock()
+
+    def __len__(self) -> int:
+        """Number of operations being polled."""
+        return len(self._ops)
+
+    @staticmethod
+    def _resolve_kind(kind: str | OperationKind) -> OperationKind:
+        if isinstance(kind, OperationKind):
+            return kind
+        try:
+            return OPERATION_KINDS[kind]
+        except KeyError:
+            raise ValueError(f"Unknown operation kind {kind!r}; known: {sorted(OPERATION_KINDS)}") from None
+
+    def _register(
+        self,
+        future: Any,
+        kind: str | OperationKind,
+        operation_id: str,
+        params: dict[str, Any],
+        max_wait: float | None,
+    ) -> None:
+        now = self._clock()
+        op = _Operation(self._resolve_kind(kind), operation_id, params, self.initial_interval, now)
+        op = self._ops.setdefault(op.key, op)
+        deadline = now + max_wait if max_wait is not None else None
+        op.waiters.append((future, deadline))
+        if not op.waiters[1:]:
+            self._schedule(op, now)
+        elif deadline is not None and op.due is not None and deadline < op.due:
+            self._schedule(op, deadline)
+
+    def _schedule(self, op: _Operation, when: float) -> None:
+        op.due = when
+        heapq.heappush(self._heap, (when, next(self._seq), op))
+
+    def _schedule_next(self, op: _Operation) -> None:
+        deadlines = [d for _, d in op.waiters if d is not None]
+        self._schedule(op, min([self._round_start + op.interval, *deadlines]))
+
+    def _take_due(self) -> list[_Operation]:
+        """Pop every operation due now that still has live waiters."""
+        now = self._round_start = self._clock()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            when, _, op = heapq.heappop(self._heap)
+            if op.due != when:
+                continue  # superseded by an earlier entry
+            op.due = None
+            if self._prune(op, now):
+                due.append(op)
+        return due
+
+    def _prune(self, op: _Operation, now: float) -> bool:
+        """Drop cancelled and timed-out waiters; False if none is left."""
+        live = []
+        for future, deadline in op.waiters:
+            if future.done():
+                continue
+            if deadline is not None and deadline <= now:
+                future.set_exception(WaitTimeoutError(
+                    f"{op.kind.name} {op.operation_id} still {op.status or 'unknown'}",
+                    details={"kind": op.kind.name, "id": op.operation_id, "status": op.status},
+                ))
+                continue
+            live.append((future, deadline))
+        op.waiters = live
+        if not live:
+            self._ops.pop(op.key, None)
+        return bool(live)
+
+    def _next_delay(self) -> float | None:
+        if not self._heap:
+            return None
+        return max(self._heap[0][0] - self._clock(), 0.0)
+
+    # ------------------------------------------------------------------
+    # Applying poll results
+    # ------------------------------------------------------------------
+
+    def _settle(self, op: _Operation, payload: dict[str, Any]) -> None:
+        status = str(payload.get(op.kind.status_field) or "").lower()
+        if status in op.kind.terminal:
+            try:
+                result = op.kind.model.model_validate(payload) if op.kind.model else payload
+            except Exception as e:
+                self._fail(op, e)
+                return
+            self._ops.pop(op.key, None)
+            for future, _ in op.waiters:
+                if not future.done():
+                    future.set_result(result)
+            return
+        if status != op.status:
+            op.status, op.interval = status, self.initial_interval
+        else:
+            op.interval = min(op.interval * self.backoff, self.max_interval)
+        self._schedule_next(op)
+
+    def _retry_later(self, op: _Operation) -> None:
+        op.interval = min(op.interval * self.backoff, self.max_interval)
+        self._schedule_next(op)
+
+    def _fail(self, op: _Operation, error: Exception) -> None:
+        self._ops.pop(op.key, None)
+        for future, _ in op.waiters:
+            if not future.done():
+                future.set_exception(error)
+
+    def _not_found(self, op: _Operation, error: Exception) -> None:
+        """Retry a 404 while the operation may not be visible yet, then fail."""
+        if self._clock() - op.registered < self.not_found_grace:
+            self._retry_later(op)
+        else:
+            self._fail(op, error)
+
+    def _error(self, ops: Iterable[_Operation], error: Exception) -> None:
+        for op in ops:
+            if isinstance(error, NotFoundError):
+                self._not_found(op, error)
+            elif _transient(error):
+                self._retry_later(op)
+            else:
+                self._fail(op, error)
+
+    def _apply_batch(self, kind: OperationKind, ops: list[_Operation], data: Any) -> None:
+        items = data if isinstance(data, list) else data.get("operations", data.get("items", []))
+        by_id = {str(item.get(kind.id_field, item.get("id"))): item for item in items}
+        for op in ops:
+            payload = by_id.get(op.operation_id)
+            if payload is None:
+                self._not_found(op, NotFoundError(op.kind.name, op.operation_id))
+            else:
+                self._settle(op, payload)
+
+    def _batch_plan(self, ops: list[_Operation]) -> list[tuple[OperationKind, list[_Operation]]]:
+        """Group due operations by kind into batch-sized chunks."""
+        groups: dict[str, list[_Operation]] = {}
+        for op in ops:
+            groups.setdefault(op.kind.name, []).append(op)
+        chunks = []
+        for group in groups.values():
+            kind = group[0].kind
+            size = STATUS_BATCH_SIZE if self._use_batch(kind) else 1
+            chunks.extend((kind, group[i:i + size]) for i in range(0, len(group), size))
+        return chunks
+
+    def _use_batch(self, kind: OperationKind) -> bool:
+        return kind.batch_path is not None and self._batch_supported.get(kind.name) is not False
+
+    def _batch_unavailable(self, kind: OperationKind, error: Exception) -> bool:
+        """Whether ``error`` means the kind's batch endpoint does not exist (remembered)."""
+        if (
+            isinstance(error, APIError)
+            and error.status_code in NO_BATCH_STATUS
+            and self._batch_supported.get(kind.name) is None
+        ):
+            self._batch_supported[kind.name] = False
+            return True
+        return False
+
+    @staticmethod
+    def _batch_body(ops: list[_Operation]) -> dict[str, Any]:
+        return {"operations": [{"id": op.operation_id, **op.params} for op in ops]}
+
+    @staticmethod
+    def _path(op: _Operation) -> str:
+        return op.kind.path.format(id=op.operation_id)
+
+
+class AsyncPollScheduler(_SchedulerBase):
+    """Polls every outstanding operation of an async client from one task.
+
+    Most code uses :meth:`AsyncSardis.wait_for`, which owns one scheduler
+    per client.
+
+    Args:
+        client: Client used for status calls
+        initial_interval: Seconds between polls right after registration or
+            a status change
+        max_interval: Longest interval an unchanged operation backs off to
+        backoff: Interval multiplier per unchanged poll
+        concurrency: Status requests in flight when polling one by one
+        not_found_grace: Seconds after registration during which a 404 is
+            retried instead of failing the wait
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        client: AsyncSardis,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        concurrency: int = 8,
+        not_found_grace: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(initial_interval, max_interval, backoff, concurrency, not_found_grace, clock)
+        self._client = client
+        self._task: asyncio.Task[None] | None = None
+        self._wakeup = asyncio.Event()
+
+    def wait_for(
+        self,
+        kind: str | OperationKind,
+        operation_id: str,
+        *,
+        max_wait: float | None = None,
+        callback: Callable[[asyncio.Future[Any]], None] | None = None,
+        **params: Any,
+    ) -> asyncio.Future[Any]:
+        """Track an operation until it reaches a terminal state.
+
+        Must be called from a running event loop.
+
+        Args:
+            kind: A key of :data:`OPERATION_KINDS` or a custom :class:`OperationKind`
+            operation_id: Transaction hash, payment token, request or dispute ID
+            max_wait: Seconds before the future fails with :class:`WaitTimeoutError`
+            callback: Called with the future once it is done
+            **params: Query parameters of the status call, e.g. ``chain="base"``
+
+        Returns:
+            Future resolving to the final status (a model for built-in kinds
+            that have one, otherwise the raw payload). Cancelling it stops
+            tracking for this caller only.
+        """
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        self._register(future, kind, operation_id, params, max_wait)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+        return future
+
+    async def _run(self) -> None:
+        while self._ops:
+            due = self._take_due()
+            if due:
+                await self._poll(due)
+                continue
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._next_delay())
+            except TimeoutError:
+                pass
+
+    async def _poll(self, ops: list[_Operation]) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(kind: OperationKind, chunk: list[_Operation]) -> None:
+            async with semaphore:
+                try:
+                    await self._poll_chunk(kind, chunk)
+                except Exception as e:
+                    self._error(chunk, e)
+
+        await asyncio.gather(*(run(kind, chunk) for kind, chunk in self._batch_plan(ops)))
+
+    async def _poll_chunk(self, kind: OperationKind, ops: list[_Operation]) -> None:
+        if self._use_batch(kind):
+            try:
+                data = await self._client._request("POST", kind.batch_path, json=self._batch_body(ops))
+            except APIError as e:
+                if not self._batch_unavailable(kind, e):
+                    raise
+            else:
+                self._batch_supported[kind.name] = True
+                self._apply_batch(kind, ops, data)
+                return
+
+        async def one(op: _Operation) -> None:
+            try:
+                payload = await self._client._request("GET", self._path(op), params=op.params or None)
+            except Exception as e:
+                self._error([op], e)
+            else:
+                self._settle(op, payload)
+
+        await asyncio.gather(*(one(op) for op in ops))
+
+    async def close(self) -> None:
+        """Stop polling and cancel every pending future."""
+        for op in list(self._ops.values()):
+            for future, _ in op.waiters:
+                future.cancel()
+        self._ops.clear()
+        self._heap.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+class PollScheduler(_SchedulerBase):
+    """Polls every outstanding operation of a sync client from one thread.
+
+    Most code uses :meth:`Sardis.wait_for`, which owns one scheduler per
+    client. Futures are :class:`concurrent.futures.Future`; callbacks run on
+    the scheduler's threads.
+
+    Args:
+        client: Client used for status calls
+        initial_interval: Seconds between polls right after registration or
+            a status change
+        max_interval: Longest interval an unchanged operation backs off to
+        backoff: Interval multiplier per unchanged poll
+        concurrency: Worker threads issuing status requests
+        not_found_grace: Seconds after registration during which a 404 is
+            retried instead of failing the wait
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        client: Sardis,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        concurrency: int = 8,
+        not_found_grace: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(initial_interval, max_interval, backoff, concurrency, not_found_grace, clock)
+        self._client = client
+        # Reentrant so a callback may register another wait.
+        self._cond = threading.Condition(threading.RLock())
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    def wait_for(
+        self,
+        kind: str | OperationKind,
+        operation_id: str,
+        *,
+        max_wait: float | None = None,
+        callback: Callable[[Future[Any]], None] | None = None,
+        **params: Any,
+    ) -> Future[Any]:
+        """Track an operation until it reaches a terminal state.
+
+        Args:
+            kind: A key of :data:`OPERATION_KINDS` or a custom :class:`OperationKind`
+            operation_id: Transaction hash, payment token, request or dispute ID
+            max_wait: Seconds before the future fails with :class:`WaitTimeoutError`
+            callback: Called with the future once it is done
+            **params: Query parameters of the status call, e.g. ``chain="base"``
+
+        Returns:
+            Future resolving to the final status; call ``.result()`` to block
+        """
+        future: Future[Any] = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        with self._cond:
+            self._register(future, kind, operation_id, params, max_wait)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="sardis-poller", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return future
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                due = self._take_due()
+                while not due:
+                    if not self._ops:
+                        self._thread = None
+                        return
+                    self._cond.wait(self._next_delay())
+                    due = self._take_due()
+            try:
+                self._poll(due)
+            except Exception:
+                logger.debug("Polling failed", exc_info=True)
+                with self._cond:
+                    for op in due:
+                        if op.key in self._ops and op.due is None:
+                            self._retry_later(op)
+
+    def _poll(self, ops: list[_Operation]) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="sardis-poll")
+        futures = [self._executor.submit(self._poll_chunk, kind, chunk) for kind, chunk in self._batch_plan(ops)]
+        for future in futures:
+            future.result()
+
+    def _poll_chunk(self, kind: OperationKind, ops: list[_Operation]) -> None:
+        if self._use_batch(kind):
+            try:
+                data = self._client._request("POST", kind.batch_path, json=self._batch_body(ops))
+            except Exception as e:
+                with self._cond:
+                    if not self._batch_unavailable(kind, e):
+                        self._error(ops, e)
+                        return
+            else:
+                with self._cond:
+                    self._batch_supported[kind.name] = True
+                    self._apply_batch(kind, ops, data)
+                return
+
+        for op in ops:
+            try:
+                payload = self._client._request("GET", self._path(op), params=op.params or None)
+            except Exception as e:
+                with self._cond:
+                    self._error([op], e)
+            else:
+                with self._cond:
+                    self._settle(op, payload)
+
+    def close(self) -> None:
+        """Stop polling and cancel every pending future."""
+        with self._cond:
+            for op in list(self._ops.values()):
+                for future, _ in op.waiters:
+                    future.cancel()
+            self._ops.clear()
+            self._heap.clear()
+            self._cond.notify()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+__all__ = [
+    "OPERATION_KINDS",
+    "STATUS_BATCH_SIZE",
+    "AsyncPollScheduler",
+    "OperationKind",
+    "PollScheduler",
+    "WaitTimeoutError",
+]
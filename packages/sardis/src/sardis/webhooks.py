@@ -0,0 +1,572 @@
+"""
+Receiving Sardis webhooks: signature verification, dedupe and async dispatch.
+
+``client.webhooks`` manages subscriptions; this module is the other end. A
+:class:`WebhookReceiver` verifies each delivery's ``X-Sardis-Signature``
+against the current (and, during a rotation, the previous) signing secret
+in constant time. It rejects deliveries outside the replay window and drops
+event IDs that are already queued or were handled, using a bounded LRU. The
+event is then put on a bounded queue and acknowledged immediately. A pool of worker tasks
+runs the handlers registered for the event type, so a slow handler never
+delays the response Sardis is waiting for.
+
+The receiver is an ASGI application (mount it in Starlette/FastAPI or serve
+it with uvicorn directly). :meth:`WebhookReceiver.handle` is the same logic
+as a plain coroutine for other async frameworks, and :func:`construct_event`
+verifies and parses a single delivery for synchronous code.
+
+Signature header formats:
+
+- ``t=<unix seconds>,v1=<hex>``: HMAC-SHA256 of ``"<t>." + body``. The
+  timestamp is checked against ``tolerance``.
+- ``sha256=<hex>`` or bare hex: HMAC-SHA256 of the body. These carry no
+  timestamp, so replays are caught by event-ID dedupe only.
+
+Example:
+    ```python
+    receiver = WebhookReceiver(secret=os.environ["SARDIS_WEBHOOK_SECRET"], workers=16)
+
+    @receiver.on(WebhookEventType.PAYMENT_COMPLETED)
+    async def paid(event: WebhookEvent) -> None:
+        await fulfil(event.payload["payment_id"])
+
+    receiver.on("*")(balance_cache.apply_event)
+
+    # uvicorn app:receiver   or   app.mount("/webhooks/sardis", receiver)
+    print(receiver.metrics())
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import inspect
+import json
+import logging
+import math
+import time
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from .models.errors import ErrorCode, SardisError
+from .models.webhook import WebhookEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Sequence
+
+    Handler = Callable[[WebhookEvent], Awaitable[None] | None]
+
+logger = logging.getLogger("sardis_sdk.webhooks")
+
+SIGNATURE_HEADER = "x-sardis-signature"
+DEFAULT_TOLERANCE = 300.0
+MAX_BODY_SIZE = 1 << 20
+
+# Recent handler latencies kept for percentiles.
+_LATENCY_SAMPLES = 1024
+
+
+class WebhookSignatureError(SardisError):
+    """A webhook delivery failed signature or replay-window verification."""
+
+    default_code = ErrorCode.AUTHENTICATION_ERROR
+    default_message = "Invalid webhook signature"
+
+
+def _digest(secret: str, message: bytes) -> str:
+    return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def sign_payload(body: bytes, secret: str, timestamp: int | None = None) -> str:
+    """Build an ``X-Sardis-Signature`` value for ``body``.
+
+    Useful for tests and for feeding locally stored events through a
+    receiver.
+    """
+    ts = int(time.time()) if timestamp is None else timestamp
+    return f"t={ts},v1={_digest(secret, f'{ts}.'.encode() + body)}"
+
+
+def verify_signature(
+    body: bytes,
+    header: str | None,
+    secrets: str | Iterable[str],
+    *,
+    tolerance: float | None = DEFAULT_TOLERANCE,
+    now: float | None = None,
+) -> None:
+    """Verify a delivery's signature header.
+
+    Every candidate signature is compared with every secret using
+    :func:`hmac.compare_digest`, and no comparison is skipped once one
+    matches, so timing reveals neither the match nor which secret it was.
+
+    Args:
+        body: Raw request body, exactly as received
+        header: ``X-Sardis-Signature`` value
+        secrets: Signing secret, or several during a rotation
+        tolerance: Maximum age (and clock skew) in seconds of a timestamped
+            signature; None disables the replay-window check
+        now: Current Unix time (defaults to ``time.time()``)
+
+    Raises:
+        WebhookSignatureError: If the header is missing or malformed, the
+            timestamp is outside the window, or no signature matches
+    """
+    if not header:
+        raise WebhookSignatureError("Missing webhook signature header")
+    keys = [secrets] if isinstance(secrets, str) else list(secrets)
+    if not keys:
+        raise WebhookSignatureError("No webhook signing secret configured")
+
+    fields: dict[str, list[str]] = {}
+    for part in header.split(","):
+        name, sep, value = part.strip().partition("=")
+        if sep:
+            fields.setdefault(name.strip(), []).append(value.strip())
+
+    if "t" in fields:
+        try:
+            timestamp = int(fields["t"][0])
+        except ValueError:
+            raise WebhookSignatureError("Malformed webhook signature timestamp") from None
+        if tolerance is not None:
+            age = (time.time() if now is None else now) - timestamp
+            if abs(age) > tolerance:
+                raise WebhookSignatureError(
+                    "Webhook timestamp outside the replay window",
+                    details={"age": age, "tolerance": tolerance},
+                )
+        message = f"{timestamp}.".encode() + body
+        candidates = fields.get("v1", [])
+    else:
+        message = body
+        candidates = fields.get("sha256") or [header.strip()]
+
+    matched = False
+    for secret in keys:
+        expected = _digest(secret, message)
+        for candidate in candidates:
+            matched |= hmac.compare_digest(expected, candidate)
+    if not matched:
+        raise WebhookSignatureError()
+
+
+def _parse_event(body: bytes) -> WebhookEvent:
+    """Parse a delivery body into a :class:`WebhookEvent`.
+
+    Accepts the envelope (``id``, ``event_type``, ``payload``, ``created_at``)
+    as well as ``type``/``data`` aliases and flat bodies, whose remaining
+    fields become the payload. Bodies without an ID get one from their hash.
+    """
+    data = json.loads(body)
+    if not isinstance(data, dict):
+        raise ValueError("webhook body is not a JSON object")
+    data = dict(data)
+    event_id = data.pop("id", None) or data.pop("event_id", None)
+    event_type = data.pop("event_type", None) or data.pop("type", None)
+    if not event_type:
+        raise ValueError("webhook body has no event type")
+    created_at = data.pop("created_at", None) or datetime.now(UTC)
+    payload = data.pop("payload", None)
+    if payload is None:
+        payload = data.pop("data", None)
+    if payload is None:
+        payload = data
+    return WebhookEvent.model_validate({
+        "id": event_id or "evt_" + hashlib.sha256(body).hexdigest()[:32],
+        "event_type": str(event_type),
+        "payload": payload,
+        "created_at": created_at,
+    })
+
+
+def construct_event(
+    body: bytes,
+    header: str | None,
+    secrets: str | Iterable[str],
+    *,
+    tolerance: float | None = DEFAULT_TOLERANCE,
+) -> WebhookEvent:
+    """Verify a delivery and parse it into a :class:`WebhookEvent`.
+
+    The framework-agnostic building block for synchronous receivers (Flask,
+    Django): no queue, no dedupe, just verification and parsing.
+
+    Raises:
+        WebhookSignatureError: If verification fails
+        ValueError: If the body is not a valid event
+    """
+    verify_signature(body, header, secrets, tolerance=tolerance)
+    return _parse_event(body)
+
+
+@dataclass(frozen=True)
+class WebhookResponse:
+    """Response a receiver gives Sardis for one delivery."""
+
+    status: int
+    body: dict[str, Any] = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ReceiverMetrics:
+    """Point-in-time counters of a webhook receiver.
+
+    Attributes:
+        received: Deliveries passed to the receiver
+        accepted: Events queued for handlers
+        duplicates: Deliveries acknowledged without dispatch (event seen before)
+        rejected: Deliveries refused for a bad signature or body
+        dropped: Deliveries refused with 503 because the queue was full
+        handled: Events whose handlers all succeeded
+        failed: Events with at least one failing handler
+        queue_depth: Events waiting for a worker
+        in_flight: Events currently being handled
+        latency_ms: Handler latency percentiles (50, 95, 99) over recent events
+    """
+
+    received: int
+    accepted: int
+    duplicates: int
+    rejected: int
+    dropped: int
+    handled: int
+    failed: int
+    queue_depth: int
+    in_flight: int
+    latency_ms: dict[float, float]
+
+
+class WebhookReceiver:
+    """Verify, dedupe and dispatch Sardis webhook deliveries.
+
+    Handlers take a :class:`~sardis.models.webhook.WebhookEvent` and may be
+    coroutines or plain functions; plain functions run in the default
+    executor so they cannot stall the event loop. Handlers registered for
+    ``"*"`` see every event. A failing handler is logged (and reported to
+    ``on_error``) without affecting the other handlers; since the delivery
+    was already acknowledged, Sardis does not retry it. An event is marked
+    seen only once its handlers succeed, so a redelivery (``webhooks.redeliver``
+    or a backfill) of a failed event runs the handlers again.
+
+    Args:
+        secret: Signing secret (from ``webhooks.create``/``rotate_secret``),
+            or several that are all accepted
+        tolerance: Replay window in seconds; None disables it
+        workers: Number of concurrent handler tasks
+        max_queue: Events waiting for a worker before deliveries get 503
+        dedupe_size: Event IDs remembered for de-duplication
+        max_body_size: Largest accepted request body in bytes (ASGI only)
+        on_error: Called with the event and exception when a handler fails
+        clock: Wall clock used for the replay window and secret expiry
+    """
+
+    def __init__(
+        self,
+        secret: str | Sequence[str],
+        *,
+        tolerance: float | None = DEFAULT_TOLERANCE,
+        workers: int = 8,
+        max_queue: int = 1000,
+        dedupe_size: int = 10_000,
+        max_body_size: int = MAX_BODY_SIZE,
+        on_error: Callable[[WebhookEvent, Exception], None] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.tolerance = tolerance
+        self.workers = workers
+        self.max_queue = max_queue
+        self.dedupe_size = dedupe_size
+        self.max_body_size = max_body_size
+        self._on_error = on_error
+        self._clock = clock
+        # secret -> expiry (Unix time), None for no expiry
+        self._secrets: dict[str, float | None] = dict.fromkeys(
+            [secret] if isinstance(secret, str) else secret
+        )
+        self._handlers: dict[str, list[Handler]] = {}
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        # IDs of events queued or being handled, not yet marked seen.
+        self._queued: set[str] = set()
+        self._queue: asyncio.Queue[WebhookEvent] | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._latency: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+        self._in_flight = 0
+        self._received = 0
+        self._accepted = 0
+        self._duplicates = 0
+        self._rejected = 0
+        self._dropped = 0
+        self._handled = 0
+        self._failed = 0
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+
+    def on(self, *event_types: str | Enum) -> Callable[[Handler], Handler]:
+        """Register a handler for one or more event types (``"*"`` for all).
+
+        Usable as a decorator or called directly with the handler.
+        """
+        def register(handler: Handler) -> Handler:
+            for event_type in event_types or ("*",):
+                name = event_type.value if isinstance(event_type, Enum) else event_type
+                self._handlers.setdefault(name, []).append(handler)
+            return handler
+
+        return register
+
+    @property
+    def secrets(self) -> list[str]:
+        """Secrets currently accepted."""
+        now = self._clock()
+        for secret, expires in list(self._secrets.items()):
+            if expires is not None and expires <= now:
+                del self._secrets[secret]
+        return list(self._secrets)
+
+    def rotate_secret(self, new_secret: str, overlap: float = 86_400.0) -> None:
+        """Start accepting ``new_secret``; the current secrets stay valid for ``overlap`` seconds.
+
+        Call this with the secret returned by ``webhooks.rotate_secret`` so
+        deliveries signed before the rotation still verify.
+        """
+        expires = self._clock() + overlap
+        for secret, current in self._secrets.items():
+            self._secrets[secret] = expires if current is None else min(current, expires)
+        self._secrets[new_secret] = None
+
+    # ------------------------------------------------------------------
+    # Worker pool
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the worker tasks (done automatically on the first delivery)."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.max_queue)
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def close(self) -> None:
+        """Wait for queued events to be handled, then stop the workers."""
+        if self._queue is not None and self._tasks:
+            await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def __aenter__(self) -> WebhookReceiver:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def _work(self) -> None:
+        assert self._queue is not None
+        while True:
+            event = await self._queue.get()
+            self._in_flight += 1
+            try:
+                if await self.dispatch(event):
+                    self.mark_seen(event.event_id)
+            finally:
+                self._queued.discard(event.event_id)
+                self._in_flight -= 1
+                self._queue.task_done()
+
+    async def dispatch(self, event: WebhookEvent) -> bool:
+        """Run the handlers for ``event`` now; False if any of them failed.
+
+        Bypasses verification, dedupe and the queue; replay tools use this to
+        push stored events through the same handlers.
+        """
+        handlers = self._handlers.get(event.event_type, []) + self._handlers.get("*", [])
+        started = time.perf_counter()
+        ok = True
+        for handler in handlers:
+            try:
+                if inspect.iscoroutinefunction(handler):
+                    await handler(event)
+                else:
+                    result = await asyncio.to_thread(handler, event)
+                    if inspect.isawaitable(result):
+                        await result
+            except Exception as e:
+                ok = False
+                logger.warning("webhook handler %r failed for %s", handler, event.event_id, exc_info=True)
+                if self._on_error is not None:
+                    self._on_error(event, e)
+        self._latency.append((time.perf_counter() - started) * 1000)
+        if ok:
+            self._handled += 1
+        else:
+            self._failed += 1
+        return ok
+
+    # ------------------------------------------------------------------
+    # Deliveries
+    # ------------------------------------------------------------------
+
+    def has_seen(self, event_id: str) -> bool:
+        """Whether an event ID was handled (is in the dedupe LRU) or is queued."""
+        return event_id in self._seen or event_id in self._queued
+
+    def mark_seen(self, event_id: str) -> bool:
+        """Record an event ID in the dedupe LRU; False if it was already there."""
+        if event_id in self._seen:
+            self._seen.move_to_end(event_id)
+            return False
+        self._seen[event_id] = None
+        if len(self._seen) > self.dedupe_size:
+            self._seen.popitem(last=False)
+        return True
+
+    async def handle(self, body: bytes, headers: Mapping[str, str]) -> WebhookResponse:
+        """Process one delivery and return the response to send.
+
+        Never waits for handlers: the event is queued and the delivery is
+        acknowledged with 200. Returns 401 for a bad signature, 400 for a
+        malformed body and 503 (with ``Retry-After``) when the queue is full,
+        so Sardis redelivers later. The event ID is marked seen by the worker
+        once the handlers succeed; until then, it only blocks duplicates
+        while the event is queued.
+
+        Args:
+            body: Raw request body
+            headers: Request headers (any case)
+        """
+        self._received += 1
+        header = next((v for k, v in headers.items() if k.lower() == SIGNATURE_HEADER), None)
+        try:
+            verify_signature(body, header, self.secrets, tolerance=self.tolerance, now=self._clock())
+            event = _parse_event(body)
+        except WebhookSignatureError as e:
+            self._rejected += 1
+            return WebhookResponse(401, {"error": e.message})
+        except ValueError as e:
+            self._rejected += 1
+            return WebhookResponse(400, {"error": f"Malformed webhook body: {e}"})
+
+        if self.has_seen(event.event_id):
+            self._duplicates += 1
+            return WebhookResponse(200, {"received": True, "duplicate": True})
+
+        self._queued.add(event.event_id)
+        await self.start()
+        assert self._queue is not None
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._queued.discard(event.event_id)
+            self._dropped += 1
+            return WebhookResponse(503, {"error": "Receiver busy"}, {"retry-after": "1"})
+        self._accepted += 1
+        return WebhookResponse(200, {"received": True})
+
+    # ------------------------------------------------------------------
+    # ASGI
+    # ------------------------------------------------------------------
+
+    async def __call__(
+        self,
+        scope: dict[str, Any],
+        receive: Callable[[], Awaitable[dict[str, Any]]],
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] != "POST":
+            response = WebhookResponse(405, {"error": "Method not allowed"}, {"allow": "POST"})
+        else:
+            chunks: list[bytes] = []
+            size = 0
+            more = True
+            while more:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                if size > self.max_body_size:
+                    response = WebhookResponse(413, {"error": "Request body too large"})
+                    break
+                chunks.append(chunk)
+                more = message.get("more_body", False)
+            else:
+                headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope.get("headers", [])}
+                response = await self.handle(b"".join(chunks), headers)
+
+        payload = json.dumps(response.body).encode()
+        raw_headers = [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())]
+        raw_headers += [(k.encode("latin-1"), v.encode("latin-1")) for k, v in response.headers.items()]
+        await send({"type": "http.response.start", "status": response.status, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": payload})
+
+    async def _lifespan(
+        self,
+        receive: Callable[[], Awaitable[dict[str, Any]]],
+        send: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await self.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def metrics(self) -> ReceiverMetrics:
+        """Current counters, queue depth and handler latency."""
+        values = sorted(self._latency)
+        latency = (
+            {p: values[min(len(values) - 1, max(0, math.ceil(p / 100 * len(values)) - 1))] for p in (50, 95, 99)}
+            if values
+            else {}
+        )
+        return ReceiverMetrics(
+            received=self._received,
+            accepted=self._accepted,
+            duplicates=self._duplicates,
+            rejected=self._rejected,
+            dropped=self._dropped,
+            handled=self._handled,
+            failed=self._failed,
+            queue_depth=self._queue.qsize() if self._queue is not None else 0,
+            in_flight=self._in_flight,
+            latency_ms=latency,
+        )
+
+
+__all__ = [
+    "DEFAULT_TOLERANCE",
+    "SIGNATURE_HEADER",
+    "ReceiverMetrics",
+    "WebhookReceiver",
+    "WebhookResponse",
+    "WebhookSignatureError",
+    "construct_event",
+    "sign_payload",
+    "verify_signature",
+]
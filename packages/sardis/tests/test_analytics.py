@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from sardis.analytics import SpendAnalytics
+
+
+def _entry(i: int, amount: str, wallet: str, currency: str = "USDC") -> dict:
+    return {
+        "tx_id": f"tx_{i}",
+        "from_wallet": wallet,
+        "to_wallet": "merchant_1",
+        "amount": amount,
+        "currency": currency,
+        "chain": "base",
+        "created_at": f"2026-01-{1 + i % 3:02d}T12:00:00Z",
+    }
+
+
+def test_incremental_rollups_match_single_batch() -> None:
+    entries = [_entry(i, f"{i % 7}.25", f"wallet_{i % 2}") for i in range(40)]
+    entries.append(_entry(40, "9.00", "wallet_0", currency="EURC"))
+
+    whole = SpendAnalytics(dimensions=("wallet", "day"))
+    whole.add_ledger_entries(entries)
+    paged = SpendAnalytics(dimensions=("wallet", "day"))
+    for start in range(0, len(entries), 8):
+        paged.add_ledger_entries(entries[start:start + 8])
+
+    assert paged.rollup("wallet") == whole.rollup("wallet")
+    assert paged.percentiles("day") == whole.percentiles("day")
+    eurc = whole.rollup("wallet", currency="EURC")
+    assert [(r.key, r.total) for r in eurc] == [("wallet_0", Decimal("9"))]
+
+
+def test_budget_burn_and_running_spend() -> None:
+    analytics = SpendAnalytics(dimensions=("wallet",))
+    analytics.add_ledger_entries([_entry(i, "10", "wallet_0") for i in range(6)])
+
+    burn = analytics.budget_burn("wallet", {"wallet_0": "40", "wallet_9": "5"})
+    assert [(b.key, b.ratio) for b in burn] == [("wallet_0", 1.5), ("wallet_9", 0.0)]
+    assert burn[0].remaining == Decimal("-20")
+    assert [total for _, total in analytics.running_spend("wallet", "wallet_0")] == [
+        Decimal("20"), Decimal("40"), Decimal("60"),
+    ]
+
+
+def _card_tx(i: int, amount: str, status: str = "settled", **extra: str) -> dict:
+    return {
+        "transaction_id": f"card_tx_{i}",
+        "card_id": "card_1",
+        "amount": amount,
+        "currency": "USDC",
+        "merchant_name": "Cloud",
+        "merchant_category": "5734",
+        "status": status,
+        "created_at": "2026-01-05T00:00:00",
+        **extra,
+    }
+
+
+def test_anomalies_flagged_against_prior_history() -> None:
+    analytics = SpendAnalytics(dimensions=("card", "merchant"), anomaly_dimension="card", anomaly_min_count=10)
+    analytics.add_card_transactions([_card_tx(i, f"{10 + i % 3}") for i in range(30)])
+    analytics.add_card_transactions([_card_tx(30, "5000", status="approved")])
+
+    assert [a.tx_id for a in analytics.anomalies()] == ["card_tx_30"]
+    assert "Cloud" in {r.key for r in analytics.rollup("merchant")}
+
+
+def test_declined_and_reversed_card_transactions_are_not_spend() -> None:
+    from sardis.models.card import CardTransaction
+
+    analytics = SpendAnalytics(dimensions=("card",))
+    ingested = analytics.add_card_transactions([
+        _card_tx(1, "20"),
+        _card_tx(2, "30", status="declined", decline_reason="insufficient_funds"),
+        CardTransaction.model_validate(_card_tx(3, "40", status="Reversed")),
+        _card_tx(4, "50", status="pending", decline_reason="policy_blocked"),
+    ])
+
+    assert ingested == 1 and analytics.skipped == 3
+    assert [(r.key, r.total) for r in analytics.rollup("card")] == [("card_1", Decimal("20"))]
+
+
+def test_bad_row_keeps_columns_aligned_and_stats_current() -> None:
+    analytics = SpendAnalytics(dimensions=("wallet", "day"))
+    rows = [_entry(0, "5", "wallet_0"), _entry(1, "7", "wallet_0"), {**_entry(2, "1", "wallet_0"), "created_at": "?"}]
+    with pytest.raises(ValueError):
+        analytics.add_ledger_entries(rows)
+
+    assert len(analytics) == 2
+    assert [(r.key, r.count, r.total) for r in analytics.rollup("wallet")] == [("wallet_0", 2, Decimal("12"))]
+    analytics.add_ledger_entries([_entry(3, "1", "wallet_0")])
+    assert sum(r.count for r in analytics.rollup("day")) == len(analytics) == 3
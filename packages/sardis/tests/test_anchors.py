@@ -0,0 +1,104 @@
+"""Tests for bulk audit anchor verification."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sardis.anchors import AnchorVerifier, AsyncAnchorVerifier, leaf_hash, merkle_root, node_hash
+from sardis.models.errors import NotFoundError
+
+
+def entries(anchor: str, n: int, start: int = 0) -> list[dict[str, Any]]:
+    return [
+        {
+            "tx_id": f"tx_{i}",
+            "from_wallet": "wallet_1",
+            "to_wallet": "merchant",
+            "amount": f"{i}.50",
+            "currency": "USDC",
+            "chain": "base",
+            "audit_anchor": anchor,
+            "created_at": "2026-03-01T00:00:00Z",
+        }
+        for i in range(start, start + n)
+    ]
+
+
+def proofs_for(leaves: list[bytes]) -> dict[int, list[dict[str, str]]]:
+    """Sibling paths for every leaf, built the same way as merkle_root."""
+    paths: dict[int, list[dict[str, str]]] = {i: [] for i in range(len(leaves))}
+    level = [(leaf, [i]) for i, leaf in enumerate(leaves)]
+    while len(level) > 1:
+        nxt = []
+        for i in range(0, len(level) - 1, 2):
+            (left, lidx), (right, ridx) = level[i], level[i + 1]
+            for j in lidx:
+                paths[j].append({"hash": right.hex(), "position": "right"})
+            for j in ridx:
+                paths[j].append({"hash": left.hex(), "position": "left"})
+            nxt.append((node_hash(left, right), lidx + ridx))
+        if len(level) % 2:
+            nxt.append(level[-1])
+        level = nxt
+    return paths
+
+
+class FakeLedger:
+    def __init__(self, materials: dict[str, dict[str, Any]]) -> None:
+        self.materials = materials
+        self.calls: list[str] = []
+
+    def get_anchor(self, anchor: str) -> dict[str, Any]:
+        self.calls.append(anchor)
+        if anchor not in self.materials:
+            raise NotFoundError("anchor")
+        return self.materials[anchor]
+
+
+class AsyncFakeLedger(FakeLedger):
+    async def get_anchor(self, anchor: str) -> dict[str, Any]:
+        return super().get_anchor(anchor)
+
+
+def build() -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]:
+    batch_a = entries("anchor_a", 7)
+    leaves_a = [leaf_hash(e) for e in batch_a]
+    batch_b = entries("", 5, start=100)
+    leaves_b = [leaf_hash(e) for e in batch_b]
+    root_b = merkle_root(leaves_b).hex()
+    for e in batch_b:
+        e["audit_anchor"] = f"merkle::{root_b}"
+    paths = proofs_for(leaves_b)
+    materials = {
+        "anchor_a": {"root": merkle_root(leaves_a).hex(), "leaves": [h.hex() for h in leaves_a]},
+        f"merkle::{root_b}": {
+            "root": root_b,
+            "proofs": {e["tx_id"]: paths[i] for i, e in enumerate(batch_b)},
+        },
+    }
+    return batch_a + batch_b, materials
+
+
+def test_sync_verifier_fetches_once_per_anchor_and_reports_tampering() -> None:
+    all_entries, materials = build()
+    all_entries[2]["amount"] = "999"  # tampered, leaves mode
+    all_entries[9]["to_wallet"] = "attacker"  # tampered, proofs mode
+    all_entries.append({**entries("anchor_missing", 1, start=500)[0]})
+
+    ledger = FakeLedger(materials)
+    report = AnchorVerifier(ledger, max_workers=0, batch_size=3).verify(all_entries)
+
+    assert sorted(ledger.calls) == sorted([*materials, "anchor_missing"])
+    assert report.checked == 13
+    assert {(m.tx_id, m.reason) for m in report.mismatches} == {
+        ("tx_2", "entry hash is not committed under the anchor"),
+        ("tx_102", "inclusion proof does not reach the anchor root"),
+        ("tx_500", "anchor not found"),
+    }
+
+
+async def test_async_verifier_in_process_pool() -> None:
+    all_entries, materials = build()
+    report = await AsyncAnchorVerifier(AsyncFakeLedger(materials), max_workers=2).verify(all_entries)
+    assert report.ok
+    assert report.anchors == 2
@@ -0,0 +1,63 @@
+"""Tests for the append-only binary archive."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from decimal import Decimal
+
+from sardis.archive import ArchiveReader, ArchiveWriter, convert_json_exports
+
+
+def entry(i: int) -> dict:
+    return {
+        "tx_id": f"tx_{i}",
+        "amount": f"{i}.5",
+        "currency": "USDC",
+        "chain": "base",
+        "from_wallet": f"wallet_{i % 3}",
+        "to_wallet": "merchant",
+        "audit_anchor": "anchor_1",
+        "created_at": f"2026-03-{1 + i % 20:02d}T00:00:00Z",
+    }
+
+
+def test_convert_and_lookup(tmp_path) -> None:
+    (tmp_path / "ledger.json").write_text(json.dumps({"entries": [entry(i) for i in range(50)]}))
+    (tmp_path / "events.json").write_text(json.dumps({
+        "events": [{"event_id": "ev_1", "occurred_at": "2026-03-02T10:00:00Z", "hash": "h1"}],
+    }))
+    archive = tmp_path / "audit.sda"
+    assert convert_json_exports([tmp_path / "ledger.json", tmp_path / "events.json"], archive) == 51
+
+    with ArchiveReader(archive) as reader:
+        assert len(reader) == 51
+        assert reader.get("tx_7")["amount"] == Decimal("7.5")
+        assert reader.get("tx_7")["from_wallet"] == "wallet_1"
+        assert reader.get("ev_1")["hash"] == "h1"
+        assert reader.get("missing") is None
+        day = list(reader.between(datetime(2026, 3, 2, tzinfo=UTC), datetime(2026, 3, 3, tzinfo=UTC)))
+        assert {r.get("tx_id", r.get("event_id")) for r in day} == {"tx_1", "tx_21", "tx_41", "ev_1"}
+        assert sorted(reader.strings) == sorted({"USDC", "base", "wallet_0", "wallet_1", "wallet_2", "merchant"})
+
+
+def test_unflushed_records_are_discarded_and_unindexed_tail_is_found(tmp_path) -> None:
+    archive = tmp_path / "ledger.sda"
+    with ArchiveWriter(archive) as writer:
+        writer.append_ledger_entry(entry(0))
+
+    # Committed but never indexed (the writer died before close).
+    writer = ArchiveWriter(archive)
+    writer.append_ledger_entry(entry(1))
+    writer.flush()
+    writer.append_ledger_entry(entry(2))  # never committed
+
+    with ArchiveReader(archive) as reader:
+        assert len(reader) == 2
+        assert reader.get("tx_1") is not None
+        assert reader.get("tx_2") is None
+
+    with ArchiveWriter(archive) as writer:
+        assert len(writer) == 2
+    with ArchiveReader(archive) as reader:
+        assert reader._indexed == 2
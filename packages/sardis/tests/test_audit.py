@@ -0,0 +1,99 @@
+"""Tests for audit packet hash-chain and signature verification."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+pytest.importorskip("cryptography")
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+from sardis.audit import AsyncAuditVerifier, AuditVerifier, SigningKeyCache, packet_hash
+from sardis.models.errors import NotFoundError
+
+KEY = Ed25519PrivateKey.generate()
+PUBLIC = KEY.public_key().public_bytes(Encoding.Raw, PublicFormat.Raw).hex()
+
+
+def chain(n: int, stream: str = "org_1") -> list[dict[str, Any]]:
+    packets, prev = [], None
+    for i in range(n):
+        packet = {"event_id": f"{stream}_{i}", "stream": stream, "seq": i, "prev_hash": prev, "key_id": "k1"}
+        digest = packet_hash(packet)
+        packet["hash"] = digest.hex()
+        packet["signature"] = KEY.sign(digest).hex()
+        packets.append(packet)
+        prev = packet["hash"]
+    return packets
+
+
+class FakeEvidence:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def get_signing_key(self, key_id: str) -> dict[str, Any]:
+        self.calls.append(key_id)
+        if key_id != "k1":
+            raise NotFoundError("key")
+        return {"key_id": key_id, "public_key": PUBLIC}
+
+
+class AsyncFakeEvidence(FakeEvidence):
+    async def get_signing_key(self, key_id: str) -> dict[str, Any]:
+        return super().get_signing_key(key_id)
+
+
+def test_detects_tampering_broken_links_and_unknown_keys_across_segments(tmp_path) -> None:
+    packets = chain(20)
+    packets[3]["seq"] = 99  # contents changed after hashing
+    packets[10]["prev_hash"] = packets[8]["hash"]  # link crosses a segment boundary
+    packets[10]["hash"] = packet_hash(packets[10]).hex()
+    packets[10]["signature"] = KEY.sign(packet_hash(packets[10])).hex()
+    packets[15]["key_id"] = "rotated"
+
+    evidence = FakeEvidence()
+    cache = SigningKeyCache(path=tmp_path / "keys.json")
+    report = AuditVerifier(evidence, key_cache=cache, max_workers=0, segment_size=5).verify(
+        [{"events": packets[:12]}, {"events": packets[12:]}]
+    )
+
+    assert report.checked == 20
+    assert report.segments == 4
+    assert [(f.index, f.reason) for f in report.failures] == [
+        (3, "hash does not match packet contents"),
+        (10, "prev_hash does not link to the previous packet"),
+        (11, "prev_hash does not link to the previous packet"),
+        (15, "hash does not match packet contents"),
+        (15, "unknown signing key 'rotated'"),
+    ]
+    assert sorted(evidence.calls) == ["k1", "rotated"]
+    cache.save()
+    assert SigningKeyCache(path=tmp_path / "keys.json").get("k1") == bytes.fromhex(PUBLIC)
+
+
+async def test_async_verifier_with_independent_chains_in_process_pool() -> None:
+    async def stream():
+        for a, b in zip(chain(30, "org_a"), chain(30, "org_b"), strict=True):
+            yield a
+            yield b
+
+    verifier = AsyncAuditVerifier(AsyncFakeEvidence(), max_workers=2, segment_size=8, chain_field="stream")
+    report = await verifier.verify(stream())
+    assert report.ok, report.failures
+    assert report.checked == 60
+
+
+def test_signing_key_id_is_url_quoted() -> None:
+    import respx
+
+    from sardis import Sardis
+
+    with respx.mock, Sardis(api_key="sk_test", base_url="https://api.test") as client:
+        route = respx.get("https://api.test/api/v2/evidence/signing-keys/kms%2Fkey%201").respond(
+            200, json={"key_id": "kms/key 1", "public_key": PUBLIC}
+        )
+        assert client.evidence.get_signing_key("kms/key 1")["public_key"] == PUBLIC
+        assert route.call_count == 1
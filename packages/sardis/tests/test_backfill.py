@@ -0,0 +1,203 @@
+"""Tests for webhook delivery backfill."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import httpx
+import respx
+
+from sardis import AsyncSardis, Sardis
+from sardis.backfill import (
+    AsyncWebhookBackfill,
+    BackfillHandlerError,
+    BackfillItem,
+    BackfillPayloadMissingError,
+    WebhookBackfill,
+)
+from sardis.models.webhook import WebhookDelivery, WebhookEvent
+from sardis.webhooks import WebhookReceiver
+
+BASE = "https://api.test"
+SINCE = datetime(2026, 1, 1, tzinfo=UTC)
+UNTIL = datetime(2026, 1, 2, tzinfo=UTC)
+
+
+def webhook(webhook_id: str, events: list[str]) -> dict:
+    return {
+        "id": webhook_id,
+        "organization_id": "org_1",
+        "url": f"https://hooks.test/{webhook_id}",
+        "events": events,
+        "created_at": "2025-12-01T00:00:00Z",
+        "updated_at": "2025-12-01T00:00:00Z",
+    }
+
+
+def delivery(delivery_id: str, webhook_id: str, event_id: str, success: bool, at: str = "2026-01-01T12:00:00Z",
+             event_type: str = "payment.completed", attempt: int = 1) -> dict:
+    return {
+        "id": delivery_id,
+        "subscription_id": webhook_id,
+        "event_id": event_id,
+        "event_type": event_type,
+        "url": f"https://hooks.test/{webhook_id}",
+        "success": success,
+        "attempt_number": attempt,
+        "payload": {"event": event_id},
+        "created_at": at,
+    }
+
+
+def mock_api() -> tuple[respx.Route, respx.Route]:
+    respx.get(f"{BASE}/api/v2/webhooks/wh_a").respond(200, json=webhook("wh_a", ["payment.completed"]))
+    respx.get(f"{BASE}/api/v2/webhooks/wh_b").respond(200, json=webhook("wh_b", ["*"]))
+
+    # wh_a: two pages. evt_1 failed then succeeded, evt_2 failed twice, evt_old is outside the window.
+    page_a = [
+        delivery("d1", "wh_a", "evt_1", False),
+        delivery("d2", "wh_a", "evt_1", True, attempt=2),
+        delivery("d3", "wh_a", "evt_2", False),
+    ]
+    page_a2 = [
+        delivery("d4", "wh_a", "evt_2", False, at="2026-01-01T13:00:00Z", attempt=2),
+        delivery("d5", "wh_a", "evt_old", False, at="2025-12-30T00:00:00Z"),
+    ]
+
+    def deliveries_a(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["created_from"] == SINCE.isoformat()
+        offset = int(request.url.params["offset"])
+        return httpx.Response(200, json={"deliveries": page_a if offset == 0 else page_a2})
+
+    route_a = respx.get(f"{BASE}/api/v2/webhooks/wh_a/deliveries").mock(side_effect=deliveries_a)
+    # wh_b got evt_3 (only wh_b saw it) but never evt_1 or evt_2.
+    route_b = respx.get(f"{BASE}/api/v2/webhooks/wh_b/deliveries").respond(
+        200, json={"deliveries": [delivery("d6", "wh_b", "evt_3", True, event_type="hold.created")]}
+    )
+    return route_a, route_b
+
+
+@respx.mock
+async def test_async_backfill_finds_failed_and_missing_deliveries() -> None:
+    route_a, _ = mock_api()
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        backfill = AsyncWebhookBackfill(client, ["wh_a", "wh_b"], SINCE, UNTIL, page_size=3)
+        items = await backfill.scan()
+
+    assert route_a.call_count == 2
+    found = {(i.webhook_id, i.event_id, i.reason) for i in items}
+    assert found == {
+        ("wh_a", "evt_2", "failed"),
+        ("wh_b", "evt_1", "missing"),
+        ("wh_b", "evt_2", "missing"),
+    }
+    failed = next(i for i in items if i.reason == "failed")
+    assert failed.delivery.delivery_id == "d4"  # latest attempt
+    progress = backfill.progress()
+    assert (progress.webhooks, progress.deliveries, progress.found) == (2, 5, 3)
+
+
+@respx.mock
+async def test_async_replay_is_idempotent_across_webhooks_and_runs(tmp_path) -> None:
+    mock_api()
+    state = tmp_path / "backfill.state"
+    receiver = WebhookReceiver("whsec_test")
+    handled: list[WebhookEvent] = []
+
+    @receiver.on("payment.completed")
+    async def record(event: WebhookEvent) -> None:
+        handled.append(event)
+
+    receiver.mark_seen("evt_1")  # already handled live
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        backfill = AsyncWebhookBackfill(client, ["wh_a", "wh_b"], SINCE, UNTIL, page_size=3, state_path=state)
+        await backfill.scan()
+        result = await backfill.replay(receiver)
+
+        assert [e.event_id for e in handled] == ["evt_2"]
+        assert handled[0].payload == {"event": "evt_2"}
+        assert [i.event_id for i in result.processed] == ["evt_2"]
+        assert sorted(i.event_id for i in result.skipped) == ["evt_1", "evt_2"]
+
+        rerun = AsyncWebhookBackfill(client, ["wh_a", "wh_b"], SINCE, UNTIL, page_size=3, state_path=state)
+        await rerun.scan()
+        again = await rerun.replay(lambda event: handled.append(event))
+
+    assert len(handled) == 1
+    assert not again.processed
+    assert state.read_text().splitlines() == ["replay:evt_1", "replay:evt_2"]
+
+
+async def test_async_replay_fails_without_payload_and_marks_seen_only_on_success() -> None:
+    def item(event_id: str, payload: bool) -> BackfillItem:
+        data = delivery(f"d_{event_id}", "wh_a", event_id, False)
+        if not payload:
+            data["payload"] = None
+        return BackfillItem("wh_a", event_id, "payment.completed", "failed", WebhookDelivery.model_validate(data))
+
+    receiver = WebhookReceiver("whsec_test")
+    calls: list[str] = []
+
+    @receiver.on("payment.completed")
+    async def flaky(event: WebhookEvent) -> None:
+        calls.append(event.event_id)
+        if len(calls) == 1:
+            raise RuntimeError("database unavailable")
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        backfill = AsyncWebhookBackfill(client, ["wh_a"], SINCE, UNTIL)
+        items = [item("evt_1", payload=False), item("evt_2", payload=True)]
+        first = await backfill.replay(receiver, items)
+
+        errors = {i.event_id: e for i, e in first.failed}
+        assert isinstance(errors["evt_1"], BackfillPayloadMissingError) and "redeliver()" in str(errors["evt_1"])
+        assert isinstance(errors["evt_2"], BackfillHandlerError)
+        # Neither event is marked seen, so a live redelivery would still be handled.
+        assert not receiver.has_seen("evt_1") and not receiver.has_seen("evt_2")
+
+        again = await backfill.replay(receiver, items)
+        assert [i.event_id for i in again.processed] == ["evt_2"]
+        assert receiver.has_seen("evt_2") and not receiver.has_seen("evt_1")
+        assert calls == ["evt_2", "evt_2"]
+
+
+@respx.mock
+async def test_async_redeliver_reports_per_item_failures() -> None:
+    mock_api()
+    redeliver_a = respx.post(f"{BASE}/api/v2/webhooks/wh_a/deliveries/d4/redeliver").respond(
+        200, json=delivery("d7", "wh_a", "evt_2", True)
+    )
+    redeliver_b = respx.post(url__regex=rf"{BASE}/api/v2/webhooks/wh_b/deliveries/.+/redeliver").respond(
+        422, json={"detail": "not subscribed"}
+    )
+    progress = []
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        backfill = AsyncWebhookBackfill(
+            client, ["wh_a", "wh_b"], SINCE, UNTIL, page_size=3, concurrency=2, on_progress=progress.append
+        )
+        await backfill.scan()
+        result = await backfill.redeliver()
+
+    assert redeliver_a.call_count == 1
+    assert redeliver_b.call_count == 2
+    assert [(i.webhook_id, i.event_id) for i in result.processed] == [("wh_a", "evt_2")]
+    assert sorted(i.event_id for i, _ in result.failed) == ["evt_1", "evt_2"]
+    assert progress[-1].processed == 1 and progress[-1].failed == 2
+
+
+@respx.mock
+def test_sync_backfill_scan_and_replay() -> None:
+    mock_api()
+    handled: list[str] = []
+
+    with Sardis(api_key="sk_test", base_url=BASE) as client:
+        backfill = WebhookBackfill(client, ["wh_a", "wh_b"], SINCE, UNTIL, page_size=3)
+        items = backfill.scan()
+        result = backfill.replay(lambda event: handled.append(event.event_id))
+
+    assert len(items) == 3
+    assert sorted(handled) == ["evt_1", "evt_2"]
+    assert len(result.processed) == 2 and len(result.skipped) == 1
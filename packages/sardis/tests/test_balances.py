@@ -0,0 +1,116 @@
+"""Tests for the opt-in wallet balance cache."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import httpx
+import pytest
+import respx
+
+from sardis import AsyncSardis, Sardis
+from sardis._client import RetryConfig
+from sardis.balances import BalanceCache
+from sardis.models.errors import APIError
+from sardis.models.wallet import WalletBalance
+
+BASE = "https://api.test"
+BALANCE = {"wallet_id": "wallet_1", "chain": "base", "token": "USDC", "balance": "100", "address": "0xabc"}
+HOLD = {
+    "id": "hold_1", "wallet_id": "wallet_1", "amount": "5", "status": "captured",
+    "expires_at": "2026-01-02T00:00:00Z", "created_at": "2026-01-01T00:00:00Z",
+}
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@respx.mock
+async def test_cached_balance_is_debited_on_transfer_and_dropped_on_hold_capture() -> None:
+    balance_route = respx.get(f"{BASE}/api/v2/wallets/wallet_1/balance").respond(200, json=BALANCE)
+    respx.post(f"{BASE}/api/v2/wallets/wallet_1/transfer").respond(200, json={
+        "tx_hash": "0x1", "status": "submitted", "from_address": "0xabc", "to_address": "0xdef",
+        "amount": "30", "token": "USDC", "chain": "base",
+    })
+    respx.post(f"{BASE}/api/v2/holds/hold_1/capture").respond(200, json=HOLD)
+
+    clock = Clock()
+    async with AsyncSardis(api_key="sk_test", base_url=BASE, balance_cache=BalanceCache(ttl=5, clock=clock)) as client:
+        assert (await client.wallets.get_balance("wallet_1")).balance == Decimal("100")
+        assert (await client.wallets.get_balance("wallet_1", token="usdc")).balance == Decimal("100")
+        assert balance_route.call_count == 1
+
+        await client.wallets.transfer("wallet_1", destination="0xdef", amount=Decimal("30"), chain="base")
+        assert (await client.wallets.get_balance("wallet_1")).balance == Decimal("70")
+        assert balance_route.call_count == 1
+
+        await client.holds.capture("hold_1")
+        await client.wallets.get_balance("wallet_1")
+        assert balance_route.call_count == 2
+
+        clock.now = 10
+        await client.wallets.get_balance("wallet_1")
+        await client.wallets.get_balance("wallet_1", cached=False)
+        assert balance_route.call_count == 4
+
+
+def test_sync_client_without_cache_always_fetches_and_events_refresh() -> None:
+    with respx.mock:
+        route = respx.get(f"{BASE}/api/v2/wallets/wallet_1/balance").respond(200, json=BALANCE)
+        with Sardis(api_key="sk_test", base_url=BASE) as client:
+            assert client.balance_cache is None
+            client.wallets.get_balance("wallet_1")
+            client.wallets.get_balance("wallet_1")
+        assert route.call_count == 2
+
+    cache = BalanceCache()
+    cache.apply_event({"event_type": "wallet.funded", "payload": {**BALANCE, "balance": "250"}})
+    assert cache.get("wallet_1", "base", "USDC").balance == Decimal("250")
+    cache.apply_event({"event_type": "hold.created", "payload": {"wallet_id": "wallet_1"}})
+    assert cache.get("wallet_1", "base", "USDC") is None
+
+
+def test_failed_writes_drop_cached_balances() -> None:
+    cache = BalanceCache()
+    with respx.mock:
+        route = respx.get(f"{BASE}/api/v2/wallets/wallet_1/balance").respond(200, json=BALANCE)
+        respx.post(f"{BASE}/api/v2/wallets/wallet_1/transfer").respond(503, json={"detail": "upstream timeout"})
+        respx.post(f"{BASE}/api/v2/mandates/execute").respond(503, json={"detail": "upstream timeout"})
+        with Sardis(api_key="sk_test", base_url=BASE, balance_cache=cache, retry=RetryConfig(max_retries=0)) as client:
+            client.wallets.get_balance("wallet_1", "base", "USDC", 5.0)
+            with pytest.raises(APIError):
+                client.wallets.transfer("wallet_1", destination="0xdef", amount=Decimal("30"), chain="base")
+            client.wallets.get_balance("wallet_1")
+            assert route.call_count == 2
+
+            with pytest.raises(APIError):
+                client.payments.execute_mandate({"mandate_id": "m_1"})
+            client.wallets.get_balance("wallet_1")
+            assert route.call_count == 3
+
+
+def test_balance_fetched_during_a_write_is_not_cached() -> None:
+    cache = BalanceCache()
+    with respx.mock:
+        def balance(request: httpx.Request) -> httpx.Response:
+            # A transfer debits the wallet while this GET is in flight.
+            cache.debit("wallet_1", "base", "USDC", Decimal("30"))
+            return httpx.Response(200, json=BALANCE)
+
+        route = respx.get(f"{BASE}/api/v2/wallets/wallet_1/balance").mock(side_effect=balance)
+        with Sardis(api_key="sk_test", base_url=BASE, balance_cache=cache) as client:
+            client.wallets.get_balance("wallet_1")
+            assert len(cache) == 0
+            route.mock(return_value=httpx.Response(200, json=BALANCE))
+            client.wallets.get_balance("wallet_1")
+            client.wallets.get_balance("wallet_1")
+        assert route.call_count == 2
+
+    stale = cache.generation("wallet_2")
+    cache.clear()
+    assert not cache.put(WalletBalance.model_validate({**BALANCE, "wallet_id": "wallet_2"}), generation=stale)
@@ -0,0 +1,102 @@
+"""Tests for ``sardis ledger export``."""
+
+from __future__ import annotations
+
+import csv
+import json
+
+import httpx
+import respx
+from click.testing import CliRunner
+
+from sardis.cli.main import cli
+
+BASE = "https://api.test"
+ROWS = [{"tx_id": f"tx_{i}", "amount": f"{i}.00", "currency": "USDC", "status": "confirmed"} for i in range(7)]
+
+
+class Ledger:
+    """Fake /ledger endpoint that caps ``limit`` at 2 and can fail at an offset."""
+
+    def __init__(self, fail_at: int | None = None, drop: bool = False) -> None:
+        self.fail_at = fail_at
+        self.drop = drop
+        self.offsets: list[int] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        self.offsets.append(offset)
+        if offset == self.fail_at and self.drop:
+            raise httpx.ConnectError("connection reset", request=request)
+        if offset == self.fail_at:
+            return httpx.Response(503, json={"detail": "upstream unavailable"})
+        return httpx.Response(200, json={"entries": ROWS[offset : offset + 2]})
+
+
+def export(*args: str):
+    return CliRunner().invoke(
+        cli, ["--api-url", BASE, "--api-key", "sk_test", "ledger", "export", "--page-size", "5", *args]
+    )
+
+
+@respx.mock
+def test_short_pages_do_not_end_the_export(tmp_path) -> None:
+    ledger = Ledger()
+    respx.get(f"{BASE}/api/v2/ledger").mock(side_effect=ledger)
+    out = tmp_path / "ledger.jsonl"
+
+    result = export("--format", "jsonl", "-o", str(out))
+
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line)["tx_id"] for line in out.read_text().splitlines()] == [r["tx_id"] for r in ROWS]
+    assert ledger.offsets == [0, 2, 4, 6, 7]
+
+
+@respx.mock
+def test_failed_export_exits_nonzero_and_resumes_after_truncating(tmp_path) -> None:
+    respx.get(f"{BASE}/api/v2/ledger").mock(side_effect=Ledger(fail_at=4))
+    out = tmp_path / "ledger.csv"
+
+    failed = export("-o", str(out))
+    assert failed.exit_code == 1
+    assert "--resume" in failed.output and "upstream unavailable" in failed.output
+    with open(out, "a") as f:
+        f.write("tx_partial,half-written")  # bytes past the checkpoint
+
+    respx.get(f"{BASE}/api/v2/ledger").mock(side_effect=Ledger())
+    resumed = export("-o", str(out), "--resume")
+
+    assert resumed.exit_code == 0, resumed.output
+    with open(out, newline="") as f:
+        assert [row["tx_id"] for row in csv.DictReader(f)] == [r["tx_id"] for r in ROWS]
+    again = export("-o", str(out), "--resume")
+    assert "already" in again.output and "(7 entries)" in again.output
+
+
+@respx.mock
+def test_json_export_resumes_into_one_valid_array(tmp_path) -> None:
+    respx.get(f"{BASE}/api/v2/ledger").mock(side_effect=Ledger(fail_at=2))
+    out = tmp_path / "ledger.json"
+
+    assert export("--format", "json", "-o", str(out)).exit_code == 1
+    respx.get(f"{BASE}/api/v2/ledger").mock(side_effect=Ledger())
+    mismatch = export("--format", "jsonl", "-o", str(out), "--resume")
+    assert mismatch.exit_code == 1 and "different export" in mismatch.output
+
+    assert export("--format", "json", "-o", str(out), "--resume").exit_code == 0
+    assert json.loads(out.read_text()) == ROWS
+
+
+@respx.mock
+def test_network_drop_reports_partial_file_and_resumes(tmp_path) -> None:
+    respx.get(f"{BASE}/api/v2/ledger").mock(side_effect=Ledger(fail_at=4, drop=True))
+    out = tmp_path / "ledger.jsonl"
+
+    failed = export("--format", "jsonl", "-o", str(out))
+    assert failed.exit_code == 1
+    assert "Network error" in failed.output and "--resume" in failed.output
+    assert "Traceback" not in failed.output
+
+    respx.get(f"{BASE}/api/v2/ledger").mock(side_effect=Ledger())
+    assert export("--format", "jsonl", "-o", str(out), "--resume").exit_code == 0
+    assert [json.loads(line)["tx_id"] for line in out.read_text().splitlines()] == [r["tx_id"] for r in ROWS]
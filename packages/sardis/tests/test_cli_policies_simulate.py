@@ -0,0 +1,108 @@
+"""Tests for ``sardis policies simulate``."""
+
+from __future__ import annotations
+
+import io
+import json
+import threading
+
+import httpx
+import pytest
+import respx
+from click.testing import CliRunner
+
+from sardis.cli.api import SardisAPIClient
+from sardis.cli.commands.policies import _iter_json_array
+from sardis.cli.main import cli
+
+BASE = "https://api.test"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1 << 16])
+@pytest.mark.parametrize(
+    "text",
+    [
+        '[{"amount": 12345}, {"amount": 2.5, "note": "[not an array]"}]',
+        '{"meta": {"tags": ["x"], "title": "a [b]"}, "transactions": [{"amount": 12345}, {"amount": 2.5}]}',
+        ' {"transactions" : [ {"amount": 12345} , {"amount": 2.5} ] , "after": [1]}',
+    ],
+)
+def test_json_array_is_located_at_the_top_level(text: str, chunk_size: int) -> None:
+    items = list(_iter_json_array(io.StringIO(text), chunk_size=chunk_size))
+    assert [item["amount"] for item in items] == [12345, 2.5]
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ('{"meta": {"tags": ["x"]}}', "must contain an array"),
+        ('"[1, 2]"', "must contain an array"),
+        ('[{"amount": 1}, {"amount": 2}', "end of file"),
+    ],
+)
+def test_json_layout_errors(text: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        list(_iter_json_array(io.StringIO(text), chunk_size=4))
+
+
+def simulate(tmp_path, body: str, *args: str):
+    path = tmp_path / "txs.json"
+    path.write_text(body)
+    return CliRunner().invoke(
+        cli,
+        ["--api-url", BASE, "--api-key", "sk_test", "policies", "simulate", "--agent", "agent_1",
+         "--file", str(path), *args],
+    )
+
+
+@respx.mock
+def test_simulate_streams_results_in_input_order(tmp_path) -> None:
+    def check(request: httpx.Request) -> httpx.Response:
+        amount = json.loads(request.content)["amount"]
+        if amount == 13:
+            return httpx.Response(422, json={"detail": "bad token"})
+        return httpx.Response(200, json={"allowed": amount < 50, "reason": "" if amount < 50 else "over_limit"})
+
+    route = respx.post(f"{BASE}/api/v2/policies/check").mock(side_effect=check)
+    out = tmp_path / "results.jsonl"
+    txs = [{"amount": a, "destination": "shop"} for a in (10, 75, 13, 20, 90)]
+
+    result = simulate(tmp_path, json.dumps({"meta": {"tags": ["x"]}, "transactions": txs}),
+                      "--concurrency", "4", "--output", str(out))
+
+    assert result.exit_code == 0, result.output
+    rows = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [(r["index"], r["amount"], r["allowed"], r["error"]) for r in rows] == [
+        (1, 10, True, ""), (2, 75, False, ""), (3, 13, None, "bad token"), (4, 20, True, ""), (5, 90, False, ""),
+    ]
+    assert route.call_count == 5
+    assert "Pass: 2" in result.output and "Fail: 2" in result.output and "over_limit" in result.output
+
+
+@respx.mock
+def test_simulate_rejects_non_object_items(tmp_path) -> None:
+    respx.post(f"{BASE}/api/v2/policies/check").respond(200, json={"allowed": True})
+    result = simulate(tmp_path, '{"transactions": [{"amount": 1}, "x"]}')
+    assert "Transaction 2 is not a JSON object" in result.output
+    assert "Traceback" not in result.output
+
+    missing = simulate(tmp_path, '{"meta": {"tags": ["x"]}}')
+    assert "must contain an array" in missing.output
+
+
+def test_api_client_is_created_once_across_threads() -> None:
+    api = SardisAPIClient(base_url=BASE, api_key="sk_test")
+    barrier = threading.Barrier(16)
+    seen: list[httpx.Client] = []
+
+    def worker() -> None:
+        barrier.wait()
+        seen.append(api.client)
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(client) for client in seen}) == 1
+    api.close()
@@ -20,9 +20,28 @@ import sardis
 CLIENT_SUBMODULES = (
     "sardis._client",
     "sardis._version",
+    "sardis.analytics",
+    "sardis.anchors",
+    "sardis.archive",
+    "sardis.audit",
+    "sardis.backfill",
+    "sardis.balances",
     "sardis.bulk",
+    "sardis.columnar",
+    "sardis.decisions",
+    "sardis.events",
+    "sardis.inbox",
+    "sardis.evaluator",
+    "sardis.exports",
+    "sardis.metering",
+    "sardis.metadata",
     "sardis.pagination",
+    "sardis.rates",
+    "sardis.replica",
+    "sardis.reporter",
     "sardis.telemetry",
+    "sardis.waiters",
+    "sardis.webhooks",
     "sardis.cli",
     "sardis.integrations",
     "sardis.models",
@@ -0,0 +1,82 @@
+"""Tests for columnar ledger export."""
+
+from __future__ import annotations
+
+from decimal import ROUND_HALF_EVEN, Decimal
+
+import pytest
+
+from sardis.columnar import LedgerColumns, to_epoch_micros, to_minor_units
+
+ROWS = [
+    {"tx_id": "tx_1", "amount": "12.5", "currency": "USDC", "chain": "base",
+     "from_wallet": "wallet_a", "to_wallet": "wallet_b", "created_at": "2026-01-01T00:00:00Z"},
+    {"tx_id": "tx_2", "amount": "-0.000001", "currency": "EURC", "chain": "base",
+     "from_wallet": "wallet_b", "created_at": "2026-01-01T00:00:01.5+00:00", "mandate_id": "mnd_1"},
+    {"tx_id": "tx_3", "amount": "1e3", "currency": "USDC", "chain": "polygon",
+     "from_wallet": "wallet_a", "to_wallet": "wallet_c", "created_at": "2026-01-02T00:00:00"},
+]
+
+
+def columns() -> LedgerColumns:
+    cols = LedgerColumns()
+    cols.extend(ROWS)
+    return cols
+
+
+def test_minor_units_conversion() -> None:
+    assert to_minor_units("12.50") == 12_500_000
+    assert to_minor_units("-.5", scale=2) == -50
+    assert to_minor_units(Decimal("1e3")) == 1_000_000_000
+    assert to_minor_units(7, scale=2) == 700
+    with pytest.raises(ValueError, match="does not fit scale"):
+        to_minor_units("0.0000005")
+    assert to_minor_units("0.0000005", rounding=ROUND_HALF_EVEN) == 0
+    assert to_minor_units("0.0000015", rounding=ROUND_HALF_EVEN) == 2
+    with pytest.raises(ValueError, match="Invalid amount"):
+        to_minor_units("12,50")
+
+
+def test_bad_rows_name_the_entry_and_leave_columns_aligned() -> None:
+    cols = columns()
+    with pytest.raises(ValueError, match="'tx_4'.*overflows int64"):
+        cols.append({**ROWS[0], "tx_id": "tx_4", "amount": "9300000000000"})
+    with pytest.raises(ValueError, match="'tx_5'.*does not fit scale"):
+        cols.append({**ROWS[0], "tx_id": "tx_5", "amount": "0.1234567"})
+    with pytest.raises(ValueError, match="'tx_6'"):
+        cols.append({**ROWS[0], "tx_id": "tx_6", "created_at": "yesterday"})
+    assert len(cols) == len(cols.amount) == len(cols.created_at) == len(cols.currency) == 3
+
+    rounded = LedgerColumns(rounding=ROUND_HALF_EVEN)
+    rounded.append({**ROWS[0], "amount": "0.1234567"})
+    assert rounded.amount_at(0) == Decimal("0.123457")
+
+
+def test_numpy_round_trip() -> None:
+    np = pytest.importorskip("numpy")
+    cols = columns()
+    out = cols.to_numpy()
+
+    assert list(out["tx_id"]) == ["tx_1", "tx_2", "tx_3"]
+    assert [Decimal(int(a)).scaleb(-cols.scale) for a in out["amount"]] == [
+        Decimal("12.5"), Decimal("-0.000001"), Decimal("1000"),
+    ]
+    assert out["created_at"][1] == np.datetime64("2026-01-01T00:00:01.500000")
+    assert [cols.currency.categories[c] for c in out["currency"]] == ["USDC", "EURC", "USDC"]
+    assert out["to_wallet"][1] == -1
+    assert list(out["mandate_id"]) == ["", "mnd_1", ""]
+
+
+def test_arrow_round_trip() -> None:
+    pytest.importorskip("numpy")
+    pytest.importorskip("pyarrow")
+    cols = columns()
+    table = cols.to_arrow()
+
+    assert table.schema.metadata == {b"amount_scale": b"6"}
+    assert table.column("amount").to_pylist() == list(cols.amount)
+    assert table.column("currency").to_pylist() == ["USDC", "EURC", "USDC"]
+    assert table.column("to_wallet").to_pylist() == ["wallet_b", None, "wallet_c"]
+    stamps = table.column("created_at").to_pylist()
+    assert [to_epoch_micros(t) for t in stamps] == list(cols.created_at)
+    assert table.column("mandate_id").to_pylist() == [None, "mnd_1", None]
@@ -0,0 +1,70 @@
+"""Tests for the local policy decision index."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from sardis.decisions import DecisionIndex
+
+NOW = datetime.now(UTC)
+
+
+def decision(i: int, hours_ago: float, agent: str, outcome: str, reason: str, **extra: object) -> dict[str, object]:
+    return {
+        "decision_id": f"dec_{i}",
+        "agent_id": agent,
+        "decision": outcome,
+        "reason": reason,
+        "created_at": (NOW - timedelta(hours=hours_ago)).isoformat(),
+        **extra,
+    }
+
+
+DECISIONS = [
+    decision(1, 1, "a1", "denied", "over_limit", merchant_id="m1", matched_rules=["r_limit"], latency_ms=4),
+    decision(2, 2, "a1", "denied", "over_limit", merchant_id="m2", matched_rules=[{"rule_id": "r_limit"}]),
+    decision(3, 3, "a1", "denied", "blocked_merchant", merchant_id="m2", matched_rules=["r_block"], latency_ms=8),
+    decision(4, 30, "a1", "denied", "blocked_merchant", merchant_id="m2"),
+    decision(5, 0.5, "a1", "allowed", "ok", merchant_id="m1", latency_ms=2),
+    decision(6, 5, "a2", "denied", "over_limit", merchant_id="m1"),
+]
+
+
+def test_top_deny_reasons_for_agent_in_window() -> None:
+    index = DecisionIndex()
+    # Out-of-order ingest and a duplicate.
+    assert index.extend(reversed(DECISIONS)) == 6
+    assert index.add(DECISIONS[0]) is False
+
+    top = index.top("reason", agent="a1", outcome="deny", since=timedelta(hours=24))
+    assert top == [("over_limit", 2), ("blocked_merchant", 1)]
+    assert dict(index.top("reason", agent="a1", outcome="deny")) == {"over_limit": 2, "blocked_merchant": 2}
+    assert index.top("rule", outcome="deny") == [("r_limit", 2), ("r_block", 1)]
+    assert index.count(merchant="m2", outcome="deny", since=timedelta(hours=24)) == 2
+    assert index.count(agent="unknown") == 0
+
+
+def test_deny_rates_and_latency() -> None:
+    index = DecisionIndex()
+    index.extend(DECISIONS)
+    buckets = index.deny_rates(bucket=timedelta(days=365), agent="a1")
+    assert sum(b.total for b in buckets) == 5
+    assert sum(b.denied for b in buckets) == 4
+    assert index.latency_percentiles((50, 100), agent="a1") == {50: 4.0, 100: 8.0}
+    with pytest.raises(ValueError):
+        index.count(wallet="w1")
+
+
+def test_malformed_decision_is_not_marked_seen() -> None:
+    index = DecisionIndex()
+    bad = decision(7, 1, "a1", "denied", "over_limit", created_at="not a time")
+    with pytest.raises(ValueError):
+        index.add(bad)
+    with pytest.raises(ValueError):
+        index.add({**decision(7, 1, "a1", "denied", "over_limit"), "latency_ms": "slow"})
+    assert len(index) == 0
+
+    assert index.add(decision(7, 1, "a1", "denied", "over_limit")) is True
+    assert index.count(agent="a1", outcome="deny") == 1
@@ -0,0 +1,102 @@
+"""Tests for offline policy evaluation."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+from sardis.evaluator import OfflinePolicy, PolicyEvaluator, check_parity_sync, what_if
+from sardis.models.policy import ParsedPolicy, PolicyCheckResponse
+
+DAY = datetime(2026, 3, 2, tzinfo=UTC)
+
+
+def tx(i: int, amount: str, hours: float, to: str = "wallet_shop", currency: str = "USDC") -> dict[str, Any]:
+    return {
+        "tx_id": f"tx_{i}",
+        "amount": amount,
+        "currency": currency,
+        "to_wallet": to,
+        "created_at": (DAY + timedelta(hours=hours)).isoformat(),
+    }
+
+
+HISTORY = [
+    tx(3, "30", 3),
+    tx(1, "40", 1),
+    tx(2, "50", 2),
+    tx(4, "500", 4),
+    tx(5, "20", 25),
+    tx(6, "10", 26, to="wallet_casino"),
+    tx(7, "10", 27, currency="ETH"),
+]
+
+
+def test_replay_is_ordered_and_stateful() -> None:
+    policy = OfflinePolicy.from_dict({
+        "max_per_tx": 400,
+        "global_daily_limit": 100,
+        "blocked_destinations": ["wallet_casino"],
+        "allowed_tokens": ["USDC"],
+    })
+    verdicts = PolicyEvaluator(policy).evaluate(HISTORY)
+    assert [(v.tx_id, v.outcome, v.reason) for v in verdicts] == [
+        ("tx_1", "allow", "ok"),
+        ("tx_2", "allow", "ok"),
+        ("tx_3", "deny", "daily_limit"),
+        ("tx_4", "deny", "per_transaction_limit"),
+        ("tx_5", "allow", "ok"),
+        ("tx_6", "deny", "destination_blocked"),
+        ("tx_7", "deny", "token_not_allowed"),
+    ]
+
+
+def test_global_caps_only_count_usd_tokens() -> None:
+    policy = OfflinePolicy.from_dict({"global_daily_limit": 100, "max_total": 150})
+    verdicts = PolicyEvaluator(policy).evaluate([
+        tx(1, "60", 1, currency="EURC"),
+        tx(2, "90", 2),
+        tx(3, "80", 3, currency="EURC"),
+        tx(4, "20", 4, currency="USDT"),
+        tx(5, "70", 30, currency="PYUSD"),
+    ])
+    assert [(v.tx_id, v.reason) for v in verdicts] == [
+        ("tx_1", "ok"),
+        ("tx_2", "ok"),
+        ("tx_3", "ok"),
+        ("tx_4", "daily_limit"),
+        ("tx_5", "total_limit"),
+    ]
+
+
+def test_what_if_reports_flips_against_history_and_current_policy() -> None:
+    parsed = ParsedPolicy(
+        name="shop cap",
+        description="",
+        spending_limits=[{"vendor_pattern": "wallet_shop*", "max_amount": 60, "period": "daily", "currency": "USD"}],
+        requires_approval_above=300,
+    )
+    report = what_if(OfflinePolicy.from_parsed(parsed), HISTORY)
+    assert {f.tx_id: f.after.reason for f in report.flips} == {
+        "tx_2": "merchant_limit:wallet_shop*:daily",
+        "tx_3": "merchant_limit:wallet_shop*:daily",
+        "tx_4": "merchant_limit:wallet_shop*:daily",
+    }
+    assert len(report.newly_denied) == 3
+
+    current = OfflinePolicy(max_per_tx=Decimal("45"))
+    report = what_if(OfflinePolicy(), HISTORY, current=current)
+    assert sorted(f.tx_id for f in report.newly_allowed) == ["tx_2", "tx_4"]
+
+
+def test_parity_reports_server_disagreements() -> None:
+    class Policies:
+        def check(self, **kwargs: Any) -> PolicyCheckResponse:
+            return PolicyCheckResponse(allowed=kwargs["amount"] <= 45, reason="server")
+
+    report = check_parity_sync(Policies(), "agent_1", OfflinePolicy(max_per_tx=Decimal("40")), HISTORY, sample=10)
+    assert report.checked == len(HISTORY)
+    assert [m.tx_id for m in report.mismatches] == []
+    report = check_parity_sync(Policies(), "agent_1", OfflinePolicy(), HISTORY, sample=10)
+    assert sorted(m.tx_id for m in report.mismatches) == ["tx_2", "tx_4"]
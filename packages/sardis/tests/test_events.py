@@ -0,0 +1,125 @@
+"""Tests for the real-time event subscription client."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from sardis import AsyncSardis
+from sardis._client import RetryConfig
+from sardis.events import StreamEvent
+from sardis.models.errors import SardisError
+
+BASE = "https://api.test"
+SSE = {"content-type": "text/event-stream"}
+
+
+async def take(subscription, n: int) -> list[StreamEvent]:
+    async def collect() -> list[StreamEvent]:
+        return [await anext(subscription) for _ in range(n)]
+
+    return await asyncio.wait_for(collect(), 2.0)
+
+
+@respx.mock
+async def test_stream_fans_out_and_resumes_with_last_event_id() -> None:
+    seen_ids: list[str | None] = []
+
+    def stream(request: httpx.Request) -> httpx.Response:
+        seen_ids.append(request.headers.get("last-event-id"))
+        if len(seen_ids) == 1:
+            body = (
+                b": keepalive\n\n"
+                b"id: 1\nevent: approval.requested\ndata: {\"approval_id\": \"apr_1\"}\n\n"
+                b"id: 2\ndata: {\"type\": \"hold.created\",\n"
+                b"data:  \"hold_id\": \"hold_1\"}\n\n"
+            )
+        else:
+            body = b"id: 3\nevent: approval.resolved\ndata: {\"approval_id\": \"apr_1\"}\n\n"
+        return httpx.Response(200, headers=SSE, content=body)
+
+    route = respx.get(f"{BASE}/api/v2/events/stream").mock(side_effect=stream)
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        client.events.configure(reconnect_delay=0.01)
+        approvals = client.events.subscribe(types=["approval.*"], heartbeats=True)
+        everything = client.events.subscribe()
+
+        got = await take(approvals, 3)
+        assert [e.type for e in got] == ["heartbeat", "approval.requested", "approval.resolved"]
+        assert got[1].data == {"approval_id": "apr_1"} and got[1].id == "1"
+
+        all_events = await take(everything, 3)
+        assert [e.type for e in all_events] == ["approval.requested", "hold.created", "approval.resolved"]
+        assert all_events[1].data == {"type": "hold.created", "hold_id": "hold_1"}
+
+        await approvals.close()
+        await everything.close()
+        assert client.events.stream.subscribers == 0
+
+    assert seen_ids[:2] == [None, "2"]
+    assert route.calls[0].request.url.params.get("types") is None
+    assert client.events.stream.mode == "stream"
+
+
+@respx.mock
+async def test_falls_back_to_conditional_polling() -> None:
+    respx.get(f"{BASE}/api/v2/events/stream").respond(404, json={"detail": "Not Found"})
+    holds = respx.get(f"{BASE}/api/v2/holds").respond(200, json={"holds": []})
+    bodies = iter([
+        {"approvals": [{"approval_id": "apr_1"}]},
+        {"approvals": [{"approval_id": "apr_1"}, {"approval_id": "apr_2"}]},
+        None,  # 304
+        {"approvals": [{"approval_id": "apr_2"}]},
+    ])
+    conditional: list[str | None] = []
+
+    def pending(request: httpx.Request) -> httpx.Response:
+        conditional.append(request.headers.get("if-none-match"))
+        body = next(bodies, {"approvals": [{"approval_id": "apr_2"}]})
+        if body is None:
+            return httpx.Response(304)
+        return httpx.Response(200, json=body, headers={"etag": f'"v{len(conditional)}"'})
+
+    respx.get(f"{BASE}/api/v2/approvals/pending").mock(side_effect=pending)
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        client.events.configure(poll_interval=0.01, max_poll_interval=0.02)
+        async with client.events.subscribe(types=["approval.*"]) as events:
+            got = await take(events, 2)
+
+    assert [(e.type, e.data["approval_id"]) for e in got] == [
+        ("approval.requested", "apr_2"),
+        ("approval.resolved", "apr_1"),
+    ]
+    assert conditional[:3] == [None, '"v1"', '"v2"']
+    assert holds.call_count == 0
+    assert client.events.stream.mode == "poll"
+
+
+@respx.mock
+async def test_permanent_errors_reach_subscribers() -> None:
+    respx.get(f"{BASE}/api/v2/events/stream").respond(401, json={"detail": "Invalid API key"})
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE, retry=RetryConfig(max_retries=0)) as client:
+        events = client.events.subscribe()
+        with pytest.raises(SardisError):
+            await asyncio.wait_for(anext(events), 2.0)
+        await events.close()
+
+
+async def test_slow_subscriber_drops_oldest_events() -> None:
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        stream = client.events.stream
+        subscription = stream.subscribe(types=["hold.*"], max_queue=2)
+        await stream._stop()  # no upstream needed for this test
+        for i in range(4):
+            stream._publish(StreamEvent(type="hold.created", data=i))
+        stream._publish(StreamEvent(type="approval.requested"))
+
+        assert [e.data for e in await take(subscription, 2)] == [2, 3]
+        assert subscription.dropped == 2
+        await subscription.close()
@@ -0,0 +1,104 @@
+"""Tests for time-partitioned parallel export."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from sardis.exports import (
+    AsyncTimePartitionedExporter,
+    PartitionFilterError,
+    PartitionOverflowError,
+    TimePartitionedExporter,
+)
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+END = START + timedelta(days=4)
+
+# Sparse events, a dense burst on day 2, and events exactly on partition bounds.
+EVENTS = sorted(
+    [{"event_id": f"sparse_{i}", "occurred_at": (START + timedelta(hours=3 * i)).isoformat()} for i in range(32)]
+    + [{"event_id": f"burst_{i}", "occurred_at": (START + timedelta(days=2, seconds=i)).isoformat()}
+       for i in range(40)],
+    key=lambda e: (e["occurred_at"], e["event_id"]),
+)
+
+
+class Server:
+    """Inclusive on both ends, newest first, truncated at limit."""
+
+    def __init__(self) -> None:
+        self.windows: list[tuple[datetime, datetime]] = []
+
+    def fetch(self, start: datetime, end: datetime, limit: int) -> list[dict[str, Any]]:
+        self.windows.append((start, end))
+        hits = [e for e in EVENTS if start <= datetime.fromisoformat(e["occurred_at"]) <= end]
+        return list(reversed(hits))[:limit]
+
+
+def test_sync_export_splits_full_windows_and_dedupes_boundaries() -> None:
+    server = Server()
+    exporter = TimePartitionedExporter(server.fetch, limit=10, partitions=4, concurrency=3)
+    records = list(exporter.iter(START, END))
+
+    assert [r["event_id"] for r in records] == [e["event_id"] for e in EVENTS]
+    assert len(server.windows) > 4  # the burst forced splits
+
+
+async def test_async_export_to_jsonl(tmp_path) -> None:
+    server = Server()
+
+    async def fetch(start: datetime, end: datetime, limit: int) -> list[dict[str, Any]]:
+        return server.fetch(start, end, limit)
+
+    exporter = AsyncTimePartitionedExporter(fetch, limit=10, partitions=8, concurrency=2)
+    assert await exporter.to_jsonl(tmp_path / "events.jsonl", START, END) == len(EVENTS)
+    lines = (tmp_path / "events.jsonl").read_text().splitlines()
+    assert len(set(lines)) == len(EVENTS)
+
+
+def test_overflow_at_minimum_window_raises() -> None:
+    exporter = TimePartitionedExporter(Server().fetch, limit=2, partitions=1, min_window=timedelta(hours=1))
+    with pytest.raises(PartitionOverflowError):
+        list(exporter.iter(START + timedelta(days=2), START + timedelta(days=2, minutes=1)))
+
+
+def test_ignored_time_filter_fails_fast() -> None:
+    calls: list[tuple[datetime, datetime]] = []
+
+    def fetch(start: datetime, end: datetime, limit: int) -> list[dict[str, Any]]:
+        calls.append((start, end))
+        return EVENTS[:limit]  # the filter is silently ignored
+
+    exporter = TimePartitionedExporter(fetch, limit=10, partitions=4, concurrency=1)
+    with pytest.raises(PartitionFilterError, match="does not apply the time filter"):
+        list(exporter.iter(START + timedelta(days=1), END))
+    assert len(calls) <= 4  # nothing was split
+
+
+async def test_abandoned_async_iteration_cancels_split_children() -> None:
+    started = asyncio.Event()
+    release = asyncio.Event()
+    pending: list[asyncio.Task[Any]] = []
+
+    async def fetch(start: datetime, end: datetime, limit: int) -> list[dict[str, Any]]:
+        if end - start < timedelta(days=4):  # split children block until cancelled
+            pending.append(asyncio.current_task())
+            started.set()
+            await release.wait()
+        return Server().fetch(start, end, limit)
+
+    exporter = AsyncTimePartitionedExporter(fetch, limit=10, partitions=1, concurrency=4)
+    records = exporter.iter(START, END)
+    consumer = asyncio.create_task(anext(records))
+    await asyncio.wait_for(started.wait(), 2.0)
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+    await records.aclose()
+    await asyncio.sleep(0)
+
+    assert pending and all(task.cancelled() for task in pending)
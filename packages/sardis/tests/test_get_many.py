@@ -0,0 +1,70 @@
+"""Tests for multi-get on resources."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import respx
+
+from sardis import AsyncSardis, Sardis
+from sardis._client import RetryConfig
+from sardis.bulk import Missing
+from sardis.models.errors import APIError
+
+BASE = "https://api.test"
+NOW = "2026-01-01T00:00:00Z"
+
+
+def wallet(wallet_id: str) -> dict[str, str]:
+    return {"wallet_id": wallet_id, "agent_id": "agent_1", "created_at": NOW, "updated_at": NOW}
+
+
+@respx.mock
+async def test_async_get_many_falls_back_to_concurrent_gets() -> None:
+    batch = respx.post(f"{BASE}/api/v2/wallets/batch-get").respond(404, json={"detail": "Not Found"})
+    respx.get(f"{BASE}/api/v2/wallets/w_1").respond(200, json=wallet("w_1"))
+    respx.get(f"{BASE}/api/v2/wallets/w_2").respond(200, json=wallet("w_2"))
+    missing = respx.get(f"{BASE}/api/v2/wallets/w_9").respond(404, json={"detail": "Wallet not found"})
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        results = await client.wallets.get_many(["w_2", "w_9", "w_1", "w_2"])
+        await client.wallets.get_many(["w_1"])
+
+    assert [getattr(r, "wallet_id", None) for r in results] == ["w_2", None, "w_1", "w_2"]
+    assert results[1] == Missing("w_9") and not results[1]
+    assert batch.call_count == 1
+    assert missing.call_count == 1
+
+
+def test_sync_get_many_uses_batch_endpoint() -> None:
+    def batch_get(request: httpx.Request) -> httpx.Response:
+        ids = json.loads(request.content)["ids"]
+        return httpx.Response(200, json={"holds": [
+            {"id": i, "wallet_id": "w_1", "amount": "5", "status": "active",
+             "expires_at": "2026-01-02T00:00:00Z", "created_at": "2026-01-01T00:00:00Z"}
+            for i in ids if i != "hold_9"
+        ]})
+
+    with respx.mock:
+        route = respx.post(f"{BASE}/api/v2/holds/batch-get").mock(side_effect=batch_get)
+        with Sardis(api_key="sk_test", base_url=BASE) as client:
+            results = client.holds.get_many(["hold_1", "hold_9", "hold_1"])
+
+    assert route.call_count == 1
+    assert json.loads(route.calls[0].request.content) == {"ids": ["hold_1", "hold_9"]}
+    assert [r.hold_id if r else r for r in results] == ["hold_1", Missing("hold_9"), "hold_1"]
+
+
+def test_sync_get_many_records_failed_ids_instead_of_raising() -> None:
+    with respx.mock:
+        respx.post(f"{BASE}/api/v2/wallets/batch-get").respond(404, json={"detail": "Not Found"})
+        respx.get(f"{BASE}/api/v2/wallets/w_1").respond(200, json=wallet("w_1"))
+        respx.get(f"{BASE}/api/v2/wallets/w_2").respond(503, json={"detail": "Unavailable"})
+        respx.get(f"{BASE}/api/v2/wallets/w_3").mock(side_effect=httpx.ConnectError("refused"))
+        with Sardis(api_key="sk_test", base_url=BASE, retry=RetryConfig(max_retries=0)) as client:
+            results = client.wallets.get_many(["w_1", "w_2", "w_3"], concurrency=2)
+
+    assert results[0].wallet_id == "w_1"
+    assert not results[1] and isinstance(results[1].error, APIError) and results[1].error.status_code == 503
+    assert not results[2] and results[2].error is not None
@@ -0,0 +1,121 @@
+"""Tests for the approval inbox watcher and bulk decisions."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import respx
+
+from sardis import AsyncSardis, Sardis
+from sardis.inbox import ApprovalWatcher
+
+BASE = "https://api.test"
+SSE = {"content-type": "text/event-stream"}
+
+
+@respx.mock
+async def test_watcher_yields_existing_then_new_approvals() -> None:
+    respx.get(f"{BASE}/api/v2/approvals/pending").respond(200, json={"approvals": [{"approval_id": "apr_1"}]})
+    body = (
+        b"id: 1\nevent: approval.requested\ndata: {\"approval_id\": \"apr_1\"}\n\n"
+        b"id: 2\nevent: hold.created\ndata: {\"hold_id\": \"hold_1\"}\n\n"
+        b"id: 3\nevent: approval.requested\ndata: {\"approval\": {\"approval_id\": \"apr_2\"}}\n\n"
+        b"id: 4\nevent: approval.resolved\ndata: {\"approval_id\": \"apr_1\"}\n\n"
+        b"id: 5\nevent: approval.requested\ndata: {\"approval_id\": \"apr_3\", \"amount\": \"12.50\"}\n\n"
+    )
+    respx.get(f"{BASE}/api/v2/events/stream").respond(200, headers=SSE, content=body)
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        client.events.configure(reconnect_delay=0.01)
+        async with ApprovalWatcher(client) as inbox:
+            stream = aiter(inbox)
+
+            async def take(n: int) -> list[dict]:
+                return [await anext(stream) for _ in range(n)]
+
+            got = await asyncio.wait_for(take(3), 2.0)
+            assert [a["approval_id"] for a in got] == ["apr_1", "apr_2", "apr_3"]
+            assert got[2]["amount"] == "12.50"
+            assert [a["approval_id"] for a in inbox.pending] == ["apr_2", "apr_3"]
+            await stream.aclose()
+
+        assert client.events.stream.subscribers == 0
+
+
+@respx.mock
+async def test_watcher_polls_pending_without_event_stream() -> None:
+    respx.get(f"{BASE}/api/v2/events/stream").respond(404, json={"detail": "Not Found"})
+    calls = 0
+
+    def pending(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        approvals = [{"approval_id": "apr_1"}]
+        if calls > 2:
+            approvals.append({"approval_id": "apr_2"})
+        return httpx.Response(200, json={"approvals": approvals})
+
+    respx.get(f"{BASE}/api/v2/approvals/pending").mock(side_effect=pending)
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        client.events.configure(poll_interval=0.01, max_poll_interval=0.02)
+        async with ApprovalWatcher(client, include_existing=False) as inbox:
+            first = await asyncio.wait_for(anext(aiter(inbox)), 2.0)
+
+    assert first["approval_id"] == "apr_2"
+    assert client.events.stream.mode == "poll"
+
+
+@respx.mock
+async def test_watcher_lists_existing_only_after_the_subscription_is_live() -> None:
+    respx.get(f"{BASE}/api/v2/events/stream").respond(404, json={"detail": "Not Found"})
+    calls = 0
+
+    def pending(request: httpx.Request) -> httpx.Response:
+        # apr_1 arrives after the first request: a listing made before the
+        # polling baseline would miss it for good.
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={"approvals": [{"approval_id": "apr_1"}] if calls > 1 else []})
+
+    respx.get(f"{BASE}/api/v2/approvals/pending").mock(side_effect=pending)
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        client.events.configure(poll_interval=0.01, max_poll_interval=0.02)
+        async with ApprovalWatcher(client) as inbox:
+            first = await asyncio.wait_for(anext(aiter(inbox)), 2.0)
+
+    assert first["approval_id"] == "apr_1"
+
+
+@respx.mock
+async def test_async_approve_many_reports_each_approval() -> None:
+    ok = respx.post(url__regex=rf"{BASE}/api/v2/approvals/apr_[13]/approve").respond(
+        200, json={"status": "approved"}
+    )
+    bad = respx.post(f"{BASE}/api/v2/approvals/apr_2/approve").respond(409, json={"detail": "already resolved"})
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        result = await client.approvals.approve_many(["apr_1", "apr_2", "apr_3"], notes="batch", concurrency=2)
+
+    assert ok.call_count == 2 and bad.call_count == 1
+    assert json.loads(ok.calls[0].request.content)["notes"] == "batch"
+    assert [r.input for r in result.results] == ["apr_1", "apr_2", "apr_3"]
+    assert [r.input for r in result.failed_results] == ["apr_2"]
+    assert result.results[0].output == {"status": "approved"}
+    assert (result.summary.total, result.summary.successful, result.summary.failed) == (3, 2, 1)
+
+
+@respx.mock
+def test_sync_deny_many_uses_reject_endpoint() -> None:
+    route = respx.post(url__regex=rf"{BASE}/api/v2/approvals/apr_\d/reject").respond(200, json={"status": "rejected"})
+
+    with Sardis(api_key="sk_test", base_url=BASE) as client:
+        result = client.approvals.deny_many(["apr_1", "apr_2"], reason="over budget", concurrency=2)
+
+    assert route.call_count == 2
+    assert {json.loads(c.request.content)["reason"] for c in route.calls} == {"over budget"}
+    assert [r.input for r in result.successful_results] == ["apr_1", "apr_2"]
+    assert result.summary.failed == 0
@@ -0,0 +1,89 @@
+"""Tests for the chain/token metadata registry and gas estimate cache."""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+
+import respx
+
+from sardis import AsyncSardis, Sardis
+from sardis.metadata import CACHE_VERSION, AsyncChainRegistry, ChainRegistry
+
+BASE = "https://api.test"
+
+CHAINS = {"chains": [
+    {"name": "base", "chain_id": 8453, "native_token": "ETH", "block_time": 2, "explorer": "https://basescan.org"},
+    {"name": "polygon", "chain_id": 137, "native_token": "POL", "block_time": 2, "explorer": "https://polygonscan.com"},
+]}
+GAS = {
+    "gas_limit": 65000,
+    "gas_price_gwei": "0.01",
+    "max_fee_gwei": "0.02",
+    "max_priority_fee_gwei": "0.001",
+    "estimated_cost_wei": 650000000000,
+}
+
+
+def mock_metadata() -> respx.Route:
+    chains = respx.get(f"{BASE}/api/v2/transactions/chains").respond(200, json=CHAINS)
+    respx.get(f"{BASE}/api/v2/transactions/tokens/base").respond(
+        200, json={"tokens": [{"symbol": "USDC", "address": "0xusdc", "decimals": 6}]}
+    )
+    respx.get(f"{BASE}/api/v2/transactions/tokens/polygon").respond(200, json={"tokens": []})
+    return chains
+
+
+@respx.mock
+async def test_async_registry_refreshes_and_persists(tmp_path) -> None:
+    path = tmp_path / "chains.json"
+    chains = mock_metadata()
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        registry = AsyncChainRegistry(client.transactions, path=path)
+        assert registry.stale and registry.chain("base") is None
+        await registry.ensure()
+        await registry.ensure()
+
+    assert chains.call_count == 1
+    assert registry.chain("BASE").chain_id == 8453
+    assert registry.chain_by_id(137).name == "polygon"
+    assert registry.token("base", "usdc")["address"] == "0xusdc"
+    assert registry.tokens("polygon") == []
+    assert json.loads(path.read_text())["version"] == CACHE_VERSION
+
+
+def test_sync_registry_loads_snapshot_without_requests(tmp_path) -> None:
+    path = tmp_path / "chains.json"
+    with respx.mock:
+        mock_metadata()
+        with Sardis(api_key="sk_test", base_url=BASE) as client:
+            ChainRegistry(client.transactions, path=path).refresh()
+
+    with respx.mock(assert_all_called=False) as router:
+        with Sardis(api_key="sk_test", base_url=BASE) as client:
+            registry = ChainRegistry(client.transactions, path=path)
+            other = ChainRegistry(Sardis(api_key="sk_test", base_url="https://other.test").transactions, path=path)
+        assert not router.calls
+
+    assert not registry.stale
+    assert [c.name for c in registry.chains()] == ["base", "polygon"]
+    # A snapshot from another API base URL is ignored.
+    assert other.fetched_at is None
+
+
+@respx.mock
+async def test_estimate_gas_is_cached_per_chain_and_token() -> None:
+    route = respx.post(f"{BASE}/api/v2/transactions/estimate-gas").respond(200, json=GAS)
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE, gas_cache=True) as client:
+        first = await client.transactions.estimate_gas("base", "0x1", Decimal("5"))
+        again = await client.transactions.estimate_gas("BASE", "0x2", Decimal("7"), token="usdc")
+        await client.transactions.estimate_gas("base", "0x1", Decimal("5"), token="EURC")
+        await client.transactions.estimate_gas("base", "0x1", Decimal("5"), cached=False)
+        # timeout stays the fifth positional parameter.
+        await client.transactions.estimate_gas("base", "0x1", Decimal("5"), "USDC", 5.0)
+
+    assert again is first
+    assert route.call_count == 3
+    assert client.gas_cache.hits == 2
@@ -0,0 +1,75 @@
+"""Tests for client-side streaming payment metering."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+import respx
+
+from sardis import AsyncSardis, Sardis
+from sardis._client import RetryConfig
+from sardis.metering import AsyncStreamMeter, StreamLimitExceededError, StreamMeter
+
+BASE = "https://api.test"
+STREAM = {"stream_id": "st_1", "max_amount": "1.00", "rate_per_unit": "0.01", "status": "open"}
+
+
+def consumed(route: respx.Route) -> list[tuple[int, str]]:
+    bodies = [json.loads(call.request.content) for call in route.calls]
+    return [(body["units"], body["idempotency_key"]) for body in bodies]
+
+
+@respx.mock
+async def test_async_meter_aggregates_and_enforces_max_amount() -> None:
+    route = respx.post(f"{BASE}/api/v2/payments/stream/st_1/consume").respond(200, json={"ok": True})
+    settle = respx.post(f"{BASE}/api/v2/payments/stream/st_1/settle").respond(200, json={"status": "settled"})
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        async with AsyncStreamMeter(client.streaming, flush_units=1000, flush_interval=60) as meter:
+            meter.track(STREAM, consumed_units=10)
+            for _ in range(40):
+                meter.record("st_1", 2)
+            assert meter.remaining("st_1") == 10
+            with pytest.raises(StreamLimitExceededError):
+                meter.record("st_1", 11)
+            assert route.call_count == 0
+
+            assert (await meter.settle("st_1"))["status"] == "settled"
+
+    assert [units for units, _ in consumed(route)] == [80]
+    assert settle.called
+
+
+def test_sync_meter_retries_failed_batch_with_same_key() -> None:
+    with respx.mock:
+        route = respx.post(f"{BASE}/api/v2/payments/stream/st_1/consume").mock(side_effect=[
+            httpx.Response(503, json={"detail": "unavailable"}),
+            httpx.Response(200, json={"ok": True}),
+            httpx.Response(200, json={"ok": True}),
+        ])
+        with Sardis(api_key="sk_test", base_url=BASE, retry=RetryConfig(max_retries=0)) as client:
+            meter = StreamMeter(client.streaming, flush_units=10_000, flush_interval=60)
+            meter.record("st_1", 5)
+            with pytest.raises(Exception):
+                meter.flush()
+            meter.record("st_1", 3)
+            meter.flush()
+            assert meter.pending() == 0
+            meter.close()
+
+    (first, key1), (retry, key2), (rest, key3) = consumed(route)
+    assert (first, retry, rest) == (5, 5, 3)
+    assert key1 == key2 != key3
+
+
+@respx.mock
+def test_consume_keeps_timeout_positional() -> None:
+    route = respx.post(f"{BASE}/api/v2/payments/stream/st_1/consume").respond(200, json={"ok": True})
+    with Sardis(api_key="sk_test", base_url=BASE) as client:
+        client.streaming.consume("st_1", 2, "memo", 5.0)
+        with pytest.raises(TypeError):
+            client.streaming.consume("st_1", 2, "memo", 5.0, "key_1")  # type: ignore[misc]
+        client.streaming.consume("st_1", 2, idempotency_key="key_1")
+    assert [json.loads(c.request.content).get("idempotency_key") for c in route.calls] == [None, "key_1"]
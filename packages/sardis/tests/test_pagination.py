@@ -0,0 +1,143 @@
+"""Tests for paginator checkpoints and resume."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from sardis.pagination import (
+    AsyncPaginator,
+    Page,
+    PageInfo,
+    PaginationCheckpoint,
+    SyncPaginator,
+)
+
+DATA = list(range(23))
+
+
+def fetch_page(limit: int, offset: int = 0, **filters: Any) -> Page[int]:
+    items = DATA[offset : offset + limit]
+    return Page(items=items, page_info=PageInfo(has_next=offset + limit < len(DATA), page_size=limit))
+
+
+class FlakyFetch:
+    """Fails once when asked for the page at ``fail_at``."""
+
+    def __init__(self, fail_at: int) -> None:
+        self.fail_at = fail_at
+        self.calls: list[int] = []
+
+    def __call__(self, limit: int, offset: int = 0, **filters: Any) -> Page[int]:
+        self.calls.append(offset)
+        if offset == self.fail_at:
+            self.fail_at = -1
+            raise ConnectionError("network down")
+        return fetch_page(limit, offset)
+
+
+def test_checkpoint_file_resumes_without_duplicates_or_gaps(tmp_path) -> None:
+    path = tmp_path / "scan.ckpt"
+    flaky = FlakyFetch(fail_at=15)
+    seen: list[int] = []
+
+    with pytest.raises(ConnectionError):
+        for item in SyncPaginator(flaky, {"limit": 5, "offset": 0, "wallet_id": "w1"}, checkpoint_path=path):
+            seen.append(item)
+
+    saved = PaginationCheckpoint.load(path)
+    assert saved is not None
+    assert saved.params["offset"] == 15
+    assert not saved.exhausted
+
+    seen.extend(SyncPaginator(flaky, {"limit": 5, "offset": 0, "wallet_id": "w1"}, checkpoint_path=path))
+    assert seen == DATA
+    assert PaginationCheckpoint.load(path).exhausted
+
+
+def test_resume_mid_page_skips_consumed_items() -> None:
+    paginator = SyncPaginator(fetch_page, {"limit": 5, "offset": 0})
+    taken = paginator.take(7)
+    checkpoint = paginator.checkpoint.to_dict()
+    assert checkpoint["params"]["offset"] == 5
+    assert checkpoint["skip"] == 2
+
+    rest = list(SyncPaginator(fetch_page, {"limit": 5, "offset": 0}).resume(checkpoint))
+    assert taken + rest == DATA
+
+
+def test_stopping_mid_page_persists_received_items_only(tmp_path) -> None:
+    path = tmp_path / "scan.ckpt"
+    paginator = SyncPaginator(fetch_page, {"limit": 5, "offset": 0}, checkpoint_path=path)
+    received = []
+    for item in paginator:
+        received.append(item)
+        if len(received) == 7:
+            break
+    assert paginator.checkpoint.items_fetched == 7
+
+    saved = PaginationCheckpoint.load(path)
+    assert (saved.params["offset"], saved.skip, saved.items_fetched) == (5, 2, 7)
+    assert received + list(SyncPaginator(fetch_page, {"limit": 5, "offset": 0}, checkpoint_path=path)) == DATA
+
+
+def test_resume_rejects_checkpoint_with_different_filters() -> None:
+    checkpoint = PaginationCheckpoint(params={"limit": 5, "offset": 10, "wallet_id": "w1"})
+    with pytest.raises(ValueError):
+        SyncPaginator(fetch_page, {"limit": 5, "offset": 0, "wallet_id": "w2"}).resume(checkpoint)
+
+
+async def test_async_paginator_persists_and_resumes(tmp_path) -> None:
+    async def afetch(**params: Any) -> Page[int]:
+        return fetch_page(**params)
+
+    path = tmp_path / "scan.ckpt"
+    head = await AsyncPaginator(afetch, {"limit": 4, "offset": 0}, checkpoint_path=path, max_pages=2).all()
+    assert head == DATA[:8]
+
+    rest = await AsyncPaginator(afetch, {"limit": 4, "offset": 0}, checkpoint_path=path).all()
+    assert head + rest == DATA
+
+
+LEDGER_ROWS = [
+    {"tx_id": f"tx_{i}", "amount": "1.50", "currency": "USDC", "created_at": "2026-01-01T00:00:00Z"}
+    for i in range(5)
+]
+
+
+def test_lazy_model_list_validates_on_access() -> None:
+    from decimal import Decimal
+
+    from sardis.pagination import LazyModelList, parse_model_list
+    from sardis.resources.ledger import LedgerEntry
+
+    entries = parse_model_list(LEDGER_ROWS, LedgerEntry, lazy=True)
+    assert isinstance(entries, LazyModelList)
+    assert entries.column("tx_id") == [f"tx_{i}" for i in range(5)]
+    assert "validated=0" in repr(entries)
+
+    assert entries[1].amount == Decimal("1.50")
+    assert entries[1] is entries[1]
+    assert "validated=1" in repr(entries)
+
+    tail = entries[3:]
+    assert [e.tx_id for e in tail] == ["tx_3", "tx_4"]
+    assert entries.materialize() == parse_model_list(LEDGER_ROWS, LedgerEntry)
+
+
+def test_list_timeout_stays_positional_and_lazy_is_keyword_only() -> None:
+    import respx
+
+    from sardis import Sardis
+    from sardis.pagination import LazyModelList
+
+    with respx.mock, Sardis(api_key="sk_test", base_url="https://api.test") as client:
+        route = respx.get("https://api.test/api/v2/ledger/entries").respond(200, json={"entries": LEDGER_ROWS})
+
+        entries = client.ledger.list_entries(None, 50, 0, 5.0)
+        assert isinstance(entries, list) and len(entries) == 5
+        assert route.calls[0].request.extensions["timeout"]["read"] == 5.0
+        assert isinstance(client.ledger.list_entries(lazy=True), LazyModelList)
+        with pytest.raises(TypeError):
+            client.ledger.list_entries(None, 50, 0, 5.0, True)  # type: ignore[call-overload]
@@ -0,0 +1,80 @@
+"""Tests for batched policy checks."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from decimal import Decimal
+
+import httpx
+import pytest
+import respx
+
+from sardis import AsyncSardis, Sardis
+from sardis.models.errors import ValidationError
+
+BASE = "https://api.test"
+CANDIDATES = [
+    {"agent_id": "agent_1", "amount": "10", "merchant_id": "m1"},
+    {"agent_id": "agent_1", "amount": "10.00", "merchant_id": "m1"},
+    {"agent_id": "agent_1", "amount": "900", "merchant_id": "m2"},
+    {"agent_id": "agent_1", "amount": "900", "currency": "EUR", "merchant_id": "m2"},
+    {"agent_id": "agent_1", "amount": "20", "merchant_id": "m3"},
+]
+
+
+def verdict(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    return httpx.Response(200, json={"allowed": Decimal(body["amount"]) < 50, "reason": body["merchant_id"]})
+
+
+@respx.mock
+async def test_async_check_many_falls_back_to_single_flight_fan_out() -> None:
+    respx.get(f"{BASE}/api/v2/policies/agent_1").respond(200, json={"agent_id": "agent_1", "max_per_tx": "500"})
+    batch = respx.post(f"{BASE}/api/v2/policies/check/batch").respond(404, json={"detail": "Not Found"})
+    single = respx.post(f"{BASE}/api/v2/policies/check").mock(side_effect=verdict)
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        await client.policies.get("agent_1")
+        first, second = await asyncio.gather(
+            client.policies.check_many(CANDIDATES),
+            client.policies.check_many(CANDIDATES[:1]),
+        )
+        await client.policies.check_many(CANDIDATES[4:])
+
+    assert [(r.allowed, r.reason, r.prefiltered) for r in first] == [
+        (True, "m1", False),
+        (True, "m1", False),
+        (False, "Amount exceeds per-transaction limit of 500", True),
+        (False, "m2", False),
+        (True, "m3", False),
+    ]
+    assert second[0] == first[0]
+    assert batch.call_count == 1
+    # m1 shared between calls, m2 only in EUR (no local rejection), m3 twice.
+    assert single.call_count == 4
+
+
+def test_sync_check_many_uses_batch_endpoint() -> None:
+    with respx.mock:
+        def batch_verdicts(request: httpx.Request) -> httpx.Response:
+            checks = json.loads(request.content)["checks"]
+            return httpx.Response(200, json={"results": [
+                {"allowed": Decimal(c["amount"]) < 50, "reason": c["merchant_id"]} for c in checks
+            ]})
+
+        batch = respx.post(f"{BASE}/api/v2/policies/check/batch").mock(side_effect=batch_verdicts)
+        with Sardis(api_key="sk_test", base_url=BASE) as client:
+            results = client.policies.check_many(CANDIDATES)
+
+    assert [r.allowed for r in results] == [True, True, False, False, True]
+    assert not any(r.prefiltered for r in results)
+    assert batch.call_count == 1
+    assert len(json.loads(batch.calls[0].request.content)["checks"]) == 4
+
+
+@respx.mock
+def test_check_many_propagates_real_errors() -> None:
+    respx.post(f"{BASE}/api/v2/policies/check/batch").respond(422, json={"detail": "bad"})
+    with Sardis(api_key="sk_test", base_url=BASE) as client, pytest.raises(ValidationError):
+        client.policies.check_many(CANDIDATES[:1])
@@ -0,0 +1,93 @@
+"""Tests for the FX rate table and quote cache."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from decimal import Decimal
+
+import httpx
+import pytest
+import respx
+
+from sardis import AsyncSardis, Sardis
+from sardis.rates import FXRateCache, QuoteCache, RateTable
+
+BASE = "https://api.test"
+
+
+def test_rate_table_parses_layouts_and_derives_cross_rates() -> None:
+    listed = RateTable.from_response({"rates": [
+        {"from_currency": "USDC", "to_currency": "EURC", "rate": "0.92"},
+        {"pair": "USDC/JPYC", "rate": "150"},
+    ]})
+    mapped = RateTable.from_response({"USDC_EURC": 0.92, "USDC/JPYC": {"rate": "150"}, "updated_at": "now"})
+    nested = RateTable.from_response({"rates": {"USDC": {"EURC": "0.92", "JPYC": "150"}}})
+
+    for table in (listed, mapped, nested):
+        assert sorted(table.pairs) == [("USDC", "EURC"), ("USDC", "JPYC")]
+        assert table.convert(Decimal("100"), "usdc", "eurc") == Decimal("92.00")
+        assert table.rate("EURC", "USDC") == 1 / Decimal("0.92")
+        # Cross rate through the USDC pivot.
+        assert table.rate("EURC", "JPYC") == (1 / Decimal("0.92")) * 150
+        with pytest.raises(KeyError):
+            table.rate("USDC", "GBPC")
+
+    assert listed.convert_many([Decimal("1"), Decimal("2.5")], "USDC", "EURC") == [Decimal("0.92"), Decimal("2.300")]
+
+
+def test_rate_table_converts_numpy_columns() -> None:
+    np = pytest.importorskip("numpy")
+    table = RateTable({("USDC", "EURC"): Decimal("0.5")})
+    assert table.convert_many(np.array([2.0, 4.0]), "USDC", "EURC").tolist() == [1.0, 2.0]
+
+
+def test_sync_rate_cache_refetches_only_when_stale() -> None:
+    with respx.mock:
+        route = respx.get(f"{BASE}/api/v2/fx/rates").respond(200, json={"USDC/EURC": "0.9"})
+        with Sardis(api_key="sk_test", base_url=BASE) as client:
+            rates = FXRateCache(client.fx, max_age=60)
+            assert rates.convert(Decimal("10"), "USDC", "EURC") == Decimal("9.0")
+            assert rates.convert(Decimal("20"), "EURC", "USDC") == Decimal("20") / Decimal("0.9")
+            assert route.call_count == 1
+
+            rates.table.fetched_at -= 61
+            rates.get_table()
+            assert route.call_count == 2
+
+
+@respx.mock
+async def test_released_quote_reused_by_one_caller_and_dropped_on_execute() -> None:
+    expires = time.time() + 30
+    ids = iter(range(1, 10))
+    route = respx.post(f"{BASE}/api/v2/fx/quote").mock(
+        side_effect=lambda request: httpx.Response(200, json={"id": f"q_{next(ids)}", "expires_at": expires})
+    )
+    respx.post(f"{BASE}/api/v2/fx/execute").respond(200, json={"status": "completed"})
+
+    cache = QuoteCache(bucket=Decimal("10"))
+    async with AsyncSardis(api_key="sk_test", base_url=BASE, quote_cache=cache) as client:
+        first = await client.fx.quote("USDC", "EURC", Decimal("250"))
+        # Concurrent callers never share a quote that is still held.
+        held, other = await asyncio.gather(
+            client.fx.quote("USDC", "EURC", Decimal("250")), client.fx.quote("USDC", "EURC", Decimal("250"))
+        )
+        assert len({first["id"], held["id"], other["id"]}) == 3
+
+        cache.release(first["id"])
+        reused = await client.fx.quote("usdc", "eurc", Decimal("255"))
+        assert reused is first
+        assert (await client.fx.quote("USDC", "EURC", Decimal("250")))["id"] == "q_4"
+        assert route.call_count == 4
+
+        cache.release(reused["id"])
+        await client.fx.execute(reused["id"])
+        assert len(cache) == 0
+        cache.release(reused["id"])
+        assert (await client.fx.quote("USDC", "EURC", Decimal("250")))["id"] == "q_5"
+
+    # Quotes inside the safety margin of their expiry are not reused.
+    late = QuoteCache(margin=5.0, clock=lambda: expires - 1)
+    late.put("USDC", "EURC", Decimal("1"), {"id": "q_2", "expires_at": expires})
+    late.release("q_2")
+    assert late.take("USDC", "EURC", Decimal("1")) is None
@@ -0,0 +1,107 @@
+"""Tests for the local ledger replica."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from sardis.pagination import Page, create_page_from_response
+from sardis.replica import AsyncLedgerReplica, LedgerOrderError, LedgerReplica
+from sardis.resources.ledger import LedgerEntry
+
+
+def entry(i: int) -> dict[str, Any]:
+    return {
+        "tx_id": f"tx_{i:04d}",
+        "mandate_id": f"mnd_{i % 3}",
+        "from_wallet": f"wallet_{i % 4}",
+        "to_wallet": "merchant",
+        "amount": f"{i}.10",
+        "currency": "USDC",
+        "chain": "base",
+        "created_at": f"2026-03-{1 + i // 10:02d}T00:00:{i % 60:02d}Z",
+    }
+
+
+class FakeLedger:
+    def __init__(self, n: int, max_limit: int | None = None) -> None:
+        self.rows = [entry(i) for i in range(n)]
+        self.offsets: list[int] = []
+        self.max_limit = max_limit
+
+    def list_entries_page(self, wallet_id=None, limit=50, offset=0, lazy=False) -> Page[LedgerEntry]:
+        self.offsets.append(offset)
+        served = min(limit, self.max_limit or limit)
+        return create_page_from_response(
+            {"entries": self.rows[offset : offset + served]},
+            items_key="entries",
+            model=LedgerEntry,
+            lazy=lazy,
+            page_size=limit,
+        )
+
+
+class AsyncFakeLedger(FakeLedger):
+    async def list_entries_page(self, **kwargs: Any) -> Page[LedgerEntry]:
+        return super().list_entries_page(**kwargs)
+
+
+def test_delta_sync_fetches_only_new_entries(tmp_path) -> None:
+    ledger = FakeLedger(25)
+    with LedgerReplica(ledger, path=tmp_path / "ledger.db", page_size=10) as replica:
+        assert replica.sync() == 25
+        ledger.rows.extend(entry(i) for i in range(25, 32))
+        ledger.offsets.clear()
+        assert replica.sync() == 7
+        assert ledger.offsets[0] == 24  # re-reads the boundary entry only
+        assert len(replica) == 32
+        assert replica.high_water_mark == datetime(2026, 3, 4, 0, 0, 31, tzinfo=UTC)
+
+    # The high-water mark survives reopening the database.
+    reopened = LedgerReplica(ledger, path=tmp_path / "ledger.db", page_size=10)
+    assert reopened.sync() == 0
+    reopened.close()
+
+
+@pytest.mark.parametrize(("page_size", "max_limit"), [(10, 3), (1, None)])
+def test_sync_pages_past_short_pages(page_size: int, max_limit: int | None) -> None:
+    ledger = FakeLedger(12, max_limit=max_limit)
+    with LedgerReplica(ledger, path=":memory:", page_size=page_size) as replica:
+        assert replica.sync() == 12
+        ledger.rows.append(entry(12))
+        assert replica.sync() == 1
+        assert len(replica) == 13
+
+
+def test_rescans_when_boundary_moves() -> None:
+    ledger = FakeLedger(12)
+    replica = LedgerReplica(ledger, page_size=5)
+    replica.sync()
+    ledger.rows.insert(3, {**entry(3), "tx_id": "tx_0099"})
+    assert replica.sync() == 13
+    assert replica.get("tx_0099") is not None
+
+
+def test_newest_first_pages_are_rejected() -> None:
+    ledger = FakeLedger(12)
+    ledger.rows.reverse()
+    replica = LedgerReplica(ledger, page_size=5)
+    with pytest.raises(LedgerOrderError, match="offset 0"):
+        replica.sync()
+    assert len(replica) == 0 and replica.offset == 0
+
+
+async def test_async_replica_queries() -> None:
+    replica = AsyncLedgerReplica(AsyncFakeLedger(40), page_size=16)
+    assert await replica.sync() == 40
+
+    wallet = replica.entries_for_wallet(
+        "wallet_1", start=datetime(2026, 3, 2, tzinfo=UTC), end=datetime(2026, 3, 4, tzinfo=UTC)
+    )
+    assert [e.tx_id for e in wallet] == ["tx_0013", "tx_0017", "tx_0021", "tx_0025", "tx_0029"]
+    assert len(replica.entries_for_wallet("merchant", limit=3)) == 3
+    assert all(e.mandate_id == "mnd_2" for e in replica.entries_for_mandate("mnd_2"))
+    assert str(replica.get("tx_0007").amount) == "7.10"
+    await replica.aclose()
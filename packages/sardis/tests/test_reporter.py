@@ -0,0 +1,117 @@
+"""Tests for the buffered usage reporter."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import respx
+
+from sardis import AsyncSardis, Sardis
+from sardis._client import RetryConfig
+from sardis.reporter import AsyncUsageReporter, UsageReporter
+
+BASE = "https://api.test"
+NOW = 1_767_225_605.0  # 2026-01-01T00:00:05Z
+
+
+def bodies(route: respx.Route) -> list[dict]:
+    return [json.loads(call.request.content) for call in route.calls]
+
+
+@respx.mock
+async def test_async_reporter_aggregates_per_meter_subscription_and_window() -> None:
+    batch = respx.post(f"{BASE}/api/v2/usage/report/batch").respond(404, json={"detail": "Not Found"})
+    report = respx.post(f"{BASE}/api/v2/usage/report").respond(200, json={"ok": True})
+    sub = respx.post(f"{BASE}/api/v2/mandate-subscriptions/sub_1/usage").respond(200, json={"ok": True})
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        reporter = AsyncUsageReporter(client, window=10.0, reporter_id="host1", clock=lambda: NOW)
+        async with reporter:
+            for _ in range(3):
+                reporter.add("api_calls")
+            await reporter.put("tokens", 40, subscription_id="sub_1")
+            reporter.add("tokens", 2, subscription_id="sub_1")
+
+    assert batch.call_count == 1
+    assert bodies(report) == [{
+        "meter_id": "api_calls",
+        "quantity": 3,
+        "timestamp": "2026-01-01T00:00:00+00:00",
+        "idempotency_key": "usage_host1_-_api_calls_176722560",
+    }]
+    assert bodies(sub)[0]["usage_delta"] == 42
+    stats = reporter.stats()
+    assert (stats.accepted, stats.sent, stats.pending, stats.dropped) == (5, 2, 0, 0)
+
+
+def test_sync_reporter_spools_during_outage_and_replays(tmp_path) -> None:
+    spool = tmp_path / "usage.spool"
+    clock = [NOW]
+    with respx.mock:
+        route = respx.post(f"{BASE}/api/v2/usage/report/batch").mock(side_effect=[
+            httpx.Response(503, json={"detail": "unavailable"}),
+            httpx.Response(200, json={"ok": True}),
+            httpx.Response(200, json={"ok": True}),
+        ])
+        with Sardis(api_key="sk_test", base_url=BASE, retry=RetryConfig(max_retries=0)) as client:
+            reporter = UsageReporter(client, window=10.0, spool_path=spool, reporter_id="host1", clock=lambda: clock[0])
+            reporter.add("api_calls", 5)
+            reporter.flush()
+            assert reporter.stats().spooled == 1
+            assert spool.exists()
+
+            clock[0] += 10
+            reporter.add("api_calls", 7)
+            reporter.close()
+
+    sent = [event for body in bodies(route) for event in body["events"]]
+    assert [e["quantity"] for e in sent] == [5, 7, 5]
+    # The replayed report keeps its idempotency key.
+    assert sent[0]["idempotency_key"] == sent[2]["idempotency_key"] != sent[1]["idempotency_key"]
+    assert reporter.stats().spooled == 0 and not spool.exists()
+
+
+def test_spool_is_kept_until_its_replay_is_settled(tmp_path) -> None:
+    spool = tmp_path / "usage.spool"
+    replay = tmp_path / "usage.spool.replay"
+    clock = [NOW]
+    on_disk = []
+
+    def replay_fails(request: httpx.Request) -> httpx.Response:
+        on_disk.append((spool.exists(), replay.exists()))
+        return httpx.Response(503, json={"detail": "unavailable"})
+
+    with respx.mock:
+        respx.post(f"{BASE}/api/v2/usage/report/batch").mock(side_effect=[
+            httpx.Response(503, json={"detail": "unavailable"}),
+            httpx.Response(200, json={"ok": True}),
+            replay_fails,
+        ])
+        with Sardis(api_key="sk_test", base_url=BASE, retry=RetryConfig(max_retries=0)) as client:
+            reporter = UsageReporter(client, window=10.0, spool_path=spool, reporter_id="host1", clock=lambda: clock[0])
+            reporter.add("api_calls", 5)
+            reporter.flush()
+            clock[0] += 10
+            reporter.add("api_calls", 7)
+            reporter.flush()
+
+    # The spool was moved aside, not deleted, while it was resent; the
+    # failed report went back to a fresh spool.
+    assert on_disk == [(False, True)]
+    assert spool.exists() and not replay.exists()
+    assert reporter.stats().spooled == 1
+
+
+def test_reporter_drops_new_entries_when_full() -> None:
+    with respx.mock:
+        route = respx.post(f"{BASE}/api/v2/usage/report/batch").respond(200, json={"ok": True})
+        with Sardis(api_key="sk_test", base_url=BASE) as client, \
+                UsageReporter(client, max_entries=1, clock=lambda: NOW) as reporter:
+            assert reporter.add("a")
+            assert reporter.add("a", 3)
+            assert not reporter.add("b")
+            stats = reporter.stats()
+            assert (stats.accepted, stats.dropped, stats.pending) == (2, 1, 1)
+
+    assert [e["quantity"] for e in bodies(route)[0]["events"]] == [4]
@@ -0,0 +1,124 @@
+"""Tests for the shared long-running operation poller."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections import Counter
+
+import httpx
+import pytest
+import respx
+
+from sardis import AsyncSardis, Sardis
+from sardis._client import RetryConfig
+from sardis.models.errors import NotFoundError
+from sardis.waiters import OperationKind, WaitTimeoutError
+
+BASE = "https://api.test"
+
+
+def tx_status(tx_hash: str, status: str) -> dict[str, object]:
+    return {"tx_hash": tx_hash, "chain": "base", "status": status}
+
+
+@respx.mock
+async def test_async_wait_for_batches_status_calls() -> None:
+    polls: Counter[str] = Counter()
+
+    def batch(request: httpx.Request) -> httpx.Response:
+        operations = json.loads(request.content)["operations"]
+        polls.update(op["id"] for op in operations)
+        return httpx.Response(200, json={"operations": [
+            tx_status(op["id"], "confirmed" if polls[op["id"]] > 1 else "submitted") for op in operations
+        ]})
+
+    route = respx.post(f"{BASE}/api/v2/transactions/status/batch").mock(side_effect=batch)
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        client.poll_scheduler.initial_interval = 0.01
+        futures = [client.wait_for("transaction", f"0x{i}", chain="base") for i in range(250)]
+        results = await asyncio.gather(*futures)
+
+    assert {r.status for r in results} == {"confirmed"}
+    assert [r.tx_hash for r in results] == [f"0x{i}" for i in range(250)]
+    # 250 operations in chunks of 100 -> 3 calls per round, 2 rounds.
+    assert route.call_count == 6
+    assert all(op["chain"] == "base" for op in json.loads(route.calls[0].request.content)["operations"])
+    assert len(client.poll_scheduler) == 0
+
+
+@respx.mock
+async def test_async_wait_for_falls_back_to_single_polls_and_times_out() -> None:
+    batch = respx.post(f"{BASE}/api/v2/transactions/status/batch").respond(404, json={"detail": "Not Found"})
+    done = respx.get(f"{BASE}/api/v2/transactions/status/0xa").respond(200, json=tx_status("0xa", "failed"))
+    respx.get(f"{BASE}/api/v2/transactions/status/0xb").respond(200, json=tx_status("0xb", "pending"))
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        client.poll_scheduler.initial_interval = 0.01
+        seen: list[str] = []
+        first = client.wait_for("transaction", "0xa", chain="base", callback=lambda f: seen.append(f.result().status))
+        again = client.wait_for("transaction", "0xa", chain="base")
+        stuck = client.wait_for("transaction", "0xb", chain="base", max_wait=0.1)
+
+        assert (await first).status == "failed"
+        assert (await again).status == "failed"
+        with pytest.raises(WaitTimeoutError):
+            await stuck
+
+    assert seen == ["failed"]
+    assert batch.call_count == 1
+    # Both waiters on 0xa shared one poll.
+    assert done.call_count == 1
+
+
+@respx.mock
+async def test_async_wait_for_gives_up_on_unknown_ids_after_grace() -> None:
+    respx.post(f"{BASE}/api/v2/transactions/status/batch").respond(
+        200, json={"operations": [tx_status("0xa", "confirmed")]}
+    )
+
+    async with AsyncSardis(api_key="sk_test", base_url=BASE) as client:
+        client.poll_scheduler.initial_interval = 0.01
+        client.poll_scheduler.not_found_grace = 0.05
+        found = client.wait_for("transaction", "0xa", chain="base")
+        missing = client.wait_for("transaction", "0xtypo", chain="base")
+
+        assert (await found).status == "confirmed"
+        with pytest.raises(NotFoundError, match="0xtypo"):
+            await asyncio.wait_for(missing, 2.0)
+        assert len(client.poll_scheduler) == 0
+
+
+def test_sync_wait_for_custom_kind_with_callback() -> None:
+    bridge = OperationKind("bridge_transfer", "bridge/transfers/{id}", frozenset({"completed", "failed"}))
+    called = threading.Event()
+
+    with respx.mock:
+        route = respx.get(f"{BASE}/api/v2/bridge/transfers/br_1").mock(side_effect=[
+            httpx.Response(200, json={"id": "br_1", "status": "in_flight"}),
+            httpx.Response(503, json={"detail": "busy"}),
+            httpx.Response(200, json={"id": "br_1", "status": "COMPLETED"}),
+        ])
+        with Sardis(api_key="sk_test", base_url=BASE, retry=RetryConfig(max_retries=0)) as client:
+            client.poll_scheduler.initial_interval = 0.01
+            future = client.wait_for(bridge, "br_1", callback=lambda f: called.set())
+            assert future.result(timeout=5) == {"id": "br_1", "status": "COMPLETED"}
+
+    assert called.wait(1)
+    assert route.call_count == 3
+
+
+def test_sync_wait_for_fails_on_persistent_404() -> None:
+    bridge = OperationKind("bridge_transfer", "bridge/transfers/{id}", frozenset({"completed"}))
+
+    with respx.mock:
+        route = respx.get(f"{BASE}/api/v2/bridge/transfers/br_typo").respond(404, json={"detail": "Not Found"})
+        with Sardis(api_key="sk_test", base_url=BASE, retry=RetryConfig(max_retries=0)) as client:
+            client.poll_scheduler.initial_interval = 0.01
+            client.poll_scheduler.not_found_grace = 0.05
+            with pytest.raises(NotFoundError):
+                client.wait_for(bridge, "br_typo").result(timeout=5)
+
+    assert route.call_count > 1
@@ -0,0 +1,213 @@
+"""Tests for the webhook receiver."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from sardis.models.webhook import WebhookEvent, WebhookEventType
+from sardis.webhooks import (
+    WebhookReceiver,
+    WebhookSignatureError,
+    construct_event,
+    sign_payload,
+    verify_signature,
+)
+
+NOW = 1_767_225_600.0
+SECRET = "whsec_test"
+
+
+def event_body(event_id: str = "evt_1", event_type: str = "payment.completed", **payload: object) -> bytes:
+    return json.dumps({
+        "id": event_id,
+        "event_type": event_type,
+        "payload": payload or {"payment_id": "pay_1"},
+        "created_at": "2026-01-01T00:00:00Z",
+    }).encode()
+
+
+def signed(body: bytes, secret: str = SECRET, at: float = NOW) -> dict[str, str]:
+    return {"X-Sardis-Signature": sign_payload(body, secret, int(at))}
+
+
+def test_verify_signature_checks_secret_and_replay_window() -> None:
+    body = event_body()
+    header = sign_payload(body, SECRET, int(NOW))
+
+    verify_signature(body, header, SECRET, now=NOW + 10)
+    verify_signature(body, header, ["whsec_old", SECRET], now=NOW)
+
+    with pytest.raises(WebhookSignatureError):
+        verify_signature(body + b" ", header, SECRET, now=NOW)
+    with pytest.raises(WebhookSignatureError):
+        verify_signature(body, header, "whsec_other", now=NOW)
+    with pytest.raises(WebhookSignatureError, match="replay window"):
+        verify_signature(body, header, SECRET, now=NOW + 301)
+    verify_signature(body, header, SECRET, tolerance=None, now=NOW + 10_000)
+    with pytest.raises(WebhookSignatureError):
+        verify_signature(body, None, SECRET)
+
+
+def test_construct_event_accepts_untimestamped_signature_and_flat_body() -> None:
+    import hashlib
+    import hmac
+
+    body = json.dumps({"event_type": "payment.completed", "amount": "25.00"}).encode()
+    header = "sha256=" + hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+
+    event = construct_event(body, header, SECRET)
+
+    assert event.event_type == "payment.completed"
+    assert event.payload == {"amount": "25.00"}
+    assert event.event_id.startswith("evt_")
+
+
+async def test_receiver_acknowledges_fast_and_dispatches_typed_events() -> None:
+    seen: list[WebhookEvent] = []
+    release = asyncio.Event()
+    receiver = WebhookReceiver(SECRET, workers=2, clock=lambda: NOW)
+
+    @receiver.on(WebhookEventType.PAYMENT_COMPLETED)
+    async def paid(event: WebhookEvent) -> None:
+        await release.wait()
+        seen.append(event)
+
+    everything: list[str] = []
+    receiver.on("*")(lambda event: everything.append(event.event_type))
+
+    async with receiver:
+        body = event_body()
+        response = await receiver.handle(body, signed(body))
+        assert response.status == 200
+        await asyncio.sleep(0)
+        assert receiver.metrics().in_flight == 1  # acknowledged while the handler waits
+
+        other = event_body("evt_2", "hold.created")
+        assert (await receiver.handle(other, signed(other))).status == 200
+        release.set()
+
+    assert [e.event_id for e in seen] == ["evt_1"]
+    assert isinstance(seen[0].payload, dict)
+    assert sorted(everything) == ["hold.created", "payment.completed"]
+    metrics = receiver.metrics()
+    assert (metrics.accepted, metrics.handled, metrics.failed) == (2, 2, 0)
+    assert set(metrics.latency_ms) == {50, 95, 99}
+
+
+async def test_receiver_dedupes_rejects_and_sheds_load() -> None:
+    receiver = WebhookReceiver(SECRET, workers=1, max_queue=1, dedupe_size=2, clock=lambda: NOW)
+    gate = asyncio.Event()
+    receiver.on("*")(lambda event: None)
+
+    @receiver.on("payment.completed")
+    async def slow(event: WebhookEvent) -> None:
+        await gate.wait()
+
+    first = event_body("evt_1")
+    assert (await receiver.handle(first, signed(first))).status == 200
+    duplicate = await receiver.handle(first, signed(first))
+    assert duplicate.status == 200 and duplicate.body["duplicate"] is True
+
+    assert (await receiver.handle(first, signed(first, "whsec_bad"))).status == 401
+    assert (await receiver.handle(first, signed(first, at=NOW - 3600))).status == 401
+    assert (await receiver.handle(b"not json", signed(b"not json"))).status == 400
+
+    await asyncio.sleep(0)  # worker picks up evt_1 and blocks
+    second, third = event_body("evt_2"), event_body("evt_3")
+    assert (await receiver.handle(second, signed(second))).status == 200
+    busy = await receiver.handle(third, signed(third))
+    assert busy.status == 503 and busy.headers["retry-after"] == "1"
+
+    metrics = receiver.metrics()
+    assert (metrics.duplicates, metrics.rejected, metrics.dropped, metrics.queue_depth) == (1, 3, 1, 1)
+
+    gate.set()
+    while receiver.metrics().queue_depth:
+        await asyncio.sleep(0.01)
+    assert (await receiver.handle(third, signed(third))).status == 200  # redelivery is not a duplicate
+    await receiver.close()
+    assert receiver.metrics().handled == 3
+
+
+async def test_receiver_marks_events_seen_only_after_handlers_succeed() -> None:
+    receiver = WebhookReceiver(SECRET, workers=1, clock=lambda: NOW)
+    calls: list[str] = []
+
+    @receiver.on("payment.completed")
+    async def flaky(event: WebhookEvent) -> None:
+        calls.append(event.event_id)
+        if len(calls) == 1:
+            raise RuntimeError("downstream unavailable")
+
+    body = event_body()
+    async with receiver:
+        assert (await receiver.handle(body, signed(body))).status == 200
+        assert receiver.has_seen("evt_1")  # queued: a concurrent duplicate is dropped
+        while receiver.metrics().queue_depth or receiver.metrics().in_flight:
+            await asyncio.sleep(0.01)
+        assert not receiver.has_seen("evt_1")
+
+        redelivery = await receiver.handle(body, signed(body))
+        assert "duplicate" not in redelivery.body
+        while receiver.metrics().queue_depth or receiver.metrics().in_flight:
+            await asyncio.sleep(0.01)
+        assert receiver.has_seen("evt_1")
+
+    assert calls == ["evt_1", "evt_1"]
+    assert (receiver.metrics().failed, receiver.metrics().handled) == (1, 1)
+
+
+async def test_receiver_secret_rotation_overlap() -> None:
+    now = [NOW]
+    receiver = WebhookReceiver("whsec_old", clock=lambda: now[0])
+    receiver.rotate_secret("whsec_new", overlap=60)
+
+    old, new = event_body("evt_old"), event_body("evt_new")
+    assert (await receiver.handle(old, signed(old, "whsec_old"))).status == 200
+    assert (await receiver.handle(new, signed(new, "whsec_new"))).status == 200
+
+    now[0] += 61
+    late = event_body("evt_late")
+    assert (await receiver.handle(late, signed(late, "whsec_old", at=now[0]))).status == 401
+    assert receiver.secrets == ["whsec_new"]
+    await receiver.close()
+
+
+async def test_receiver_as_asgi_app() -> None:
+    failures: list[str] = []
+    receiver = WebhookReceiver(SECRET, clock=lambda: NOW, on_error=lambda e, exc: failures.append(str(exc)))
+
+    @receiver.on("payment.completed")
+    def broken(event: WebhookEvent) -> None:
+        raise RuntimeError("boom")
+
+    body = event_body()
+    sent: list[dict] = []
+    messages = iter([{"type": "http.request", "body": body[:10], "more_body": True},
+                     {"type": "http.request", "body": body[10:]}])
+
+    async def receive() -> dict:
+        return next(messages)
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in signed(body).items()],
+    }
+    await receiver(scope, receive, send)
+    await receiver.close()
+
+    assert sent[0]["status"] == 200
+    assert json.loads(sent[1]["body"]) == {"received": True}
+    assert failures == ["boom"]
+    assert receiver.metrics().failed == 1
+
+    sent.clear()
+    await receiver({"type": "http", "method": "GET", "headers": []}, receive, send)
+    assert sent[0]["status"] == 405
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark eager vs lazy model validation for large list responses.
+
+Builds a synthetic ``/ledger/entries`` page and measures CPU time and peak
+allocated memory for each way the SDK can turn it into ``LedgerEntry``
+objects:
+
+* ``per-item``: the historical ``[Model.model_validate(x) for x in items]``
+* ``eager``: ``parse_model_list`` (one compiled ``TypeAdapter`` pass)
+* ``lazy-ids``: ``parse_model_list(lazy=True)`` reading only ``tx_id``/``amount``
+* ``lazy-10``: ``parse_model_list(lazy=True)`` touching the first 10 entries
+
+Run from the repository root:
+
+    python scripts/bench_list_validation.py --items 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from sardis.pagination import parse_model_list
+from sardis.resources.ledger import LedgerEntry
+
+
+def make_entries(n: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "tx_id": f"tx_{i:08d}",
+            "mandate_id": f"mnd_{i % 97}",
+            "from_wallet": f"wallet_{i % 500}",
+            "to_wallet": f"wallet_{(i * 7) % 500}",
+            "amount": f"{(i % 10_000) / 100:.2f}",
+            "currency": "USDC",
+            "chain": "base",
+            "chain_tx_hash": f"0x{i:064x}",
+            "audit_anchor": f"anchor_{i // 1000}",
+            "created_at": "2026-01-01T00:00:00+00:00",
+        }
+        for i in range(n)
+    ]
+
+
+def per_item(raw: list[dict[str, Any]]) -> Any:
+    return [LedgerEntry.model_validate(e) for e in raw]
+
+
+def eager(raw: list[dict[str, Any]]) -> Any:
+    return parse_model_list(raw, LedgerEntry)
+
+
+def lazy_ids(raw: list[dict[str, Any]]) -> Any:
+    entries = parse_model_list(raw, LedgerEntry, lazy=True)
+    return entries.column("tx_id"), entries.column("amount")
+
+
+def lazy_10(raw: list[dict[str, Any]]) -> Any:
+    entries = parse_model_list(raw, LedgerEntry, lazy=True)
+    return [entries[i] for i in range(min(10, len(entries)))]
+
+
+CASES: dict[str, Callable[[list[dict[str, Any]]], Any]] = {
+    "per-item": per_item,
+    "eager": eager,
+    "lazy-ids": lazy_ids,
+    "lazy-10": lazy_10,
+}
+
+
+def measure(fn: Callable[[list[dict[str, Any]]], Any], raw: list[dict[str, Any]], repeat: int) -> tuple[float, int]:
+    fn(raw)  # warm up validator construction
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(raw)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = fn(raw)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return statistics.median(timings), peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000, help="entries per page")
+    parser.add_argument("--repeat", type=int, default=7, help="timed runs per case")
+    args = parser.parse_args()
+
+    raw = make_entries(args.items)
+    baseline_time, baseline_mem = measure(per_item, raw, args.repeat)
+
+    print(f"{args.items} ledger entries, median of {args.repeat} runs\n")
+    print(f"{'case':<10} {'time (ms)':>10} {'speedup':>8} {'peak (KiB)':>11} {'mem':>6}")
+    for name, fn in CASES.items():
+        elapsed, peak = (baseline_time, baseline_mem) if fn is per_item else measure(fn, raw, args.repeat)
+        print(
+            f"{name:<10} {elapsed * 1000:>10.2f} {baseline_time / elapsed:>7.1f}x "
+            f"{peak / 1024:>11.0f} {peak / baseline_mem:>5.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()